@@ -65,6 +65,25 @@ impl RedisCacheDatabase {
         }
     }
 
+    #[pyo3(name = "read_bulk")]
+    fn py_read_bulk(&mut self, py: Python, keys: Vec<String>) -> PyResult<Vec<Vec<PyObject>>> {
+        match self.read_bulk(&keys) {
+            Ok(results) => {
+                let vec_py_results = results
+                    .into_iter()
+                    .map(|result| {
+                        result
+                            .into_iter()
+                            .map(|r| PyBytes::new(py, r.as_ref()).into())
+                            .collect::<Vec<PyObject>>()
+                    })
+                    .collect::<Vec<Vec<PyObject>>>();
+                Ok(vec_py_results)
+            }
+            Err(e) => Err(to_pyruntime_err(e)),
+        }
+    }
+
     #[pyo3(name = "insert")]
     fn py_insert(&mut self, key: String, payload: Vec<Vec<u8>>) -> PyResult<()> {
         let payload: Vec<Bytes> = payload.into_iter().map(Bytes::from).collect();
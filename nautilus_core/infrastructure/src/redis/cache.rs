@@ -53,6 +53,9 @@ const CACHE_WRITE: &str = "cache-write";
 // Error constants
 const FAILED_TX_CHANNEL: &str = "Failed to send to channel";
 
+// Maximum number of commands sent in a single pipelined bulk read
+const READ_BULK_BATCH_SIZE: usize = 1_000;
+
 // Collection keys
 const INDEX: &str = "index";
 const GENERAL: &str = "general";
@@ -216,6 +219,41 @@ impl RedisCacheDatabase {
         }
     }
 
+    /// Reads the values for all of the given `keys`, pipelining the reads into batches of
+    /// round trips. The result for each key is in the same order as `keys`, and is empty
+    /// where no value exists.
+    pub fn read_bulk(&mut self, keys: &[String]) -> anyhow::Result<Vec<Vec<Bytes>>> {
+        let mut results = Vec::with_capacity(keys.len());
+
+        for chunk in keys.chunks(READ_BULK_BATCH_SIZE) {
+            let mut pipe = redis::pipe();
+
+            for key in chunk {
+                let collection = get_collection_key(key)?;
+                let key = format!("{}{REDIS_DELIMITER}{}", self.trader_key, key);
+
+                match collection {
+                    GENERAL | CURRENCIES | INSTRUMENTS | SYNTHETICS | ACTORS | STRATEGIES => {
+                        pipe.get(key);
+                    }
+                    ACCOUNTS | ORDERS | POSITIONS => {
+                        pipe.lrange(key, 0, -1);
+                    }
+                    _ => anyhow::bail!(
+                        "Unsupported operation: `read_bulk` for collection '{collection}'"
+                    ),
+                }
+            }
+
+            let values: Vec<redis::Value> = pipe.query(&mut self.con)?;
+            for value in values {
+                results.push(value_to_bytes(value)?);
+            }
+        }
+
+        Ok(results)
+    }
+
     pub fn insert(&mut self, key: String, payload: Option<Vec<Bytes>>) -> anyhow::Result<()> {
         let op = DatabaseCommand::new(DatabaseOperation::Insert, key, payload);
         match self.tx.send(op) {
@@ -371,6 +409,22 @@ fn read_list(conn: &mut Connection, key: &str) -> anyhow::Result<Vec<Bytes>> {
     Ok(result)
 }
 
+fn value_to_bytes(value: redis::Value) -> anyhow::Result<Vec<Bytes>> {
+    match value {
+        redis::Value::Nil => Ok(vec![]),
+        redis::Value::BulkString(data) if data.is_empty() => Ok(vec![]),
+        redis::Value::BulkString(data) => Ok(vec![Bytes::from(data)]),
+        redis::Value::Array(values) => values
+            .into_iter()
+            .map(|value| match value {
+                redis::Value::BulkString(data) => Ok(Bytes::from(data)),
+                other => anyhow::bail!("Unexpected value for bulk read element: {other:?}"),
+            })
+            .collect(),
+        other => anyhow::bail!("Unexpected value for bulk read: {other:?}"),
+    }
+}
+
 fn insert(
     pipe: &mut Pipeline,
     collection: &str,
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
@@ -24,20 +25,45 @@ from nautilus_trader.common.component cimport Logger
 from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.events.order cimport OrderFilled
+from nautilus_trader.model.identifiers cimport ClientOrderId
+from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Money
+from nautilus_trader.model.orders.base cimport Order
+
+
+cdef class OrderLedger:
+    cdef dict _contributions
+
+    cdef readonly tuple key
+    """The account parameters the contributions were calculated with.\n\n:returns: `tuple`"""
+    cdef readonly int64_t buy_total_raw
+    """The total raw contribution of the open BUY orders.\n\n:returns: `int64_t`"""
+    cdef readonly int64_t sell_total_raw
+    """The total raw contribution of the open SELL orders.\n\n:returns: `int64_t`"""
+
+    cdef bint is_empty(self)
+    cdef void set(self, ClientOrderId client_order_id, OrderSide side, int64_t raw)
+    cdef void discard(self, ClientOrderId client_order_id)
 
 
 cdef class AccountsManager:
     cdef Clock _clock
     cdef Logger _log
     cdef CacheFacade _cache
+    cdef dict _ledgers
 
     cdef AccountState update_balances(self, Account account, Instrument instrument, OrderFilled fill)
     cdef AccountState update_orders(self, Account account, Instrument instrument, list orders_open, uint64_t ts_event)
     cdef AccountState update_positions(self, MarginAccount account, Instrument instrument, list positions_open, uint64_t ts_event)
-    cdef AccountState _update_balance_locked(self, CashAccount account, Instrument instrument, list orders_open, uint64_t ts_event)
-    cdef AccountState _update_margin_init(self, MarginAccount account, Instrument instrument, list orders_open, uint64_t ts_event)
+    cdef AccountState update_order(self, Account account, Instrument instrument, Order order, uint64_t ts_event)
+    cdef void discard_order(self, InstrumentId instrument_id, ClientOrderId client_order_id)
+    cpdef void reset(self)
+    cdef tuple _ledger_key(self, Account account, Instrument instrument)
+    cdef OrderLedger _rebuild_ledger(self, Account account, Instrument instrument, list orders_open)
+    cdef void _update_ledger(self, Account account, Instrument instrument, OrderLedger ledger, Order order)
+    cdef AccountState _apply_ledger(self, Account account, Instrument instrument, OrderLedger ledger, uint64_t ts_event)
+    cdef object _convert_to_base(self, Account account, Instrument instrument, OrderSide side, object amount)
     cdef void _update_balance_single_currency(self, Account account, OrderFilled fill, Money pnl)
     cdef void _update_balance_multi_currency(self, Account account, OrderFilled fill, list pnls)
     cdef AccountState _generate_account_state(self, Account account, uint64_t ts_event)
@@ -15,6 +15,7 @@
 
 from decimal import Decimal
 
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.error import AccountBalanceNegative
@@ -28,21 +29,74 @@ from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport is_logging_initialized
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.model cimport FIXED_PRECISION
 from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.core.uuid cimport UUID4
+from nautilus_trader.model.identifiers cimport ClientOrderId
+from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport AccountBalance
 from nautilus_trader.model.objects cimport Currency
+from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.orders.base cimport Order
 from nautilus_trader.model.position cimport Position
 
 
+cdef class OrderLedger:
+    """
+    Provides the per-order balance contributions of the open orders for a
+    single instrument, held as fixed-point raw values totaled by order side.
+
+    Contributions are the initial (order) margin for margin accounts, or the
+    locked balance for cash accounts, in the currency they were calculated in.
+
+    Parameters
+    ----------
+    key : tuple
+        The account parameters the contributions were calculated with.
+    """
+
+    def __init__(self, tuple key not None):
+        self.key = key
+        self.buy_total_raw = 0
+        self.sell_total_raw = 0
+        self._contributions = {}
+
+    cdef bint is_empty(self):
+        return not self._contributions
+
+    cdef void set(self, ClientOrderId client_order_id, OrderSide side, int64_t raw):
+        self.discard(client_order_id)
+
+        self._contributions[client_order_id] = (side, raw)
+        if side == OrderSide.BUY:
+            self.buy_total_raw += raw
+        else:
+            self.sell_total_raw += raw
+
+    cdef void discard(self, ClientOrderId client_order_id):
+        cdef tuple contribution = self._contributions.pop(client_order_id, None)
+        if contribution is None:
+            return
+
+        side, raw = contribution
+        if side == OrderSide.BUY:
+            self.buy_total_raw -= raw
+        else:
+            self.sell_total_raw -= raw
+
+
 cdef class AccountsManager:
     """
     Provides account management functionality.
 
+    The initial (order) margin and locked balance of each instrument are held in
+    an `OrderLedger`, which is adjusted by the delta of a single order on each
+    order event. The ledger is only rebuilt from all open orders when the
+    account parameters it was calculated with (such as leverage) change.
+
     Parameters
     ----------
     cache : CacheFacade
@@ -62,6 +116,7 @@ cdef class AccountsManager:
         self._clock = clock
         self._log = logger
         self._cache = cache
+        self._ledgers: dict[InstrumentId, OrderLedger] = {}
 
     cdef AccountState update_balances(
         self,
@@ -146,6 +201,8 @@ cdef class AccountsManager:
         """
         Update the account states based on the given orders.
 
+        The order ledger for the instrument is rebuilt from the given orders.
+
         Parameters
         ----------
         account : MarginAccount
@@ -159,120 +216,38 @@ cdef class AccountsManager:
 
         Returns
         -------
-        AccountState
+        AccountState or ``None``
 
         """
         Condition.not_none(account, "account")
         Condition.not_none(instrument, "instrument")
         Condition.not_none(orders_open, "orders_open")
 
-        if account.is_cash_account:
-            return self._update_balance_locked(
-                account,
-                instrument,
-                orders_open,
-                ts_event,
-            )
-        elif account.is_margin_account:
-            return self._update_margin_init(
-                account,
-                instrument,
-                orders_open,
-                ts_event,
-            )
-        else:
-            raise RuntimeError("invalid `AccountType`")  # pragma: no cover (design-time error)
-
-    cdef AccountState _update_balance_locked(
-        self,
-        CashAccount account,
-        Instrument instrument,
-        list orders_open,
-        uint64_t ts_event,
-    ):
-        if not orders_open:
-            account.clear_balance_locked(instrument.id)
-            return self._generate_account_state(
-                account=account,
-                ts_event=ts_event,
-            )
-
-        total_locked = Decimal(0)
-        base_xrate  = Decimal(0)
-
-        cdef Currency currency = instrument.get_settlement_currency()
-        cdef:
-            Order order
-        for order in orders_open:
-            assert order.instrument_id == instrument.id
-            assert order.is_open_c()
-
-            if not order.has_price_c() and not order.has_trigger_price_c():
-                continue
-
-            # Calculate balance locked
-            locked = account.calculate_balance_locked(
-                instrument,
-                order.side,
-                order.quantity,
-                order.price if order.has_price_c() else order.trigger_price,
-            ).as_decimal()
-
-            if account.base_currency is not None:
-                if base_xrate == 0:
-                    # Cache base currency and xrate
-                    currency = account.base_currency
-                    base_xrate = self._calculate_xrate_to_base(
-                        instrument=instrument,
-                        account=account,
-                        side=order.side,
-                    )
-
-                    if base_xrate == 0:
-                        self._log.debug(
-                            f"Cannot calculate balance locked: "
-                            f"insufficient data for "
-                            f"{instrument.get_settlement_currency()}/{account.base_currency}"
-                        )
-                        return None  # Cannot calculate
-
-                # Apply base xrate
-                locked = round(locked * base_xrate, currency.get_precision())
-
-            # Increment total locked
-            total_locked += locked
-
-        cdef Money locked_money = Money(total_locked, currency)
-        account.update_balance_locked(instrument.id, locked_money)
-
-        self._log.info(f"{instrument.id} balance_locked={locked_money.to_formatted_str()}")
+        cdef OrderLedger ledger = self._rebuild_ledger(account, instrument, orders_open)
+        return self._apply_ledger(account, instrument, ledger, ts_event)
 
-        return self._generate_account_state(
-            account=account,
-            ts_event=ts_event,
-        )
-
-    cdef AccountState _update_margin_init(
+    cdef AccountState update_order(
         self,
-        MarginAccount account,
+        Account account,
         Instrument instrument,
-        list orders_open,
+        Order order,
         uint64_t ts_event,
     ):
         """
-        Update the initial (order) margin for margin accounts or locked balance
-        for cash accounts.
+        Update the account states based on the given changed order.
 
-        Will return ``None`` if operation fails.
+        Only the contribution of the given order is recalculated, unless the
+        account parameters have changed since the ledger for the instrument was
+        built, in which case it is rebuilt from the open orders in the cache.
 
         Parameters
         ----------
-        account : MarginAccount
+        account : Account
             The account to update.
         instrument : Instrument
             The instrument for the update.
-        orders_open : list[Order]
-            The open orders for the update.
+        order : Order
+            The order which changed.
         ts_event : uint64_t
             UNIX timestamp (nanoseconds) when the account event occurred.
 
@@ -283,65 +258,182 @@ cdef class AccountsManager:
         """
         Condition.not_none(account, "account")
         Condition.not_none(instrument, "instrument")
-        Condition.not_none(orders_open, "orders_open")
+        Condition.not_none(order, "order")
 
-        total_margin_init = Decimal(0)
-        base_xrate = Decimal(0)
+        cdef OrderLedger ledger = self._ledgers.get(instrument.id)
+        cdef list orders_open
+        cdef Order o
+        if ledger is None or ledger.key != self._ledger_key(account, instrument):
+            orders_open = self._cache.orders_open(
+                venue=None,  # Faster query filtering
+                instrument_id=instrument.id,
+            )
+            ledger = self._rebuild_ledger(
+                account,
+                instrument,
+                [o for o in orders_open if o.is_passive_c()],
+            )
+        else:
+            self._update_ledger(account, instrument, ledger, order)
 
-        cdef Currency currency = instrument.get_settlement_currency()
+        return self._apply_ledger(account, instrument, ledger, ts_event)
+
+    cdef void discard_order(self, InstrumentId instrument_id, ClientOrderId client_order_id):
+        """
+        Discard the given order from the order ledger for the instrument.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the order.
+        client_order_id : ClientOrderId
+            The client order ID to discard.
+
+        """
+        cdef OrderLedger ledger = self._ledgers.get(instrument_id)
+        if ledger is not None:
+            ledger.discard(client_order_id)
+
+    cpdef void reset(self):
+        """
+        Reset the accounts manager.
+
+        All order ledgers are cleared.
+
+        """
+        self._ledgers.clear()
+
+    cdef tuple _ledger_key(self, Account account, Instrument instrument):
+        if account.is_margin_account:
+            leverage = (<MarginAccount>account).leverage(instrument.id)
+            return (
+                account.id,
+                account.base_currency,
+                leverage or (<MarginAccount>account).default_leverage,
+                instrument.margin_init,
+                instrument.taker_fee,
+            )
+        return (account.id, account.base_currency, None, None, instrument.taker_fee)
+
+    cdef OrderLedger _rebuild_ledger(self, Account account, Instrument instrument, list orders_open):
+        cdef OrderLedger ledger = OrderLedger(self._ledger_key(account, instrument))
 
         cdef Order order
         for order in orders_open:
             assert order.instrument_id == instrument.id, f"order not for instrument {instrument}"
+            self._update_ledger(account, instrument, ledger, order)
 
-            if not order.is_open_c() or (not order.has_price_c() and not order.has_trigger_price_c()):
-                # Does not contribute to initial margin
-                continue
+        self._ledgers[instrument.id] = ledger
+        return ledger
+
+    cdef void _update_ledger(
+        self,
+        Account account,
+        Instrument instrument,
+        OrderLedger ledger,
+        Order order,
+    ):
+        if (
+            not order.is_open_c()
+            or not order.is_passive_c()
+            or (not order.has_price_c() and not order.has_trigger_price_c())
+        ):
+            # Does not contribute to initial margin or locked balance
+            ledger.discard(order.client_order_id)
+            return
 
-            # Calculate initial margin
-            margin_init = account.calculate_margin_init(
+        cdef Price price = order.price if order.has_price_c() else order.trigger_price
+        cdef Money contribution
+        if account.is_margin_account:
+            contribution = (<MarginAccount>account).calculate_margin_init(
                 instrument,
                 order.quantity,
-                order.price if order.has_price_c() else order.trigger_price,
-            ).as_decimal()
-
-            if account.base_currency is not None:
-                if base_xrate == 0:
-                    # Cache base currency and xrate
-                    currency = account.base_currency
-                    base_xrate = self._calculate_xrate_to_base(
-                        instrument=instrument,
-                        account=account,
-                        side=order.side,
-                    )
+                price,
+            )
+        else:
+            contribution = (<CashAccount>account).calculate_balance_locked(
+                instrument,
+                order.side,
+                order.quantity,
+                price,
+            )
 
-                    if base_xrate == 0:
-                        self._log.debug(
-                            f"Cannot calculate initial (order) margin: "
-                            f"insufficient data for "
-                            f"{instrument.get_settlement_currency()}/{account.base_currency}"
-                        )
-                        return None  # Cannot calculate
+        if contribution is None:
+            ledger.discard(order.client_order_id)
+        else:
+            ledger.set(order.client_order_id, order.side, contribution._mem.raw)
 
-                # Apply base xrate
-                margin_init = round(margin_init * base_xrate, currency.get_precision())
+    cdef AccountState _apply_ledger(
+        self,
+        Account account,
+        Instrument instrument,
+        OrderLedger ledger,
+        uint64_t ts_event,
+    ):
+        cdef str label = "margin_init" if account.is_margin_account else "balance_locked"
+        if ledger.is_empty():
+            if account.is_margin_account:
+                (<MarginAccount>account).clear_margin_init(instrument.id)
+            else:
+                (<CashAccount>account).clear_balance_locked(instrument.id)
+            return self._generate_account_state(
+                account=account,
+                ts_event=ts_event,
+            )
 
-            # Increment total initial margin
-            total_margin_init += margin_init
+        cdef Currency currency = instrument.get_settlement_currency()
+        buy_total = Decimal(ledger.buy_total_raw).scaleb(-FIXED_PRECISION)
+        sell_total = Decimal(ledger.sell_total_raw).scaleb(-FIXED_PRECISION)
 
-        cdef Money margin_init_money = Money(total_margin_init, currency)
-        if total_margin_init == 0:
-            account.clear_margin_init(instrument.id)
+        if account.base_currency is not None:
+            currency = account.base_currency
+            if ledger.buy_total_raw != 0:
+                buy_total = self._convert_to_base(account, instrument, OrderSide.BUY, buy_total)
+                if buy_total is None:
+                    return None  # Cannot calculate
+            if ledger.sell_total_raw != 0:
+                sell_total = self._convert_to_base(account, instrument, OrderSide.SELL, sell_total)
+                if sell_total is None:
+                    return None  # Cannot calculate
+
+        cdef Money total_money = Money(buy_total + sell_total, currency)
+        if account.is_margin_account:
+            if total_money._mem.raw == 0:
+                (<MarginAccount>account).clear_margin_init(instrument.id)
+            else:
+                (<MarginAccount>account).update_margin_init(instrument.id, total_money)
         else:
-            account.update_margin_init(instrument.id, margin_init_money)
+            (<CashAccount>account).update_balance_locked(instrument.id, total_money)
 
-        self._log.info(f"{instrument.id} margin_init={margin_init_money.to_formatted_str()}")
+        self._log.info(f"{instrument.id} {label}={total_money.to_formatted_str()}")
 
         return self._generate_account_state(
             account=account,
             ts_event=ts_event,
         )
 
+    cdef object _convert_to_base(
+        self,
+        Account account,
+        Instrument instrument,
+        OrderSide side,
+        object amount,
+    ):
+        xrate = self._calculate_xrate_to_base(
+            instrument=instrument,
+            account=account,
+            side=side,
+        )
+        if xrate == 0:
+            self._log.debug(
+                f"Cannot calculate {instrument.id} order balances: "
+                f"insufficient data for "
+                f"{instrument.get_settlement_currency()}/{account.base_currency}"
+            )
+            return None
+
+        return round(amount * xrate, account.base_currency.get_precision())
+
     cdef AccountState update_positions(
         self,
         MarginAccount account,
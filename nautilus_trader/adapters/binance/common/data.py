@@ -15,6 +15,7 @@
 
 import asyncio
 import decimal
+from collections.abc import Callable
 from decimal import Decimal
 
 import msgspec
@@ -177,18 +178,19 @@ class BinanceCommonDataClient(LiveMarketDataClient):
         self._log.info(f"Base url HTTP {self._http_client.base_url}", LogColor.BLUE)
         self._log.info(f"Base url WebSocket {base_url_ws}", LogColor.BLUE)
 
-        # Register common WebSocket message handlers
-        self._ws_handlers = {
-            "@bookTicker": self._handle_book_ticker,
-            "@ticker": self._handle_ticker,
-            "@kline": self._handle_kline,
-            "@trade": self._handle_trade,
-            "@aggTrade": self._handle_agg_trade,
-            "@depth@": self._handle_book_diff_update,
-            "@depth5": self._handle_book_partial_update,
-            "@depth10": self._handle_book_partial_update,
-            "@depth20": self._handle_book_partial_update,
+        # Register common WebSocket message handlers (keyed by stream type)
+        self._ws_handlers: dict[str, Callable[[bytes], None]] = {
+            "bookTicker": self._handle_book_ticker,
+            "ticker": self._handle_ticker,
+            "kline": self._handle_kline,
+            "trade": self._handle_trade,
+            "aggTrade": self._handle_agg_trade,
+            "depth": self._handle_book_diff_update,
+            "depth5": self._handle_book_partial_update,
+            "depth10": self._handle_book_partial_update,
+            "depth20": self._handle_book_partial_update,
         }
+        self._ws_stream_handlers: dict[str, Callable[[bytes], None]] = {}  # Resolved per stream
 
         # WebSocket msgspec decoders
         self._decoder_data_msg_wrapper = msgspec.json.Decoder(BinanceDataMsgWrapper)
@@ -933,7 +935,7 @@ class BinanceCommonDataClient(LiveMarketDataClient):
             self._handle_data(instrument)
 
         for currency in self._instrument_provider.currencies().values():
-            self._cache.add_currency(currency)
+            self.update_cache(self._cache.add_currency, currency)
 
     def _get_cached_instrument_id(self, symbol: str) -> InstrumentId:
         # Parse instrument ID
@@ -952,23 +954,40 @@ class BinanceCommonDataClient(LiveMarketDataClient):
     def _handle_ws_message(self, raw: bytes) -> None:
         # TODO: Uncomment for development
         # self._log.info(str(raw), LogColor.CYAN)
-        wrapper = self._decoder_data_msg_wrapper.decode(raw)
-        if not wrapper.stream:
-            # Control message response
-            return
+        stream = _parse_stream_name(raw)
+        if stream is None:
+            # Not a compact combined stream frame, decode the wrapper to read the stream
+            wrapper = self._decoder_data_msg_wrapper.decode(raw)
+            if not wrapper.stream:
+                # Control message response
+                return
+            stream = wrapper.stream
+
+        handler = self._ws_stream_handlers.get(stream)
+        if handler is None:
+            handler = self._resolve_ws_handler(stream)
+            if handler is None:
+                self._log.error(f"Unrecognized websocket message type: {stream}")
+                return
+
         try:
-            handled = False
-            for handler in self._ws_handlers:
-                if handler in wrapper.stream:
-                    self._ws_handlers[handler](raw)
-                    handled = True
-            if not handled:
-                self._log.error(
-                    f"Unrecognized websocket message type: {wrapper.stream}",
-                )
+            handler(raw)
         except Exception as e:
             self._log.error(f"Error handling websocket message, {e}")
 
+    def _resolve_ws_handler(self, stream: str) -> Callable[[bytes], None] | None:
+        # Stream names are '<symbol>@<type>[_<interval>][@<speed>]', e.g. 'btcusdt@kline_1m'
+        symbol, _, stream_type = stream.partition("@")
+        if not symbol or symbol.startswith("!"):
+            return None  # All market streams are not handled
+
+        stream_type = stream_type.partition("@")[0].partition("_")[0]
+        handler = self._ws_handlers.get(stream_type)
+        if handler is not None:
+            self._ws_stream_handlers[stream] = handler
+
+        return handler
+
     def _handle_book_diff_update(self, raw: bytes) -> None:
         msg = self._decoder_order_book_msg.decode(raw)
         instrument_id: InstrumentId = self._get_cached_instrument_id(msg.data.s)
@@ -1034,3 +1053,20 @@ class BinanceCommonDataClient(LiveMarketDataClient):
             ts_init=self._clock.timestamp_ns(),
         )
         self._handle_data(trade_tick)
+
+
+_STREAM_PREFIX = b'{"stream":"'
+_STREAM_PREFIX_LEN = len(_STREAM_PREFIX)
+
+
+def _parse_stream_name(raw: bytes) -> str | None:
+    # Read the stream name from the head of a compact combined stream frame
+    # (as sent by Binance) without decoding the message.
+    if not raw.startswith(_STREAM_PREFIX):
+        return None
+
+    end = raw.find(b'"', _STREAM_PREFIX_LEN)
+    if end == -1:
+        return None
+
+    return raw[_STREAM_PREFIX_LEN:end].decode()
@@ -391,8 +391,8 @@ class BinanceOrderBookData(msgspec.Struct, frozen=True):
     s: str  # Symbol
     U: int  # First update ID in event
     u: int  # Final update ID in event
-    b: list[BinanceOrderBookDelta]  # Bids to be updated
-    a: list[BinanceOrderBookDelta]  # Asks to be updated
+    b: list[tuple[str, str]]  # Bids to be updated (price, size)
+    a: list[tuple[str, str]]  # Asks to be updated (price, size)
 
     T: int | None = None  # FUTURES only, transaction time
     pu: int | None = None  # FUTURES only, previous final update ID
@@ -404,29 +404,26 @@ class BinanceOrderBookData(msgspec.Struct, frozen=True):
         ts_init: int,
     ) -> OrderBookDeltas:
         ts_event: int = millis_to_nanos(self.T) if self.T is not None else millis_to_nanos(self.E)
+        update_id: int = self.u
+
+        # Parse price levels directly into deltas (sizes of zero delete the level)
+        deltas: list[OrderBookDelta] = []
+        for side, levels in ((OrderSide.BUY, self.b), (OrderSide.SELL, self.a)):
+            for price, size in levels:
+                quantity = Quantity.from_str(size)
+                deltas.append(
+                    OrderBookDelta(
+                        instrument_id=instrument_id,
+                        action=BookAction.UPDATE if quantity > 0 else BookAction.DELETE,
+                        order=BookOrder(side, Price.from_str(price), quantity, 0),
+                        flags=0,
+                        sequence=update_id,
+                        ts_event=ts_event,
+                        ts_init=ts_init,
+                    ),
+                )
 
-        bid_deltas: list[OrderBookDelta] = [
-            delta.parse_to_order_book_delta(
-                instrument_id,
-                OrderSide.BUY,
-                ts_event,
-                ts_init,
-                self.u,
-            )
-            for delta in self.b
-        ]
-        ask_deltas: list[OrderBookDelta] = [
-            delta.parse_to_order_book_delta(
-                instrument_id,
-                OrderSide.SELL,
-                ts_event,
-                ts_init,
-                self.u,
-            )
-            for delta in self.a
-        ]
-
-        return OrderBookDeltas(instrument_id=instrument_id, deltas=bid_deltas + ask_deltas)
+        return OrderBookDeltas(instrument_id=instrument_id, deltas=deltas)
 
     def parse_to_order_book_snapshot(
         self,
@@ -435,17 +432,26 @@ class BinanceOrderBookData(msgspec.Struct, frozen=True):
     ) -> OrderBookDeltas:
         ts_event: int = millis_to_nanos(self.T)
         bids: list[BookOrder] = [
-            BookOrder(OrderSide.BUY, Price.from_str(o.price), Quantity.from_str(o.size), 0)
-            for o in self.b
+            BookOrder(OrderSide.BUY, Price.from_str(price), Quantity.from_str(size), 0)
+            for price, size in self.b
         ]
         asks: list[BookOrder] = [
-            BookOrder(OrderSide.SELL, Price.from_str(o.price), Quantity.from_str(o.size), 0)
-            for o in self.a
+            BookOrder(OrderSide.SELL, Price.from_str(price), Quantity.from_str(size), 0)
+            for price, size in self.a
         ]
 
         deltas = [OrderBookDelta.clear(instrument_id, ts_init, ts_event)]
         deltas += [
-            OrderBookDelta(instrument_id, BookAction.ADD, o, ts_event, ts_init) for o in bids + asks
+            OrderBookDelta(
+                instrument_id,
+                BookAction.ADD,
+                o,
+                flags=0,
+                sequence=self.u,
+                ts_event=ts_event,
+                ts_init=ts_init,
+            )
+            for o in bids + asks
         ]
         return OrderBookDeltas(instrument_id=instrument_id, deltas=deltas)
 
@@ -109,7 +109,7 @@ class BinanceFuturesDataClient(BinanceCommonDataClient):
         )
 
         # Register additional futures websocket handlers
-        self._ws_handlers["@markPrice"] = self._handle_mark_price
+        self._ws_handlers["markPrice"] = self._handle_mark_price
 
         # Websocket msgspec decoders
         self._decoder_futures_trade_msg = msgspec.json.Decoder(BinanceFuturesTradeMsg)
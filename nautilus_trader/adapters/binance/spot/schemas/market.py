@@ -17,7 +17,6 @@ import msgspec
 
 from nautilus_trader.adapters.binance.common.enums import BinanceOrderType
 from nautilus_trader.adapters.binance.common.schemas.market import BinanceExchangeFilter
-from nautilus_trader.adapters.binance.common.schemas.market import BinanceOrderBookDelta
 from nautilus_trader.adapters.binance.common.schemas.market import BinanceRateLimit
 from nautilus_trader.adapters.binance.common.schemas.market import BinanceSymbolFilter
 from nautilus_trader.core.datetime import millis_to_nanos
@@ -115,8 +114,8 @@ class BinanceSpotOrderBookPartialDepthData(msgspec.Struct):
     """
 
     lastUpdateId: int
-    bids: list[BinanceOrderBookDelta]
-    asks: list[BinanceOrderBookDelta]
+    bids: list[tuple[str, str]]  # (price, size)
+    asks: list[tuple[str, str]]  # (price, size)
 
     def parse_to_order_book_snapshot(
         self,
@@ -124,12 +123,12 @@ class BinanceSpotOrderBookPartialDepthData(msgspec.Struct):
         ts_init: int,
     ) -> OrderBookDeltas:
         bids = [
-            BookOrder(OrderSide.BUY, Price.from_str(o.price), Quantity.from_str(o.size), 0)
-            for o in self.bids
+            BookOrder(OrderSide.BUY, Price.from_str(price), Quantity.from_str(size), 0)
+            for price, size in self.bids
         ]
         asks = [
-            BookOrder(OrderSide.SELL, Price.from_str(o.price), Quantity.from_str(o.size), 0)
-            for o in self.asks
+            BookOrder(OrderSide.SELL, Price.from_str(price), Quantity.from_str(size), 0)
+            for price, size in self.asks
         ]
 
         deltas = [OrderBookDelta.clear(instrument_id, ts_init, ts_init, self.lastUpdateId)]
@@ -233,7 +233,7 @@ class BybitDataClient(LiveMarketDataClient):
             self._handle_data(instrument)
 
         for currency in self._instrument_provider.currencies().values():
-            self._cache.add_currency(currency)
+            self.update_cache(self._cache.add_currency, currency)
 
     async def _update_instruments(self) -> None:
         try:
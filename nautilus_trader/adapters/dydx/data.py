@@ -184,7 +184,7 @@ class DYDXDataClient(LiveMarketDataClient):
             self._handle_data(instrument)
 
         for currency in self._instrument_provider.currencies().values():
-            self._cache.add_currency(currency)
+            self.update_cache(self._cache.add_currency, currency)
 
     def _handle_ws_message(self, raw: bytes) -> None:
         callbacks: dict[tuple[str | None, str | None], Callable[[bytes], None]] = {
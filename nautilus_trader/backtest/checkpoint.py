@@ -0,0 +1,186 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any
+
+import pandas as pd
+
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.core.correctness import PyCondition
+
+
+class BacktestCheckpoint:
+    """
+    Represents a checkpoint of a backtest at a given timestamp.
+
+    The engine state at the checkpoint (cache, portfolio, accounts, matching engine
+    books and open orders, actors and strategies including their indicators,
+    clocks and timers) is not serialized, as much of it is held in Rust and Cython
+    objects. Instead the checkpoint records the function which builds the engine,
+    and restoring it replays the engine up to the checkpoint timestamp.
+
+    Resuming from the checkpoint in separate processes (see `run`) replays the
+    checkpoint in each process concurrently, so any number of variants can be
+    resumed in the wall time of a single replay and variant run.
+
+    Parameters
+    ----------
+    setup : Callable[[], BacktestEngine]
+        The function which builds the engine with its venues, instruments, data,
+        actors and strategies. Must be picklable (such as a module level function)
+        to save the checkpoint or resume from it in separate processes.
+    ts_checkpoint : datetime or str or int
+        The checkpoint datetime (UTC) the engine is run up to (inclusive).
+
+    """
+
+    def __init__(
+        self,
+        setup: Callable[[], BacktestEngine],
+        ts_checkpoint: datetime | str | int,
+    ) -> None:
+        PyCondition.callable(setup, "setup")
+        PyCondition.not_none(ts_checkpoint, "ts_checkpoint")
+
+        self.setup = setup
+        self.ts_checkpoint: int = pd.to_datetime(ts_checkpoint, utc=True).value
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"setup={self.setup!r}, "
+            f"ts_checkpoint={pd.Timestamp(self.ts_checkpoint, tz='UTC')})"
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Save the checkpoint to the given file path.
+
+        Parameters
+        ----------
+        path : str
+            The file path to save the checkpoint to.
+
+        """
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path: str) -> BacktestCheckpoint:
+        """
+        Load a checkpoint from the given file path.
+
+        Parameters
+        ----------
+        path : str
+            The file path to load the checkpoint from.
+
+        Returns
+        -------
+        BacktestCheckpoint
+
+        Raises
+        ------
+        TypeError
+            If the file does not hold a `BacktestCheckpoint`.
+
+        """
+        with open(path, "rb") as f:
+            checkpoint = pickle.load(f)
+
+        PyCondition.type(checkpoint, BacktestCheckpoint, "checkpoint")
+        return checkpoint
+
+    def restore(self) -> BacktestEngine:
+        """
+        Build the engine and run it up to the checkpoint timestamp.
+
+        The engine is left in `streaming` mode, so the run can be resumed with
+        `BacktestEngine.run(start=checkpoint.ts_checkpoint + 1, ...)`.
+
+        Returns
+        -------
+        BacktestEngine
+
+        """
+        engine = self.setup()
+        engine.run(end=self.ts_checkpoint, streaming=True)
+        return engine
+
+    def run(
+        self,
+        funcs: list[Callable[[BacktestEngine], Any]],
+        max_workers: int | None = None,
+    ) -> list[Any]:
+        """
+        Run each of the given functions on an engine restored from the checkpoint.
+
+        Each function is called in its own spawned process, with the engine
+        restored from the checkpoint in that process.
+
+        Parameters
+        ----------
+        funcs : list[Callable[[BacktestEngine], Any]]
+            The functions to call with a restored engine (such as resuming with
+            `run(...)` for a parameter variant). The functions and their return
+            values must be picklable.
+        max_workers : int, optional
+            The maximum number of worker processes. If ``None`` then defaults to
+            the number of functions.
+
+        Returns
+        -------
+        list[Any]
+            The return value of each function, in the order given.
+
+        Raises
+        ------
+        ValueError
+            If `funcs` is empty.
+        ValueError
+            If `max_workers` is not positive (> 0).
+        Exception
+            Any exception raised by a function in its worker process.
+
+        """
+        PyCondition.not_empty(funcs, "funcs")
+        if max_workers is not None:
+            PyCondition.positive_int(max_workers, "max_workers")
+
+        # Use spawned processes, as the Rust runtime and logging are not fork safe
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers or len(funcs), len(funcs)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures = [executor.submit(_run_from_checkpoint, self, func) for func in funcs]
+            return [future.result() for future in futures]
+
+
+def _run_from_checkpoint(
+    checkpoint: BacktestCheckpoint,
+    func: Callable[[BacktestEngine], Any],
+) -> Any:
+    engine = checkpoint.restore()
+    try:
+        return func(engine)
+    finally:
+        engine.dispose()
@@ -125,6 +125,26 @@ class BacktestDataConfig(NautilusConfig, frozen=True):
         else:
             return self.data_cls
 
+    @property
+    def bar_type(self) -> str | None:
+        """
+        Return the bar type for the configuration.
+
+        The `bar_spec` may include the aggregation source (such as
+        '1-MINUTE-LAST-INTERNAL'), otherwise the bars are assumed to be aggregated
+        externally.
+
+        Returns
+        -------
+        str or ``None``
+
+        """
+        if not self.bar_spec:
+            return None
+        if self.bar_spec.upper().endswith(("-EXTERNAL", "-INTERNAL")):
+            return f"{self.instrument_id}-{self.bar_spec}"
+        return f"{self.instrument_id}-{self.bar_spec}-EXTERNAL"
+
     @property
     def query(self) -> dict[str, Any]:
         """
@@ -136,8 +156,7 @@ class BacktestDataConfig(NautilusConfig, frozen=True):
 
         """
         if self.data_cls is Bar and self.bar_spec:
-            bar_type = f"{self.instrument_id}-{self.bar_spec}-EXTERNAL"
-            filter_expr: str | None = f'field("bar_type") == "{bar_type}"'
+            filter_expr: str | None = f'field("bar_type") == "{self.bar_type}"'
         else:
             filter_expr = self.filter_expr
 
@@ -19,11 +19,48 @@ from libc.stdint cimport uint64_t
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Logger
+from nautilus_trader.common.component cimport TestClockGroup
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.rust.backtest cimport TimeEventAccumulatorAPI
 from nautilus_trader.core.rust.core cimport CVec
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.data.engine cimport DataEngine
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport Venue
+
+
+cdef class BacktestDataStream:
+    cdef list _data
+    cdef object _source
+    cdef const uint64_t[::1] _ts_inits
+    cdef list _chunk
+    cdef uint64_t _chunk_len
+    cdef uint64_t _cursor
+
+    cdef void reset(self)
+    cdef void seek(self, uint64_t ts_init)
+    cdef void limit(self, uint64_t ts_init)
+    cdef void _build_index(self)
+    cdef Data current(self)
+    cdef bint advance(self)
+    cdef bint _load_next_chunk(self)
+
+
+cdef class BacktestDataIterator:
+    cdef list[BacktestDataStream] _streams
+    cdef list _heap
+
+    cpdef void add_data(self, list data)
+    cpdef void add_iterator(self, iterator)
+    cpdef void clear(self)
+    cpdef void reset(self)
+    cpdef void set_window(self, uint64_t start_ns, uint64_t end_ns)
+    cpdef list data(self)
+    cpdef bint is_resident(self)
+    cdef uint64_t last_ts_init(self)
+    cdef Data peek(self)
+    cdef Data next(self)
+    cdef void _build_heap(self)
 
 
 cdef class BacktestEngine:
@@ -43,12 +80,29 @@ cdef class BacktestEngine:
     cdef datetime _backtest_end
 
     cdef dict[Venue, SimulatedExchange] _venues
-    cdef list[Data] _data
-    cdef uint64_t _data_len
-    cdef uint64_t _index
+    cdef list[SimulatedExchange] _exchanges
+    cdef dict[InstrumentId, SimulatedExchange] _instrument_exchanges
+    cdef dict[SimulatedExchange, uint64_t] _exchange_indices
+    cdef list _exchange_queue
+    cdef dict[SimulatedExchange, uint64_t] _exchange_pending
+    cdef uint64_t _exchange_sequence
+    cdef BacktestDataIterator _data_iterator
     cdef uint64_t _iteration
+    cdef TestClockGroup _clock_group
 
-    cdef Data _next(self)
+    cdef void _run_linked(
+        self,
+        start,
+        end,
+        uint64_t start_ns,
+        uint64_t end_ns,
+        str run_config_id,
+    )
+    cdef Data _next(self, uint64_t end_ns)
+    cdef SimulatedExchange _route(self, InstrumentId instrument_id)
+    cdef void _process_venue_data(self, Data data)
+    cdef void _schedule_exchange(self, SimulatedExchange exchange)
+    cdef void _process_exchanges(self, uint64_t ts_now)
     cdef CVec _advance_time(self, uint64_t ts_now)
     cdef void _process_raw_time_event_handlers(
         self,
@@ -15,7 +15,14 @@
 
 import pickle
 from decimal import Decimal
-
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+from heapq import heapreplace
+from heapq import merge
+from operator import attrgetter
+
+import numpy as np
 import pandas as pd
 
 from nautilus_trader.accounting.error import AccountError
@@ -35,6 +42,7 @@ from nautilus_trader.trading.trader import Trader
 
 from cpython.datetime cimport datetime
 from cpython.object cimport PyObject
+from libc.stdint cimport UINT64_MAX
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.backtest.data_client cimport BacktestDataClient
@@ -51,14 +59,16 @@ from nautilus_trader.common.actor cimport Actor
 from nautilus_trader.common.component cimport LiveClock
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport TestClock
+from nautilus_trader.common.component cimport TestClockGroup
 from nautilus_trader.common.component cimport TimeEvent
 from nautilus_trader.common.component cimport TimeEventHandler
-from nautilus_trader.common.component cimport get_component_clocks
+from nautilus_trader.common.component cimport link_component_clocks
 from nautilus_trader.common.component cimport log_level_from_str
 from nautilus_trader.common.component cimport log_sysinfo
 from nautilus_trader.common.component cimport set_logging_clock_realtime_mode
 from nautilus_trader.common.component cimport set_logging_clock_static_mode
 from nautilus_trader.common.component cimport set_logging_clock_static_time
+from nautilus_trader.common.component cimport unlink_component_clocks
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.datetime cimport maybe_dt_to_unix_nanos
@@ -98,6 +108,42 @@ from nautilus_trader.portfolio.base cimport PortfolioFacade
 from nautilus_trader.trading.strategy cimport Strategy
 
 
+cdef enum:
+    _HANDLER_UNRESOLVED = -1
+    _HANDLER_NONE = 0
+    _HANDLER_ORDER_BOOK_DELTA = 1
+    _HANDLER_ORDER_BOOK_DELTAS = 2
+    _HANDLER_QUOTE_TICK = 3
+    _HANDLER_TRADE_TICK = 4
+    _HANDLER_BAR = 5
+    _HANDLER_INSTRUMENT_CLOSE = 6
+    _HANDLER_INSTRUMENT_STATUS = 7
+
+
+# Fixed venue handler per data type (dispatched on exact type, rather than an `isinstance` chain)
+cdef dict _VENUE_DATA_HANDLERS = {
+    OrderBookDelta: _HANDLER_ORDER_BOOK_DELTA,
+    OrderBookDeltas: _HANDLER_ORDER_BOOK_DELTAS,
+    QuoteTick: _HANDLER_QUOTE_TICK,
+    TradeTick: _HANDLER_TRADE_TICK,
+    Bar: _HANDLER_BAR,
+    InstrumentClose: _HANDLER_INSTRUMENT_CLOSE,
+    InstrumentStatus: _HANDLER_INSTRUMENT_STATUS,
+}
+
+
+cdef int _resolve_venue_data_handler(type data_cls):
+    # Resolve the handler for a data type not yet seen (such as a subclass), then cache
+    cdef int handler = _HANDLER_NONE
+    for base_cls, base_handler in list(_VENUE_DATA_HANDLERS.items()):
+        if issubclass(data_cls, base_cls):
+            handler = base_handler
+            break
+
+    _VENUE_DATA_HANDLERS[data_cls] = handler
+    return handler
+
+
 cdef class BacktestEngine:
     """
     Provides a backtest engine to run a portfolio of strategies over historical
@@ -130,9 +176,13 @@ cdef class BacktestEngine:
 
         # Venues and data
         self._venues: dict[Venue, SimulatedExchange] = {}
-        self._data: list[Data] = []
-        self._data_len: uint64_t = 0
-        self._index: uint64_t = 0
+        self._exchanges: list[SimulatedExchange] = []
+        self._instrument_exchanges: dict[InstrumentId, SimulatedExchange] = {}
+        self._exchange_indices: dict[SimulatedExchange, int] = {}
+        self._exchange_queue: list[tuple[int, int, SimulatedExchange]] = []
+        self._exchange_pending: dict[SimulatedExchange, int] = {}  # Exchange -> scheduled time (ns)
+        self._exchange_sequence: uint64_t = 0
+        self._data_iterator = BacktestDataIterator()
         self._iteration: uint64_t = 0
 
         # Timing
@@ -327,12 +377,15 @@ cdef class BacktestEngine:
         """
         Return the engines internal data stream.
 
+        Data added through `add_data_iterator()` is not included, as it is only
+        loaded lazily during a run.
+
         Returns
         -------
         list[Data]
 
         """
-        return self._data.copy()
+        return self._data_iterator.data()
 
     @property
     def portfolio(self) -> PortfolioFacade:
@@ -485,6 +538,10 @@ cdef class BacktestEngine:
         )
 
         self._venues[venue] = exchange
+        self._exchange_indices[exchange] = len(self._exchanges)
+        self._exchanges.append(exchange)
+        exchange.register_pending_handler(self._on_exchange_pending)
+        self._schedule_exchange(exchange)
 
         # Create execution client for exchange
         exec_client = BacktestExecClient(
@@ -566,7 +623,8 @@ cdef class BacktestEngine:
 
         # Add data
         self.kernel.data_engine.process(instrument)  # Adds to cache
-        self._venues[instrument.id.venue].add_instrument(instrument)
+        venue.add_instrument(instrument)
+        self._instrument_exchanges[instrument.id] = venue
 
         self._log.info(f"Added {instrument.id} Instrument")
 
@@ -590,7 +648,7 @@ cdef class BacktestEngine:
             If `data` should be validated
             (recommended when adding data directly to the engine).
         sort : bool, default True
-            If `data` should be sorted by `ts_init` with the rest of the stream after adding
+            If `data` should be sorted by `ts_init` prior to being added as a stream
             (recommended when adding data directly to the engine).
 
         Raises
@@ -614,6 +672,11 @@ cdef class BacktestEngine:
         Caution if adding data without `sort` being True, as this could lead to running backtests
         on a stream which does not have monotonically increasing timestamps.
 
+        Notes
+        -----
+        Each call adds `data` as a separate stream, which is merged lazily with all other
+        streams on `ts_init` during a run (the existing streams are not re-sorted).
+
         """
         Condition.not_empty(data, "data")
         Condition.list_type(data, Data, "data")
@@ -659,15 +722,52 @@ cdef class BacktestEngine:
                     data_added_str = f"{type(first.data).__name__} "
 
         # Add data
-        self._data.extend(data)
-
         if sort:
-            self._data = sorted(self._data, key=lambda x: x.ts_init)
+            data = sorted(data, key=lambda x: x.ts_init)
+
+        self._data_iterator.add_data(data)
 
         self._log.info(
             f"Added {len(data):,} {data_added_str} element{'' if len(data) == 1 else 's'}",
         )
 
+    def add_data_iterator(
+        self,
+        iterator,
+        ClientId client_id = None,
+    ) -> None:
+        """
+        Add the given data iterator to the backtest engine as a lazily loaded stream.
+
+        The iterator may yield either `Data` objects, or lists of `Data` objects
+        (such as chunks from a catalog query), and will only be consumed as the
+        backtest runs. This keeps memory bounded by the number of streams rather than
+        the number of events.
+
+        Parameters
+        ----------
+        iterator : Iterator[Data | list[Data]]
+            The data iterator to add.
+        client_id : ClientId, optional
+            The data client ID to associate with custom data.
+
+        Warnings
+        --------
+        The data yielded by the iterator must be sorted by `ts_init`, and is not
+        validated. An iterator stream is consumed once and cannot be rewound for
+        subsequent runs.
+
+        """
+        Condition.not_none(iterator, "iterator")
+
+        if client_id is not None:
+            # Check client has been registered
+            self._add_data_client_if_not_exists(client_id)
+
+        self._data_iterator.add_iterator(iterator)
+
+        self._log.info("Added data iterator stream")
+
     def dump_pickled_data(self) -> bytes:
         """
         Return the internal data stream pickled.
@@ -677,7 +777,7 @@ cdef class BacktestEngine:
         bytes
 
         """
-        return pickle.dumps(self._data)
+        return pickle.dumps(self._data_iterator.data())
 
     def load_pickled_data(self, bytes data) -> None:
         """
@@ -697,10 +797,12 @@ cdef class BacktestEngine:
         """
         Condition.not_none(data, "data")
 
-        self._data = pickle.loads(data)
+        cdef list loaded = pickle.loads(data)
+        self._data_iterator.clear()
+        self._data_iterator.add_data(loaded)
 
         self._log.info(
-            f"Loaded {len(self._data):,} data "
+            f"Loaded {len(loaded):,} data "
             f"element{'' if len(data) == 1 else 's'} from pickle",
         )
 
@@ -823,13 +925,17 @@ cdef class BacktestEngine:
         for exchange in self._venues.values():
             exchange.reset()
 
+        self._exchange_queue.clear()
+        self._exchange_pending.clear()
+        for exchange in self._exchanges:
+            self._schedule_exchange(exchange)
+
         # Reset run IDs
         self._run_config_id = None
         self._run_id = None
 
         # Reset timing
         self._iteration = 0
-        self._index = 0
         self._run_started = None
         self._run_finished = None
         self._backtest_start = None
@@ -844,9 +950,7 @@ cdef class BacktestEngine:
         Does not clear added instruments.
 
         """
-        self._data.clear()
-        self._data_len = 0
-        self._index = 0
+        self._data_iterator.clear()
 
     def clear_actors(self) -> None:
         """
@@ -952,6 +1056,7 @@ cdef class BacktestEngine:
             # Process remaining messages
             for exchange in self._venues.values():
                 exchange.process(self.kernel.clock.timestamp_ns())
+                self._schedule_exchange(exchange)
         except AccountError:
             pass
 
@@ -988,7 +1093,7 @@ cdef class BacktestEngine:
             backtest_start=maybe_dt_to_unix_nanos(self._backtest_start),
             backtest_end=maybe_dt_to_unix_nanos(self._backtest_end),
             elapsed_time=(self._backtest_end - self._backtest_start).total_seconds(),
-            iterations=self._index,
+            iterations=self._iteration,
             total_events=self._kernel.exec_engine.event_count,
             total_orders=self._kernel.cache.orders_total_count(),
             total_positions=self._kernel.cache.positions_total_count(),
@@ -1002,31 +1107,52 @@ cdef class BacktestEngine:
         end: datetime | str | int | None = None,
         run_config_id: str | None = None,
     ):
+        # Rewind the data stream to its start
+        self._data_iterator.reset()
+        cdef Data first = self._data_iterator.peek()
+        Condition.true(first is not None, "No data has been added to the engine")
+
         cdef uint64_t start_ns
         cdef uint64_t end_ns
         # Time range check and set
         if start is None:
             # Set `start` to start of data
-            start_ns = self._data[0].ts_init
+            start_ns = first.ts_init
             start = unix_nanos_to_dt(start_ns)
         else:
             start = pd.to_datetime(start, utc=True)
             start_ns = start.value
         if end is None:
-            # Set `end` to end of data
-            end_ns = self._data[-1].ts_init
-            end = unix_nanos_to_dt(end_ns)
+            if self._data_iterator.is_resident():
+                # Set `end` to end of data
+                end_ns = self._data_iterator.last_ts_init()
+                end = unix_nanos_to_dt(end_ns)
+            else:
+                # End of lazily loaded data is unknown until consumed
+                end_ns = UINT64_MAX
         else:
             end = pd.to_datetime(end, utc=True)
             end_ns = end.value
         Condition.true(start_ns < end_ns, "start was >= end")
-        Condition.not_empty(self._data, "data")
 
-        # Set clocks
-        cdef TestClock clock
-        for clock in get_component_clocks(self._instance_id):
-            clock.set_time(start_ns)
+        # Link clocks to a shared time source and timer queue for the run
+        self._clock_group = link_component_clocks(self._instance_id)
+        self._clock_group.set_time(start_ns)
+
+        try:
+            self._run_linked(start, end, start_ns, end_ns, run_config_id)
+        finally:
+            unlink_component_clocks(self._instance_id)
+            self._clock_group = None
 
+    cdef void _run_linked(
+        self,
+        start,
+        end,
+        uint64_t start_ns,
+        uint64_t end_ns,
+        str run_config_id,
+    ):
         cdef SimulatedExchange exchange
         if self._iteration == 0:
             # Initialize run
@@ -1062,64 +1188,32 @@ cdef class BacktestEngine:
 
         self._log_run(start, end)
 
-        # Set data stream length
-        self._data_len = len(self._data)
-
-        # Set starting index
-        cdef uint64_t i
-        for i in range(self._data_len):
-            if start_ns <= self._data[i].ts_init:
-                self._index = i
-                break
+        # Position data stream at the time window (bisects resident streams)
+        self._data_iterator.set_window(start_ns, end_ns)
 
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
         cdef bint force_stop = False
         cdef uint64_t last_ns = 0
         cdef uint64_t raw_handlers_count = 0
-        cdef Data data = self._next()
+        cdef Data data = self._next(end_ns)
         cdef CVec raw_handlers
-        cdef SimulatedExchange venue
         try:
             while data is not None:
-                if data.ts_init > end_ns:
-                    # End of backtest
-                    break
                 if data.ts_init > last_ns:
                     # Advance clocks to the next data time
                     raw_handlers = self._advance_time(data.ts_init)
                     raw_handlers_count = raw_handlers.len
 
                 # Process data through venue
-                if isinstance(data, OrderBookDelta):
-                    venue = self._venues[data.instrument_id.venue]
-                    venue.process_order_book_delta(data)
-                elif isinstance(data, OrderBookDeltas):
-                    venue = self._venues[data.instrument_id.venue]
-                    venue.process_order_book_deltas(data)
-                elif isinstance(data, QuoteTick):
-                    venue = self._venues[data.instrument_id.venue]
-                    venue.process_quote_tick(data)
-                elif isinstance(data, TradeTick):
-                    venue = self._venues[data.instrument_id.venue]
-                    venue.process_trade_tick(data)
-                elif isinstance(data, Bar):
-                    venue = self._venues[data.bar_type.instrument_id.venue]
-                    venue.process_bar(data)
-                elif isinstance(data, InstrumentClose):
-                    venue = self._venues[data.instrument_id.venue]
-                    venue.process_instrument_close(data)
-                elif isinstance(data, InstrumentStatus):
-                    venue = self._venues[data.instrument_id.venue]
-                    venue.process_instrument_status(data)
+                self._process_venue_data(data)
 
                 self._data_engine.process(data)
 
                 # Process all exchange messages
-                for exchange in self._venues.values():
-                    exchange.process(data.ts_init)
+                self._process_exchanges(data.ts_init)
 
                 last_ns = data.ts_init
-                data = self._next()
+                data = self._next(end_ns)
                 if data is None or data.ts_init > last_ns:
                     # Finally process the time events
                     self._process_raw_time_event_handlers(
@@ -1144,6 +1238,7 @@ cdef class BacktestEngine:
         # Process remaining messages
         for exchange in self._venues.values():
             exchange.process(self.kernel.clock.timestamp_ns())
+            self._schedule_exchange(exchange)
 
         # Process remaining time events
         if raw_handlers_count > 0:
@@ -1154,23 +1249,100 @@ cdef class BacktestEngine:
             )
             vec_time_event_handlers_drop(raw_handlers)
 
-    cdef Data _next(self):
-        cdef uint64_t cursor = self._index
-        self._index += 1
-        if cursor < self._data_len:
-            return self._data[cursor]
+    cdef Data _next(self, uint64_t end_ns):
+        cdef Data data = self._data_iterator.peek()
+        if data is None or data.ts_init > end_ns:
+            # End of backtest (data beyond `end_ns` remains in the stream)
+            return None
+
+        return self._data_iterator.next()
+
+    cdef SimulatedExchange _route(self, InstrumentId instrument_id):
+        cdef SimulatedExchange exchange = self._instrument_exchanges.get(instrument_id)
+        if exchange is None:
+            # Instrument not added through the engine (exchange will add from the cache)
+            exchange = self._venues[instrument_id.venue]
+            self._instrument_exchanges[instrument_id] = exchange
+
+        return exchange
+
+    cdef void _process_venue_data(self, Data data):
+        cdef int handler = _VENUE_DATA_HANDLERS.get(type(data), _HANDLER_UNRESOLVED)
+        if handler == _HANDLER_UNRESOLVED:
+            handler = _resolve_venue_data_handler(type(data))
+
+        if handler == _HANDLER_NONE:
+            return  # Not processed by venues
+        elif handler == _HANDLER_QUOTE_TICK:
+            self._route((<QuoteTick>data).instrument_id).process_quote_tick(data)
+        elif handler == _HANDLER_TRADE_TICK:
+            self._route((<TradeTick>data).instrument_id).process_trade_tick(data)
+        elif handler == _HANDLER_ORDER_BOOK_DELTAS:
+            self._route((<OrderBookDeltas>data).instrument_id).process_order_book_deltas(data)
+        elif handler == _HANDLER_ORDER_BOOK_DELTA:
+            self._route((<OrderBookDelta>data).instrument_id).process_order_book_delta(data)
+        elif handler == _HANDLER_BAR:
+            self._route((<Bar>data).bar_type.instrument_id).process_bar(data)
+        elif handler == _HANDLER_INSTRUMENT_CLOSE:
+            self._route((<InstrumentClose>data).instrument_id).process_instrument_close(data)
+        elif handler == _HANDLER_INSTRUMENT_STATUS:
+            self._route((<InstrumentStatus>data).instrument_id).process_instrument_status(data)
+
+    def _on_exchange_pending(self, SimulatedExchange exchange) -> None:
+        self._schedule_exchange(exchange)
+
+    cdef void _schedule_exchange(self, SimulatedExchange exchange):
+        cdef uint64_t ts_pending = exchange.next_pending_ns()
+        if ts_pending == UINT64_MAX:
+            self._exchange_pending.pop(exchange, None)
+            return  # Idle
+
+        if self._exchange_pending.get(exchange) == ts_pending:
+            return  # Already scheduled
+
+        # Entries superseded by a later schedule are skipped when popped
+        self._exchange_pending[exchange] = ts_pending
+        heappush(self._exchange_queue, (ts_pending, self._exchange_sequence, exchange))
+        self._exchange_sequence += 1
+
+    cdef void _process_exchanges(self, uint64_t ts_now):
+        # Only venues with work due at `ts_now` are processed (idle venues are never queued),
+        # all component clocks have already been advanced to `ts_now`.
+        if not self._exchange_queue or self._exchange_queue[0][0] > ts_now:
+            return
 
-    cdef CVec _advance_time(self, uint64_t ts_now):
-        cdef list[TestClock] clocks = get_component_clocks(self._instance_id)
+        cdef list due = []
+        cdef tuple entry
+        cdef SimulatedExchange exchange
+        while self._exchange_queue and self._exchange_queue[0][0] <= ts_now:
+            entry = heappop(self._exchange_queue)
+            exchange = entry[2]
+            if self._exchange_pending.get(exchange) != entry[0]:
+                continue  # Stale entry
+            del self._exchange_pending[exchange]
+            due.append(exchange)
+
+        if len(due) > 1:
+            # Process venues in the order they were added
+            due.sort(key=self._exchange_indices.__getitem__)
+
+        for exchange in due:
+            exchange.process(ts_now)
+            self._schedule_exchange(exchange)
 
+    cdef CVec _advance_time(self, uint64_t ts_now):
+        # Only clocks with a timer due are advanced (the queue is keyed by next fire time)
         cdef TestClock clock
-        for clock in clocks:
-            time_event_accumulator_advance_clock(
-                &self._accumulator,
-                &clock._mem,
-                ts_now,
-                False,
-            )
+        if self._clock_group.next_time() <= ts_now:
+            for clock in self._clock_group.pop_due(ts_now):
+                clock._sync_time()
+                time_event_accumulator_advance_clock(
+                    &self._accumulator,
+                    &clock._mem,
+                    ts_now,
+                    False,
+                )
+                self._clock_group.schedule(clock)
 
         cdef CVec raw_handlers = time_event_accumulator_drain(&self._accumulator)
 
@@ -1183,8 +1355,7 @@ cdef class BacktestEngine:
 
         # Set all clocks to now
         set_logging_clock_static_time(ts_now)
-        for clock in clocks:
-            clock.set_time(ts_now)
+        self._clock_group.set_time(ts_now)
 
         # Return all remaining events to be handled (at `ts_now`)
         return raw_handlers
@@ -1202,7 +1373,6 @@ cdef class BacktestEngine:
             uint64_t ts_last_init = 0
             TimeEventHandler_t raw_handler
             TimeEvent event
-            TestClock clock
             PyObject *raw_callback
             object callback
             SimulatedExchange exchange
@@ -1214,8 +1384,7 @@ cdef class BacktestEngine:
 
             # Set all clocks to event timestamp
             set_logging_clock_static_time(ts_event_init)
-            for clock in get_component_clocks(self._instance_id):
-                clock.set_time(ts_event_init)
+            self._clock_group.set_time(ts_event_init)
 
             event = TimeEvent.from_mem_c(raw_handler.event)
 
@@ -1227,8 +1396,7 @@ cdef class BacktestEngine:
             if ts_event_init != ts_last_init:
                 # Process exchange messages
                 ts_last_init = ts_event_init
-                for exchange in self._venues.values():
-                    exchange.process(ts_event_init)
+                self._process_exchanges(ts_event_init)
 
     def _get_log_color_code(self):
         return "\033[36m" if logging_is_colored() else ""
@@ -1405,3 +1573,353 @@ cdef class BacktestEngine:
                 clock=self._kernel.clock,
             )
             self._kernel.data_engine.register_client(client)
+
+
+cdef class BacktestDataStream:
+    """
+    Provides a single stream of data sorted by `ts_init` for a `BacktestDataIterator`.
+
+    A stream is either resident (backed by a list which can be rewound), or lazily
+    loaded from an iterator yielding `Data` objects or lists of `Data` objects (chunks),
+    in which case only the current chunk is held in memory.
+
+    Resident streams hold a packed `uint64` index of `ts_init` values (built on first
+    use), so time windows are located by bisection rather than by scanning the data.
+
+    Parameters
+    ----------
+    source : list[Data] or Iterator[Data | list[Data]]
+        The data source for the stream (must be sorted by `ts_init`).
+
+    """
+
+    def __init__(self, source not None) -> None:
+        if isinstance(source, list):
+            self._data = source
+            self._source = None
+        else:
+            self._data = None
+            self._source = iter(source)
+
+        self._ts_inits = None
+        self._chunk = None
+        self._chunk_len = 0
+        self._cursor = 0
+
+        self.reset()
+
+    @property
+    def is_resident(self) -> bool:
+        """
+        Return whether the stream is resident (can be rewound).
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._data is not None
+
+    @property
+    def ts_inits(self):
+        """
+        Return the packed `ts_init` index for the stream (``None`` if not resident).
+
+        Returns
+        -------
+        np.ndarray[uint64] or ``None``
+
+        """
+        if self._data is None:
+            return None
+
+        self._build_index()
+        return np.asarray(self._ts_inits)
+
+    cdef void reset(self):
+        if self._data is not None:
+            self._chunk = self._data
+            self._chunk_len = len(self._data)
+            self._cursor = 0
+        elif self._chunk is None:
+            # Load first chunk (an iterator stream cannot be rewound)
+            self._load_next_chunk()
+
+    cdef void seek(self, uint64_t ts_init):
+        if self._data is not None:
+            self._build_index()
+            self._cursor = _bisect_left(self._ts_inits, ts_init, self._cursor, self._chunk_len)
+            return
+
+        cdef Data data = self.current()
+        while data is not None and data.ts_init < ts_init:
+            self.advance()
+            data = self.current()
+
+    cdef void limit(self, uint64_t ts_init):
+        if self._data is None:
+            return  # Bounded by the caller as data is loaded
+
+        self._build_index()
+        self._chunk_len = _bisect_right(self._ts_inits, ts_init, self._cursor, self._chunk_len)
+
+    cdef void _build_index(self):
+        if self._ts_inits is not None:
+            return
+
+        self._ts_inits = np.fromiter(
+            map(attrgetter("ts_init"), self._data),
+            dtype=np.uint64,
+            count=len(self._data),
+        )
+
+    cdef Data current(self):
+        if self._cursor < self._chunk_len:
+            return self._chunk[self._cursor]
+
+        return None  # Stream exhausted
+
+    cdef bint advance(self):
+        self._cursor += 1
+        if self._cursor < self._chunk_len:
+            return True
+
+        if self._source is None:
+            return False
+
+        return self._load_next_chunk()
+
+    cdef bint _load_next_chunk(self):
+        for item in self._source:
+            if isinstance(item, Data):
+                self._chunk = [item]
+            elif item:
+                self._chunk = item
+            else:
+                continue  # Empty chunk
+
+            self._chunk_len = len(self._chunk)
+            self._cursor = 0
+            return True
+
+        # Source exhausted
+        self._chunk = []
+        self._chunk_len = 0
+        self._cursor = 0
+        return False
+
+
+cdef class BacktestDataIterator:
+    """
+    Provides a lazy k-way merge of multiple data streams on `ts_init`.
+
+    Each stream must already be sorted by `ts_init`, and only the head of each
+    stream is held on the internal heap, so the memory used by the merge is bounded
+    by the number of streams rather than the number of events. Data with equal
+    `ts_init` is yielded in the order the streams were added.
+    """
+
+    def __init__(self) -> None:
+        self._streams: list[BacktestDataStream] = []
+        self._heap: list[tuple[uint64_t, int]] = []
+
+    @property
+    def streams_count(self) -> int:
+        """
+        Return the count of data streams held by the iterator.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._streams)
+
+    cpdef void add_data(self, list data):
+        """
+        Add the given data as a resident stream.
+
+        Parameters
+        ----------
+        data : list[Data]
+            The data for the stream (must be sorted by `ts_init`).
+
+        """
+        Condition.not_none(data, "data")
+
+        self._streams.append(BacktestDataStream(data))
+        self._build_heap()
+
+    cpdef void add_iterator(self, iterator):
+        """
+        Add the given iterator as a lazily loaded stream.
+
+        Parameters
+        ----------
+        iterator : Iterator[Data | list[Data]]
+            The iterator for the stream (must yield data sorted by `ts_init`).
+
+        """
+        Condition.not_none(iterator, "iterator")
+
+        self._streams.append(BacktestDataStream(iterator))
+        self._build_heap()
+
+    cpdef void clear(self):
+        """
+        Clear all data streams from the iterator.
+
+        """
+        self._streams.clear()
+        self._heap.clear()
+
+    cpdef void reset(self):
+        """
+        Reset the iterator to the start of all resident streams.
+
+        Iterator streams are not rewound, and continue from their current position.
+
+        """
+        cdef BacktestDataStream stream
+        for stream in self._streams:
+            stream.reset()
+
+        self._build_heap()
+
+    cpdef void set_window(self, uint64_t start_ns, uint64_t end_ns):
+        """
+        Reset the iterator to the given time window (inclusive of both bounds).
+
+        Resident streams are rewound and positioned by bisection, so repeated calls
+        for many windows over the same data do not rescan the streams. Iterator
+        streams are advanced to `start_ns`, with `end_ns` to be enforced by the caller.
+
+        Parameters
+        ----------
+        start_ns : uint64_t
+            The UNIX timestamp (nanoseconds) for the window start.
+        end_ns : uint64_t
+            The UNIX timestamp (nanoseconds) for the window end.
+
+        """
+        cdef BacktestDataStream stream
+        for stream in self._streams:
+            stream.reset()
+            stream.seek(start_ns)
+            stream.limit(end_ns)
+
+        self._build_heap()
+
+    cpdef list data(self):
+        """
+        Return the data of all resident streams merged on `ts_init`.
+
+        Returns
+        -------
+        list[Data]
+
+        """
+        cdef BacktestDataStream stream
+        return list(merge(
+            *[stream._data for stream in self._streams if stream._data is not None],
+            key=attrgetter("ts_init"),
+        ))
+
+    cpdef bint is_resident(self):
+        """
+        Return whether all streams held by the iterator are resident.
+
+        Returns
+        -------
+        bool
+
+        """
+        cdef BacktestDataStream stream
+        for stream in self._streams:
+            if stream._data is None:
+                return False
+
+        return True
+
+    cdef uint64_t last_ts_init(self):
+        cdef uint64_t last_ts_init = 0
+        cdef BacktestDataStream stream
+        cdef Data last
+        for stream in self._streams:
+            if not stream._data:
+                continue
+            last = stream._data[-1]
+            if last.ts_init > last_ts_init:
+                last_ts_init = last.ts_init
+
+        return last_ts_init
+
+    cdef Data peek(self):
+        if not self._heap:
+            return None
+
+        cdef BacktestDataStream stream = self._streams[self._heap[0][1]]
+        return stream.current()
+
+    cdef Data next(self):
+        if not self._heap:
+            return None
+
+        cdef int stream_index = self._heap[0][1]
+        cdef BacktestDataStream stream = self._streams[stream_index]
+        cdef Data data = stream.current()
+
+        if stream.advance():
+            heapreplace(self._heap, (stream.current().ts_init, stream_index))
+        else:
+            heappop(self._heap)  # Stream exhausted
+
+        return data
+
+    cdef void _build_heap(self):
+        self._heap.clear()
+
+        cdef:
+            int i
+            BacktestDataStream stream
+            Data data
+        for i, stream in enumerate(self._streams):
+            data = stream.current()
+            if data is not None:
+                self._heap.append((data.ts_init, i))
+
+        heapify(self._heap)
+
+
+cdef inline uint64_t _bisect_left(
+    const uint64_t[::1] values,
+    uint64_t value,
+    uint64_t lo,
+    uint64_t hi,
+):
+    cdef uint64_t mid
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if values[mid] < value:
+            lo = mid + 1
+        else:
+            hi = mid
+
+    return lo
+
+
+cdef inline uint64_t _bisect_right(
+    const uint64_t[::1] values,
+    uint64_t value,
+    uint64_t lo,
+    uint64_t hi,
+):
+    cdef uint64_t mid
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if value < values[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+
+    return lo
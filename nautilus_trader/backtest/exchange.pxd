@@ -106,10 +106,12 @@ cdef class SimulatedExchange:
     cdef object _message_queue
     cdef list _inflight_queue
     cdef dict _inflight_counter
+    cdef object _pending_handler
 
 # -- REGISTRATION ---------------------------------------------------------------------------------
 
     cpdef void register_client(self, BacktestExecClient client)
+    cpdef void register_pending_handler(self, handler)
     cpdef void set_fill_model(self, FillModel fill_model)
     cpdef void set_latency_model(self, LatencyModel latency_model)
     cpdef void initialize_account(self)
@@ -140,6 +142,7 @@ cdef class SimulatedExchange:
     cpdef void process_bar(self, Bar bar)
     cpdef void process_instrument_close(self, InstrumentClose close)
     cpdef void process_instrument_status(self, InstrumentStatus data)
+    cpdef uint64_t next_pending_ns(self)
     cpdef void process(self, uint64_t ts_now)
     cpdef void reset(self)
 
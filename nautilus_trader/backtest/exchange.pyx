@@ -14,11 +14,14 @@
 # -------------------------------------------------------------------------------------------------
 
 from collections import deque
+from collections.abc import Callable
 from decimal import Decimal
+from heapq import heappop
 from heapq import heappush
 
 from nautilus_trader.common.config import InvalidConfiguration
 
+from libc.stdint cimport UINT64_MAX
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
@@ -230,6 +233,7 @@ cdef class SimulatedExchange:
         self._message_queue = deque()
         self._inflight_queue: list[tuple[(uint64_t, uint64_t), TradingCommand]] = []
         self._inflight_counter: dict[uint64_t, uint64_t] = {}
+        self._pending_handler = None
 
     def __repr__(self) -> str:
         return (
@@ -257,6 +261,22 @@ cdef class SimulatedExchange:
 
         self._log.info(f"Registered ExecutionClient-{client}")
 
+    cpdef void register_pending_handler(self, handler: Callable[[SimulatedExchange], None]):
+        """
+        Register the given handler to be called when a trading command is queued.
+
+        The handler is passed the exchange and can then query `next_pending_ns()`.
+
+        Parameters
+        ----------
+        handler : Callable[[SimulatedExchange], None]
+            The handler to register.
+
+        """
+        Condition.callable(handler, "handler")
+
+        self._pending_handler = handler
+
     cpdef void set_fill_model(self, FillModel fill_model):
         """
         Set the fill model for all matching engines.
@@ -626,11 +646,15 @@ cdef class SimulatedExchange:
 
         if not self.use_message_queue:
             self._process_trading_command(command)
+            return
         elif self.latency_model is None:
             self._message_queue.appendleft(command)
         else:
             heappush(self._inflight_queue, self.generate_inflight_command(command))
 
+        if self._pending_handler is not None:
+            self._pending_handler(self)
+
     cdef tuple generate_inflight_command(self, TradingCommand command):
         cdef uint64_t ts
         if isinstance(command, (SubmitOrder, SubmitOrderList)):
@@ -835,6 +859,25 @@ cdef class SimulatedExchange:
 
         matching_engine.process_instrument_close(close)
 
+    cpdef uint64_t next_pending_ns(self):
+        """
+        Return the earliest UNIX timestamp (nanoseconds) at which the exchange has pending work.
+
+        Queued commands and simulation modules are due on every call to `process`.
+
+        Returns
+        -------
+        uint64_t
+            Zero if work is due now, the timestamp of the next in-flight command,
+            otherwise `UINT64_MAX` if the exchange is idle.
+
+        """
+        if self._message_queue or self.modules:
+            return 0
+        if self._inflight_queue:
+            return self._inflight_queue[0][0][0]
+        return UINT64_MAX
+
     cpdef void process(self, uint64_t ts_now):
         """
         Process the exchange to the given time.
@@ -856,7 +899,7 @@ cdef class SimulatedExchange:
             ts = self._inflight_queue[0][0][0]
             if ts <= ts_now:
                 # Place message on queue to be processed
-                self._message_queue.appendleft(self._inflight_queue.pop(0)[1])
+                self._message_queue.appendleft(heappop(self._inflight_queue)[1])
                 self._inflight_counter.pop(ts, None)
             else:
                 break
@@ -121,6 +121,8 @@ cdef class OrderMatchingEngine:
     cdef int64_t _target_last
     cdef Bar _last_bid_bar
     cdef Bar _last_ask_bar
+    cdef TradeTick _bar_trade_tick
+    cdef QuoteTick _bar_quote_tick
 
     cdef int _position_count
     cdef int _order_count
@@ -151,6 +153,7 @@ cdef class OrderMatchingEngine:
     cpdef void process_instrument_close(self, InstrumentClose close)
     cdef void _process_trade_ticks_from_bar(self, Bar bar)
     cdef void _process_quote_ticks_from_bar(self)
+    cdef void _iterate_bar_leg(self, uint64_t timestamp_ns, bint first_leg)
 
 # -- TRADING COMMANDS -----------------------------------------------------------------------------
 
@@ -181,6 +184,7 @@ cdef class OrderMatchingEngine:
 # -- ORDER PROCESSING -----------------------------------------------------------------------------
 
     cpdef void iterate(self, uint64_t timestamp_ns)
+    cdef void _update_core_market(self)
     cpdef list determine_limit_price_and_volume(self, Order order)
     cpdef list determine_market_price_and_volume(self, Order order)
     cpdef void fill_market_order(self, Order order)
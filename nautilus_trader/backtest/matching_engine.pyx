@@ -53,8 +53,7 @@ from nautilus_trader.core.rust.model cimport orderbook_best_bid_price
 from nautilus_trader.core.rust.model cimport orderbook_has_ask
 from nautilus_trader.core.rust.model cimport orderbook_has_bid
 from nautilus_trader.core.rust.model cimport price_new
-from nautilus_trader.core.rust.model cimport trade_id_new
-from nautilus_trader.core.string cimport pystr_to_cstr
+from nautilus_trader.core.rust.model cimport quantity_new
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.execution.matching_core cimport MatchingCore
 from nautilus_trader.execution.messages cimport BatchCancelOrders
@@ -236,6 +235,8 @@ cdef class OrderMatchingEngine:
         self._has_targets = False
         self._last_bid_bar: Bar | None = None
         self._last_ask_bar: Bar | None = None
+        self._bar_trade_tick: TradeTick | None = None  # Reused for each bar
+        self._bar_quote_tick: QuoteTick | None = None  # Reused for each pair of bars
 
         self._position_count = 0
         self._order_count = 0
@@ -607,55 +608,62 @@ cdef class OrderMatchingEngine:
         #         )
 
     cdef void _process_trade_ticks_from_bar(self, Bar bar):
-        cdef Quantity size = Quantity(bar.volume.as_double() / 4.0, bar._mem.volume.precision)
-
-        # Create reusable tick
-        cdef TradeTick tick = TradeTick(
-            bar.bar_type.instrument_id,
-            bar.open,
-            size,
-            AggressorSide.BUYER if not self._core.is_last_initialized or bar._mem.open.raw > self._core.last_raw else AggressorSide.SELLER,
-            self._generate_trade_id(),
-            bar.ts_event,
-            bar.ts_event,
+        # Walk the OHLC path as trades over the raw prices, reusing a single tick
+        cdef TradeTick tick = self._bar_trade_tick
+        if tick is None:
+            tick = TradeTick(
+                bar.bar_type.instrument_id,
+                bar.open,
+                bar.volume,
+                AggressorSide.NO_AGGRESSOR,
+                TradeId(self._generate_trade_id_str()),  # Not used for matching
+                bar.ts_event,
+                bar.ts_event,
+            )
+            self._bar_trade_tick = tick
+
+        tick._mem.size = quantity_new(
+            Quantity.raw_to_f64_c(bar._mem.volume.raw) / 4.0,
+            bar._mem.volume.precision,
         )
+        tick._mem.ts_event = bar._mem.ts_event
+        tick._mem.ts_init = bar._mem.ts_event
+
+        cdef bint first_leg = True
 
         # Open
         if not self._core.is_last_initialized or bar._mem.open.raw != self._core.last_raw:  # Direct memory comparison
+            tick._mem.price = bar._mem.open  # Direct memory assignment
+            tick._mem.aggressor_side = AggressorSide.BUYER if not self._core.is_last_initialized or bar._mem.open.raw > self._core.last_raw else AggressorSide.SELLER
             self._book.update_trade_tick(tick)
-            self.iterate(tick.ts_init)
+            self._iterate_bar_leg(tick._mem.ts_init, first_leg)
             self._core.set_last_raw(bar._mem.open.raw)
-
-        cdef str trade_id_str  # Assigned below
+            first_leg = False
 
         # High
         if bar._mem.high.raw > self._core.last_raw:  # Direct memory comparison
             tick._mem.price = bar._mem.high  # Direct memory assignment
             tick._mem.aggressor_side = AggressorSide.BUYER  # Direct memory assignment
-            trade_id_str = self._generate_trade_id_str()
-            tick._mem.trade_id = trade_id_new(pystr_to_cstr(trade_id_str))
             self._book.update_trade_tick(tick)
-            self.iterate(tick.ts_init)
+            self._iterate_bar_leg(tick._mem.ts_init, first_leg)
             self._core.set_last_raw(bar._mem.high.raw)
+            first_leg = False
 
         # Low
         if bar._mem.low.raw < self._core.last_raw:  # Direct memory comparison
             tick._mem.price = bar._mem.low  # Direct memory assignment
             tick._mem.aggressor_side = AggressorSide.SELLER
-            trade_id_str = self._generate_trade_id_str()
-            tick._mem.trade_id = trade_id_new(pystr_to_cstr(trade_id_str))
             self._book.update_trade_tick(tick)
-            self.iterate(tick.ts_init)
+            self._iterate_bar_leg(tick._mem.ts_init, first_leg)
             self._core.set_last_raw(bar._mem.low.raw)
+            first_leg = False
 
         # Close
         if bar._mem.close.raw != self._core.last_raw:  # Direct memory comparison
             tick._mem.price = bar._mem.close  # Direct memory assignment
             tick._mem.aggressor_side = AggressorSide.BUYER if bar._mem.close.raw > self._core.last_raw else AggressorSide.SELLER
-            trade_id_str = self._generate_trade_id_str()
-            tick._mem.trade_id = trade_id_new(pystr_to_cstr(trade_id_str))
             self._book.update_trade_tick(tick)
-            self.iterate(tick.ts_init)
+            self._iterate_bar_leg(tick._mem.ts_init, first_leg)
             self._core.set_last_raw(bar._mem.close.raw)
 
     cdef void _process_quote_ticks_from_bar(self):
@@ -665,45 +673,66 @@ cdef class OrderMatchingEngine:
         if self._last_bid_bar.ts_event != self._last_ask_bar.ts_event:
             return  # Wait for next bar
 
-        cdef Quantity bid_size = Quantity(self._last_bid_bar.volume.as_double() / 4.0, self._last_bid_bar._mem.volume.precision)
-        cdef Quantity ask_size = Quantity(self._last_ask_bar.volume.as_double() / 4.0, self._last_ask_bar._mem.volume.precision)
-
-        # Create reusable tick
-        cdef QuoteTick tick = QuoteTick(
-            self._book.instrument_id,
-            self._last_bid_bar.open,
-            self._last_ask_bar.open,
-            bid_size,
-            ask_size,
-            self._last_bid_bar.ts_event,
-            self._last_ask_bar.ts_init,
+        # Walk the OHLC path as quotes over the raw prices, reusing a single tick
+        cdef QuoteTick tick = self._bar_quote_tick
+        if tick is None:
+            tick = QuoteTick(
+                self._book.instrument_id,
+                self._last_bid_bar.open,
+                self._last_ask_bar.open,
+                self._last_bid_bar.volume,
+                self._last_ask_bar.volume,
+                self._last_bid_bar.ts_event,
+                self._last_ask_bar.ts_init,
+            )
+            self._bar_quote_tick = tick
+
+        tick._mem.bid_size = quantity_new(
+            Quantity.raw_to_f64_c(self._last_bid_bar._mem.volume.raw) / 4.0,
+            self._last_bid_bar._mem.volume.precision,
         )
+        tick._mem.ask_size = quantity_new(
+            Quantity.raw_to_f64_c(self._last_ask_bar._mem.volume.raw) / 4.0,
+            self._last_ask_bar._mem.volume.precision,
+        )
+        tick._mem.ts_event = self._last_bid_bar._mem.ts_event
+        tick._mem.ts_init = self._last_ask_bar._mem.ts_init
 
         # Open
+        tick._mem.bid_price = self._last_bid_bar._mem.open  # Direct memory assignment
+        tick._mem.ask_price = self._last_ask_bar._mem.open  # Direct memory assignment
         self._book.update_quote_tick(tick)
-        self.iterate(tick.ts_init)
+        self._iterate_bar_leg(tick._mem.ts_init, True)
 
         # High
         tick._mem.bid_price = self._last_bid_bar._mem.high  # Direct memory assignment
         tick._mem.ask_price = self._last_ask_bar._mem.high  # Direct memory assignment
         self._book.update_quote_tick(tick)
-        self.iterate(tick.ts_init)
+        self._iterate_bar_leg(tick._mem.ts_init, False)
 
         # Low
         tick._mem.bid_price = self._last_bid_bar._mem.low  # Assigning memory directly
         tick._mem.ask_price = self._last_ask_bar._mem.low  # Assigning memory directly
         self._book.update_quote_tick(tick)
-        self.iterate(tick.ts_init)
+        self._iterate_bar_leg(tick._mem.ts_init, False)
 
         # Close
         tick._mem.bid_price = self._last_bid_bar._mem.close  # Assigning memory directly
         tick._mem.ask_price = self._last_ask_bar._mem.close  # Assigning memory directly
         self._book.update_quote_tick(tick)
-        self.iterate(tick.ts_init)
+        self._iterate_bar_leg(tick._mem.ts_init, False)
 
         self._last_bid_bar = None
         self._last_ask_bar = None
 
+    cdef void _iterate_bar_leg(self, uint64_t timestamp_ns, bint first_leg):
+        if first_leg or self._core.has_orders():
+            self.iterate(timestamp_ns)
+        else:
+            # No resting orders to match, so only the market moves (time, order
+            # expiry and instrument expiration were handled by the first leg)
+            self._update_core_market()
+
 # -- TRADING COMMANDS -----------------------------------------------------------------------------
 
     cpdef void process_order(self, Order order, AccountId account_id):
@@ -1309,44 +1338,30 @@ cdef class OrderMatchingEngine:
 
         """
         self._clock.set_time(timestamp_ns)
-
-        cdef Price_t bid
-        cdef Price_t ask
-
-        if orderbook_has_bid(&self._book._mem):
-            bid = orderbook_best_bid_price(&self._book._mem)
-            self._core.set_bid_raw(bid.raw)
-        if orderbook_has_ask(&self._book._mem):
-            ask = orderbook_best_ask_price(&self._book._mem)
-            self._core.set_ask_raw(ask.raw)
-
+        self._update_core_market()
         self._core.iterate(timestamp_ns)
 
-        cdef list orders = self._core.get_orders()
         cdef Order order
-        for order in orders:
-            if order.is_closed_c():
+        if self._support_gtd_orders:
+            for order in self._core.get_orders_expired(timestamp_ns):
+                self._core.delete_order(order)
                 self._cached_filled_qty.pop(order.client_order_id, None)
-                continue
-
-            # Check expiry
-            if self._support_gtd_orders:
-                if order.expire_time_ns > 0 and timestamp_ns >= order.expire_time_ns:
-                    self._core.delete_order(order)
-                    self._cached_filled_qty.pop(order.client_order_id, None)
-                    self.expire_order(order)
+                if order.is_closed_c():
                     continue
+                self.expire_order(order)
 
-            # Manage trailing stop
-            if order.order_type == OrderType.TRAILING_STOP_MARKET or order.order_type == OrderType.TRAILING_STOP_LIMIT:
-                self._update_trailing_stop_order(order)
+        # Move market back to targets
+        if self._has_targets and self._core.has_orders():
+            self._core.set_bid_raw(self._target_bid)
+            self._core.set_ask_raw(self._target_ask)
+            self._core.set_last_raw(self._target_last)
+            self._has_targets = False
 
-            # Move market back to targets
-            if self._has_targets:
-                self._core.set_bid_raw(self._target_bid)
-                self._core.set_ask_raw(self._target_ask)
-                self._core.set_last_raw(self._target_last)
-                self._has_targets = False
+        # Manage trailing stops
+        for order in self._core.get_orders_trailing():
+            if order.is_closed_c():
+                continue
+            self._update_trailing_stop_order(order)
 
         # Reset any targets after iteration
         self._target_bid = 0
@@ -1379,6 +1394,17 @@ cdef class OrderMatchingEngine:
                 self.cache.add_order(order, position_id=position.id)
                 self.fill_market_order(order)
 
+    cdef void _update_core_market(self):
+        cdef Price_t bid
+        cdef Price_t ask
+
+        if orderbook_has_bid(&self._book._mem):
+            bid = orderbook_best_bid_price(&self._book._mem)
+            self._core.set_bid_raw(bid.raw)
+        if orderbook_has_ask(&self._book._mem):
+            ask = orderbook_best_ask_price(&self._book._mem)
+            self._core.set_ask_raw(ask.raw)
+
     cpdef list determine_limit_price_and_volume(self, Order order):
         """
         Return the projected fills for the given *limit* order filling passively
@@ -2323,6 +2349,9 @@ cdef class OrderMatchingEngine:
         )
         self.msgbus.send(endpoint="ExecEngine.process", msg=event)
 
+        # Reindex for any updated price or trigger price
+        self._core.reindex_order(order)
+
     cdef void _generate_order_canceled(self, Order order, VenueOrderId venue_order_id):
         # Generate event
         cdef uint64_t ts_now = self._clock.timestamp_ns()
@@ -2355,6 +2384,9 @@ cdef class OrderMatchingEngine:
         )
         self.msgbus.send(endpoint="ExecEngine.process", msg=event)
 
+        # Reindex as the triggered order now matches on its limit price
+        self._core.reindex_order(order)
+
     cdef void _generate_order_expired(self, Order order):
         # Generate event
         cdef uint64_t ts_now = self._clock.timestamp_ns()
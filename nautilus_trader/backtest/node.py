@@ -13,9 +13,18 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import gc
+import multiprocessing
+import os
+import sys
+import tempfile
+from collections import Counter
 from decimal import Decimal
+from typing import Any
 
+import msgspec
 import pandas as pd
+import pyarrow as pa
 
 from nautilus_trader.backtest.config import BacktestDataConfig
 from nautilus_trader.backtest.config import BacktestRunConfig
@@ -27,6 +36,7 @@ from nautilus_trader.common.component import Logger
 from nautilus_trader.common.component import LogGuard
 from nautilus_trader.common.config import ActorFactory
 from nautilus_trader.common.config import InvalidConfiguration
+from nautilus_trader.common.config import LoggingConfig
 from nautilus_trader.core import nautilus_pyo3
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.datetime import dt_to_unix_nanos
@@ -56,6 +66,9 @@ class BacktestNode:
     ----------
     configs : list[BacktestRunConfig]
         The backtest run configurations.
+    max_workers : int, default 1
+        The maximum number of worker processes to execute the backtest runs with.
+        If greater than 1 then runs are executed in parallel in a process pool.
 
     Raises
     ------
@@ -63,22 +76,41 @@ class BacktestNode:
         If `configs` is ``None`` or empty.
     ValueError
         If `configs` contains a type other than `BacktestRunConfig`.
+    ValueError
+        If `max_workers` is not positive (> 0).
+
+    Notes
+    -----
+    When running with multiple worker processes, the backtest engines are created
+    and disposed within the workers, and so are not available from the node.
+    Catalog data used by more than one run is read once by the node and shared with
+    the workers through memory-mapped Arrow IPC files. Each run executes in its own
+    worker process, which logs to a file that is written to stdout by the node
+    once the run completes.
 
     """
 
-    def __init__(self, configs: list[BacktestRunConfig]):
+    def __init__(
+        self,
+        configs: list[BacktestRunConfig],
+        max_workers: int = 1,
+    ):
         PyCondition.not_none(configs, "configs")
         PyCondition.not_empty(configs, "configs")
         PyCondition.true(
             all(isinstance(config, BacktestRunConfig) for config in configs),
             "configs",
         )
+        PyCondition.positive_int(max_workers, "max_workers")
 
         self._validate_configs(configs)
 
         self._configs: list[BacktestRunConfig] = configs
+        self._max_workers = max_workers
         self._engines: dict[str, BacktestEngine] = {}
         self._log_guard: nautilus_pyo3.LogGuard | LogGuard | None = None
+        self._shared_data_paths: dict[str, str | None] = {}
+        self._worker_log_directory: str | None = None
 
     @property
     def configs(self) -> list[BacktestRunConfig]:
@@ -134,8 +166,8 @@ class BacktestNode:
 
     def run(self) -> list[BacktestResult]:
         """
-        Run the backtest node which will synchronously execute the list of loaded
-        backtest run configs.
+        Run the backtest node which will execute the list of loaded backtest run
+        configs (synchronously, unless running with multiple worker processes).
 
         Any exceptions raised from a backtest will be printed to stdout and
         the next backtest run will commence (if any).
@@ -143,9 +175,12 @@ class BacktestNode:
         Returns
         -------
         list[BacktestResult]
-            The results of the backtest runs.
+            The results of the backtest runs (in the order of the configs).
 
         """
+        if self._max_workers > 1 and len(self._configs) > 1:
+            return self._run_parallel()
+
         results: list[BacktestResult] = []
         for config in self._configs:
             try:
@@ -166,6 +201,77 @@ class BacktestNode:
 
         return results
 
+    def _run_parallel(self) -> list[BacktestResult]:
+        results: list[BacktestResult] = []
+        with tempfile.TemporaryDirectory(prefix="nautilus-backtest-") as shared_dir:
+            shared_data_paths = self._write_shared_data(shared_dir)
+
+            # Use spawned processes, as the Rust runtime and logging are not fork safe.
+            # Each process executes a single run, as logging can only be initialized
+            # once per process and is shut down to flush the run's logs.
+            with multiprocessing.get_context("spawn").Pool(
+                processes=min(self._max_workers, len(self._configs)),
+                maxtasksperchild=1,
+            ) as pool:
+                async_results = [
+                    pool.apply_async(
+                        _run_backtest_worker,
+                        (config, shared_data_paths, os.path.join(shared_dir, f"logs-{i}")),
+                    )
+                    for i, config in enumerate(self._configs)
+                ]
+                for config, async_result in zip(self._configs, async_results):
+                    try:
+                        run_results, logs = async_result.get()
+                    except Exception as e:
+                        # Worker process failures are logged consistently with in-process runs
+                        Logger(type(self).__name__).error(f"Error running backtest: {e}")
+                        Logger(type(self).__name__).info(f"Config: {config}")
+                        continue
+
+                    # Write each run's logs in order, rather than interleaved between workers
+                    sys.stdout.write(logs)
+                    sys.stdout.flush()
+                    results.extend(run_results)
+
+        return results
+
+    def _write_shared_data(self, shared_dir: str) -> dict[str, str | None]:
+        # Only share data configs loaded in one shot by more than one run
+        counts = Counter(
+            data_config.id
+            for config in self._configs
+            if config.batch_size_bytes is None
+            for data_config in config.data
+        )
+
+        shared_data_paths: dict[str, str | None] = {}
+        for config in self._configs:
+            for data_config in config.data:
+                config_id = data_config.id
+                if counts[config_id] < 2 or config_id in shared_data_paths:
+                    continue
+
+                catalog = self.load_catalog(data_config)
+                query = _data_config_query(data_config)
+                if catalog.uses_rust_backend(query["data_cls"]):
+                    # Match the in-process load, which does not apply filter expressions
+                    query["filter_expr"] = None
+
+                table = catalog.query_table(**query)
+                if table is None or not table.num_rows:
+                    shared_data_paths[config_id] = None
+                    continue
+
+                path = os.path.join(shared_dir, f"{config_id}.arrow")
+                with pa.OSFile(path, "wb") as sink:
+                    with pa.ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+
+                shared_data_paths[config_id] = path
+
+        return shared_data_paths
+
     def _validate_configs(self, configs: list[BacktestRunConfig]) -> None:  # noqa: C901
         venue_ids: list[Venue] = []
         for config in configs:
@@ -218,6 +324,8 @@ class BacktestNode:
         data_configs: list[BacktestDataConfig],
     ) -> BacktestEngine:
         # Build the backtest engine
+        if self._worker_log_directory is not None:
+            config = _worker_logging_config(config, self._worker_log_directory)
         engine = BacktestEngine(config=config)
         self._engines[run_config_id] = engine
 
@@ -334,7 +442,7 @@ class BacktestNode:
                 # TODO: Temporary hack - improve bars config and decide implementation with `filter_expr`
                 assert config.instrument_id, "No `instrument_id` for Bar data config"
                 assert config.bar_spec, "No `bar_spec` for Bar data config"
-                bar_type = config.instrument_id + "-" + config.bar_spec + "-EXTERNAL"
+                bar_type = config.bar_type
             else:
                 bar_type = None
             session = catalog.backend_session(
@@ -348,20 +456,11 @@ class BacktestNode:
                 session=session,
             )
 
-        # Stream data
-        for chunk in session.to_query_result():
-            engine.add_data(
-                data=capsule_to_list(chunk),
-                validate=False,  # Cannot validate mixed type stream
-                sort=True,  # Temporarily sorting  # Already sorted from kmerge
-            )
-            engine.run(
-                run_config_id=run_config_id,
-                streaming=True,
-            )
-            engine.clear_data()
-
-        engine.end()
+        # Stream data (chunks are already sorted from kmerge, and loaded lazily during the run)
+        engine.add_data_iterator(
+            capsule_to_list(chunk) for chunk in session.to_query_result()
+        )
+        engine.run(run_config_id=run_config_id)
 
     def _run_oneshot(
         self,
@@ -375,7 +474,7 @@ class BacktestNode:
             engine.logger.info(
                 f"Reading {config.data_type} data for instrument={config.instrument_id}.",
             )
-            result: CatalogDataResult = self.load_data_config(config)
+            result: CatalogDataResult = self._load_data_config(config)
             if config.instrument_id and result.instrument is None:
                 engine.logger.warning(
                     f"Requested instrument_id={result.instrument} from data_config not found in catalog",
@@ -417,7 +516,36 @@ class BacktestNode:
 
         return CatalogDataResult(
             data_cls=config.data_type,
-            data=catalog.query(**config.query),
+            data=catalog.query(**_data_config_query(config)),
+            instrument=instruments[0] if instruments else None,
+            client_id=ClientId(config.client_id) if config.client_id else None,
+        )
+
+    def _load_data_config(self, config: BacktestDataConfig) -> CatalogDataResult:
+        config_id = config.id
+        if config_id not in self._shared_data_paths:
+            return self.load_data_config(config)
+
+        catalog: ParquetDataCatalog = self.load_catalog(config)
+        instruments = (
+            catalog.instruments(instrument_ids=[config.instrument_id])
+            if config.instrument_id
+            else None
+        )
+        if config.instrument_id and not instruments:
+            return CatalogDataResult(data_cls=config.data_type, data=[])
+
+        data: list = []
+        path = self._shared_data_paths[config_id]
+        if path is not None:
+            # Zero-copy read of the Arrow data shared by the node
+            with pa.memory_map(path) as source:
+                table = pa.ipc.open_file(source).read_all()
+            data = catalog.table_to_data(table, config.data_type, metadata=config.metadata)
+
+        return CatalogDataResult(
+            data_cls=config.data_type,
+            data=data,
             instrument=instruments[0] if instruments else None,
             client_id=ClientId(config.client_id) if config.client_id else None,
         )
@@ -426,3 +554,64 @@ class BacktestNode:
         for engine in self.get_engines():
             if not engine.trader.is_disposed:
                 engine.dispose()
+
+
+def _data_config_query(config: BacktestDataConfig) -> dict[str, Any]:
+    # Bars are stored under a directory per bar type with no `bar_type` column,
+    # so select the bar type by file rather than with a filter expression.
+    query = config.query
+    if config.data_type is Bar and config.bar_spec:
+        query["bar_types"] = [config.bar_type]
+        query["filter_expr"] = None
+
+    return query
+
+
+def _worker_logging_config(
+    config: BacktestEngineConfig | None,
+    log_directory: str,
+) -> BacktestEngineConfig:
+    # Log to a file for the run (rather than stdout), so the logs can be returned
+    config = config or BacktestEngineConfig()
+    logging = config.logging or LoggingConfig()
+    if logging.bypass_logging:
+        return config
+
+    logging = msgspec.structs.replace(
+        logging,
+        log_level="OFF",
+        log_level_file=logging.log_level_file or logging.log_level,
+        log_directory=log_directory,
+        log_colors=False,
+    )
+    return msgspec.structs.replace(config, logging=logging)
+
+
+def _read_worker_logs(log_directory: str) -> str:
+    if not os.path.isdir(log_directory):
+        return ""
+
+    logs: list[str] = []
+    for file_name in sorted(os.listdir(log_directory)):
+        with open(os.path.join(log_directory, file_name), encoding="utf-8") as f:
+            logs.append(f.read())
+
+    return "".join(logs)
+
+
+def _run_backtest_worker(
+    config: BacktestRunConfig,
+    shared_data_paths: dict[str, str | None],
+    log_directory: str,
+) -> tuple[list[BacktestResult], str]:
+    node = BacktestNode(configs=[config])
+    node._shared_data_paths = shared_data_paths
+    node._worker_log_directory = log_directory
+    try:
+        results = node.run()
+    finally:
+        node.dispose()
+        del node
+        gc.collect()  # Drops the log guard, which flushes the logs to file
+
+    return results, _read_worker_logs(log_directory)
@@ -18,7 +18,6 @@ from cpython.datetime cimport timedelta
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
-from nautilus_trader.accounting.calculators cimport ExchangeRateCalculator
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
 from nautilus_trader.common.actor cimport Actor
@@ -54,13 +53,32 @@ from nautilus_trader.model.position cimport Position
 from nautilus_trader.trading.strategy cimport Strategy
 
 
+cdef class QueryIndex:
+    cdef dict _all
+    cdef dict _by_venue
+    cdef dict _by_instrument
+    cdef dict _by_strategy
+    cdef dict _by_strategy_venue
+    cdef dict _by_strategy_instrument
+
+    cdef void add(self, object item_id, InstrumentId instrument_id, StrategyId strategy_id)
+    cdef void discard(self, object item_id, InstrumentId instrument_id, StrategyId strategy_id)
+    cdef void discard_strategy(self, StrategyId strategy_id)
+    cdef dict query(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
+    cdef void clear(self)
+
+
 cdef class Cache(CacheFacade):
     cdef Logger _log
     cdef CacheDatabaseFacade _database
-    cdef ExchangeRateCalculator _xrate_calculator
 
     cdef dict _general
     cdef dict _xrate_symbols
+    cdef dict _xrate_bid_quotes
+    cdef dict _xrate_ask_quotes
+    cdef dict _xrate_graphs
+    cdef dict _xrate_rates
+    cdef dict _xrate_rates_by_symbol
     cdef dict _quote_ticks
     cdef dict _trade_ticks
     cdef dict _order_books
@@ -104,6 +122,16 @@ cdef class Cache(CacheFacade):
     cdef set _index_actors
     cdef set _index_strategies
     cdef set _index_exec_algorithms
+
+    cdef QueryIndex _query_orders
+    cdef QueryIndex _query_orders_open
+    cdef QueryIndex _query_orders_closed
+    cdef QueryIndex _query_orders_emulated
+    cdef QueryIndex _query_orders_inflight
+    cdef QueryIndex _query_positions
+    cdef QueryIndex _query_positions_open
+    cdef QueryIndex _query_positions_closed
+
     cdef bint _drop_instruments_on_reset
 
     cdef readonly bint has_backing
@@ -129,15 +157,16 @@ cdef class Cache(CacheFacade):
     cpdef void dispose(self)
     cpdef void flush_db(self)
 
-    cdef tuple _build_quote_table(self, Venue venue)
+    cdef list _xrate_path(self, Venue venue, str from_code, str to_code)
+    cdef void _update_xrate_quote(self, InstrumentId instrument_id)
     cdef void _build_index_venue_account(self)
     cdef void _cache_venue_account_id(self, AccountId account_id)
     cdef void _build_indexes_from_orders(self)
     cdef void _build_indexes_from_positions(self)
     cdef set _build_order_query_filter_set(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
-    cdef set _build_position_query_filter_set(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
     cdef list _get_orders_for_ids(self, set client_order_ids, OrderSide side)
-    cdef list _get_positions_for_ids(self, set position_ids, PositionSide side)
+    cdef list _get_orders_for_query(self, dict client_order_ids, OrderSide side)
+    cdef list _get_positions_for_query(self, dict position_ids, PositionSide side)
     cdef void _assign_position_id_to_contingencies(self, Order order)
     cpdef Money calculate_unrealized_pnl(self, Position position)
 
@@ -29,7 +29,6 @@ from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
-from nautilus_trader.accounting.calculators cimport ExchangeRateCalculator
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
 from nautilus_trader.common.component cimport LogColor
 from nautilus_trader.common.component cimport Logger
@@ -71,6 +70,107 @@ from nautilus_trader.model.orders.list cimport OrderList
 from nautilus_trader.trading.strategy cimport Strategy
 
 
+cdef dict _EMPTY_QUERY = {}
+
+
+cdef class QueryIndex:
+    """
+    Provides an insertion-ordered index of identifiers for cache queries.
+
+    Identifiers are indexed by venue, instrument ID and strategy ID, as well as
+    by the compound strategy ID with venue or instrument ID. Each query filter
+    combination resolves to a single index without sorting or set intersection.
+
+    The dictionaries returned from `query` are views of the index and must not
+    be modified.
+    """
+
+    def __init__(self):
+        self._all: dict[object, None] = {}
+        self._by_venue: dict[Venue, dict[object, None]] = {}
+        self._by_instrument: dict[InstrumentId, dict[object, None]] = {}
+        self._by_strategy: dict[StrategyId, dict[object, None]] = {}
+        self._by_strategy_venue: dict[tuple[StrategyId, Venue], dict[object, None]] = {}
+        self._by_strategy_instrument: dict[tuple[StrategyId, InstrumentId], dict[object, None]] = {}
+
+    cdef void add(self, object item_id, InstrumentId instrument_id, StrategyId strategy_id):
+        self._all[item_id] = None
+        _index_add(self._by_venue, instrument_id.venue, item_id)
+        _index_add(self._by_instrument, instrument_id, item_id)
+
+        if strategy_id is None:
+            return
+
+        _index_add(self._by_strategy, strategy_id, item_id)
+        _index_add(self._by_strategy_venue, (strategy_id, instrument_id.venue), item_id)
+        _index_add(self._by_strategy_instrument, (strategy_id, instrument_id), item_id)
+
+    cdef void discard(self, object item_id, InstrumentId instrument_id, StrategyId strategy_id):
+        if item_id not in self._all:
+            return  # Not indexed
+
+        del self._all[item_id]
+
+        _index_discard(self._by_venue, instrument_id.venue, item_id)
+        _index_discard(self._by_instrument, instrument_id, item_id)
+
+        if strategy_id is None:
+            return
+
+        _index_discard(self._by_strategy, strategy_id, item_id)
+        _index_discard(self._by_strategy_venue, (strategy_id, instrument_id.venue), item_id)
+        _index_discard(self._by_strategy_instrument, (strategy_id, instrument_id), item_id)
+
+    cdef void discard_strategy(self, StrategyId strategy_id):
+        self._by_strategy.pop(strategy_id, None)
+
+        cdef tuple key
+        for key in [k for k in self._by_strategy_venue if k[0] == strategy_id]:
+            del self._by_strategy_venue[key]
+        for key in [k for k in self._by_strategy_instrument if k[0] == strategy_id]:
+            del self._by_strategy_instrument[key]
+
+    cdef dict query(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id):
+        if instrument_id is not None:
+            if venue is not None and instrument_id.venue != venue:
+                return _EMPTY_QUERY
+            if strategy_id is not None:
+                return self._by_strategy_instrument.get((strategy_id, instrument_id), _EMPTY_QUERY)
+            return self._by_instrument.get(instrument_id, _EMPTY_QUERY)
+
+        if venue is not None:
+            if strategy_id is not None:
+                return self._by_strategy_venue.get((strategy_id, venue), _EMPTY_QUERY)
+            return self._by_venue.get(venue, _EMPTY_QUERY)
+
+        if strategy_id is not None:
+            return self._by_strategy.get(strategy_id, _EMPTY_QUERY)
+
+        return self._all
+
+    cdef void clear(self):
+        self._all.clear()
+        self._by_venue.clear()
+        self._by_instrument.clear()
+        self._by_strategy.clear()
+        self._by_strategy_venue.clear()
+        self._by_strategy_instrument.clear()
+
+
+cdef inline void _index_add(dict index, object key, object item_id):
+    cdef dict items = index.get(key)
+    if items is None:
+        index[key] = {item_id: None}
+    else:
+        items[item_id] = None
+
+
+cdef inline void _index_discard(dict index, object key, object item_id):
+    cdef dict items = index.get(key)
+    if items is not None:
+        items.pop(item_id, None)
+
+
 cdef class Cache(CacheFacade):
     """
     Provides a common object cache for market and execution related data.
@@ -99,7 +199,6 @@ cdef class Cache(CacheFacade):
 
         self._database = database
         self._log = Logger(name=type(self).__name__)
-        self._xrate_calculator = ExchangeRateCalculator()
 
         # Configuration
         self._drop_instruments_on_reset = config.drop_instruments_on_reset
@@ -110,6 +209,11 @@ cdef class Cache(CacheFacade):
         # Caches
         self._general: dict[str, bytes] = {}
         self._xrate_symbols: dict[InstrumentId, str] = {}
+        self._xrate_bid_quotes: dict[Venue, dict[str, float]] = {}
+        self._xrate_ask_quotes: dict[Venue, dict[str, float]] = {}
+        self._xrate_graphs: dict[Venue, dict[str, dict[str, str]]] = {}
+        self._xrate_rates: dict[Venue, dict[tuple, float]] = {}
+        self._xrate_rates_by_symbol: dict[Venue, dict[str, set[tuple]]] = {}
         self._quote_ticks: dict[InstrumentId, deque[QuoteTick]] = {}
         self._trade_ticks: dict[InstrumentId, deque[TradeTick]] = {}
         self._order_books: dict[InstrumentId, OrderBook] = {}
@@ -155,6 +259,16 @@ cdef class Cache(CacheFacade):
         self._index_strategies: set[StrategyId] = set()
         self._index_exec_algorithms: set[ExecAlgorithmId] = set()
 
+        # Ordered query indexes
+        self._query_orders = QueryIndex()
+        self._query_orders_open = QueryIndex()
+        self._query_orders_closed = QueryIndex()
+        self._query_orders_emulated = QueryIndex()
+        self._query_orders_inflight = QueryIndex()
+        self._query_positions = QueryIndex()
+        self._query_positions_open = QueryIndex()
+        self._query_positions_closed = QueryIndex()
+
         self._log.info("READY")
 
 # -- COMMANDS -------------------------------------------------------------------------------------
@@ -711,6 +825,14 @@ cdef class Cache(CacheFacade):
         self._index_actors.clear()
         self._index_strategies.clear()
         self._index_exec_algorithms.clear()
+        self._query_orders.clear()
+        self._query_orders_open.clear()
+        self._query_orders_closed.clear()
+        self._query_orders_emulated.clear()
+        self._query_orders_inflight.clear()
+        self._query_positions.clear()
+        self._query_positions_open.clear()
+        self._query_positions_closed.clear()
 
         self._log.debug(f"Cleared index")
 
@@ -724,6 +846,11 @@ cdef class Cache(CacheFacade):
 
         self._general.clear()
         self._xrate_symbols.clear()
+        self._xrate_bid_quotes.clear()
+        self._xrate_ask_quotes.clear()
+        self._xrate_graphs.clear()
+        self._xrate_rates.clear()
+        self._xrate_rates_by_symbol.clear()
         self._quote_ticks.clear()
         self._trade_ticks.clear()
         self._order_books.clear()
@@ -821,22 +948,27 @@ cdef class Cache(CacheFacade):
 
             # 9: Build _index_orders -> {ClientOrderId}
             self._index_orders.add(client_order_id)
+            self._query_orders.add(client_order_id, order.instrument_id, order.strategy_id)
 
             # 10: Build _index_orders_open -> {ClientOrderId}
             if order.is_open_c():
                 self._index_orders_open.add(client_order_id)
+                self._query_orders_open.add(client_order_id, order.instrument_id, order.strategy_id)
 
             # 11: Build _index_orders_closed -> {ClientOrderId}
             if order.is_closed_c():
                 self._index_orders_closed.add(client_order_id)
+                self._query_orders_closed.add(client_order_id, order.instrument_id, order.strategy_id)
 
             # 12: Build _index_orders_emulated -> {ClientOrderId}
             if order.emulation_trigger != TriggerType.NO_TRIGGER and not order.is_closed_c():
                 self._index_orders_emulated.add(client_order_id)
+                self._query_orders_emulated.add(client_order_id, order.instrument_id, order.strategy_id)
 
             # 13: Build _index_orders_inflight -> {ClientOrderId}
             if order.is_inflight_c():
                 self._index_orders_inflight.add(client_order_id)
+                self._query_orders_inflight.add(client_order_id, order.instrument_id, order.strategy_id)
 
             # 14: Build _index_strategies -> {StrategyId}
             self._index_strategies.add(order.strategy_id)
@@ -878,13 +1010,16 @@ cdef class Cache(CacheFacade):
 
             # 6: Build _index_positions -> {PositionId}
             self._index_positions.add(position_id)
+            self._query_positions.add(position_id, position.instrument_id, position.strategy_id)
 
             # 7: Build _index_positions_open -> {PositionId}
             if position.is_open_c():
                 self._index_positions_open.add(position_id)
+                self._query_positions_open.add(position_id, position.instrument_id, position.strategy_id)
             # 8: Build _index_positions_closed -> {PositionId}
             elif position.is_closed_c():
                 self._index_positions_closed.add(position_id)
+                self._query_positions_closed.add(position_id, position.instrument_id, position.strategy_id)
 
             # 9: Build _index_strategies -> {StrategyId}
             self._index_strategies.add(position.strategy_id)
@@ -1145,6 +1280,9 @@ cdef class Cache(CacheFacade):
 
         ticks.appendleft(tick)
 
+        if instrument_id in self._xrate_symbols:
+            self._update_xrate_quote(instrument_id)
+
     cpdef void add_trade_tick(self, TradeTick tick):
         """
         Add the given trade tick to the cache.
@@ -1193,6 +1331,11 @@ cdef class Cache(CacheFacade):
             self._bars_bid[bar.bar_type.instrument_id] = bar
         elif price_type == PriceType.ASK:
             self._bars_ask[bar.bar_type.instrument_id] = bar
+        else:
+            return
+
+        if bar.bar_type.instrument_id in self._xrate_symbols:
+            self._update_xrate_quote(bar.bar_type.instrument_id)
 
     cpdef void add_quote_ticks(self, list ticks):
         """
@@ -1231,6 +1374,9 @@ cdef class Cache(CacheFacade):
         for tick in ticks:
             cached_ticks.appendleft(tick)
 
+        if instrument_id in self._xrate_symbols:
+            self._update_xrate_quote(instrument_id)
+
     cpdef void add_trade_ticks(self, list ticks):
         """
         Add the given trade ticks to the cache.
@@ -1311,6 +1457,11 @@ cdef class Cache(CacheFacade):
             self._bars_bid[bar.bar_type.instrument_id] = bar
         elif price_type == PriceType.ASK:
             self._bars_ask[bar.bar_type.instrument_id] = bar
+        else:
+            return
+
+        if bar.bar_type.instrument_id in self._xrate_symbols:
+            self._update_xrate_quote(bar.bar_type.instrument_id)
 
     cpdef void add_currency(self, Currency currency):
         """
@@ -1349,6 +1500,7 @@ cdef class Cache(CacheFacade):
             self._xrate_symbols[instrument.id] = (
                 f"{instrument.base_currency}/{instrument.quote_currency}"
             )
+            self._update_xrate_quote(instrument.id)
 
         self._log.debug(f"Added instrument {instrument.id}")
 
@@ -1486,6 +1638,7 @@ cdef class Cache(CacheFacade):
 
         self._orders[order.client_order_id] = order
         self._index_orders.add(order.client_order_id)
+        self._query_orders.add(order.client_order_id, order.instrument_id, order.strategy_id)
         self._index_order_strategy[order.client_order_id] = order.strategy_id
         self._index_strategies.add(order.strategy_id)
 
@@ -1534,8 +1687,10 @@ cdef class Cache(CacheFacade):
         # Update emulation
         if order.emulation_trigger == TriggerType.NO_TRIGGER:
             self._index_orders_emulated.discard(order.client_order_id)
+            self._query_orders_emulated.discard(order.client_order_id, order.instrument_id, order.strategy_id)
         else:
             self._index_orders_emulated.add(order.client_order_id)
+            self._query_orders_emulated.add(order.client_order_id, order.instrument_id, order.strategy_id)
 
         self._log.debug(f"Added {order}")
 
@@ -1662,6 +1817,8 @@ cdef class Cache(CacheFacade):
         self._positions[position.id] = position
         self._index_positions.add(position.id)
         self._index_positions_open.add(position.id)
+        self._query_positions.add(position.id, position.instrument_id, position.strategy_id)
+        self._query_positions_open.add(position.id, position.instrument_id, position.strategy_id)
 
         self.add_position_id(
             position.id,
@@ -1822,26 +1979,38 @@ cdef class Cache(CacheFacade):
                 overwrite=isinstance(order._events[-1], OrderUpdated),
             )
 
+        cdef ClientOrderId client_order_id = order.client_order_id
+        cdef InstrumentId instrument_id = order.instrument_id
+        cdef StrategyId strategy_id = order.strategy_id
+
         # Update in-flight state
         if order.is_inflight_c():
-            self._index_orders_inflight.add(order.client_order_id)
+            self._index_orders_inflight.add(client_order_id)
+            self._query_orders_inflight.add(client_order_id, instrument_id, strategy_id)
         else:
-            self._index_orders_inflight.discard(order.client_order_id)
+            self._index_orders_inflight.discard(client_order_id)
+            self._query_orders_inflight.discard(client_order_id, instrument_id, strategy_id)
 
         # Update open/closed state
         if order.is_open_c():
-            self._index_orders_closed.discard(order.client_order_id)
-            self._index_orders_open.add(order.client_order_id)
+            self._index_orders_closed.discard(client_order_id)
+            self._index_orders_open.add(client_order_id)
+            self._query_orders_closed.discard(client_order_id, instrument_id, strategy_id)
+            self._query_orders_open.add(client_order_id, instrument_id, strategy_id)
         elif order.is_closed_c():
-            self._index_orders_open.discard(order.client_order_id)
-            self._index_orders_pending_cancel.discard(order.client_order_id)
-            self._index_orders_closed.add(order.client_order_id)
+            self._index_orders_open.discard(client_order_id)
+            self._index_orders_pending_cancel.discard(client_order_id)
+            self._index_orders_closed.add(client_order_id)
+            self._query_orders_open.discard(client_order_id, instrument_id, strategy_id)
+            self._query_orders_closed.add(client_order_id, instrument_id, strategy_id)
 
         # Update emulation
         if order.is_closed_c() or order.emulation_trigger == TriggerType.NO_TRIGGER:
-            self._index_orders_emulated.discard(order.client_order_id)
+            self._index_orders_emulated.discard(client_order_id)
+            self._query_orders_emulated.discard(client_order_id, instrument_id, strategy_id)
         else:
-            self._index_orders_emulated.add(order.client_order_id)
+            self._index_orders_emulated.add(client_order_id)
+            self._query_orders_emulated.add(client_order_id, instrument_id, strategy_id)
 
         if self._database is None:
             return
@@ -1875,12 +2044,20 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(position, "position")
 
+        cdef PositionId position_id = position.id
+        cdef InstrumentId instrument_id = position.instrument_id
+        cdef StrategyId strategy_id = position.strategy_id
+
         if position.is_open_c():
-            self._index_positions_open.add(position.id)
-            self._index_positions_closed.discard(position.id)
+            self._index_positions_open.add(position_id)
+            self._index_positions_closed.discard(position_id)
+            self._query_positions_open.add(position_id, instrument_id, strategy_id)
+            self._query_positions_closed.discard(position_id, instrument_id, strategy_id)
         elif position.is_closed_c():
-            self._index_positions_closed.add(position.id)
-            self._index_positions_open.discard(position.id)
+            self._index_positions_closed.add(position_id)
+            self._index_positions_open.discard(position_id)
+            self._query_positions_closed.add(position_id, instrument_id, strategy_id)
+            self._query_positions_open.discard(position_id, instrument_id, strategy_id)
 
         if self._database is None:
             return
@@ -1973,6 +2150,19 @@ cdef class Cache(CacheFacade):
         if strategy.id in self._index_strategy_positions:
             del self._index_strategy_positions[strategy.id]
 
+        cdef QueryIndex index
+        for index in (
+            self._query_orders,
+            self._query_orders_open,
+            self._query_orders_closed,
+            self._query_orders_emulated,
+            self._query_orders_inflight,
+            self._query_positions,
+            self._query_positions_open,
+            self._query_positions_closed,
+        ):
+            index.discard_strategy(strategy.id)
+
         # Update database
         if self._database is not None:
             self._database.delete_strategy(strategy.id)
@@ -2399,48 +2589,143 @@ cdef class Cache(CacheFacade):
         if from_currency == to_currency:
             return Decimal(1)  # No conversion necessary
 
-        cdef tuple quotes = self._build_quote_table(venue)
+        cdef dict rates = self._xrate_rates.get(venue)
+        if rates is None:
+            rates = {}
+            self._xrate_rates[venue] = rates
+            self._xrate_rates_by_symbol[venue] = {}
+
+        cdef tuple key = (from_currency.code, to_currency.code, price_type)
+        xrate = rates.get(key)
+        if xrate is not None:
+            return xrate  # Memoized since a quote on its path last changed
+
+        Condition.true(price_type != PriceType.LAST, "price_type was invalid (LAST)")
+
+        cdef list path = self._xrate_path(venue, from_currency.code, to_currency.code)
+        cdef dict bid_quotes = self._xrate_bid_quotes.get(venue)
+        cdef dict ask_quotes = self._xrate_ask_quotes.get(venue)
+        cdef dict rates_by_symbol = self._xrate_rates_by_symbol[venue]
+        cdef str code = from_currency.code
+        cdef str symbol
+        cdef double quote
+        xrate = 0.0 if path is None else 1.0  # Not enough data if no path
+        if path is not None:
+            for symbol in path:
+                if price_type == PriceType.BID:
+                    quote = bid_quotes[symbol]
+                elif price_type == PriceType.ASK:
+                    quote = ask_quotes[symbol]
+                else:
+                    quote = (bid_quotes[symbol] + ask_quotes[symbol]) / 2.0
+
+                # Convert along the pair, or its inverse when quoted the other way
+                if symbol.startswith(code + "/"):
+                    xrate *= quote
+                    code = symbol.partition("/")[2]
+                else:
+                    xrate /= quote
+                    code = symbol.partition("/")[0]
+
+                rates_by_symbol.setdefault(symbol, set()).add(key)
+
+        rates[key] = xrate
+
+        return xrate
+
+    cdef list _xrate_path(self, Venue venue, str from_code, str to_code):
+        # Breadth-first search of the venue currency graph, returning the pair
+        # symbols of the shortest conversion path (or ``None`` if no path)
+        cdef dict graph = self._xrate_graphs.get(venue)
+        if graph is None or from_code not in graph or to_code not in graph:
+            return None
 
-        return self._xrate_calculator.get_rate(
-            from_currency=from_currency,
-            to_currency=to_currency,
-            price_type=price_type,
-            bid_quotes=quotes[0],  # Bid
-            ask_quotes=quotes[1],  # Ask
-        )
+        cdef dict previous = {from_code: None}  # Code -> (previous code, symbol)
+        cdef object queue = deque([from_code])
+        cdef str code
+        cdef str neighbor
+        cdef str symbol
+        while queue:
+            code = queue.popleft()
+            if code == to_code:
+                break
+            for neighbor, symbol in (<dict>graph[code]).items():
+                if neighbor not in previous:
+                    previous[neighbor] = (code, symbol)
+                    queue.append(neighbor)
+        else:
+            return None  # No path
+
+        cdef list path = []
+        cdef tuple step
+        while code != from_code:
+            step = previous[code]
+            path.append(step[1])
+            code = step[0]
+        path.reverse()
 
-    cdef tuple _build_quote_table(self, Venue venue):
-        cdef dict bid_quotes = {}
-        cdef dict ask_quotes = {}
+        return path
+
+    cdef void _update_xrate_quote(self, InstrumentId instrument_id):
+        # Update the venue quote table from the latest quote for the instrument,
+        # otherwise the latest bid and ask bars when no quotes have been cached.
+        cdef str base_quote = self._xrate_symbols[instrument_id]
 
         cdef:
-            InstrumentId instrument_id
-            str base_quote
             Price bid_price
             Price ask_price
             Bar bid_bar
             Bar ask_bar
-        for instrument_id, base_quote in self._xrate_symbols.items():
-            if instrument_id.venue != venue:
-                continue
-
-            ticks = self._quote_ticks.get(instrument_id)
-            if ticks:
-                bid_price = ticks[0].bid_price
-                ask_price = ticks[0].ask_price
-            else:
-                # No quotes for instrument_id
-                bid_bar = self._bars_bid.get(instrument_id)
-                ask_bar = self._bars_ask.get(instrument_id)
-                if bid_bar is None or ask_bar is None:
-                    continue # No prices for instrument_id
-                bid_price = bid_bar.close
-                ask_price = ask_bar.close
-
-            bid_quotes[base_quote] = bid_price.as_f64_c()
-            ask_quotes[base_quote] = ask_price.as_f64_c()
-
-        return bid_quotes, ask_quotes
+        ticks = self._quote_ticks.get(instrument_id)
+        if ticks:
+            bid_price = ticks[0].bid_price
+            ask_price = ticks[0].ask_price
+        else:
+            # No quotes for instrument_id
+            bid_bar = self._bars_bid.get(instrument_id)
+            ask_bar = self._bars_ask.get(instrument_id)
+            if bid_bar is None or ask_bar is None:
+                return  # No prices for instrument_id
+            bid_price = bid_bar.close
+            ask_price = ask_bar.close
+
+        cdef double bid = bid_price.as_f64_c()
+        cdef double ask = ask_price.as_f64_c()
+
+        cdef Venue venue = instrument_id.venue
+        cdef dict bid_quotes = self._xrate_bid_quotes.get(venue)
+        cdef dict ask_quotes
+        if bid_quotes is None:
+            bid_quotes = {}
+            ask_quotes = {}
+            self._xrate_bid_quotes[venue] = bid_quotes
+            self._xrate_ask_quotes[venue] = ask_quotes
+            self._xrate_graphs[venue] = {}
+        else:
+            ask_quotes = self._xrate_ask_quotes[venue]
+            if bid_quotes.get(base_quote) == bid and ask_quotes.get(base_quote) == ask:
+                return  # No change to exchange rates
+
+        cdef bint is_new_pair = base_quote not in bid_quotes
+        bid_quotes[base_quote] = bid
+        ask_quotes[base_quote] = ask
+
+        cdef dict rates = self._xrate_rates.get(venue)
+        cdef dict graph
+        cdef tuple pieces
+        if is_new_pair:
+            # Add the pair to the currency graph, which may shorten or create
+            # paths, so invalidate all memoized exchange rates for the venue
+            graph = self._xrate_graphs[venue]
+            pieces = base_quote.partition("/")
+            graph.setdefault(pieces[0], {}).setdefault(pieces[2], base_quote)
+            graph.setdefault(pieces[2], {}).setdefault(pieces[0], base_quote)
+            self._xrate_rates.pop(venue, None)
+            self._xrate_rates_by_symbol.pop(venue, None)
+        elif rates is not None:
+            # Invalidate only the memoized exchange rates with a path using the pair
+            for key in self._xrate_rates_by_symbol[venue].pop(base_quote, ()):
+                rates.pop(key, None)
 
 # -- INSTRUMENT QUERIES ---------------------------------------------------------------------------
 
@@ -2682,30 +2967,6 @@ cdef class Cache(CacheFacade):
 
         return query
 
-    cdef set _build_position_query_filter_set(
-        self,
-        Venue venue,
-        InstrumentId instrument_id,
-        StrategyId strategy_id,
-    ):
-        cdef set query = None
-
-        # Build potential query set
-        if venue is not None:
-            query = self._index_venue_positions.get(venue, set())
-        if instrument_id is not None:
-            if query is None:
-                query = self._index_instrument_positions.get(instrument_id, set())
-            else:
-                query = query.intersection(self._index_instrument_positions.get(instrument_id, set()))
-        if strategy_id is not None:
-            if query is None:
-                query = self._index_strategy_positions.get(strategy_id, set())
-            else:
-                query = query.intersection(self._index_strategy_positions.get(strategy_id, set()))
-
-        return query
-
     cdef list _get_orders_for_ids(self, set client_order_ids, OrderSide side):
         cdef list orders = []
 
@@ -2725,14 +2986,30 @@ cdef class Cache(CacheFacade):
 
         return orders
 
-    cdef list _get_positions_for_ids(self, set position_ids, PositionSide side):
+    cdef list _get_orders_for_query(self, dict client_order_ids, OrderSide side):
+        cdef list orders = []
+
+        cdef:
+            ClientOrderId client_order_id
+            Order order
+        try:
+            for client_order_id in client_order_ids:
+                order = self._orders[client_order_id]
+                if side == OrderSide.NO_ORDER_SIDE or side == order.side:
+                    orders.append(order)
+        except KeyError as e:
+            self._log.error(f"Cannot find `Order` object in cached orders {e}")
+
+        return orders
+
+    cdef list _get_positions_for_query(self, dict position_ids, PositionSide side):
         cdef list positions = []
 
         cdef:
             PositionId position_id
             Position position
         try:
-            for position_id in sorted(position_ids):
+            for position_id in position_ids:
                 position = self._positions[position_id]
                 if side == PositionSide.NO_POSITION_SIDE or side == position.side:
                     positions.append(position)
@@ -2764,12 +3041,10 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_order_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_orders
-        else:
-            return self._index_orders.intersection(query)
+
+        return set(self._query_orders.query(venue, instrument_id, strategy_id))
 
     cpdef set client_order_ids_open(
         self,
@@ -2794,12 +3069,10 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_order_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_orders_open
-        else:
-            return self._index_orders_open.intersection(query)
+
+        return set(self._query_orders_open.query(venue, instrument_id, strategy_id))
 
     cpdef set client_order_ids_closed(
         self,
@@ -2824,12 +3097,10 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_order_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_orders_closed
-        else:
-            return self._index_orders_closed.intersection(query)
+
+        return set(self._query_orders_closed.query(venue, instrument_id, strategy_id))
 
     cpdef set client_order_ids_emulated(
         self,
@@ -2854,12 +3125,10 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_order_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_orders_emulated
-        else:
-            return self._index_orders_emulated.intersection(query)
+
+        return set(self._query_orders_emulated.query(venue, instrument_id, strategy_id))
 
     cpdef set client_order_ids_inflight(
         self,
@@ -2884,12 +3153,10 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_order_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_orders_inflight
-        else:
-            return self._index_orders_inflight.intersection(query)
+
+        return set(self._query_orders_inflight.query(venue, instrument_id, strategy_id))
 
     cpdef set order_list_ids(
         self,
@@ -2933,12 +3200,10 @@ cdef class Cache(CacheFacade):
         set[PositionId]
 
         """
-        cdef set query = self._build_position_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_positions
-        else:
-            return self._index_positions.intersection(query)
+
+        return set(self._query_positions.query(venue, instrument_id, strategy_id))
 
     cpdef set position_open_ids(
         self,
@@ -2963,12 +3228,10 @@ cdef class Cache(CacheFacade):
         set[PositionId]
 
         """
-        cdef set query = self._build_position_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_positions_open
-        else:
-            return self._index_positions_open.intersection(query)
+
+        return set(self._query_positions_open.query(venue, instrument_id, strategy_id))
 
     cpdef set position_closed_ids(
         self,
@@ -2993,12 +3256,10 @@ cdef class Cache(CacheFacade):
         set[PositionId]
 
         """
-        cdef set query = self._build_position_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_positions_closed
-        else:
-            return self._index_positions_closed.intersection(query)
+
+        return set(self._query_positions_closed.query(venue, instrument_id, strategy_id))
 
     cpdef set actor_ids(self):
         """
@@ -3120,8 +3381,10 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids(venue, instrument_id, strategy_id)
-        return self._get_orders_for_ids(client_order_ids, side)
+        return self._get_orders_for_query(
+            self._query_orders.query(venue, instrument_id, strategy_id),
+            side,
+        )
 
     cpdef list orders_open(
         self,
@@ -3151,8 +3414,10 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_open(venue, instrument_id, strategy_id)
-        return self._get_orders_for_ids(client_order_ids, side)
+        return self._get_orders_for_query(
+            self._query_orders_open.query(venue, instrument_id, strategy_id),
+            side,
+        )
 
     cpdef list orders_closed(
         self,
@@ -3182,8 +3447,10 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_closed(venue, instrument_id, strategy_id)
-        return self._get_orders_for_ids(client_order_ids, side)
+        return self._get_orders_for_query(
+            self._query_orders_closed.query(venue, instrument_id, strategy_id),
+            side,
+        )
 
     cpdef list orders_emulated(
         self,
@@ -3213,8 +3480,10 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_emulated(venue, instrument_id, strategy_id)
-        return self._get_orders_for_ids(client_order_ids, side)
+        return self._get_orders_for_query(
+            self._query_orders_emulated.query(venue, instrument_id, strategy_id),
+            side,
+        )
 
     cpdef list orders_inflight(
         self,
@@ -3244,8 +3513,10 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_inflight(venue, instrument_id, strategy_id)
-        return self._get_orders_for_ids(client_order_ids, side)
+        return self._get_orders_for_query(
+            self._query_orders_inflight.query(venue, instrument_id, strategy_id),
+            side,
+        )
 
     cpdef list orders_for_position(self, PositionId position_id):
         """
@@ -3403,6 +3674,9 @@ cdef class Cache(CacheFacade):
         int
 
         """
+        if side == OrderSide.NO_ORDER_SIDE:
+            return len(self._query_orders_open.query(venue, instrument_id, strategy_id))
+
         return len(self.orders_open(venue, instrument_id, strategy_id, side))
 
     cpdef int orders_closed_count(
@@ -3431,6 +3705,9 @@ cdef class Cache(CacheFacade):
         int
 
         """
+        if side == OrderSide.NO_ORDER_SIDE:
+            return len(self._query_orders_closed.query(venue, instrument_id, strategy_id))
+
         return len(self.orders_closed(venue, instrument_id, strategy_id, side))
 
     cpdef int orders_emulated_count(
@@ -3459,6 +3736,9 @@ cdef class Cache(CacheFacade):
         int
 
         """
+        if side == OrderSide.NO_ORDER_SIDE:
+            return len(self._query_orders_emulated.query(venue, instrument_id, strategy_id))
+
         return len(self.orders_emulated(venue, instrument_id, strategy_id, side))
 
     cpdef int orders_inflight_count(
@@ -3487,6 +3767,9 @@ cdef class Cache(CacheFacade):
         int
 
         """
+        if side == OrderSide.NO_ORDER_SIDE:
+            return len(self._query_orders_inflight.query(venue, instrument_id, strategy_id))
+
         return len(self.orders_inflight(venue, instrument_id, strategy_id, side))
 
     cpdef int orders_total_count(
@@ -3515,6 +3798,9 @@ cdef class Cache(CacheFacade):
         int
 
         """
+        if side == OrderSide.NO_ORDER_SIDE:
+            return len(self._query_orders.query(venue, instrument_id, strategy_id))
+
         return len(self.orders(venue, instrument_id, strategy_id, side))
 
 # -- ORDER LIST QUERIES ---------------------------------------------------------------------------
@@ -3876,8 +4162,10 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_ids(venue, instrument_id, strategy_id)
-        return self._get_positions_for_ids(position_ids, side)
+        return self._get_positions_for_query(
+            self._query_positions.query(venue, instrument_id, strategy_id),
+            side,
+        )
 
     cpdef list positions_open(
         self,
@@ -3907,8 +4195,10 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_open_ids(venue, instrument_id, strategy_id)
-        return self._get_positions_for_ids(position_ids, side)
+        return self._get_positions_for_query(
+            self._query_positions_open.query(venue, instrument_id, strategy_id),
+            side,
+        )
 
     cpdef list positions_closed(
         self,
@@ -3935,8 +4225,10 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_closed_ids(venue, instrument_id, strategy_id)
-        return self._get_positions_for_ids(position_ids, PositionSide.NO_POSITION_SIDE)
+        return self._get_positions_for_query(
+            self._query_positions_closed.query(venue, instrument_id, strategy_id),
+            PositionSide.NO_POSITION_SIDE,
+        )
 
     cpdef bint position_exists(self, PositionId position_id):
         """
@@ -4020,6 +4312,9 @@ cdef class Cache(CacheFacade):
         int
 
         """
+        if side == PositionSide.NO_POSITION_SIDE:
+            return len(self._query_positions_open.query(venue, instrument_id, strategy_id))
+
         return len(self.positions_open(venue, instrument_id, strategy_id, side))
 
     cpdef int positions_closed_count(
@@ -4045,7 +4340,7 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.positions_closed(venue, instrument_id, strategy_id))
+        return len(self._query_positions_closed.query(venue, instrument_id, strategy_id))
 
     cpdef int positions_total_count(
         self,
@@ -4073,6 +4368,9 @@ cdef class Cache(CacheFacade):
         int
 
         """
+        if side == PositionSide.NO_POSITION_SIDE:
+            return len(self._query_positions.query(venue, instrument_id, strategy_id))
+
         return len(self.positions(venue, instrument_id, strategy_id, side))
 
 # -- STRATEGY QUERIES -----------------------------------------------------------------------------
@@ -13,10 +13,19 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
+from nautilus_trader.model.objects cimport Currency
+from nautilus_trader.model.orders.base cimport Order
+from nautilus_trader.model.position cimport Position
 from nautilus_trader.serialization.base cimport Serializer
 
 
 cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
     cdef Serializer _serializer
     cdef object _backing
+
+    cdef Currency _decode_currency(self, str code, list result)
+    cdef Account _decode_account(self, list result)
+    cdef Order _decode_order(self, list result)
+    cdef Position _decode_position(self, list result, dict instruments)
@@ -256,13 +256,17 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not currency_keys:
             return currencies
 
+        cdef list currency_codes = [key.rsplit(':', maxsplit=1)[1] for key in currency_keys]
+        cdef list results = self._backing.read_bulk(
+            [f"{_CURRENCIES}:{code}" for code in currency_codes],
+        )
+
         cdef:
-            str key
             str currency_code
+            list result
             Currency currency
-        for key in currency_keys:
-            currency_code = key.rsplit(':', maxsplit=1)[1]
-            currency = self.load_currency(currency_code)
+        for currency_code, result in zip(currency_codes, results):
+            currency = self._decode_currency(currency_code, result)
 
             if currency is not None:
                 currencies[currency.code] = currency
@@ -284,16 +288,19 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not instrument_keys:
             return instruments
 
+        cdef list results = self._backing.read_bulk(
+            [f"{_INSTRUMENTS}:{key.rsplit(':', maxsplit=1)[1]}" for key in instrument_keys],
+        )
+
         cdef:
-            str key
-            InstrumentId instrument_id
+            list result
             Instrument instrument
-        for key in instrument_keys:
-            instrument_id = InstrumentId.from_str_c(key.rsplit(':', maxsplit=1)[1])
-            instrument = self.load_instrument(instrument_id)
+        for result in results:
+            if not result:
+                continue
 
-            if instrument is not None:
-                instruments[instrument.id] = instrument
+            instrument = self._serializer.deserialize(result[0])
+            instruments[instrument.id] = instrument
 
         return instruments
 
@@ -312,16 +319,19 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not synthetic_keys:
             return synthetics
 
+        cdef list results = self._backing.read_bulk(
+            [f"{_SYNTHETICS}:{key.rsplit(':', maxsplit=1)[1]}" for key in synthetic_keys],
+        )
+
         cdef:
-            str key
-            InstrumentId instrument_id
+            list result
             SyntheticInstrument synthetic
-        for key in synthetic_keys:
-            instrument_id = InstrumentId.from_str_c(key.rsplit(':', maxsplit=1)[1])
-            synthetic = self.load_synthetic(instrument_id)
+        for result in results:
+            if not result:
+                continue
 
-            if synthetic is not None:
-                synthetics[synthetic.id] = synthetic
+            synthetic = self._serializer.deserialize(result[0])
+            synthetics[synthetic.id] = synthetic
 
         return synthetics
 
@@ -340,14 +350,15 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not account_keys:
             return accounts
 
+        cdef list results = self._backing.read_bulk(
+            [f"{_ACCOUNTS}:{key.rsplit(':', maxsplit=1)[1]}" for key in account_keys],
+        )
+
         cdef:
-            str key
-            str account_str
-            AccountId account_id
+            list result
             Account account
-        for key in account_keys:
-            account_id = AccountId(key.rsplit(':', maxsplit=1)[1])
-            account = self.load_account(account_id)
+        for result in results:
+            account = self._decode_account(result)
 
             if account is not None:
                 accounts[account.id] = account
@@ -369,13 +380,15 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not order_keys:
             return orders
 
+        cdef list results = self._backing.read_bulk(
+            [f"{_ORDERS}:{key.rsplit(':', maxsplit=1)[1]}" for key in order_keys],
+        )
+
         cdef:
-            str key
-            ClientOrderId client_order_id
+            list result
             Order order
-        for key in order_keys:
-            client_order_id = ClientOrderId(key.rsplit(':', maxsplit=1)[1])
-            order = self.load_order(client_order_id)
+        for result in results:
+            order = self._decode_order(result)
 
             if order is not None:
                 orders[order.client_order_id] = order
@@ -397,13 +410,17 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not position_keys:
             return positions
 
+        cdef list results = self._backing.read_bulk(
+            [f"{_POSITIONS}:{key.rsplit(':', maxsplit=1)[1]}" for key in position_keys],
+        )
+
+        cdef dict instruments = {}  # Instruments loaded for positions
+
         cdef:
-            str key
-            PositionId position_id
+            list result
             Position position
-        for key in position_keys:
-            position_id = PositionId(key.rsplit(':', maxsplit=1)[1])
-            position = self.load_position(position_id)
+        for result in results:
+            position = self._decode_position(result, instruments)
 
             if position is not None:
                 positions[position.id] = position
@@ -461,6 +478,9 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         cdef str key = f"{_CURRENCIES}:{code}"
         cdef list result = self._backing.read(key)
 
+        return self._decode_currency(code, result)
+
+    cdef Currency _decode_currency(self, str code, list result):
         if not result:
             return None
 
@@ -550,6 +570,10 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
 
         cdef str key = f"{_ACCOUNTS}:{account_id.to_str()}"
         cdef list result = self._backing.read(key)
+
+        return self._decode_account(result)
+
+    cdef Account _decode_account(self, list result):
         if not result:
             return None
 
@@ -581,6 +605,9 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         cdef str key = f"{_ORDERS}:{client_order_id.to_str()}"
         cdef list result = self._backing.read(key)
 
+        return self._decode_order(result)
+
+    cdef Order _decode_order(self, list result):
         # Check there is at least one event to pop
         if not result:
             return None
@@ -633,12 +660,18 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         cdef str key = f"{_POSITIONS}:{position_id.to_str()}"
         cdef list result = self._backing.read(key)
 
+        return self._decode_position(result, {})
+
+    cdef Position _decode_position(self, list result, dict instruments):
         # Check there is at least one event to pop
         if not result:
             return None
 
         cdef OrderFilled initial_fill = self._serializer.deserialize(result.pop(0))
-        cdef Instrument instrument = self.load_instrument(initial_fill.instrument_id)
+        cdef Instrument instrument = instruments.get(initial_fill.instrument_id)
+        if instrument is None:
+            instrument = self.load_instrument(initial_fill.instrument_id)
+            instruments[initial_fill.instrument_id] = instrument
         if instrument is None:
             self._log.error(
                 f"Cannot load position: "
@@ -58,6 +58,8 @@ cdef class Actor(Component):
     cdef dict[InstrumentId, list[Indicator]] _indicators_for_trades
     cdef dict[BarType, list[Indicator]] _indicators_for_bars
     cdef set[type] _pyo3_conversion_types
+    cdef bint _has_historical_data
+    cdef bint _has_historical_data_batch
 
     cdef readonly PortfolioFacade portfolio
     """The read-only portfolio for the actor.\n\n:returns: `PortfolioFacade`"""
@@ -95,6 +97,7 @@ cdef class Actor(Component):
     cpdef void on_bar(self, Bar bar)
     cpdef void on_data(self, data)
     cpdef void on_historical_data(self, data)
+    cpdef void on_historical_data_batch(self, list data)
     cpdef void on_event(self, Event event)
 
 # -- REGISTRATION ---------------------------------------------------------------------------------
@@ -248,6 +251,7 @@ cdef class Actor(Component):
     cpdef void handle_instrument_status(self, InstrumentStatus data)
     cpdef void handle_instrument_close(self, InstrumentClose data)
     cpdef void handle_historical_data(self, data)
+    cpdef void handle_historical_data_batch(self, list data)
     cpdef void handle_event(self, Event event)
 
 # -- HANDLERS -------------------------------------------------------------------------------------
@@ -262,6 +266,9 @@ cdef class Actor(Component):
     cpdef void _handle_indicators_for_quote(self, list indicators, QuoteTick tick)
     cpdef void _handle_indicators_for_trade(self, list indicators, TradeTick tick)
     cpdef void _handle_indicators_for_bar(self, list indicators, Bar bar)
+    cpdef void _handle_indicators_for_quotes(self, list indicators, list ticks)
+    cpdef void _handle_indicators_for_trades(self, list indicators, list ticks)
+    cpdef void _handle_indicators_for_bars(self, list indicators, list bars)
 
 # -- EGRESS ---------------------------------------------------------------------------------------
 
@@ -125,6 +125,12 @@ cdef class Actor(Component):
         self._indicators_for_bars: dict[BarType, list[Indicator]] = {}
 
         self._pyo3_conversion_types = set()
+        self._has_historical_data = (
+            type(self).on_historical_data is not Actor.on_historical_data
+        )
+        self._has_historical_data_batch = (
+            type(self).on_historical_data_batch is not Actor.on_historical_data_batch
+        )
 
         # Configuration
         self.config = config
@@ -463,6 +469,29 @@ cdef class Actor(Component):
         """
         # Optionally override in subclass
 
+    cpdef void on_historical_data_batch(self, list data):
+        """
+        Actions to be performed when running and receives a batch of historical data.
+
+        Only called if overridden, otherwise `on_historical_data` is called for
+        each item of the batch. When overridden, any registered indicators are
+        updated with the whole batch prior to this method being called.
+
+        Parameters
+        ----------
+        data : list[Data]
+            The historical data received.
+
+        Warnings
+        --------
+        System method (not intended to be called by user code).
+
+        """
+        # Optionally override in subclass
+        cdef int i
+        for i in range(len(data)):
+            self.on_historical_data(data[i])
+
     cpdef void on_event(self, Event event):
         """
         Actions to be performed running and receives an event.
@@ -1146,9 +1175,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.instrument"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=self._msgbus.topic_cache.get_instrument_topic(instrument_id),
             handler=self.handle_instrument,
         )
 
@@ -1203,9 +1230,7 @@ cdef class Actor(Component):
             self._pyo3_conversion_types.add(OrderBookDeltas)
 
         self._msgbus.subscribe(
-            topic=f"data.book.deltas"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=self._msgbus.topic_cache.get_deltas_topic(instrument_id),
             handler=self.handle_order_book_deltas,
         )
 
@@ -1285,10 +1310,7 @@ cdef class Actor(Component):
             return
 
         self._msgbus.subscribe(
-            topic=f"data.book.snapshots"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}"
-                  f".{interval_ms}",
+            topic=self._msgbus.topic_cache.get_snapshots_topic(instrument_id, interval_ms),
             handler=self.handle_order_book,
         )
 
@@ -1326,9 +1348,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.quotes"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=self._msgbus.topic_cache.get_quotes_topic(instrument_id),
             handler=self.handle_quote_tick,
         )
 
@@ -1359,9 +1379,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.trades"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=self._msgbus.topic_cache.get_trades_topic(instrument_id),
             handler=self.handle_trade_tick,
         )
 
@@ -1400,7 +1418,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.bars.{bar_type}",
+            topic=self._msgbus.topic_cache.get_bars_topic(bar_type),
             handler=self.handle_bar,
         )
 
@@ -1436,7 +1454,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.status.{instrument_id.venue}.{instrument_id.symbol}",
+            topic=self._msgbus.topic_cache.get_status_topic(instrument_id),
             handler=self.handle_instrument_status,
         )
 
@@ -1468,7 +1486,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.venue.close_price.{instrument_id.to_str()}",
+            topic=self._msgbus.topic_cache.get_close_prices_topic(instrument_id),
             handler=self.handle_instrument_close,
         )
 
@@ -1564,9 +1582,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.instrument"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=self._msgbus.topic_cache.get_instrument_topic(instrument_id),
             handler=self.handle_instrument,
         )
 
@@ -1597,9 +1613,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.book.deltas"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=self._msgbus.topic_cache.get_deltas_topic(instrument_id),
             handler=self.handle_order_book_deltas,
         )
 
@@ -1639,10 +1653,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.book.snapshots"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}"
-                  f".{interval_ms}",
+            topic=self._msgbus.topic_cache.get_snapshots_topic(instrument_id, interval_ms),
             handler=self.handle_order_book,
         )
 
@@ -1676,9 +1687,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.quotes"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=self._msgbus.topic_cache.get_quotes_topic(instrument_id),
             handler=self.handle_quote_tick,
         )
 
@@ -1709,9 +1718,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.trades"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=self._msgbus.topic_cache.get_trades_topic(instrument_id),
             handler=self.handle_trade_tick,
         )
 
@@ -1742,7 +1749,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.bars.{bar_type}",
+            topic=self._msgbus.topic_cache.get_bars_topic(bar_type),
             handler=self.handle_bar,
         )
 
@@ -1774,7 +1781,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.status.{instrument_id.venue}.{instrument_id.symbol}",
+            topic=self._msgbus.topic_cache.get_status_topic(instrument_id),
             handler=self.handle_instrument_status,
         )
 
@@ -2526,6 +2533,14 @@ cdef class Actor(Component):
         cdef:
             int i
             QuoteTick tick
+        # Indicators can be updated for the whole batch up front when no
+        # per-item handler could observe their intermediate values
+        if self._has_historical_data_batch or not self._has_historical_data:
+            if indicators:
+                self._handle_indicators_for_quotes(indicators, ticks)
+            self.handle_historical_data_batch(ticks)
+            return
+
         for i in range(length):
             tick = ticks[i]
             if indicators:
@@ -2596,6 +2611,14 @@ cdef class Actor(Component):
         cdef:
             int i
             TradeTick tick
+        # Indicators can be updated for the whole batch up front when no
+        # per-item handler could observe their intermediate values
+        if self._has_historical_data_batch or not self._has_historical_data:
+            if indicators:
+                self._handle_indicators_for_trades(indicators, ticks)
+            self.handle_historical_data_batch(ticks)
+            return
+
         for i in range(length):
             tick = ticks[i]
             if indicators:
@@ -2669,6 +2692,14 @@ cdef class Actor(Component):
         cdef:
             int i
             Bar bar
+        # Indicators can be updated for the whole batch up front when no
+        # per-item handler could observe their intermediate values
+        if self._has_historical_data_batch or not self._has_historical_data:
+            if indicators:
+                self._handle_indicators_for_bars(indicators, bars)
+            self.handle_historical_data_batch(bars)
+            return
+
         for i in range(length):
             bar = bars[i]
             if indicators:
@@ -2772,6 +2803,41 @@ cdef class Actor(Component):
             self._log.exception(f"Error on handling {repr(data)}", e)
             raise
 
+    cpdef void handle_historical_data_batch(self, list data):
+        """
+        Handle the given batch of historical data.
+
+        If `on_historical_data_batch` is overridden then the whole batch is
+        passed in one call, otherwise each item is handled individually.
+
+        Parameters
+        ----------
+        data : list[Data]
+            The historical data received.
+
+        Warnings
+        --------
+        System method (not intended to be called by user code).
+
+        """
+        Condition.not_none(data, "data")
+
+        cdef int length = len(data)
+        if length == 0:
+            return  # Nothing to handle
+
+        cdef int i
+        if not self._has_historical_data_batch:
+            for i in range(length):
+                self.handle_historical_data(data[i])
+            return
+
+        try:
+            self.on_historical_data_batch(data)
+        except Exception as e:
+            self._log.exception(f"Error on handling <{type(data[0]).__name__}[{length}]> data", e)
+            raise
+
     cpdef void handle_event(self, Event event):
         """
         Handle the given event.
@@ -2799,8 +2865,7 @@ cdef class Actor(Component):
 
     cpdef void _handle_data_response(self, DataResponse response):
         if isinstance(response.data, list):
-            for data in response.data:
-                self.handle_historical_data(data)
+            self.handle_historical_data_batch(response.data)
         else:
             self.handle_historical_data(response.data)
         self._finish_response(response.correlation_id)
@@ -2845,6 +2910,21 @@ cdef class Actor(Component):
         for indicator in indicators:
             indicator.handle_bar(bar)
 
+    cpdef void _handle_indicators_for_quotes(self, list indicators, list ticks):
+        cdef Indicator indicator
+        for indicator in indicators:
+            indicator.handle_quote_ticks(ticks)
+
+    cpdef void _handle_indicators_for_trades(self, list indicators, list ticks):
+        cdef Indicator indicator
+        for indicator in indicators:
+            indicator.handle_trade_ticks(ticks)
+
+    cpdef void _handle_indicators_for_bars(self, list indicators, list bars):
+        cdef Indicator indicator
+        for indicator in indicators:
+            indicator.handle_bars(bars)
+
 # -- EGRESS ---------------------------------------------------------------------------------------
 
     cdef void _send_data_cmd(self, DataCommand command):
@@ -20,6 +20,7 @@ from cpython.datetime cimport timedelta
 from cpython.datetime cimport tzinfo
 from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
+from libc.stdint cimport uintptr_t
 
 from nautilus_trader.core.fsm cimport FiniteStateMachine
 from nautilus_trader.core.message cimport Event
@@ -35,7 +36,10 @@ from nautilus_trader.core.rust.common cimport TestClock_API
 from nautilus_trader.core.rust.common cimport TimeEvent_t
 from nautilus_trader.core.rust.core cimport CVec
 from nautilus_trader.core.uuid cimport UUID4
+from nautilus_trader.model.data cimport BarType
 from nautilus_trader.model.identifiers cimport Identifier
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport StrategyId
 from nautilus_trader.model.identifiers cimport TraderId
 from nautilus_trader.serialization.base cimport Serializer
 
@@ -81,20 +85,44 @@ cdef class Clock:
 
 
 cdef dict[UUID4, Clock] _COMPONENT_CLOCKS
+cdef dict[UUID4, TestClockGroup] _COMPONENT_CLOCK_GROUPS
 
 cdef list[TestClock] get_component_clocks(UUID4 instance_id)
 cpdef void register_component_clock(UUID4 instance_id, Clock clock)
 cpdef void deregister_component_clock(UUID4 instance_id, Clock clock)
+cdef TestClockGroup link_component_clocks(UUID4 instance_id)
+cdef void unlink_component_clocks(UUID4 instance_id)
 
 
 cdef class TestClock(Clock):
     cdef TestClock_API _mem
+    cdef TestClockGroup _group
 
+    cdef void _sync_time(self)
+    cdef void _reschedule(self)
     cpdef void set_time(self, uint64_t to_time_ns)
     cdef CVec advance_time_c(self, uint64_t to_time_ns, bint set_time=*)
     cpdef list advance_time(self, uint64_t to_time_ns, bint set_time=*)
 
 
+cdef class TestClockGroup:
+    cdef dict _clocks
+    cdef dict _scheduled
+    cdef list _queue
+    cdef uint64_t _sequence
+
+    cdef readonly uint64_t time_ns
+    """The current time of the group (UNIX nanoseconds).\n\n:returns: `uint64_t`"""
+
+    cpdef void add(self, TestClock clock)
+    cpdef void remove(self, TestClock clock)
+    cpdef void clear(self)
+    cpdef void set_time(self, uint64_t to_time_ns)
+    cdef void schedule(self, TestClock clock)
+    cdef uint64_t next_time(self)
+    cdef list pop_due(self, uint64_t to_time_ns)
+
+
 cdef class LiveClock(Clock):
     cdef LiveClock_API _mem
 
@@ -245,20 +273,52 @@ cdef class Component:
     )
 
 
+cdef class TopicCache:
+    cdef dict[tuple, str] _instrument_topics
+    cdef dict[tuple, str] _deltas_topics
+    cdef dict[tuple, str] _depth_topics
+    cdef dict[tuple, str] _snapshots_topics
+    cdef dict[tuple, str] _quotes_topics
+    cdef dict[tuple, str] _trades_topics
+    cdef dict[tuple, str] _status_topics
+    cdef dict[tuple, str] _close_prices_topics
+    cdef dict[tuple, str] _bars_topics
+    cdef dict[uintptr_t, str] _order_events_topics
+    cdef dict[uintptr_t, str] _position_events_topics
+
+    cpdef str get_instrument_topic(self, InstrumentId instrument_id)
+    cpdef str get_deltas_topic(self, InstrumentId instrument_id)
+    cpdef str get_depth_topic(self, InstrumentId instrument_id)
+    cpdef str get_snapshots_topic(self, InstrumentId instrument_id, int interval_ms)
+    cpdef str get_quotes_topic(self, InstrumentId instrument_id)
+    cpdef str get_trades_topic(self, InstrumentId instrument_id)
+    cpdef str get_status_topic(self, InstrumentId instrument_id)
+    cpdef str get_close_prices_topic(self, InstrumentId instrument_id)
+    cpdef str get_bars_topic(self, BarType bar_type)
+    cpdef str get_order_events_topic(self, StrategyId strategy_id)
+    cpdef str get_position_events_topic(self, StrategyId strategy_id)
+
+
 cdef class MessageBus:
     cdef Clock _clock
     cdef Logger _log
     cdef object _database
     cdef dict[Subscription, list[str]] _subscriptions
     cdef dict[str, Subscription[:]] _patterns
+    cdef list[str] _resolved_topics
+    cdef dict[str, list[Subscription]] _prefix_index
+    cdef dict[int, int] _prefix_lengths
+    cdef dict[Subscription, uint64_t] _subscription_order
+    cdef uint64_t _subscription_count
     cdef dict[str, object] _endpoints
     cdef dict[UUID4, object] _correlation_index
     cdef tuple[type] _publishable_types
     cdef set[type] _streaming_types
-    cdef bint _resolved
 
     cdef readonly TraderId trader_id
     """The trader ID associated with the bus.\n\n:returns: `TraderId`"""
+    cdef readonly TopicCache topic_cache
+    """The cache of topics for the bus.\n\n:returns: `TopicCache`"""
     cdef readonly Serializer serializer
     """The serializer for the bus.\n\n:returns: `Serializer`"""
     cdef readonly bint has_backing
@@ -287,11 +347,15 @@ cdef class MessageBus:
     cpdef void send(self, str endpoint, msg)
     cpdef void request(self, str endpoint, Request request)
     cpdef void response(self, Response response)
-    cpdef void subscribe(self, str topic, handler, int priority=*)
+    cpdef void subscribe(self, str topic, handler, int priority=*, batch_handler=*)
     cpdef void unsubscribe(self, str topic, handler)
     cpdef void publish(self, str topic, msg, bint external_pub=*)
     cdef void publish_c(self, str topic, msg, bint external_pub=*)
+    cpdef void publish_batch(self, str topic, list msgs, bint external_pub=*)
+    cdef void publish_batch_c(self, str topic, list msgs, bint external_pub=*)
+    cdef void _publish_external(self, str topic, msg)
     cdef Subscription[:] _resolve_subscriptions(self, str topic)
+    cdef Subscription[:] _sort_subscriptions(self, list subs)
 
 
 cdef bint is_matching(str topic, str pattern)
@@ -304,6 +368,8 @@ cdef class Subscription:
     """The handler for the subscription.\n\n:returns: `Callable`"""
     cdef readonly int priority
     """The priority for the subscription.\n\n:returns: `int`"""
+    cdef readonly object batch_handler
+    """The batch handler for the subscription (if any).\n\n:returns: `Callable` or ``None``"""
 
 
 cdef class Throttler:
@@ -15,9 +15,12 @@
 
 import asyncio
 import copy
+import heapq
 import socket
 import sys
 import traceback
+from bisect import bisect_left
+from bisect import insort
 from collections import deque
 from typing import Any
 from typing import Callable
@@ -42,7 +45,9 @@ from cpython.object cimport PyCallable_Check
 from cpython.object cimport PyObject
 from cpython.pycapsule cimport PyCapsule_GetPointer
 from libc.stdint cimport int64_t
+from libc.stdint cimport UINT64_MAX
 from libc.stdint cimport uint64_t
+from libc.stdint cimport uintptr_t
 from libc.stdio cimport printf
 
 from nautilus_trader.common.messages cimport ComponentStateChanged
@@ -114,13 +119,18 @@ from nautilus_trader.core.rust.core cimport nanos_to_millis
 from nautilus_trader.core.rust.core cimport nanos_to_secs
 from nautilus_trader.core.rust.core cimport secs_to_nanos
 from nautilus_trader.core.rust.core cimport uuid4_from_cstr
+from nautilus_trader.core.rust.model cimport BarType_t
+from nautilus_trader.core.rust.model cimport BarType_t_Tag
 from nautilus_trader.core.string cimport cstr_to_pystr
 from nautilus_trader.core.string cimport pybytes_to_cstr
 from nautilus_trader.core.string cimport pystr_to_cstr
 from nautilus_trader.core.string cimport ustr_to_pystr
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.model.identifiers cimport ComponentId
+from nautilus_trader.model.data cimport BarType
 from nautilus_trader.model.identifiers cimport Identifier
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport StrategyId
 from nautilus_trader.model.identifiers cimport TraderId
 from nautilus_trader.serialization.base cimport _EXTERNAL_PUBLISHABLE_TYPES
 from nautilus_trader.serialization.base cimport Serializer
@@ -495,6 +505,9 @@ cdef class Clock:
 # Global map of clocks per kernel instance used when running a `BacktestEngine`
 _COMPONENT_CLOCKS = {}
 
+# Global map of linked clock groups per kernel instance (while a backtest is running)
+_COMPONENT_CLOCK_GROUPS = {}
+
 
 cdef list[TestClock] get_component_clocks(UUID4 instance_id):
     # Create a shallow copy of the clocks list, in case a new
@@ -515,6 +528,10 @@ cpdef void register_component_clock(UUID4 instance_id, Clock clock):
     if clock not in clocks:
         clocks.append(clock)
 
+    cdef TestClockGroup group = _COMPONENT_CLOCK_GROUPS.get(instance_id)
+    if group is not None:
+        group.add(clock)
+
 
 cpdef void deregister_component_clock(UUID4 instance_id, Clock clock):
     Condition.not_none(instance_id, "instance_id")
@@ -528,13 +545,186 @@ cpdef void deregister_component_clock(UUID4 instance_id, Clock clock):
     if clock in clocks:
         clocks.remove(clock)
 
+    cdef TestClockGroup group = _COMPONENT_CLOCK_GROUPS.get(instance_id)
+    if group is not None:
+        group.remove(clock)
+
 
 cpdef void remove_instance_component_clocks(UUID4 instance_id):
     Condition.not_none(instance_id, "instance_id")
 
+    unlink_component_clocks(instance_id)
     _COMPONENT_CLOCKS.pop(instance_id, None)
 
 
+cdef TestClockGroup link_component_clocks(UUID4 instance_id):
+    # Link all clocks of the instance to a single shared time source and timer queue,
+    # clocks registered while linked join the group.
+    cdef TestClockGroup group = _COMPONENT_CLOCK_GROUPS.get(instance_id)
+    if group is not None:
+        return group
+
+    group = TestClockGroup()
+
+    cdef Clock clock
+    for clock in _COMPONENT_CLOCKS.get(instance_id, []):
+        group.add(clock)
+
+    _COMPONENT_CLOCK_GROUPS[instance_id] = group
+    return group
+
+
+cdef void unlink_component_clocks(UUID4 instance_id):
+    cdef TestClockGroup group = _COMPONENT_CLOCK_GROUPS.pop(instance_id, None)
+    if group is not None:
+        group.clear()
+
+
+cdef class TestClockGroup:
+    """
+    Provides a shared time source and timer queue for a group of test clocks.
+
+    Each linked `TestClock` reads the time of the group, so setting the time is
+    O(1) regardless of the number of clocks. The clocks are held in a heap keyed
+    by their next timer fire time, so only clocks with a timer due need to be
+    advanced.
+
+    """
+
+    __test__ = False  # Required so pytest does not consider this a test class
+
+    def __init__(self):
+        self.time_ns = 0
+        self._clocks: dict[TestClock, int] = {}  # Clock -> registration sequence
+        self._scheduled: dict[TestClock, int] = {}  # Clock -> scheduled next time (ns)
+        self._queue: list[tuple[int, int, TestClock]] = []
+        self._sequence = 0
+
+    cpdef void add(self, TestClock clock):
+        """
+        Add the given clock to the group.
+
+        The clock will read its time from the group until removed.
+
+        Parameters
+        ----------
+        clock : TestClock
+            The clock to add.
+
+        """
+        Condition.not_none(clock, "clock")
+
+        if clock in self._clocks:
+            return
+
+        if not self._clocks:
+            self.time_ns = test_clock_timestamp_ns(&clock._mem)
+
+        self._clocks[clock] = self._sequence
+        self._sequence += 1
+        clock._group = self
+        clock._sync_time()
+        self.schedule(clock)
+
+    cpdef void remove(self, TestClock clock):
+        """
+        Remove the given clock from the group.
+
+        The clock retains the current time of the group.
+
+        Parameters
+        ----------
+        clock : TestClock
+            The clock to remove.
+
+        """
+        Condition.not_none(clock, "clock")
+
+        if self._clocks.pop(clock, None) is None:
+            return
+
+        self._scheduled.pop(clock, None)
+        test_clock_set_time(&clock._mem, self.time_ns)
+        clock._group = None
+
+    cpdef void clear(self):
+        """
+        Remove all clocks from the group.
+
+        """
+        cdef TestClock clock
+        for clock in list(self._clocks):
+            self.remove(clock)
+
+        self._queue.clear()
+
+    cpdef void set_time(self, uint64_t to_time_ns):
+        """
+        Set the time of all clocks in the group.
+
+        Parameters
+        ----------
+        to_time_ns : uint64_t
+            The UNIX time (nanoseconds) to set.
+
+        """
+        cdef bint is_backwards = to_time_ns < self.time_ns
+        self.time_ns = to_time_ns
+
+        cdef TestClock clock
+        if is_backwards:
+            # Keep the internal clock times consistent for monotonic checks
+            for clock in self._clocks:
+                clock._sync_time()
+
+    cdef void schedule(self, TestClock clock):
+        cdef uint64_t next_time_ns = 0
+        cdef uint64_t timer_next_ns
+        cdef str name
+        for name in <list>test_clock_timer_names(&clock._mem):
+            timer_next_ns = test_clock_next_time(&clock._mem, pystr_to_cstr(name))
+            if next_time_ns == 0 or timer_next_ns < next_time_ns:
+                next_time_ns = timer_next_ns
+
+        if next_time_ns == 0:
+            self._scheduled.pop(clock, None)
+            return  # No active timers
+
+        if self._scheduled.get(clock) == next_time_ns:
+            return  # Already scheduled
+
+        self._scheduled[clock] = next_time_ns
+        heapq.heappush(self._queue, (next_time_ns, self._sequence, clock))
+        self._sequence += 1
+
+    cdef uint64_t next_time(self):
+        cdef tuple entry
+        while self._queue:
+            entry = self._queue[0]
+            if self._scheduled.get(entry[2]) == entry[0]:
+                return entry[0]
+            heapq.heappop(self._queue)  # Stale entry
+
+        return UINT64_MAX
+
+    cdef list pop_due(self, uint64_t to_time_ns):
+        cdef list due = []
+
+        cdef tuple entry
+        cdef TestClock clock
+        while self._queue and self._queue[0][0] <= to_time_ns:
+            entry = heapq.heappop(self._queue)
+            clock = entry[2]
+            if self._scheduled.get(clock) != entry[0]:
+                continue  # Stale entry
+            del self._scheduled[clock]
+            due.append(clock)
+
+        # Advance clocks in registration order
+        due.sort(key=self._clocks.__getitem__)
+        return due
+
+
 cdef class TestClock(Clock):
     """
     Provides a monotonic clock for backtesting and unit testing.
@@ -545,6 +735,7 @@ cdef class TestClock(Clock):
 
     def __init__(self):
         self._mem = test_clock_new()
+        self._group = None
 
     def __del__(self) -> None:
         if self._mem._0 != NULL:
@@ -559,14 +750,29 @@ cdef class TestClock(Clock):
         return test_clock_timer_count(&self._mem)
 
     cpdef double timestamp(self):
+        if self._group is not None:
+            return self._group.time_ns / 1_000_000_000
         return test_clock_timestamp(&self._mem)
 
     cpdef uint64_t timestamp_ms(self):
+        if self._group is not None:
+            return self._group.time_ns // 1_000_000
         return test_clock_timestamp_ms(&self._mem)
 
     cpdef uint64_t timestamp_ns(self):
+        if self._group is not None:
+            return self._group.time_ns
         return test_clock_timestamp_ns(&self._mem)
 
+    cdef void _sync_time(self):
+        # Set the internal time to the group time before timer operations
+        if self._group is not None:
+            test_clock_set_time(&self._mem, self._group.time_ns)
+
+    cdef void _reschedule(self):
+        if self._group is not None:
+            self._group.schedule(self)
+
     cpdef void register_default_handler(self, callback: Callable[[TimeEvent], None]):
         Condition.callable(callback, "callback")
 
@@ -581,12 +787,14 @@ cdef class TestClock(Clock):
         Condition.valid_string(name, "name")
         Condition.not_in(name, self.timer_names, "name", "self.timer_names")
 
+        self._sync_time()
         test_clock_set_time_alert(
             &self._mem,
             pystr_to_cstr(name),
             alert_time_ns,
             <PyObject *>callback,
         )
+        self._reschedule()
 
     cpdef void set_timer_ns(
         self,
@@ -607,6 +815,7 @@ cdef class TestClock(Clock):
             Condition.true(stop_time_ns > ts_now, "`stop_time_ns` was < `ts_now`")
             Condition.true(start_time_ns + interval_ns <= stop_time_ns, "`start_time_ns` + `interval_ns` was > `stop_time_ns`")
 
+        self._sync_time()
         test_clock_set_timer(
             &self._mem,
             pystr_to_cstr(name),
@@ -615,6 +824,7 @@ cdef class TestClock(Clock):
             stop_time_ns,
             <PyObject *>callback,
         )
+        self._reschedule()
 
     cpdef uint64_t next_time_ns(self, str name):
         Condition.valid_string(name, "name")
@@ -625,26 +835,41 @@ cdef class TestClock(Clock):
         Condition.is_in(name, self.timer_names, "name", "self.timer_names")
 
         test_clock_cancel_timer(&self._mem, pystr_to_cstr(name))
+        self._reschedule()
 
     cpdef void cancel_timers(self):
         test_clock_cancel_timers(&self._mem)
+        self._reschedule()
 
     cpdef void set_time(self, uint64_t to_time_ns):
         """
         Set the clocks datetime to the given time (UTC).
 
+        If the clock is linked to a `TestClockGroup` then the time of the
+        group (and all of its clocks) is set.
+
         Parameters
         ----------
         to_time_ns : uint64_t
             The UNIX time (nanoseconds) to set.
 
         """
+        if self._group is not None:
+            self._group.set_time(to_time_ns)
         test_clock_set_time(&self._mem, to_time_ns)
 
     cdef CVec advance_time_c(self, uint64_t to_time_ns, bint set_time=True):
-        Condition.true(to_time_ns >= test_clock_timestamp_ns(&self._mem), "to_time_ns was < time_ns (not monotonic)")
+        Condition.true(to_time_ns >= self.timestamp_ns(), "to_time_ns was < time_ns (not monotonic)")
+
+        self._sync_time()
+        cdef CVec raw_handler_vec = <CVec>test_clock_advance_time(&self._mem, to_time_ns, set_time)
+
+        if self._group is not None:
+            if set_time:
+                self._group.set_time(to_time_ns)
+            self._group.schedule(self)
 
-        return <CVec>test_clock_advance_time(&self._mem, to_time_ns, set_time)
+        return raw_handler_vec
 
     cpdef list advance_time(self, uint64_t to_time_ns, bint set_time=True):
         """
@@ -1936,6 +2161,300 @@ cdef class Component:
         )
 
 
+cdef inline tuple _instrument_id_key(InstrumentId instrument_id):
+    return (
+        <uintptr_t>instrument_id._mem.symbol._0,
+        <uintptr_t>instrument_id._mem.venue._0,
+    )
+
+
+cdef inline tuple _bar_type_key(BarType bar_type):
+    cdef BarType_t* mem = &bar_type._mem
+    if mem.tag == BarType_t_Tag.STANDARD:
+        return (
+            <uintptr_t>mem.STANDARD.instrument_id.symbol._0,
+            <uintptr_t>mem.STANDARD.instrument_id.venue._0,
+            mem.STANDARD.spec.step,
+            mem.STANDARD.spec.aggregation,
+            <int>mem.STANDARD.spec.price_type,
+            <int>mem.STANDARD.aggregation_source,
+        )
+
+    return (
+        <uintptr_t>mem.COMPOSITE.instrument_id.symbol._0,
+        <uintptr_t>mem.COMPOSITE.instrument_id.venue._0,
+        mem.COMPOSITE.spec.step,
+        mem.COMPOSITE.spec.aggregation,
+        <int>mem.COMPOSITE.spec.price_type,
+        <int>mem.COMPOSITE.aggregation_source,
+        <uintptr_t>mem.COMPOSITE.composite_instrument_id.symbol._0,
+        <uintptr_t>mem.COMPOSITE.composite_instrument_id.venue._0,
+        mem.COMPOSITE.composite_spec.step,
+        mem.COMPOSITE.composite_spec.aggregation,
+        <int>mem.COMPOSITE.composite_spec.price_type,
+        <int>mem.COMPOSITE.composite_aggregation_source,
+    )
+
+
+cdef class TopicCache:
+    """
+    Provides a cache of message bus topics for instruments, bar types and strategies.
+
+    Each topic string is formatted once and then reused, so that publishing does
+    no string formatting, and the message bus pattern lookup reuses the cached
+    hash of the same string object.
+
+    Topics are keyed on the interned (Ustr) string pointers of the identifiers,
+    as hashing the identifiers themselves would format their string values.
+    """
+
+    def __init__(self) -> None:
+        self._instrument_topics: dict[tuple, str] = {}
+        self._deltas_topics: dict[tuple, str] = {}
+        self._depth_topics: dict[tuple, str] = {}
+        self._snapshots_topics: dict[tuple, str] = {}
+        self._quotes_topics: dict[tuple, str] = {}
+        self._trades_topics: dict[tuple, str] = {}
+        self._status_topics: dict[tuple, str] = {}
+        self._close_prices_topics: dict[tuple, str] = {}
+        self._bars_topics: dict[tuple, str] = {}
+        self._order_events_topics: dict[int, str] = {}
+        self._position_events_topics: dict[int, str] = {}
+
+    cpdef str get_instrument_topic(self, InstrumentId instrument_id):
+        """
+        Return the topic for instrument updates.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the topic.
+
+        Returns
+        -------
+        str
+
+        """
+        cdef tuple key = _instrument_id_key(instrument_id)
+        cdef str topic = self._instrument_topics.get(key)
+        if topic is None:
+            topic = f"data.instrument.{instrument_id.venue}.{instrument_id.symbol}"
+            self._instrument_topics[key] = topic
+        return topic
+
+    cpdef str get_deltas_topic(self, InstrumentId instrument_id):
+        """
+        Return the topic for order book deltas.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the topic.
+
+        Returns
+        -------
+        str
+
+        """
+        cdef tuple key = _instrument_id_key(instrument_id)
+        cdef str topic = self._deltas_topics.get(key)
+        if topic is None:
+            topic = f"data.book.deltas.{instrument_id.venue}.{instrument_id.symbol}"
+            self._deltas_topics[key] = topic
+        return topic
+
+    cpdef str get_depth_topic(self, InstrumentId instrument_id):
+        """
+        Return the topic for order book depth.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the topic.
+
+        Returns
+        -------
+        str
+
+        """
+        cdef tuple key = _instrument_id_key(instrument_id)
+        cdef str topic = self._depth_topics.get(key)
+        if topic is None:
+            topic = f"data.book.depth.{instrument_id.venue}.{instrument_id.symbol}"
+            self._depth_topics[key] = topic
+        return topic
+
+    cpdef str get_snapshots_topic(self, InstrumentId instrument_id, int interval_ms):
+        """
+        Return the topic for order book snapshots at the given interval.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the topic.
+        interval_ms : int
+            The snapshot interval (milliseconds) for the topic.
+
+        Returns
+        -------
+        str
+
+        """
+        cdef tuple key = (*_instrument_id_key(instrument_id), interval_ms)
+        cdef str topic = self._snapshots_topics.get(key)
+        if topic is None:
+            topic = f"data.book.snapshots.{instrument_id.venue}.{instrument_id.symbol}.{interval_ms}"
+            self._snapshots_topics[key] = topic
+        return topic
+
+    cpdef str get_quotes_topic(self, InstrumentId instrument_id):
+        """
+        Return the topic for quote ticks.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the topic.
+
+        Returns
+        -------
+        str
+
+        """
+        cdef tuple key = _instrument_id_key(instrument_id)
+        cdef str topic = self._quotes_topics.get(key)
+        if topic is None:
+            topic = f"data.quotes.{instrument_id.venue}.{instrument_id.symbol}"
+            self._quotes_topics[key] = topic
+        return topic
+
+    cpdef str get_trades_topic(self, InstrumentId instrument_id):
+        """
+        Return the topic for trade ticks.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the topic.
+
+        Returns
+        -------
+        str
+
+        """
+        cdef tuple key = _instrument_id_key(instrument_id)
+        cdef str topic = self._trades_topics.get(key)
+        if topic is None:
+            topic = f"data.trades.{instrument_id.venue}.{instrument_id.symbol}"
+            self._trades_topics[key] = topic
+        return topic
+
+    cpdef str get_status_topic(self, InstrumentId instrument_id):
+        """
+        Return the topic for instrument status updates.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the topic.
+
+        Returns
+        -------
+        str
+
+        """
+        cdef tuple key = _instrument_id_key(instrument_id)
+        cdef str topic = self._status_topics.get(key)
+        if topic is None:
+            topic = f"data.status.{instrument_id.venue}.{instrument_id.symbol}"
+            self._status_topics[key] = topic
+        return topic
+
+    cpdef str get_close_prices_topic(self, InstrumentId instrument_id):
+        """
+        Return the topic for instrument close prices.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the topic.
+
+        Returns
+        -------
+        str
+
+        """
+        cdef tuple key = _instrument_id_key(instrument_id)
+        cdef str topic = self._close_prices_topics.get(key)
+        if topic is None:
+            topic = f"data.venue.close_price.{instrument_id}"
+            self._close_prices_topics[key] = topic
+        return topic
+
+    cpdef str get_bars_topic(self, BarType bar_type):
+        """
+        Return the topic for bars.
+
+        Parameters
+        ----------
+        bar_type : BarType
+            The bar type for the topic.
+
+        Returns
+        -------
+        str
+
+        """
+        cdef tuple key = _bar_type_key(bar_type)
+        cdef str topic = self._bars_topics.get(key)
+        if topic is None:
+            topic = f"data.bars.{bar_type}"
+            self._bars_topics[key] = topic
+        return topic
+
+    cpdef str get_order_events_topic(self, StrategyId strategy_id):
+        """
+        Return the topic for order events of the strategy.
+
+        Parameters
+        ----------
+        strategy_id : StrategyId
+            The strategy ID for the topic.
+
+        Returns
+        -------
+        str
+
+        """
+        cdef uintptr_t key = <uintptr_t>strategy_id._mem._0
+        cdef str topic = self._order_events_topics.get(key)
+        if topic is None:
+            topic = f"events.order.{strategy_id}"
+            self._order_events_topics[key] = topic
+        return topic
+
+    cpdef str get_position_events_topic(self, StrategyId strategy_id):
+        """
+        Return the topic for position events of the strategy.
+
+        Parameters
+        ----------
+        strategy_id : StrategyId
+            The strategy ID for the topic.
+
+        Returns
+        -------
+        str
+
+        """
+        cdef uintptr_t key = <uintptr_t>strategy_id._mem._0
+        cdef str topic = self._position_events_topics.get(key)
+        if topic is None:
+            topic = f"events.position.{strategy_id}"
+            self._position_events_topics[key] = topic
+        return topic
+
+
 cdef class MessageBus:
     """
     Provides a generic message bus to facilitate various messaging patterns.
@@ -2008,6 +2527,7 @@ cdef class MessageBus:
         Condition.type(config, MessageBusConfig, "config")
 
         self.trader_id = trader_id
+        self.topic_cache = TopicCache()
         self.serializer = serializer
         self.has_backing = database is not None
 
@@ -2041,13 +2561,17 @@ cdef class MessageBus:
 
         self._endpoints: dict[str, Callable[[Any], None]] = {}
         self._patterns: dict[str, Subscription[:]] = {}
+        self._resolved_topics: list[str] = []  # Sorted, for prefix range lookups
+        self._prefix_index: dict[str, list[Subscription]] = {}
+        self._prefix_lengths: dict[int, int] = {}
+        self._subscription_order: dict[Subscription, int] = {}
+        self._subscription_count = 0
         self._subscriptions: dict[Subscription, list[str]] = {}
         self._correlation_index: dict[UUID4, Callable[[Any], None]] = {}
         self._publishable_types = tuple(_EXTERNAL_PUBLISHABLE_TYPES)
         if types_filter is not None:
             self._publishable_types = tuple(o for o in _EXTERNAL_PUBLISHABLE_TYPES if o not in types_filter)
         self._streaming_types = set()
-        self._resolved = False
 
         # Counters
         self.sent_count = 0
@@ -2350,6 +2874,7 @@ cdef class MessageBus:
         str topic,
         handler: Callable[[Any], None],
         int priority = 0,
+        batch_handler: Callable[[list], None] | None = None,
     ):
         """
         Subscribe to the given message `topic` with the given callback `handler`.
@@ -2365,6 +2890,9 @@ cdef class MessageBus:
             The priority for the subscription. Determines the ordering of
             handlers receiving messages being processed, higher priority
             handlers will receive messages prior to lower priority handlers.
+        batch_handler : Callable[[list], None], optional
+            The handler for batches of messages published with `publish_batch`.
+            If ``None`` then `handler` is called for each message in a batch.
 
         Raises
         ------
@@ -2372,6 +2900,8 @@ cdef class MessageBus:
             If `topic` is not a valid string.
         ValueError
             If `handler` is not of type `Callable`.
+        ValueError
+            If `batch_handler` is not ``None`` and not of type `Callable`.
 
         Warnings
         --------
@@ -2385,12 +2915,14 @@ cdef class MessageBus:
         """
         Condition.valid_string(topic, "topic")
         Condition.callable(handler, "handler")
+        Condition.callable_or_none(batch_handler, "batch_handler")
 
         # Create subscription
         cdef Subscription sub = Subscription(
             topic=topic,
             handler=handler,
             priority=priority,
+            batch_handler=batch_handler,
         )
 
         # Check if already exists
@@ -2398,22 +2930,35 @@ cdef class MessageBus:
             self._log.debug(f"{sub} already exists")
             return
 
-        cdef list matches = []
-        cdef list patterns = list(self._patterns.keys())
+        self._subscription_order[sub] = self._subscription_count
+        self._subscription_count += 1
 
-        cdef str pattern
+        # Index the subscription by the literal prefix of its topic (up to any wildcard)
+        cdef str prefix = _literal_prefix(topic)
+        cdef list prefix_subs = self._prefix_index.get(prefix)
+        if prefix_subs is None:
+            prefix_subs = []
+            self._prefix_index[prefix] = prefix_subs
+            self._prefix_lengths[len(prefix)] = self._prefix_lengths.get(len(prefix), 0) + 1
+        prefix_subs.append(sub)
+
+        # Add to the already resolved topics starting with the prefix which match
+        cdef list matches = []
+        cdef Py_ssize_t i = bisect_left(self._resolved_topics, prefix)
+        cdef str resolved_topic
         cdef list subs
-        for pattern in patterns:
-            if is_matching(topic, pattern):
-                subs = list(self._patterns[pattern])
+        while i < len(self._resolved_topics):
+            resolved_topic = self._resolved_topics[i]
+            if not resolved_topic.startswith(prefix):
+                break
+            if is_matching(resolved_topic, topic):
+                subs = list(self._patterns[resolved_topic])
                 subs.append(sub)
-                subs = sorted(subs, reverse=True)
-                self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
-                matches.append(pattern)
-
-        self._subscriptions[sub] = sorted(matches)
+                self._patterns[resolved_topic] = self._sort_subscriptions(subs)
+                matches.append(resolved_topic)
+            i += 1
 
-        self._resolved = False
+        self._subscriptions[sub] = matches
 
         self._log.debug(f"Added {sub}")
 
@@ -2453,12 +2998,19 @@ cdef class MessageBus:
         for pattern in patterns:
             subs = list(self._patterns[pattern])
             subs.remove(sub)
-            subs = sorted(subs, reverse=True)
-            self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
+            self._patterns[pattern] = self._sort_subscriptions(subs)
 
-        del self._subscriptions[sub]
+        cdef str prefix = _literal_prefix(topic)
+        cdef list prefix_subs = self._prefix_index[prefix]
+        prefix_subs.remove(sub)
+        if not prefix_subs:
+            del self._prefix_index[prefix]
+            self._prefix_lengths[len(prefix)] -= 1
+            if self._prefix_lengths[len(prefix)] == 0:
+                del self._prefix_lengths[len(prefix)]
 
-        self._resolved = False
+        del self._subscriptions[sub]
+        del self._subscription_order[sub]
 
         self._log.debug(f"Removed {sub}")
 
@@ -2490,10 +3042,9 @@ cdef class MessageBus:
         # Get all subscriptions matching topic pattern
         # Note: cannot use truthiness on array
         cdef Subscription[:] subs = self._patterns.get(topic)
-        if subs is None or (not self._resolved and len(subs) == 0):
+        if subs is None:
             # Add the topic pattern and get matching subscribers
             subs = self._resolve_subscriptions(topic)
-            self._resolved = True
 
         # Send message to all matched subscribers
         cdef:
@@ -2504,70 +3055,164 @@ cdef class MessageBus:
             sub.handler(msg)
 
         # Publish externally (if configured)
-        cdef bytes payload_bytes
         if external_pub and self._database is not None and self.serializer is not None:
-            if isinstance(msg, self._publishable_types):
-                if isinstance(msg, bytes):
-                    payload_bytes = msg
-                else:
-                    payload_bytes = self.serializer.serialize(msg)
-                self._database.publish(
-                    topic,
-                    payload_bytes,
-                )
+            self._publish_external(topic, msg)
 
         self.pub_count += 1
 
+    cpdef void publish_batch(self, str topic, list msgs, bint external_pub = True):
+        """
+        Publish the given batch of messages for the given `topic`.
+
+        Subscription handlers will receive the batch in priority order
+        (highest first). A subscription with a batch handler receives the whole
+        batch in one call, otherwise its handler is called for each message.
+
+        Parameters
+        ----------
+        topic : str
+            The topic to publish on.
+        msgs : list[object]
+            The messages to publish.
+        external_pub : bool, default True
+            If the messages should also be published externally.
+
+        Warnings
+        --------
+        Each subscription receives every message of the batch before the next
+        subscription receives any, unlike publishing the messages individually.
+
+        """
+        self.publish_batch_c(topic, msgs, external_pub)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void publish_batch_c(self, str topic, list msgs, bint external_pub = True):
+        Condition.not_none(topic, "topic")
+        Condition.not_none(msgs, "msgs")
+
+        if not msgs:
+            return  # Nothing to publish
+
+        # Get all subscriptions matching topic pattern
+        cdef Subscription[:] subs = self._patterns.get(topic)
+        if subs is None:
+            # Add the topic pattern and get matching subscribers
+            subs = self._resolve_subscriptions(topic)
+
+        # Send messages to all matched subscribers
+        cdef:
+            int i
+            Subscription sub
+            object handler
+        for i in range(len(subs)):
+            sub = subs[i]
+            if sub.batch_handler is not None:
+                sub.batch_handler(msgs)
+            else:
+                handler = sub.handler
+                for msg in msgs:
+                    handler(msg)
+
+        # Publish externally (if configured)
+        if external_pub and self._database is not None and self.serializer is not None:
+            for msg in msgs:
+                self._publish_external(topic, msg)
+
+        self.pub_count += len(msgs)
+
+    cdef void _publish_external(self, str topic, msg):
+        cdef bytes payload_bytes
+        if isinstance(msg, self._publishable_types):
+            if isinstance(msg, bytes):
+                payload_bytes = msg
+            else:
+                payload_bytes = self.serializer.serialize(msg)
+            self._database.publish(
+                topic,
+                payload_bytes,
+            )
+
     cdef Subscription[:] _resolve_subscriptions(self, str topic):
+        # Only subscriptions whose literal prefix is a prefix of the topic can match
         cdef list subs_list = []
+        cdef Py_ssize_t n = len(topic)
+        cdef Py_ssize_t length
+        cdef list prefix_subs
         cdef Subscription existing_sub
-        # Copy to handle subscription changes on iteration
-        for existing_sub in self._subscriptions.copy():
-            if is_matching(topic, existing_sub.topic):
-                subs_list.append(existing_sub)
-
-        subs_list = sorted(subs_list, reverse=True)
-        cdef Subscription[:] subs_array = np.ascontiguousarray(subs_list, dtype=Subscription)
+        for length in self._prefix_lengths:
+            if length > n:
+                continue
+            prefix_subs = self._prefix_index.get(topic[:length])
+            if prefix_subs is None:
+                continue
+            for existing_sub in prefix_subs:
+                if is_matching(topic, existing_sub.topic):
+                    subs_list.append(existing_sub)
+
+        cdef Subscription[:] subs_array = self._sort_subscriptions(subs_list)
         self._patterns[topic] = subs_array
+        insort(self._resolved_topics, topic)
 
         cdef list matches
         for sub in subs_array:
-            matches = self._subscriptions.get(sub, [])
+            matches = self._subscriptions[sub]
             if topic not in matches:
-                matches.append(topic)
-            self._subscriptions[sub] = sorted(matches)
+                insort(matches, topic)
 
         return subs_array
 
+    cdef Subscription[:] _sort_subscriptions(self, list subs):
+        # Highest priority first, then in order of subscription (both sorts are stable)
+        subs.sort(key=self._subscription_order.__getitem__)
+        subs.sort(reverse=True)
+        return np.ascontiguousarray(subs, dtype=Subscription)
 
-cdef inline bint is_matching(str topic, str pattern):
-    # Get length of string and wildcard pattern
-    cdef int n = len(topic)
-    cdef int m = len(pattern)
-
-    # Create a DP lookup table
-    cdef np.ndarray[np.int8_t, ndim=2] t = np.empty((n + 1, m + 1), dtype=np.int8)
-    t.fill(False)
-
-    # If both pattern and string are empty: match
-    t[0, 0] = True
 
-    # Handle empty string case (i == 0)
-    cdef int j
-    for j in range(1, m + 1):
-        if pattern[j - 1] == '*':
-            t[0, j] = t[0, j - 1]
+cdef inline str _literal_prefix(str pattern):
+    cdef Py_ssize_t i
+    cdef Py_UCS4 c
+    for i in range(len(pattern)):
+        c = pattern[i]
+        if c == "*" or c == "?":
+            return pattern[:i]
+    return pattern
 
-    # Build a matrix in a bottom-up manner
-    cdef int i
-    for i in range(1, n + 1):
-        for j in range(1, m + 1):
-            if pattern[j - 1] == '*':
-                t[i, j] = t[i - 1, j] or t[i, j - 1]
-            elif pattern[j - 1] == '?' or topic[i - 1] == pattern[j - 1]:
-                t[i, j] = t[i - 1, j - 1]
 
-    return t[n, m]
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline bint is_matching(str topic, str pattern):
+    # Greedy wildcard matching, backtracking to the last `*` on a mismatch
+    cdef Py_ssize_t n = len(topic)
+    cdef Py_ssize_t m = len(pattern)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t j = 0
+    cdef Py_ssize_t star = -1
+    cdef Py_ssize_t mark = 0
+    cdef Py_UCS4 p
+    while i < n:
+        if j < m:
+            p = pattern[j]
+            if p == "*":
+                star = j
+                mark = i
+                j += 1
+                continue
+            if p == "?" or p == topic[i]:
+                i += 1
+                j += 1
+                continue
+        if star == -1:
+            return False
+        # Let the last `*` match one more character
+        j = star + 1
+        mark += 1
+        i = mark
+
+    while j < m and pattern[j] == "*":
+        j += 1
+
+    return j == m
 
 
 # Python wrapper for test access
@@ -2590,6 +3235,9 @@ cdef class Subscription:
         The handler for the subscription.
     priority : int
         The priority for the subscription.
+    batch_handler : Callable[[list], None], optional
+        The handler for batches of messages (if ``None`` then `handler` is
+        called for each message in a batch).
 
     Raises
     ------
@@ -2599,6 +3247,8 @@ cdef class Subscription:
         If `handler` is not of type `Callable`.
     ValueError
         If `priority` is negative (< 0).
+    ValueError
+        If `batch_handler` is not ``None`` and not of type `Callable`.
 
     Notes
     -----
@@ -2611,14 +3261,17 @@ cdef class Subscription:
         str topic,
         handler not None: Callable[[Any], None],
         int priority=0,
+        batch_handler: Callable[[list], None] | None = None,
     ):
         Condition.valid_string(topic, "topic")
         Condition.callable(handler, "handler")
         Condition.not_negative_int(priority, "priority")
+        Condition.callable_or_none(batch_handler, "batch_handler")
 
         self.topic = topic
         self.handler = handler
         self.priority = priority
+        self.batch_handler = batch_handler
 
     def __eq__(self, Subscription other) -> bool:
         return self.topic == other.topic and self.handler == other.handler
@@ -866,7 +866,7 @@ cdef class DataEngine(Component):
                 )
 
         # Setup subscriptions
-        cdef str topic = f"data.book.deltas.{instrument_id.venue}.{instrument_id.symbol}"
+        cdef str topic = self._msgbus.topic_cache.get_deltas_topic(instrument_id)
 
         if not self._msgbus.is_subscribed(
             topic=topic,
@@ -878,7 +878,7 @@ cdef class DataEngine(Component):
                 priority=10,
             )
 
-        topic = f"data.book.depth.{instrument_id.venue}.{instrument_id.symbol}"
+        topic = self._msgbus.topic_cache.get_depth_topic(instrument_id)
 
         if not only_deltas and not self._msgbus.is_subscribed(
             topic=topic,
@@ -1062,9 +1062,7 @@ cdef class DataEngine(Component):
                 return
 
             if not self._msgbus.has_subscribers(
-                f"data.instrument"
-                f".{instrument_id.venue}"
-                f".{instrument_id.symbol}",
+                self._msgbus.topic_cache.get_instrument_topic(instrument_id),
             ):
                 if instrument_id in client.subscribed_instruments():
                     client.unsubscribe_instrument(instrument_id)
@@ -1083,7 +1081,7 @@ cdef class DataEngine(Component):
             self._log.error("Cannot unsubscribe from synthetic instrument `OrderBookDelta` data")
             return
 
-        cdef str topic = f"data.book.deltas.{instrument_id.venue}.{instrument_id.symbol}"
+        cdef str topic = self._msgbus.topic_cache.get_deltas_topic(instrument_id)
 
         cdef int num_subscribers = len(self._msgbus.subscriptions(pattern=topic))
         cdef bint is_internal_book_subscriber = self._msgbus.is_subscribed(
@@ -1117,9 +1115,12 @@ cdef class DataEngine(Component):
             return
 
         # Setup topics
-        cdef str deltas_topic = f"data.book.deltas.{instrument_id.venue}.{instrument_id.symbol}"
-        cdef str depth_topic = f"data.book.depth.{instrument_id.venue}.{instrument_id.symbol}"
-        cdef str snapshots_topic = f"data.book.snapshots.{instrument_id.venue}.{instrument_id.symbol}"
+        cdef str deltas_topic = self._msgbus.topic_cache.get_deltas_topic(instrument_id)
+        cdef str depth_topic = self._msgbus.topic_cache.get_depth_topic(instrument_id)
+        cdef str snapshots_topic = self._msgbus.topic_cache.get_snapshots_topic(
+            instrument_id,
+            metadata["interval_ms"],
+        )
 
         # Check the deltas and the depth subscription
         cdef list[str] topics = [deltas_topic, depth_topic]
@@ -1158,9 +1159,7 @@ cdef class DataEngine(Component):
         Condition.not_none(instrument_id, "instrument_id")
 
         if not self._msgbus.has_subscribers(
-            f"data.quotes"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            self._msgbus.topic_cache.get_quotes_topic(instrument_id),
         ):
             if instrument_id in client.subscribed_quote_ticks():
                 client.unsubscribe_quote_ticks(instrument_id)
@@ -1174,9 +1173,7 @@ cdef class DataEngine(Component):
         Condition.not_none(instrument_id, "instrument_id")
 
         if not self._msgbus.has_subscribers(
-            f"data.trades"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            self._msgbus.topic_cache.get_trades_topic(instrument_id),
         ):
             if instrument_id in client.subscribed_trade_ticks():
                 client.unsubscribe_trade_ticks(instrument_id)
@@ -1189,7 +1186,7 @@ cdef class DataEngine(Component):
         Condition.not_none(client, "client")
         Condition.not_none(bar_type, "bar_type")
 
-        if self._msgbus.has_subscribers(f"data.bars.{bar_type}"):
+        if self._msgbus.has_subscribers(self._msgbus.topic_cache.get_bars_topic(bar_type)):
             return
 
         if bar_type.is_internally_aggregated():
@@ -1413,9 +1410,7 @@ cdef class DataEngine(Component):
     cpdef void _handle_instrument(self, Instrument instrument):
         self._cache.add_instrument(instrument)
         self._msgbus.publish_c(
-            topic=f"data.instrument"
-                  f".{instrument.id.venue}"
-                  f".{instrument.id.symbol}",
+            topic=self._msgbus.topic_cache.get_instrument_topic(instrument.id),
             msg=instrument,
         )
 
@@ -1440,9 +1435,7 @@ cdef class DataEngine(Component):
                     deltas=buffer_deltas
                 )
                 self._msgbus.publish_c(
-                    topic=f"data.book.deltas"
-                        f".{deltas.instrument_id.venue}"
-                        f".{deltas.instrument_id.symbol}",
+                    topic=self._msgbus.topic_cache.get_deltas_topic(deltas.instrument_id),
                     msg=deltas,
                 )
                 buffer_deltas.clear()
@@ -1452,9 +1445,7 @@ cdef class DataEngine(Component):
                 deltas=[delta]
             )
             self._msgbus.publish_c(
-                 topic=f"data.book.deltas"
-                    f".{deltas.instrument_id.venue}"
-                    f".{deltas.instrument_id.symbol}",
+                 topic=self._msgbus.topic_cache.get_deltas_topic(deltas.instrument_id),
                 msg=deltas,
             )
 
@@ -1480,25 +1471,19 @@ cdef class DataEngine(Component):
                         deltas=buffer_deltas,
                     )
                     self._msgbus.publish_c(
-                        topic=f"data.book.deltas"
-                            f".{deltas.instrument_id.venue}"
-                            f".{deltas.instrument_id.symbol}",
+                        topic=self._msgbus.topic_cache.get_deltas_topic(deltas.instrument_id),
                         msg=deltas_to_publish,
                     )
                     buffer_deltas.clear()
         else:
             self._msgbus.publish_c(
-                topic=f"data.book.deltas"
-                    f".{deltas.instrument_id.venue}"
-                    f".{deltas.instrument_id.symbol}",
+                topic=self._msgbus.topic_cache.get_deltas_topic(deltas.instrument_id),
                 msg=deltas,
             )
 
     cpdef void _handle_order_book_depth(self, OrderBookDepth10 depth):
         self._msgbus.publish_c(
-            topic=f"data.book.depth"
-                  f".{depth.instrument_id.venue}"
-                  f".{depth.instrument_id.symbol}",
+            topic=self._msgbus.topic_cache.get_depth_topic(depth.instrument_id),
             msg=depth,
         )
 
@@ -1511,9 +1496,7 @@ cdef class DataEngine(Component):
             self._update_synthetics_with_quote(synthetics, tick)
 
         self._msgbus.publish_c(
-            topic=f"data.quotes"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=self._msgbus.topic_cache.get_quotes_topic(tick.instrument_id),
             msg=tick,
         )
 
@@ -1526,9 +1509,7 @@ cdef class DataEngine(Component):
             self._update_synthetics_with_trade(synthetics, tick)
 
         self._msgbus.publish_c(
-            topic=f"data.trades"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=self._msgbus.topic_cache.get_trades_topic(tick.instrument_id),
             msg=tick,
         )
 
@@ -1569,13 +1550,13 @@ cdef class DataEngine(Component):
         if not bar.is_revision:
             self._cache.add_bar(bar)
 
-        self._msgbus.publish_c(topic=f"data.bars.{bar_type}", msg=bar)
+        self._msgbus.publish_c(topic=self._msgbus.topic_cache.get_bars_topic(bar_type), msg=bar)
 
     cpdef void _handle_instrument_status(self, InstrumentStatus data):
-        self._msgbus.publish_c(topic=f"data.status.{data.instrument_id.venue}.{data.instrument_id.symbol}", msg=data)
+        self._msgbus.publish_c(topic=self._msgbus.topic_cache.get_status_topic(data.instrument_id), msg=data)
 
     cpdef void _handle_close_price(self, InstrumentClose data):
-        self._msgbus.publish_c(topic=f"data.venue.close_price.{data.instrument_id}", msg=data)
+        self._msgbus.publish_c(topic=self._msgbus.topic_cache.get_close_prices_topic(data.instrument_id), msg=data)
 
     cpdef void _handle_custom_data(self, CustomData data):
         self._msgbus.publish_c(topic=f"data.{data.data_type.topic}", msg=data.data)
@@ -1664,10 +1645,7 @@ cdef class DataEngine(Component):
                 return
 
             self._msgbus.publish_c(
-                topic=f"data.book.snapshots"
-                      f".{instrument_id.venue}"
-                      f".{instrument_id.symbol}"
-                      f".{interval_ms}",
+                topic=self._msgbus.topic_cache.get_snapshots_topic(instrument_id, interval_ms),
                 msg=order_book,
             )
 
@@ -1738,24 +1716,20 @@ cdef class DataEngine(Component):
             composite_bar_type = bar_type.composite()
 
             self._msgbus.subscribe(
-                topic=f"data.bars.{composite_bar_type}",
+                topic=self._msgbus.topic_cache.get_bars_topic(composite_bar_type),
                 handler=aggregator.handle_bar,
             )
             self._handle_subscribe_bars(client, composite_bar_type, False)
         elif bar_type.spec.price_type == PriceType.LAST:
             self._msgbus.subscribe(
-                topic=f"data.trades"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=self._msgbus.topic_cache.get_trades_topic(bar_type.instrument_id),
                 handler=aggregator.handle_trade_tick,
                 priority=5,
             )
             self._handle_subscribe_trade_ticks(client, bar_type.instrument_id)
         else:
             self._msgbus.subscribe(
-                topic=f"data.quotes"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=self._msgbus.topic_cache.get_quotes_topic(bar_type.instrument_id),
                 handler=aggregator.handle_quote_tick,
                 priority=5,
             )
@@ -1778,23 +1752,19 @@ cdef class DataEngine(Component):
             composite_bar_type = bar_type.composite()
 
             self._msgbus.unsubscribe(
-                topic=f"data.bars.{composite_bar_type}",
+                topic=self._msgbus.topic_cache.get_bars_topic(composite_bar_type),
                 handler=aggregator.handle_bar,
             )
             self._handle_unsubscribe_bars(client, composite_bar_type)
         elif bar_type.spec.price_type == PriceType.LAST:
             self._msgbus.unsubscribe(
-                topic=f"data.trades"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=self._msgbus.topic_cache.get_trades_topic(bar_type.instrument_id),
                 handler=aggregator.handle_trade_tick,
             )
             self._handle_unsubscribe_trade_ticks(client, bar_type.instrument_id)
         else:
             self._msgbus.unsubscribe(
-                topic=f"data.quotes"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=self._msgbus.topic_cache.get_quotes_topic(bar_type.instrument_id),
                 handler=aggregator.handle_quote_tick,
             )
             self._handle_unsubscribe_quote_ticks(client, bar_type.instrument_id)
@@ -1852,9 +1822,7 @@ cdef class DataEngine(Component):
         )
 
         self._msgbus.publish_c(
-            topic=f"data.quotes"
-                  f".{synthetic_instrument_id.venue}"
-                  f".{synthetic_instrument_id.symbol}",
+            topic=self._msgbus.topic_cache.get_quotes_topic(synthetic_instrument_id),
             msg=synthetic_quote,
         )
 
@@ -1901,8 +1869,6 @@ cdef class DataEngine(Component):
         )
 
         self._msgbus.publish_c(
-            topic=f"data.trades"
-                  f".{synthetic_instrument_id.venue}"
-                  f".{synthetic_instrument_id.symbol}",
+            topic=self._msgbus.topic_cache.get_trades_topic(synthetic_instrument_id),
             msg=synthetic_trade,
         )
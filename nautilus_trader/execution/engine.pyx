@@ -735,7 +735,7 @@ cdef class ExecutionEngine(Component):
 
         self._cache.update_order(order)
         self._msgbus.publish_c(
-            topic=f"events.order.{order.strategy_id}",
+            topic=self._msgbus.topic_cache.get_order_events_topic(order.strategy_id),
             msg=denied,
         )
         if self.snapshot_orders:
@@ -1043,7 +1043,7 @@ cdef class ExecutionEngine(Component):
 
         self._cache.update_order(order)
         self._msgbus.publish_c(
-            topic=f"events.order.{event.strategy_id}",
+            topic=self._msgbus.topic_cache.get_order_events_topic(event.strategy_id),
             msg=event,
         )
         if self.snapshot_orders:
@@ -1114,7 +1114,7 @@ cdef class ExecutionEngine(Component):
         )
 
         self._msgbus.publish_c(
-            topic=f"events.position.{event.strategy_id}",
+            topic=self._msgbus.topic_cache.get_position_events_topic(event.strategy_id),
             msg=event,
         )
 
@@ -1149,7 +1149,7 @@ cdef class ExecutionEngine(Component):
             )
 
         self._msgbus.publish_c(
-            topic=f"events.position.{event.strategy_id}",
+            topic=self._msgbus.topic_cache.get_position_events_topic(event.strategy_id),
             msg=event,
         )
 
@@ -41,16 +41,33 @@ cdef class MatchingCore:
     cdef object _fill_limit_order
 
     cdef dict _orders
+    cdef dict _order_keys
+    cdef dict _orders_by_key
+    cdef list _bid_limit_keys
+    cdef list _bid_stop_keys
+    cdef list _ask_limit_keys
+    cdef list _ask_stop_keys
     cdef list _orders_bid
     cdef list _orders_ask
+    cdef dict _expire_keys
+    cdef list _expire_keys_sorted
+    cdef dict _orders_trailing
+    cdef uint64_t _sequence
+    cdef bint _is_iterating
+    cdef uint64_t _sequence_end
+    cdef set _visited
+    cdef list _moved
 
 # -- QUERIES --------------------------------------------------------------------------------------
 
     cpdef Order get_order(self, ClientOrderId client_order_id)
     cpdef bint order_exists(self, ClientOrderId client_order_id)
+    cpdef bint has_orders(self)
     cpdef list get_orders(self)
     cpdef list get_orders_bid(self)
     cpdef list get_orders_ask(self)
+    cpdef list get_orders_expired(self, uint64_t timestamp_ns)
+    cpdef list get_orders_trailing(self)
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
@@ -61,10 +78,15 @@ cdef class MatchingCore:
     cpdef void reset(self)
     cpdef void add_order(self, Order order)
     cdef void _add_order(self, Order order)
-    cdef void sort_bid_orders(self)
-    cdef void sort_ask_orders(self)
+    cdef void _index_order(self, Order order, uint64_t sequence)
+    cdef tuple _remove_order_key(self, ClientOrderId client_order_id)
+    cdef void _remove_expire_key(self, ClientOrderId client_order_id)
+    cpdef void reindex_order(self, Order order)
     cpdef void delete_order(self, Order order)
     cpdef void iterate(self, uint64_t timestamp_ns)
+    cdef void _iterate_side(self, list limit_keys, list stop_keys, OrderSide side)
+    cdef void _match_visited(self, Order order)
+    cdef list _orders_for_keys(self, list limit_keys, list stop_keys)
 
 # -- MATCHING -------------------------------------------------------------------------------------
 
@@ -81,3 +103,4 @@ cdef class MatchingCore:
 
 
 cdef int64_t order_sort_key(Order order)
+cdef bint order_matches_as_stop(Order order)
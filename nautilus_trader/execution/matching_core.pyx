@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from bisect import bisect_left
+from bisect import bisect_right
+from bisect import insort
 from typing import Callable
 
 from libc.stdint cimport uint64_t
@@ -27,10 +30,25 @@ from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.orders.base cimport Order
 
 
+# The low bits of an order key hold the sequence the order was added in
+cdef int _SEQUENCE_BITS = 40
+cdef object _SEQUENCE_MASK = (1 << _SEQUENCE_BITS) - 1
+
+
 cdef class MatchingCore:
     """
     Provides a generic order matching core.
 
+    Orders are indexed per side in price-time priority, separately for orders
+    which match when the market reaches their price or better (limit and touch
+    conditions) and orders which match when the market trades through their
+    trigger price (stop conditions). Iterating the core then only visits the
+    orders whose price has been crossed by the current market.
+
+    Orders with an expire time and trailing stop orders are also indexed
+    separately, so the matching engine can manage them without scanning every
+    order on each iteration.
+
     Parameters
     ----------
     instrument_id : InstrumentId
@@ -72,8 +90,24 @@ cdef class MatchingCore:
 
         # Orders
         self._orders: dict[ClientOrderId, Order] = {}
-        self._orders_bid: list[Order] = []
-        self._orders_ask: list[Order] = []
+        self._order_keys: dict[ClientOrderId, tuple[list[int], int]] = {}
+        self._orders_by_key: dict[int, Order] = {}
+        self._bid_limit_keys: list[int] = []
+        self._bid_stop_keys: list[int] = []
+        self._ask_limit_keys: list[int] = []
+        self._ask_stop_keys: list[int] = []
+        self._orders_bid: list[Order] | None = None  # Rebuilt on change
+        self._orders_ask: list[Order] | None = None  # Rebuilt on change
+        self._expire_keys: dict[ClientOrderId, tuple] = {}
+        self._expire_keys_sorted: list[tuple] = []
+        self._orders_trailing: dict[ClientOrderId, Order] = {}
+        self._sequence = 0
+
+        # Iteration state
+        self._is_iterating = False
+        self._sequence_end = 0
+        self._visited: set[ClientOrderId] = set()
+        self._moved: list[Order] = []
 
     @property
     def instrument_id(self) -> InstrumentId:
@@ -166,15 +200,59 @@ cdef class MatchingCore:
         Condition.not_none(client_order_id, "client_order_id")
         return client_order_id in self._orders
 
+    cpdef bint has_orders(self):
+        return len(self._orders) > 0
+
     cpdef list get_orders(self):
-        return self._orders_bid + self._orders_ask
+        return self.get_orders_bid() + self.get_orders_ask()
 
     cpdef list get_orders_bid(self):
+        # The list is rebuilt rather than mutated on change, so a returned list
+        # remains safe to iterate while orders are added or deleted
+        if self._orders_bid is None:
+            self._orders_bid = self._orders_for_keys(self._bid_limit_keys, self._bid_stop_keys)
         return self._orders_bid
 
     cpdef list get_orders_ask(self):
+        if self._orders_ask is None:
+            self._orders_ask = self._orders_for_keys(self._ask_limit_keys, self._ask_stop_keys)
         return self._orders_ask
 
+    cpdef list get_orders_expired(self, uint64_t timestamp_ns):
+        """
+        Return the orders with an expire time at or before the given timestamp.
+
+        Parameters
+        ----------
+        timestamp_ns : uint64_t
+            The UNIX timestamp (nanoseconds) to check expiry at.
+
+        Returns
+        -------
+        list[Order]
+
+        """
+        cdef list keys = self._expire_keys_sorted
+        cdef Py_ssize_t end = bisect_right(keys, (timestamp_ns, _SEQUENCE_MASK))
+        cdef tuple key
+        return [self._orders[key[2]] for key in keys[:end]]
+
+    cpdef list get_orders_trailing(self):
+        """
+        Return the trailing stop orders.
+
+        Returns
+        -------
+        list[Order]
+
+        """
+        return list(self._orders_trailing.values())
+
+    cdef list _orders_for_keys(self, list limit_keys, list stop_keys):
+        cdef list keys = limit_keys + stop_keys
+        keys.sort()  # Merges the two sorted runs
+        return [self._orders_by_key[key] for key in keys]
+
 # -- COMMANDS -------------------------------------------------------------------------------------
 
     cdef void set_bid_raw(self, int64_t bid_raw):
@@ -191,8 +269,18 @@ cdef class MatchingCore:
 
     cpdef void reset(self):
         self._orders.clear()
-        self._orders_bid.clear()
-        self._orders_ask.clear()
+        self._order_keys.clear()
+        self._orders_by_key.clear()
+        self._bid_limit_keys.clear()
+        self._bid_stop_keys.clear()
+        self._ask_limit_keys.clear()
+        self._ask_stop_keys.clear()
+        self._orders_bid = None
+        self._orders_ask = None
+        self._expire_keys.clear()
+        self._expire_keys_sorted.clear()
+        self._orders_trailing.clear()
+        self._sequence = 0
         self.bid_raw = 0
         self.ask_raw = 0
         self.last_raw = 0
@@ -210,41 +298,195 @@ cdef class MatchingCore:
         # Index order
         self._orders[order.client_order_id] = order
 
+        # Remove any existing keys (order being added back into the core)
+        self._remove_order_key(order.client_order_id)
+        self._remove_expire_key(order.client_order_id)
+
+        self._sequence += 1
+        self._index_order(order, self._sequence)
+
+        cdef tuple expire_key
+        if order.expire_time_ns > 0:
+            expire_key = (order.expire_time_ns, self._sequence, order.client_order_id)
+            insort(self._expire_keys_sorted, expire_key)
+            self._expire_keys[order.client_order_id] = expire_key
+
+        if (
+            order.order_type == OrderType.TRAILING_STOP_MARKET
+            or order.order_type == OrderType.TRAILING_STOP_LIMIT
+        ):
+            self._orders_trailing[order.client_order_id] = order
+
+    cdef void _index_order(self, Order order, uint64_t sequence):
+        cdef list keys
         if order.side == OrderSide.BUY:
-            self._orders_bid.append(order)
-            self.sort_bid_orders()
+            keys = self._bid_stop_keys if order_matches_as_stop(order) else self._bid_limit_keys
+            self._orders_bid = None
         elif order.side == OrderSide.SELL:
-            self._orders_ask.append(order)
-            self.sort_ask_orders()
+            keys = self._ask_stop_keys if order_matches_as_stop(order) else self._ask_limit_keys
+            self._orders_ask = None
         else:
             raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
 
-    cdef void sort_bid_orders(self):
-        self._orders_bid.sort(key=order_sort_key, reverse=True)
+        cdef object key = _order_key(order_sort_key(order), order.side, sequence)
+        insort(keys, key)
+        self._order_keys[order.client_order_id] = (keys, key)
+        self._orders_by_key[key] = order
+
+    cdef tuple _remove_order_key(self, ClientOrderId client_order_id):
+        cdef tuple entry = self._order_keys.pop(client_order_id, None)
+        if entry is None:
+            return None
+
+        cdef list keys = entry[0]
+        cdef object key = entry[1]
+        del keys[bisect_left(keys, key)]
+        del self._orders_by_key[key]
+
+        if keys is self._bid_limit_keys or keys is self._bid_stop_keys:
+            self._orders_bid = None
+        else:
+            self._orders_ask = None
+
+        return entry
+
+    cdef void _remove_expire_key(self, ClientOrderId client_order_id):
+        cdef tuple expire_key = self._expire_keys.pop(client_order_id, None)
+        if expire_key is not None:
+            del self._expire_keys_sorted[bisect_left(self._expire_keys_sorted, expire_key)]
+
+    cpdef void reindex_order(self, Order order):
+        """
+        Reindex the given order following a change of its price, trigger price
+        or triggered state.
+
+        The order keeps its time priority within its new price level. If the
+        core is iterating and the order has not yet been matched, it is still
+        matched once during the iteration, as if from a snapshot of the orders.
+
+        Parameters
+        ----------
+        order : Order
+            The order to reindex.
+
+        """
+        Condition.not_none(order, "order")
+
+        cdef tuple entry = self._remove_order_key(order.client_order_id)
+        if entry is None:
+            return  # Order not held in the core
 
-    cdef void sort_ask_orders(self):
-        self._orders_ask.sort(key=order_sort_key)
+        cdef uint64_t sequence = entry[1] & _SEQUENCE_MASK
+        self._orders[order.client_order_id] = order
+        self._index_order(order, sequence)
+
+        if (
+            self._is_iterating
+            and sequence <= self._sequence_end
+            and order.client_order_id not in self._visited
+        ):
+            self._moved.append(order)  # May have moved behind the iteration
 
     cpdef void delete_order(self, Order order):
         Condition.not_none(order, "order")
 
         self._orders.pop(order.client_order_id, None)
-
-        if order.side == OrderSide.BUY:
-            if order in self._orders_bid:
-                self._orders_bid.remove(order)
-        elif order.side == OrderSide.SELL:
-            if order in self._orders_ask:
-                self._orders_ask.remove(order)
-        else:
-            raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
+        self._remove_order_key(order.client_order_id)
+        self._remove_expire_key(order.client_order_id)
+        self._orders_trailing.pop(order.client_order_id, None)
 
     cpdef void iterate(self, uint64_t timestamp_ns):
-        cdef Order order
-        for order in self._orders_bid + self._orders_ask:  # Lists implicitly copied
-            if order.is_closed_c():
-                continue  # Orders state has changed since iteration started  # pragma: no cover
-            self.match_order(order)
+        # Each order held when the iteration starts is matched at most once
+        self._is_iterating = True
+        self._sequence_end = self._sequence
+        self._iterate_side(self._bid_limit_keys, self._bid_stop_keys, OrderSide.BUY)
+        self._iterate_side(self._ask_limit_keys, self._ask_stop_keys, OrderSide.SELL)
+        self._is_iterating = False
+        self._visited.clear()
+        self._moved.clear()
+
+    cdef void _iterate_side(
+        self,
+        list limit_keys,
+        list stop_keys,
+        OrderSide side,
+    ):
+        # Visits the crossed orders for the side in priority order, the market
+        # is re-read on every step as fills may move it during the iteration
+        cdef:
+            object market_level
+            object last_key = None
+            object limit_key
+            object stop_key
+            object key
+            Py_ssize_t i
+            list moved
+            tuple entry
+            Order order
+        while True:
+            if side == OrderSide.BUY:
+                if not self.is_ask_initialized:
+                    return  # No market
+                market_level = -self.ask_raw
+            else:
+                if not self.is_bid_initialized:
+                    return  # No market
+                market_level = self.bid_raw
+
+            # Orders reindexed behind the iteration are matched next, as they
+            # now have priority over the orders still to be visited
+            if self._moved and last_key is not None:
+                moved = self._moved
+                self._moved = []
+                for order in moved:
+                    entry = self._order_keys.get(order.client_order_id)
+                    if (
+                        entry is None
+                        or order.side != side
+                        or entry[1] > last_key
+                        or order.client_order_id in self._visited
+                    ):
+                        continue  # Deleted, or still to be visited by the iteration
+                    self._match_visited(order)
+                continue  # Market may have moved
+
+            # Next order with a limit or touch price at or better than the market
+            limit_key = None
+            i = 0 if last_key is None else bisect_right(limit_keys, last_key)
+            if i < len(limit_keys) and limit_keys[i] < (market_level + 1) << _SEQUENCE_BITS:
+                limit_key = limit_keys[i]
+
+            # Next order with a stop trigger price at or through the market
+            stop_key = None
+            i = bisect_left(stop_keys, market_level << _SEQUENCE_BITS)
+            if last_key is not None:
+                i = max(i, bisect_right(stop_keys, last_key))
+            if i < len(stop_keys):
+                stop_key = stop_keys[i]
+
+            if limit_key is None and stop_key is None:
+                if self._moved and last_key is not None:
+                    continue  # Match any orders reindexed behind the iteration
+                return  # No more crossed orders
+
+            if stop_key is None or (limit_key is not None and limit_key < stop_key):
+                key = limit_key
+            else:
+                key = stop_key
+            last_key = key
+
+            if key & _SEQUENCE_MASK > self._sequence_end:
+                continue  # Order added since iteration started
+            order = self._orders_by_key[key]
+            if order.client_order_id in self._visited:
+                continue  # Order reindexed since it was matched
+            self._match_visited(order)
+
+    cdef void _match_visited(self, Order order):
+        self._visited.add(order.client_order_id)
+        if order.is_closed_c():
+            return  # Orders state has changed since iteration started  # pragma: no cover
+        self.match_order(order)
 
 # -- MATCHING -------------------------------------------------------------------------------------
 
@@ -421,6 +663,22 @@ cdef class MatchingCore:
         return LiquiditySide.TAKER
 
 
+cdef inline object _order_key(int64_t price_raw, OrderSide side, uint64_t sequence):
+    # Bid price levels are negated so both sides sort best price first, then by sequence
+    cdef object level = -price_raw if side == OrderSide.BUY else price_raw
+    return (level << _SEQUENCE_BITS) | sequence
+
+
+cdef inline bint order_matches_as_stop(Order order):
+    # Whether the order next matches when the market reaches or trades through
+    # its trigger price (rather than its limit or touch price or better)
+    if order.order_type == OrderType.STOP_MARKET or order.order_type == OrderType.TRAILING_STOP_MARKET:
+        return True
+    elif order.order_type == OrderType.STOP_LIMIT or order.order_type == OrderType.TRAILING_STOP_LIMIT:
+        return not order.is_triggered
+    return False
+
+
 cdef inline int64_t order_sort_key(Order order):
     cdef Price trigger_price
     cdef Price price
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
 
@@ -35,3 +37,4 @@ cdef class ArcherMovingAveragesTrends(Indicator):
     """The current short run value.\n\n:returns: `int`"""
 
     cpdef void update_raw(self, double close)
+    cpdef void update_many(self, np.ndarray closes)
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.base.indicator cimport Indicator
 
 
@@ -30,4 +32,5 @@ cdef class AroonOscillator(Indicator):
     """The current value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double high, double low)
+    cpdef void update_many(self, np.ndarray highs, np.ndarray lows)
     cdef void _check_initialized(self)
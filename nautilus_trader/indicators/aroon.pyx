@@ -17,8 +17,12 @@ from collections import deque
 
 import numpy as np
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bar_highs
+from nautilus_trader.indicators.base.indicator cimport bar_lows
 from nautilus_trader.model.data cimport Bar
 
 
@@ -65,6 +69,20 @@ cdef class AroonOscillator(Indicator):
             bar.low.as_double(),
         )
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The update bars, in order.
+
+        """
+        Condition.not_none(bars, "bars")
+
+        self.update_many(bar_highs(bars), bar_lows(bars))
+
     cpdef void update_raw(
         self,
         double high,
@@ -94,6 +112,33 @@ cdef class AroonOscillator(Indicator):
 
         self._check_initialized()
 
+    cpdef void update_many(self, np.ndarray highs, np.ndarray lows):
+        """
+        Update the indicator with the given arrays of raw values.
+
+        The final state is the same as calling `update_raw` for each index, in order.
+
+        Parameters
+        ----------
+        highs : np.ndarray[float64]
+            The high prices.
+        lows : np.ndarray[float64]
+            The low prices.
+
+        Raises
+        ------
+        ValueError
+            If the arrays are not of equal length.
+
+        """
+        Condition.equal(len(highs), len(lows), "len(highs)", "len(lows)")
+
+        cdef double[:] high = highs
+        cdef double[:] low = lows
+        cdef Py_ssize_t i
+        for i in range(high.shape[0]):
+            self.update_raw(high[i], low[i])
+
     cdef void _check_initialized(self):
         # Initialization logic
         if not self.initialized:
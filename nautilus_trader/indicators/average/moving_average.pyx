@@ -16,9 +16,14 @@
 from enum import Enum
 from enum import unique
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bar_closes
+from nautilus_trader.indicators.base.indicator cimport quote_tick_prices
+from nautilus_trader.indicators.base.indicator cimport trade_tick_prices
 
 
 @unique
@@ -80,6 +85,67 @@ cdef class MovingAverage(Indicator):
         """
         raise NotImplementedError("method `update_raw` must be implemented in the subclass")  # pragma: no cover
 
+    cpdef void update_many(self, np.ndarray values):
+        """
+        Update the indicator with the given array of raw values.
+
+        The final state is the same as calling `update_raw` for each value, in order.
+
+        Parameters
+        ----------
+        values : np.ndarray[float64]
+            The update values.
+
+        """
+        Condition.not_none(values, "values")
+
+        cdef double[:] value = values
+        cdef Py_ssize_t i
+        for i in range(value.shape[0]):
+            self.update_raw(value[i])
+
+    cpdef void handle_quote_ticks(self, list ticks):
+        """
+        Update the indicator with the given quote ticks.
+
+        Parameters
+        ----------
+        ticks : list[QuoteTick]
+            The update ticks, in order.
+
+        """
+        Condition.not_none(ticks, "ticks")
+
+        self.update_many(quote_tick_prices(ticks, self.price_type))
+
+    cpdef void handle_trade_ticks(self, list ticks):
+        """
+        Update the indicator with the given trade ticks.
+
+        Parameters
+        ----------
+        ticks : list[TradeTick]
+            The update ticks, in order.
+
+        """
+        Condition.not_none(ticks, "ticks")
+
+        self.update_many(trade_tick_prices(ticks))
+
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The update bars, in order.
+
+        """
+        Condition.not_none(bars, "bars")
+
+        self.update_many(bar_closes(bars))
+
     cpdef void _increment_count(self):
         self.count += 1
 
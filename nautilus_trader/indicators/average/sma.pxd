@@ -14,7 +14,8 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 
 
 cdef class SimpleMovingAverage(MovingAverage):
-    cdef object _inputs
+    cdef RollingWindow _inputs
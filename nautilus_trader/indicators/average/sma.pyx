@@ -13,14 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
-import numpy as np
-
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport PriceType
-from nautilus_trader.core.stats cimport fast_mean
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -48,7 +44,7 @@ cdef class SimpleMovingAverage(MovingAverage):
         Condition.positive_int(period, "period")
         super().__init__(period, params=[period], price_type=price_type)
 
-        self._inputs = deque(maxlen=period)
+        self._inputs = RollingWindow(period)
         self.value = 0
 
     cpdef void handle_quote_tick(self, QuoteTick tick):
@@ -106,7 +102,7 @@ cdef class SimpleMovingAverage(MovingAverage):
         """
         self._inputs.append(value)
 
-        self.value = fast_mean(np.asarray(self._inputs, dtype=np.float64))
+        self.value = self._inputs.mean()
         self._increment_count()
 
     cpdef void _reset_ma(self):
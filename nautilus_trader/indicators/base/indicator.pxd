@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
+from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -33,8 +36,20 @@ cdef class Indicator:
     cpdef void handle_quote_tick(self, QuoteTick tick)
     cpdef void handle_trade_tick(self, TradeTick tick)
     cpdef void handle_bar(self, Bar bar)
+    cpdef void handle_quote_ticks(self, list ticks)
+    cpdef void handle_trade_ticks(self, list ticks)
+    cpdef void handle_bars(self, list bars)
     cpdef void reset(self)
 
     cpdef void _set_has_inputs(self, bint setting)
     cpdef void _set_initialized(self, bint setting)
     cpdef void _reset(self)
+
+
+cdef np.ndarray bar_opens(list bars)
+cdef np.ndarray bar_highs(list bars)
+cdef np.ndarray bar_lows(list bars)
+cdef np.ndarray bar_closes(list bars)
+cdef np.ndarray bar_volumes(list bars)
+cdef np.ndarray quote_tick_prices(list ticks, PriceType price_type)
+cdef np.ndarray trade_tick_prices(list ticks)
@@ -13,9 +13,17 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
+cimport cython
+cimport numpy as np
+
+from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
 
 
 cdef class Indicator:
@@ -57,6 +65,63 @@ cdef class Indicator:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError(f"Cannot handle {repr(bar)}: method `handle_bar` not implemented in subclass")  # pragma: no cover
 
+    cpdef void handle_quote_ticks(self, list ticks):
+        """
+        Update the indicator with the given quote ticks.
+
+        The final state is the same as handling each tick individually, in order.
+
+        Parameters
+        ----------
+        ticks : list[QuoteTick]
+            The update ticks, in order.
+
+        """
+        cdef QuoteTick tick
+        for tick in ticks:
+            self.handle_quote_tick(tick)
+
+    cpdef void handle_trade_ticks(self, list ticks):
+        """
+        Update the indicator with the given trade ticks.
+
+        The final state is the same as handling each tick individually, in order.
+
+        Parameters
+        ----------
+        ticks : list[TradeTick]
+            The update ticks, in order.
+
+        """
+        cdef TradeTick tick
+        for tick in ticks:
+            self.handle_trade_tick(tick)
+
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars.
+
+        The final state is the same as handling each bar individually, in order.
+        Subclasses override this to pass the bar columns to `update_many`.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The update bars, in order.
+
+        Warnings
+        --------
+        The built-in indicators which override this method (and the moving
+        averages for `handle_quote_ticks` and `handle_trade_ticks`) do not call
+        `handle_bar`, so a `handle_bar` override in a Python subclass of one of
+        these indicators is skipped for batches. Such a subclass should also
+        override this method (for example, to call `handle_bar` for each bar).
+
+        """
+        cdef Bar bar
+        for bar in bars:
+            self.handle_bar(bar)
+
     cpdef void reset(self):
         """
         Reset the indicator.
@@ -76,3 +141,108 @@ cdef class Indicator:
     cpdef void _reset(self):
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method `_reset` must be implemented in the subclass")  # pragma: no cover
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.ndarray bar_opens(list bars):
+    cdef int length = len(bars)
+    cdef np.ndarray values = np.empty(length, dtype=np.float64)
+    cdef double[::1] view = values
+    cdef Bar bar
+    cdef int i
+    for i in range(length):
+        bar = bars[i]
+        view[i] = Price.raw_to_f64_c(bar._mem.open.raw)
+    return values
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.ndarray bar_highs(list bars):
+    cdef int length = len(bars)
+    cdef np.ndarray values = np.empty(length, dtype=np.float64)
+    cdef double[::1] view = values
+    cdef Bar bar
+    cdef int i
+    for i in range(length):
+        bar = bars[i]
+        view[i] = Price.raw_to_f64_c(bar._mem.high.raw)
+    return values
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.ndarray bar_lows(list bars):
+    cdef int length = len(bars)
+    cdef np.ndarray values = np.empty(length, dtype=np.float64)
+    cdef double[::1] view = values
+    cdef Bar bar
+    cdef int i
+    for i in range(length):
+        bar = bars[i]
+        view[i] = Price.raw_to_f64_c(bar._mem.low.raw)
+    return values
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.ndarray bar_closes(list bars):
+    cdef int length = len(bars)
+    cdef np.ndarray values = np.empty(length, dtype=np.float64)
+    cdef double[::1] view = values
+    cdef Bar bar
+    cdef int i
+    for i in range(length):
+        bar = bars[i]
+        view[i] = Price.raw_to_f64_c(bar._mem.close.raw)
+    return values
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.ndarray bar_volumes(list bars):
+    cdef int length = len(bars)
+    cdef np.ndarray values = np.empty(length, dtype=np.float64)
+    cdef double[::1] view = values
+    cdef Bar bar
+    cdef int i
+    for i in range(length):
+        bar = bars[i]
+        view[i] = Quantity.raw_to_f64_c(bar._mem.volume.raw)
+    return values
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.ndarray quote_tick_prices(list ticks, PriceType price_type):
+    cdef int length = len(ticks)
+    cdef np.ndarray values = np.empty(length, dtype=np.float64)
+    cdef double[::1] view = values
+    cdef QuoteTick tick
+    cdef Price price
+    cdef int i
+    for i in range(length):
+        tick = ticks[i]
+        if price_type == PriceType.BID:
+            view[i] = Price.raw_to_f64_c(tick._mem.bid_price.raw)
+        elif price_type == PriceType.ASK:
+            view[i] = Price.raw_to_f64_c(tick._mem.ask_price.raw)
+        else:
+            price = tick.extract_price(price_type)
+            view[i] = Price.raw_to_f64_c(price._mem.raw)
+    return values
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.ndarray trade_tick_prices(list ticks):
+    cdef int length = len(ticks)
+    cdef np.ndarray values = np.empty(length, dtype=np.float64)
+    cdef double[::1] view = values
+    cdef TradeTick tick
+    cdef int i
+    for i in range(length):
+        tick = ticks[i]
+        view[i] = Price.raw_to_f64_c(tick._mem.price.raw)
+    return values
@@ -0,0 +1,51 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+
+cdef class RollingWindow:
+    cdef double[::1] _buffer
+    cdef int _head
+    cdef uint64_t _sequence
+    cdef double _sum
+    cdef double _weighted_sum
+    cdef double _mean
+    cdef double _m2
+    cdef bint _track_extremes
+    cdef object _max_sequences
+    cdef object _min_sequences
+
+    cdef readonly int capacity
+    """The maximum number of values held in the window.\n\n:returns: `int`"""
+    cdef readonly int count
+    """The number of values currently held in the window.\n\n:returns: `int`"""
+
+    cpdef bint is_full(self)
+    cpdef void append(self, double value)
+    cpdef double first(self)
+    cpdef double last(self)
+    cpdef double sum(self)
+    cpdef double weighted_sum(self)
+    cpdef double mean(self)
+    cpdef double variance(self)
+    cpdef double std(self)
+    cpdef double std_with_mean(self, double mean)
+    cpdef double max(self)
+    cpdef double min(self)
+    cpdef void clear(self)
+
+    cdef void _update_extremes(self, double value)
+    cdef void _recalculate(self)
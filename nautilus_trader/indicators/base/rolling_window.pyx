@@ -0,0 +1,341 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from collections import deque
+
+import numpy as np
+
+cimport cython
+from libc.math cimport sqrt
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+
+
+cdef class RollingWindow:
+    """
+    Provides a fixed capacity window of values with O(1) rolling statistics.
+
+    Values are held in a ring buffer, with a running sum, linear-weighted sum and
+    Welford variance updated on each append. When `track_extremes` is set, the
+    window also maintains monotonic queues so the maximum and minimum are
+    available in amortized O(1).
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of values held in the window (> 0).
+    track_extremes : bool, default False
+        If the maximum and minimum values of the window should be tracked.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    Notes
+    -----
+    The running statistics are recalculated from the buffer each time it wraps, so
+    accumulated rounding error is bounded to a single pass over the window.
+    """
+
+    def __init__(self, int capacity, bint track_extremes=False):
+        Condition.positive_int(capacity, "capacity")
+
+        self.capacity = capacity
+        self.count = 0
+        self._buffer = np.zeros(capacity, dtype=np.float64)
+        self._head = 0
+        self._sequence = 0
+        self._sum = 0.0
+        self._weighted_sum = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._track_extremes = track_extremes
+        self._max_sequences = deque()
+        self._min_sequences = deque()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(capacity={self.capacity}, count={self.count})"
+
+    cpdef bint is_full(self):
+        """
+        Return whether the window holds `capacity` values.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.count == self.capacity
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef void append(self, double value):
+        """
+        Append the given value to the window, evicting the oldest value if full.
+
+        Parameters
+        ----------
+        value : double
+            The value to append.
+
+        """
+        cdef double old
+        cdef double delta
+        cdef double mean_prev
+        if self._track_extremes:
+            self._update_extremes(value)
+
+        if self.count < self.capacity:
+            self._buffer[self._head] = value
+            self.count += 1
+            self._sum += value
+            self._weighted_sum += self.count * value
+            delta = value - self._mean
+            self._mean += delta / self.count
+            self._m2 += delta * (value - self._mean)
+        else:
+            old = self._buffer[self._head]
+            self._buffer[self._head] = value
+            # Every retained value shifts down one weight, the new value takes the top weight
+            self._weighted_sum += self.capacity * value - self._sum
+            self._sum += value - old
+            delta = value - old
+            mean_prev = self._mean
+            self._mean += delta / self.capacity
+            self._m2 += delta * (value - self._mean + old - mean_prev)
+
+        self._sequence += 1
+        self._head += 1
+        if self._head == self.capacity:
+            self._head = 0
+            self._recalculate()
+
+    cdef void _update_extremes(self, double value):
+        # Called before the value is written, while the evicted slot is still intact
+        cdef uint64_t sequence = self._sequence
+        cdef uint64_t capacity = self.capacity
+        if self._max_sequences and sequence - <uint64_t>self._max_sequences[0] >= capacity:
+            self._max_sequences.popleft()
+        if self._min_sequences and sequence - <uint64_t>self._min_sequences[0] >= capacity:
+            self._min_sequences.popleft()
+
+        cdef double[::1] buffer = self._buffer
+        while self._max_sequences and buffer[<uint64_t>self._max_sequences[-1] % capacity] <= value:
+            self._max_sequences.pop()
+        while self._min_sequences and buffer[<uint64_t>self._min_sequences[-1] % capacity] >= value:
+            self._min_sequences.pop()
+
+        self._max_sequences.append(sequence)
+        self._min_sequences.append(sequence)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _recalculate(self):
+        cdef double total = 0.0
+        cdef double weighted = 0.0
+        cdef double m2 = 0.0
+        cdef double delta
+        cdef int i
+        for i in range(self.count):
+            total += self._buffer[i]
+            weighted += (i + 1) * self._buffer[i]
+
+        cdef double mean = total / self.count
+        for i in range(self.count):
+            delta = self._buffer[i] - mean
+            m2 += delta * delta
+
+        self._sum = total
+        self._weighted_sum = weighted
+        self._mean = mean
+        self._m2 = m2
+
+    cpdef double first(self):
+        """
+        Return the oldest value in the window.
+
+        Returns
+        -------
+        double
+
+        Raises
+        ------
+        ValueError
+            If the window is empty.
+
+        """
+        Condition.true(self.count > 0, "window was empty")
+
+        if self.count < self.capacity:
+            return self._buffer[0]
+        return self._buffer[self._head]
+
+    cpdef double last(self):
+        """
+        Return the most recent value in the window.
+
+        Returns
+        -------
+        double
+
+        Raises
+        ------
+        ValueError
+            If the window is empty.
+
+        """
+        Condition.true(self.count > 0, "window was empty")
+
+        if self._head == 0:
+            return self._buffer[self.capacity - 1]
+        return self._buffer[self._head - 1]
+
+    cpdef double sum(self):
+        """
+        Return the sum of the values in the window.
+
+        Returns
+        -------
+        double
+
+        """
+        return self._sum
+
+    cpdef double weighted_sum(self):
+        """
+        Return the linear-weighted sum of the values in the window.
+
+        The oldest value has a weight of 1 and the most recent a weight of `count`.
+
+        Returns
+        -------
+        double
+
+        """
+        return self._weighted_sum
+
+    cpdef double mean(self):
+        """
+        Return the arithmetic mean of the values in the window.
+
+        Returns
+        -------
+        double
+
+        """
+        if self.count == 0:
+            return 0.0
+        return self._sum / self.count
+
+    cpdef double variance(self):
+        """
+        Return the population variance of the values in the window.
+
+        Returns
+        -------
+        double
+
+        """
+        if self.count == 0 or self._m2 <= 0.0:
+            return 0.0
+        return self._m2 / self.count
+
+    cpdef double std(self):
+        """
+        Return the population standard deviation of the values in the window.
+
+        Returns
+        -------
+        double
+
+        """
+        return sqrt(self.variance())
+
+    cpdef double std_with_mean(self, double mean):
+        """
+        Return the standard deviation of the values in the window about the given mean.
+
+        Parameters
+        ----------
+        mean : double
+            The mean to measure the deviation from.
+
+        Returns
+        -------
+        double
+
+        """
+        if self.count == 0:
+            return 0.0
+        cdef double offset = self._mean - mean
+        return sqrt(self.variance() + offset * offset)
+
+    cpdef double max(self):
+        """
+        Return the maximum value in the window.
+
+        Returns
+        -------
+        double
+
+        Raises
+        ------
+        ValueError
+            If the window is not tracking extremes, or is empty.
+
+        """
+        Condition.true(self._track_extremes, "window was not tracking extremes")
+        Condition.true(self.count > 0, "window was empty")
+
+        return self._buffer[<uint64_t>self._max_sequences[0] % <uint64_t>self.capacity]
+
+    cpdef double min(self):
+        """
+        Return the minimum value in the window.
+
+        Returns
+        -------
+        double
+
+        Raises
+        ------
+        ValueError
+            If the window is not tracking extremes, or is empty.
+
+        """
+        Condition.true(self._track_extremes, "window was not tracking extremes")
+        Condition.true(self.count > 0, "window was empty")
+
+        return self._buffer[<uint64_t>self._min_sequences[0] % <uint64_t>self.capacity]
+
+    cpdef void clear(self):
+        """
+        Clear all values from the window.
+
+        """
+        self.count = 0
+        self._head = 0
+        self._sequence = 0
+        self._sum = 0.0
+        self._weighted_sum = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._max_sequences.clear()
+        self._min_sequences.clear()
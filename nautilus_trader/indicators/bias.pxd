@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
 
@@ -26,4 +28,5 @@ cdef class Bias(Indicator):
     """The current value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double close)
+    cpdef void update_many(self, np.ndarray closes)
     cdef void _check_initialized(self)
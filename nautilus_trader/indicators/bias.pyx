@@ -16,8 +16,11 @@
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bar_closes
 from nautilus_trader.model.data cimport Bar
 
 
@@ -65,6 +68,20 @@ cdef class Bias(Indicator):
             bar.close.as_double(),
         )
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The update bars, in order.
+
+        """
+        Condition.not_none(bars, "bars")
+
+        self.update_many(bar_closes(bars))
+
     cpdef void update_raw(self, double close):
         """
         Update the indicator with the given raw values.
@@ -80,6 +97,25 @@ cdef class Bias(Indicator):
         self.value = (close / self._ma.value) - 1.0
         self._check_initialized()
 
+    cpdef void update_many(self, np.ndarray closes):
+        """
+        Update the indicator with the given arrays of raw values.
+
+        The final state is the same as calling `update_raw` for each index, in order.
+
+        Parameters
+        ----------
+        closes : np.ndarray[float64]
+            The close prices.
+
+        """
+        Condition.not_none(closes, "closes")
+
+        cdef double[:] close = closes
+        cdef Py_ssize_t i
+        for i in range(close.shape[0]):
+            self.update_raw(close[i])
+
     cdef void _check_initialized(self):
         if not self.initialized:
             self._set_has_inputs(True)
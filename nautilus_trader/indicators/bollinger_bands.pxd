@@ -13,12 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 
 
 cdef class BollingerBands(Indicator):
     cdef object _ma
-    cdef object _prices
+    cdef RollingWindow _prices
 
     cdef readonly int period
     """The period for the moving average.\n\n:returns: `int`"""
@@ -32,3 +35,4 @@ cdef class BollingerBands(Indicator):
     """The current value of the lower band.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double high, double low, double close)
+    cpdef void update_many(self, np.ndarray highs, np.ndarray lows, np.ndarray closes)
@@ -13,16 +13,17 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
-import numpy as np
-
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.core.stats cimport fast_std_with_mean
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bar_closes
+from nautilus_trader.indicators.base.indicator cimport bar_highs
+from nautilus_trader.indicators.base.indicator cimport bar_lows
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -66,7 +67,7 @@ cdef class BollingerBands(Indicator):
         self.period = period
         self.k = k
         self._ma = MovingAverageFactory.create(period, ma_type)
-        self._prices = deque(maxlen=period)
+        self._prices = RollingWindow(period)
 
         self.upper = 0.0
         self.middle = 0.0
@@ -122,6 +123,20 @@ cdef class BollingerBands(Indicator):
             bar.close.as_double(),
         )
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The update bars, in order.
+
+        """
+        Condition.not_none(bars, "bars")
+
+        self.update_many(bar_highs(bars), bar_lows(bars), bar_closes(bars))
+
     cpdef void update_raw(self, double high, double low, double close):
         """
         Update the indicator with the given prices.
@@ -145,20 +160,48 @@ cdef class BollingerBands(Indicator):
         # Initialization logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._prices) >= self.period:
+            if self._prices.is_full():
                 self._set_initialized(True)
 
         # Calculate values
-        cdef double std = fast_std_with_mean(
-            values=np.asarray(self._prices, dtype=np.float64),
-            mean=self._ma.value,
-        )
+        cdef double std = self._prices.std_with_mean(self._ma.value)
 
         # Set values
         self.upper = self._ma.value + (self.k * std)
         self.middle = self._ma.value
         self.lower = self._ma.value - (self.k * std)
 
+    cpdef void update_many(self, np.ndarray highs, np.ndarray lows, np.ndarray closes):
+        """
+        Update the indicator with the given arrays of raw values.
+
+        The final state is the same as calling `update_raw` for each index, in order.
+
+        Parameters
+        ----------
+        highs : np.ndarray[float64]
+            The high prices.
+        lows : np.ndarray[float64]
+            The low prices.
+        closes : np.ndarray[float64]
+            The close prices.
+
+        Raises
+        ------
+        ValueError
+            If the arrays are not of equal length.
+
+        """
+        Condition.equal(len(highs), len(lows), "len(highs)", "len(lows)")
+        Condition.equal(len(highs), len(closes), "len(highs)", "len(closes)")
+
+        cdef double[:] high = highs
+        cdef double[:] low = lows
+        cdef double[:] close = closes
+        cdef Py_ssize_t i
+        for i in range(high.shape[0]):
+            self.update_raw(high[i], low[i], close[i])
+
     cpdef void _reset(self):
         self._ma.reset()
         self._prices.clear()
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
 from nautilus_trader.model.data cimport Bar
@@ -33,3 +35,4 @@ cdef class CommodityChannelIndex(Indicator):
 
     cpdef void handle_bar(self, Bar bar)
     cpdef void update_raw(self, double high, double low, double close)
+    cpdef void update_many(self, np.ndarray highs, np.ndarray lows, np.ndarray closes)
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
 
@@ -28,3 +30,4 @@ cdef class ChandeMomentumOscillator(Indicator):
     """The current value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double close)
+    cpdef void update_many(self, np.ndarray closes)
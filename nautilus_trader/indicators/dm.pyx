@@ -16,8 +16,12 @@
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bar_highs
+from nautilus_trader.indicators.base.indicator cimport bar_lows
 from nautilus_trader.model.data cimport Bar
 
 
@@ -69,6 +73,20 @@ cdef class DirectionalMovement(Indicator):
             bar.high.as_double(),
             bar.low.as_double(),
         )
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The update bars, in order.
+
+        """
+        Condition.not_none(bars, "bars")
+
+        self.update_many(bar_highs(bars), bar_lows(bars))
+
     cpdef void update_raw(
         self,
         double high,
@@ -106,6 +124,33 @@ cdef class DirectionalMovement(Indicator):
             if self._neg_ma.initialized:
                 self._set_initialized(True)
 
+    cpdef void update_many(self, np.ndarray highs, np.ndarray lows):
+        """
+        Update the indicator with the given arrays of raw values.
+
+        The final state is the same as calling `update_raw` for each index, in order.
+
+        Parameters
+        ----------
+        highs : np.ndarray[float64]
+            The high prices.
+        lows : np.ndarray[float64]
+            The low prices.
+
+        Raises
+        ------
+        ValueError
+            If the arrays are not of equal length.
+
+        """
+        Condition.equal(len(highs), len(lows), "len(highs)", "len(lows)")
+
+        cdef double[:] high = highs
+        cdef double[:] low = lows
+        cdef Py_ssize_t i
+        for i in range(high.shape[0]):
+            self.update_raw(high[i], low[i])
+
     cpdef void _reset(self):
         """
         Reset the indicator.
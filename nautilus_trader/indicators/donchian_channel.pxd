@@ -13,12 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 
 
 cdef class DonchianChannel(Indicator):
-    cdef object _upper_prices
-    cdef object _lower_prices
+    cdef RollingWindow _upper_prices
+    cdef RollingWindow _lower_prices
 
     cdef readonly int period
     """The period for the moving average.\n\n:returns: `int`"""
@@ -30,3 +33,4 @@ cdef class DonchianChannel(Indicator):
     """The current value of the lower band.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double high, double low)
+    cpdef void update_many(self, np.ndarray highs, np.ndarray lows)
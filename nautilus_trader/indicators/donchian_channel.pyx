@@ -13,10 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
+cimport numpy as np
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bar_highs
+from nautilus_trader.indicators.base.indicator cimport bar_lows
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -48,8 +51,8 @@ cdef class DonchianChannel(Indicator):
         super().__init__(params=[period])
 
         self.period = period
-        self._upper_prices = deque(maxlen=period)
-        self._lower_prices = deque(maxlen=period)
+        self._upper_prices = RollingWindow(period, track_extremes=True)
+        self._lower_prices = RollingWindow(period, track_extremes=True)
 
         self.upper = 0
         self.middle = 0
@@ -100,6 +103,20 @@ cdef class DonchianChannel(Indicator):
 
         self.update_raw(bar.high.as_double(), bar.low.as_double())
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The update bars, in order.
+
+        """
+        Condition.not_none(bars, "bars")
+
+        self.update_many(bar_highs(bars), bar_lows(bars))
+
     cpdef void update_raw(self, double high, double low):
         """
         Update the indicator with the given prices.
@@ -119,14 +136,41 @@ cdef class DonchianChannel(Indicator):
         # Initialization logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._upper_prices) >= self.period and len(self._lower_prices) >= self.period:
+            if self._upper_prices.is_full() and self._lower_prices.is_full():
                 self._set_initialized(True)
 
         # Set values
-        self.upper = max(self._upper_prices)
-        self.lower = min(self._lower_prices)
+        self.upper = self._upper_prices.max()
+        self.lower = self._lower_prices.min()
         self.middle = (self.upper + self.lower) / 2
 
+    cpdef void update_many(self, np.ndarray highs, np.ndarray lows):
+        """
+        Update the indicator with the given arrays of raw values.
+
+        The final state is the same as calling `update_raw` for each index, in order.
+
+        Parameters
+        ----------
+        highs : np.ndarray[float64]
+            The high prices.
+        lows : np.ndarray[float64]
+            The low prices.
+
+        Raises
+        ------
+        ValueError
+            If the arrays are not of equal length.
+
+        """
+        Condition.equal(len(highs), len(lows), "len(highs)", "len(lows)")
+
+        cdef double[:] high = highs
+        cdef double[:] low = lows
+        cdef Py_ssize_t i
+        for i in range(high.shape[0]):
+            self.update_raw(high[i], low[i])
+
     cpdef void _reset(self):
         self._upper_prices.clear()
         self._lower_prices.clear()
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.atr cimport AverageTrueRange
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
@@ -36,3 +38,4 @@ cdef class KeltnerChannel(Indicator):
 
     cpdef void handle_bar(self, Bar bar)
     cpdef void update_raw(self, double high, double low, double close)
+    cpdef void update_many(self, np.ndarray highs, np.ndarray lows, np.ndarray closes)
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.base.indicator cimport Indicator
 from nautilus_trader.indicators.keltner_channel cimport KeltnerChannel
 
@@ -28,3 +30,4 @@ cdef class KeltnerPosition(Indicator):
     """The current value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double high, double low, double close)
+    cpdef void update_many(self, np.ndarray highs, np.ndarray lows, np.ndarray closes)
@@ -15,8 +15,13 @@
 
 from nautilus_trader.indicators.average.moving_average import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bar_closes
+from nautilus_trader.indicators.base.indicator cimport bar_highs
+from nautilus_trader.indicators.base.indicator cimport bar_lows
 from nautilus_trader.indicators.keltner_channel cimport KeltnerChannel
 from nautilus_trader.model.data cimport Bar
 
@@ -98,6 +103,20 @@ cdef class KeltnerPosition(Indicator):
             bar.close.as_double(),
         )
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The update bars, in order.
+
+        """
+        Condition.not_none(bars, "bars")
+
+        self.update_many(bar_highs(bars), bar_lows(bars), bar_closes(bars))
+
     cpdef void update_raw(
         self,
         double high,
@@ -132,6 +151,37 @@ cdef class KeltnerPosition(Indicator):
         else:
             self.value = 0
 
+    cpdef void update_many(self, np.ndarray highs, np.ndarray lows, np.ndarray closes):
+        """
+        Update the indicator with the given arrays of raw values.
+
+        The final state is the same as calling `update_raw` for each index, in order.
+
+        Parameters
+        ----------
+        highs : np.ndarray[float64]
+            The high prices.
+        lows : np.ndarray[float64]
+            The low prices.
+        closes : np.ndarray[float64]
+            The close prices.
+
+        Raises
+        ------
+        ValueError
+            If the arrays are not of equal length.
+
+        """
+        Condition.equal(len(highs), len(lows), "len(highs)", "len(lows)")
+        Condition.equal(len(highs), len(closes), "len(highs)", "len(closes)")
+
+        cdef double[:] high = highs
+        cdef double[:] low = lows
+        cdef double[:] close = closes
+        cdef Py_ssize_t i
+        for i in range(high.shape[0]):
+            self.update_raw(high[i], low[i], close[i])
+
     cpdef void _reset(self):
         self._kc.reset()
         self.value = 0
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
 
@@ -34,3 +36,10 @@ cdef class KlingerVolumeOscillator(Indicator):
     """The current value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double high, double low, double close, double volume)
+    cpdef void update_many(
+        self,
+        np.ndarray highs,
+        np.ndarray lows,
+        np.ndarray closes,
+        np.ndarray volumes,
+    )
@@ -13,11 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 
 
 cdef class LinearRegression(Indicator):
-    cdef object _inputs
+    cdef RollingWindow _inputs
 
     cdef readonly int period
     """The window period.\n\n:returns: `int`"""
@@ -35,3 +38,4 @@ cdef class LinearRegression(Indicator):
     """The current value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double close_price)
+    cpdef void update_many(self, np.ndarray closes)
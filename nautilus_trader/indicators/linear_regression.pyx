@@ -13,15 +13,17 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-from statistics import mean
-
-import numpy as np
-
 cimport numpy as np
 
+from libc.math cimport INFINITY
+from libc.math cimport M_PI
+from libc.math cimport atan
+from libc.math cimport fmax
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bar_closes
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 from nautilus_trader.model.data cimport Bar
 
 
@@ -45,7 +47,7 @@ cdef class LinearRegression(Indicator):
         super().__init__(params=[period])
 
         self.period = period
-        self._inputs = deque(maxlen=self.period)
+        self._inputs = RollingWindow(period)
         self.slope = 0.0
         self.intercept = 0.0
         self.degree = 0.0
@@ -67,6 +69,20 @@ cdef class LinearRegression(Indicator):
 
         self.update_raw(bar.close.as_double())
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The update bars, in order.
+
+        """
+        Condition.not_none(bars, "bars")
+
+        self.update_many(bar_closes(bars))
+
     cpdef void update_raw(self, double close):
         """
         Update the indicator with the given raw values.
@@ -82,30 +98,53 @@ cdef class LinearRegression(Indicator):
         # Warmup indicator logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._inputs) >= self.period:
+            if self._inputs.is_full():
                 self._set_initialized(True)
             else:
                 return
 
-        cdef np.ndarray x_arr = np.arange(1, self.period + 1, dtype=np.float64)
-        cdef np.ndarray y_arr = np.asarray(self._inputs, dtype=np.float64)
-        cdef double x_sum = 0.5 * self.period * (self.period + 1)
-        cdef double x2_sum = x_sum * (2 * self.period + 1) / 3
-        cdef double divisor = self.period * x2_sum - x_sum * x_sum
-        cdef double y_sum = sum(y_arr)
-        cdef double xy_sum = sum(x_arr * y_arr)
-        self.slope = (self.period * xy_sum - x_sum * y_sum) / divisor
+        cdef int period = self.period
+        cdef double x_sum = 0.5 * period * (period + 1)
+        cdef double x2_sum = x_sum * (2 * period + 1) / 3
+        cdef double divisor = period * x2_sum - x_sum * x_sum
+        cdef double y_sum = self._inputs.sum()
+        cdef double xy_sum = self._inputs.weighted_sum()
+        self.slope = (period * xy_sum - x_sum * y_sum) / divisor
         self.intercept = (y_sum * x2_sum - x_sum * xy_sum) / divisor
 
-        cdef np.ndarray residuals = np.zeros(self.period, dtype=np.float64)
-        cdef int i
-        for i in np.arange(self.period):
-            residuals[i] = self.slope * x_arr[i] + self.intercept - y_arr[i]
+        cdef double y_last = self._inputs.last()
+        cdef double residual = self.slope * period + self.intercept - y_last
+        self.value = residual + y_last
+        self.degree = 180.0 / M_PI * atan(self.slope)
+        self.cfo = 100.0 * residual / y_last
+
+        # Residual sum of squares follows from the total sum of squares and the fitted slope
+        cdef double ss_tot = self._inputs.variance() * period
+        cdef double ss_res
+        if ss_tot == 0.0:
+            self.R2 = -INFINITY
+        else:
+            ss_res = ss_tot - self.slope * (xy_sum - x_sum * y_sum / period)
+            self.R2 = 1.0 - fmax(ss_res, 0.0) / ss_tot
+
+    cpdef void update_many(self, np.ndarray closes):
+        """
+        Update the indicator with the given arrays of raw values.
+
+        The final state is the same as calling `update_raw` for each index, in order.
+
+        Parameters
+        ----------
+        closes : np.ndarray[float64]
+            The close prices.
+
+        """
+        Condition.not_none(closes, "closes")
 
-        self.value = residuals[-1] + y_arr[-1]
-        self.degree = 180.0 / np.pi * np.arctan(self.slope)
-        self.cfo = 100.0 * residuals[-1] / y_arr[-1]
-        self.R2 = 1.0 - sum(residuals * residuals) / sum((y_arr - mean(y_arr)) * (y_arr - mean(y_arr)))
+        cdef double[:] close = closes
+        cdef Py_ssize_t i
+        for i in range(close.shape[0]):
+            self.update_raw(close[i])
 
     cpdef void _reset(self):
         self._inputs.clear()
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.base.indicator cimport Indicator
 
 
@@ -25,3 +27,4 @@ cdef class OnBalanceVolume(Indicator):
     """The current value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double open, double close, double volume)
+    cpdef void update_many(self, np.ndarray opens, np.ndarray closes, np.ndarray volumes)
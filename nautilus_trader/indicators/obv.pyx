@@ -15,8 +15,13 @@
 
 from collections import deque
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bar_closes
+from nautilus_trader.indicators.base.indicator cimport bar_opens
+from nautilus_trader.indicators.base.indicator cimport bar_volumes
 from nautilus_trader.model.data cimport Bar
 
 
@@ -62,6 +67,20 @@ cdef class OnBalanceVolume(Indicator):
             bar.volume.as_double(),
         )
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The update bars, in order.
+
+        """
+        Condition.not_none(bars, "bars")
+
+        self.update_many(bar_opens(bars), bar_closes(bars), bar_volumes(bars))
+
     cpdef void update_raw(
         self,
         double open,
@@ -96,6 +115,37 @@ cdef class OnBalanceVolume(Indicator):
             if (self.period == 0 and len(self._obv) > 0) or len(self._obv) >= self.period:
                 self._set_initialized(True)
 
+    cpdef void update_many(self, np.ndarray opens, np.ndarray closes, np.ndarray volumes):
+        """
+        Update the indicator with the given arrays of raw values.
+
+        The final state is the same as calling `update_raw` for each index, in order.
+
+        Parameters
+        ----------
+        opens : np.ndarray[float64]
+            The open prices.
+        closes : np.ndarray[float64]
+            The close prices.
+        volumes : np.ndarray[float64]
+            The volumes.
+
+        Raises
+        ------
+        ValueError
+            If the arrays are not of equal length.
+
+        """
+        Condition.equal(len(opens), len(closes), "len(opens)", "len(closes)")
+        Condition.equal(len(opens), len(volumes), "len(opens)", "len(volumes)")
+
+        cdef double[:] open = opens
+        cdef double[:] close = closes
+        cdef double[:] volume = volumes
+        cdef Py_ssize_t i
+        for i in range(open.shape[0]):
+            self.update_raw(open[i], close[i], volume[i])
+
     cpdef void _reset(self):
         self._obv.clear()
         self.value = 0
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.atr cimport AverageTrueRange
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
@@ -30,3 +32,10 @@ cdef class Pressure(Indicator):
     """The cumulative value.\n\n:returns: `int`"""
 
     cpdef void update_raw(self, double high, double low, double close, double volume)
+    cpdef void update_many(
+        self,
+        np.ndarray highs,
+        np.ndarray lows,
+        np.ndarray closes,
+        np.ndarray volumes,
+    )
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.base.indicator cimport Indicator
 
 
@@ -26,3 +28,4 @@ cdef class RateOfChange(Indicator):
     """The current value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double price)
+    cpdef void update_many(self, np.ndarray prices)
@@ -16,8 +16,11 @@
 from collections import deque
 from math import log
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bar_closes
 from nautilus_trader.model.data cimport Bar
 
 
@@ -62,6 +65,20 @@ cdef class RateOfChange(Indicator):
 
         self.update_raw(bar.close.as_double())
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The update bars, in order.
+
+        """
+        Condition.not_none(bars, "bars")
+
+        self.update_many(bar_closes(bars))
+
     cpdef void update_raw(self, double price):
         """
         Update the indicator with the given price.
@@ -84,6 +101,25 @@ cdef class RateOfChange(Indicator):
         else:
             self.value = (price - self._prices[0]) / self._prices[0]
 
+    cpdef void update_many(self, np.ndarray prices):
+        """
+        Update the indicator with the given arrays of raw values.
+
+        The final state is the same as calling `update_raw` for each index, in order.
+
+        Parameters
+        ----------
+        prices : np.ndarray[float64]
+            The prices.
+
+        """
+        Condition.not_none(prices, "prices")
+
+        cdef double[:] price = prices
+        cdef Py_ssize_t i
+        for i in range(price.shape[0]):
+            self.update_raw(price[i])
+
     cpdef void _reset(self):
         self._prices.clear()
         self.value = 0
@@ -13,8 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 from nautilus_trader.model.data cimport Bar
 
 
@@ -22,7 +25,7 @@ cdef class RelativeVolatilityIndex(Indicator):
     cdef MovingAverage _ma
     cdef MovingAverage _pos_ma
     cdef MovingAverage _neg_ma
-    cdef object _prices
+    cdef RollingWindow _prices
 
     cdef readonly int period
     """The window period.\n\n:returns: `int`"""
@@ -37,3 +40,4 @@ cdef class RelativeVolatilityIndex(Indicator):
 
     cpdef void handle_bar(self, Bar bar)
     cpdef void update_raw(self, double close)
+    cpdef void update_many(self, np.ndarray closes)
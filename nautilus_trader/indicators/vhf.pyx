@@ -13,7 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
+cimport numpy as np
 
 from libc.math cimport fabs
 
@@ -22,6 +22,8 @@ from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bar_closes
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 from nautilus_trader.model.data cimport Bar
 
 
@@ -51,7 +53,7 @@ cdef class VerticalHorizontalFilter(Indicator):
         super().__init__(params=params)
 
         self.period = period
-        self._prices = deque(maxlen=self.period)
+        self._prices = RollingWindow(period, track_extremes=True)
         self._ma = MovingAverageFactory.create(period, ma_type)
         self._previous_close = 0
         self.value = 0
@@ -72,6 +74,20 @@ cdef class VerticalHorizontalFilter(Indicator):
             bar.close.as_double(),
         )
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The update bars, in order.
+
+        """
+        Condition.not_none(bars, "bars")
+
+        self.update_many(bar_closes(bars))
+
     cpdef void update_raw(self, double close):
         """
         Update the indicator with the given raw value.
@@ -88,8 +104,8 @@ cdef class VerticalHorizontalFilter(Indicator):
 
         self._prices.append(close)
 
-        cdef double max_price = max(self._prices)
-        cdef double min_price = min(self._prices)
+        cdef double max_price = self._prices.max()
+        cdef double min_price = self._prices.min()
 
         self._ma.update_raw(fabs(close - self._previous_close))
         if self.initialized:
@@ -98,10 +114,29 @@ cdef class VerticalHorizontalFilter(Indicator):
 
         self._check_initialized()
 
+    cpdef void update_many(self, np.ndarray closes):
+        """
+        Update the indicator with the given arrays of raw values.
+
+        The final state is the same as calling `update_raw` for each index, in order.
+
+        Parameters
+        ----------
+        closes : np.ndarray[float64]
+            The close prices.
+
+        """
+        Condition.not_none(closes, "closes")
+
+        cdef double[:] close = closes
+        cdef Py_ssize_t i
+        for i in range(close.shape[0]):
+            self.update_raw(close[i])
+
     cdef void _check_initialized(self):
         if not self.initialized:
             self._set_has_inputs(True)
-            if self._ma.initialized and len(self._prices) >= self.period:
+            if self._ma.initialized and self._prices.is_full():
                 self._set_initialized(True)
 
     cpdef void _reset(self):
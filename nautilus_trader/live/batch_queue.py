@@ -0,0 +1,356 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import time
+from asyncio.events import _get_running_loop
+from collections import deque
+from typing import Any
+
+
+class LatencyHistogram:
+    """
+    Provides a histogram of latencies with power of two nanosecond buckets.
+
+    Recording is O(1) with a fixed memory footprint, percentiles are resolved to
+    the upper bound of the bucket they fall in.
+
+    """
+
+    def __init__(self) -> None:
+        self._buckets: list[int] = [0] * 64
+        self._count = 0
+        self._total_ns = 0
+        self._min_ns = 0
+        self._max_ns = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"count={self._count}, "
+            f"mean_ns={self.mean_ns:.0f}, "
+            f"p50_ns={self.percentile_ns(0.5)}, "
+            f"p99_ns={self.percentile_ns(0.99)}, "
+            f"max_ns={self._max_ns})"
+        )
+
+    @property
+    def count(self) -> int:
+        """
+        Return the count of recorded latencies.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._count
+
+    @property
+    def min_ns(self) -> int:
+        """
+        Return the minimum recorded latency (nanoseconds).
+
+        Returns
+        -------
+        int
+
+        """
+        return self._min_ns
+
+    @property
+    def max_ns(self) -> int:
+        """
+        Return the maximum recorded latency (nanoseconds).
+
+        Returns
+        -------
+        int
+
+        """
+        return self._max_ns
+
+    @property
+    def mean_ns(self) -> float:
+        """
+        Return the mean recorded latency (nanoseconds).
+
+        Returns
+        -------
+        float
+
+        """
+        if self._count == 0:
+            return 0.0
+        return self._total_ns / self._count
+
+    def record(self, latency_ns: int) -> None:
+        """
+        Record the given latency.
+
+        Parameters
+        ----------
+        latency_ns : int
+            The latency (nanoseconds) to record, negative values are recorded as zero.
+
+        """
+        if latency_ns < 0:
+            latency_ns = 0
+
+        self._buckets[min(latency_ns.bit_length(), 63)] += 1
+        if self._count == 0 or latency_ns < self._min_ns:
+            self._min_ns = latency_ns
+        if latency_ns > self._max_ns:
+            self._max_ns = latency_ns
+        self._count += 1
+        self._total_ns += latency_ns
+
+    def percentile_ns(self, q: float) -> int:
+        """
+        Return the latency (nanoseconds) at the given quantile.
+
+        Parameters
+        ----------
+        q : float
+            The quantile in the range [0, 1].
+
+        Returns
+        -------
+        int
+
+        Raises
+        ------
+        ValueError
+            If `q` is not in the range [0, 1].
+
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"`q` must be in the range [0, 1], was {q}")
+        if self._count == 0:
+            return 0
+
+        rank = max(1, int(q * self._count + 0.5))
+        seen = 0
+        for i, bucket in enumerate(self._buckets):
+            seen += bucket
+            if seen >= rank:
+                # Upper bound of the bucket (capped at the observed maximum)
+                return min((1 << i) - 1, self._max_ns)
+
+        return self._max_ns
+
+    def reset(self) -> None:
+        """
+        Reset the histogram.
+        """
+        self._buckets = [0] * 64
+        self._count = 0
+        self._total_ns = 0
+        self._min_ns = 0
+        self._max_ns = 0
+
+
+class BatchQueue:
+    """
+    Provides a high-throughput queue which is drained by a consumer in batches.
+
+    Items may be put from any thread. A single wakeup is scheduled on the event
+    loop for all items put while the consumer is busy, rather than one cross-thread
+    call per item, and the consumer then drains all available items at once.
+
+    The queue does not block producers, when the number of queued items exceeds
+    `maxsize` the item is still queued and `put_threadsafe` reports the overflow
+    (once until the queue is drained back below `maxsize`).
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The event loop for the consumer.
+    maxsize : int
+        The soft capacity of the queue.
+    max_batch : int, optional
+        The maximum number of items returned per batch (defaults to `maxsize`).
+    track_latency : bool, default False
+        If the latency of each item from put to drain is recorded in `latency`.
+
+    Raises
+    ------
+    ValueError
+        If `maxsize` is not positive.
+    ValueError
+        If `max_batch` is not positive.
+
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        maxsize: int,
+        max_batch: int | None = None,
+        track_latency: bool = False,
+    ) -> None:
+        if max_batch is None:
+            max_batch = maxsize
+        if maxsize <= 0:
+            raise ValueError(f"`maxsize` must be positive, was {maxsize}")
+        if max_batch <= 0:
+            raise ValueError(f"`max_batch` must be positive, was {max_batch}")
+
+        self._loop = loop
+        self._maxsize = maxsize
+        self._max_batch = max_batch
+        self._items: deque[Any] = deque()
+        self._waiter: asyncio.Future | None = None
+        self._wakeup_pending = False
+        self._is_over_capacity = False
+        self._latency: LatencyHistogram | None = LatencyHistogram() if track_latency else None
+
+    @property
+    def latency(self) -> LatencyHistogram | None:
+        """
+        Return the histogram of latencies from put to drain (if tracked).
+
+        Returns
+        -------
+        LatencyHistogram or ``None``
+
+        """
+        return self._latency
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Return the soft capacity of the queue.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._maxsize
+
+    def qsize(self) -> int:
+        """
+        Return the number of items in the queue.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._items)
+
+    def empty(self) -> bool:
+        """
+        Return whether the queue is empty.
+
+        Returns
+        -------
+        bool
+
+        """
+        return not self._items
+
+    def put_threadsafe(self, item: Any) -> bool:
+        """
+        Put the given item on the queue, waking the consumer if required.
+
+        This method is thread-safe and never blocks.
+
+        Parameters
+        ----------
+        item : Any
+            The item to put.
+
+        Returns
+        -------
+        bool
+            False if the queue has just exceeded `maxsize`, otherwise True.
+
+        """
+        if self._latency is None:
+            self._items.append(item)
+        else:
+            self._items.append((time.monotonic_ns(), item))
+
+        if _get_running_loop() is self._loop:
+            # On the loop thread (no self-pipe write required)
+            if self._waiter is not None:
+                self._wakeup()
+        elif not self._wakeup_pending:
+            # Coalesce wakeups from other threads until the consumer runs
+            self._wakeup_pending = True
+            self._loop.call_soon_threadsafe(self._wakeup)
+
+        if len(self._items) > self._maxsize and not self._is_over_capacity:
+            self._is_over_capacity = True
+            return False
+
+        return True
+
+    def put_nowait(self, item: Any) -> None:
+        """
+        Put the given item on the queue.
+
+        Provided for compatibility with `asyncio.Queue`, this is equivalent
+        to `put_threadsafe`.
+
+        Parameters
+        ----------
+        item : Any
+            The item to put.
+
+        """
+        self.put_threadsafe(item)
+
+    async def get_batch(self) -> list[Any]:
+        """
+        Return all available items (up to `max_batch`), waiting if the queue is empty.
+
+        Returns
+        -------
+        list[Any]
+
+        """
+        while not self._items:
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+        # Producers may append concurrently, so only pop what is counted here
+        items = self._items
+        popleft = items.popleft
+        batch = [popleft() for _ in range(min(len(items), self._max_batch))]
+
+        latency = self._latency
+        if latency is not None:
+            ts_now = time.monotonic_ns()
+            for ts_put, _ in batch:
+                latency.record(ts_now - ts_put)
+            batch = [item for _, item in batch]
+
+        if self._is_over_capacity and len(items) <= self._maxsize:
+            self._is_over_capacity = False
+
+        return batch
+
+    def _wakeup(self) -> None:
+        self._wakeup_pending = False
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
@@ -43,10 +43,19 @@ class LiveDataEngineConfig(DataEngineConfig, frozen=True):
     ----------
     qsize : PositiveInt, default 100_000
         The queue size for the engines internal queue buffers.
+    batch_queues : bool, default False
+        If the engines internal queues coalesce wakeups from producers and are drained
+        in batches (high-throughput mode). Producers are then never blocked, with
+        `qsize` acting as a soft capacity beyond which a warning is logged.
+    track_latency : bool, default False
+        If the latency of messages through the internal batch queues is recorded in
+        histograms (requires `batch_queues`).
 
     """
 
     qsize: PositiveInt = 100_000
+    batch_queues: bool = False
+    track_latency: bool = False
 
 
 class LiveRiskEngineConfig(RiskEngineConfig, frozen=True):
@@ -57,10 +66,15 @@ class LiveRiskEngineConfig(RiskEngineConfig, frozen=True):
     ----------
     qsize : PositiveInt, default 100_000
         The queue size for the engines internal queue buffers.
+    batch_queues : bool, default False
+        If the engines internal queues coalesce wakeups from producers and are drained
+        in batches (high-throughput mode). Producers are then never blocked, with
+        `qsize` acting as a soft capacity beyond which a warning is logged.
 
     """
 
     qsize: PositiveInt = 100_000
+    batch_queues: bool = False
 
 
 class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
@@ -98,6 +112,10 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
         are colocated with the venue (to avoid the potential for race conditions).
     qsize : PositiveInt, default 100_000
         The queue size for the engines internal queue buffers.
+    batch_queues : bool, default False
+        If the engines internal queues coalesce wakeups from producers and are drained
+        in batches (high-throughput mode). Producers are then never blocked, with
+        `qsize` acting as a soft capacity beyond which a warning is logged.
 
     """
 
@@ -109,6 +127,7 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
     inflight_check_interval_ms: NonNegativeInt = 2_000
     inflight_check_threshold_ms: NonNegativeInt = 5_000
     qsize: PositiveInt = 100_000
+    batch_queues: bool = False
 
 
 class RoutingConfig(NautilusConfig, frozen=True):
@@ -213,6 +232,13 @@ class TradingNodeConfig(NautilusKernelConfig, frozen=True):
         The execution client configurations.
     heartbeat_interval : PositiveFloat, optional
         The heartbeat interval (seconds) to use for trading node health.
+    data_clients_io_thread : bool, default False
+        If data clients run on a dedicated IO thread with their own event loop, so that
+        receiving and decoding messages does not compete with the engines and strategies.
+        Data is handed off through the data engine queues (`data_engine.batch_queues`
+        is recommended to coalesce cross-thread wakeups). The cache is not thread-safe,
+        so data clients must make cache updates through `update_cache`, adapters which
+        write to the cache directly are not supported in this mode.
 
     """
 
@@ -224,3 +250,4 @@ class TradingNodeConfig(NautilusKernelConfig, frozen=True):
     data_clients: dict[str, LiveDataClientConfig] = {}
     exec_clients: dict[str, LiveExecClientConfig] = {}
     heartbeat_interval: PositiveFloat | None = None
+    data_clients_io_thread: bool = False
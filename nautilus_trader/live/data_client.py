@@ -24,6 +24,7 @@ import asyncio
 import functools
 import traceback
 from asyncio import Task
+from asyncio.events import _get_running_loop
 from collections.abc import Callable
 from collections.abc import Coroutine
 from typing import Any
@@ -95,6 +96,7 @@ class LiveDataClient(DataClient):
         )
 
         self._loop = loop
+        self._cache_loop: asyncio.AbstractEventLoop | None = None
 
     async def run_after_delay(
         self,
@@ -122,11 +124,15 @@ class LiveDataClient(DataClient):
         actions: Callable | None = None,
         success_msg: str | None = None,
         success_color: LogColor = LogColor.NORMAL,
-    ) -> asyncio.Task:
+    ) -> asyncio.Task | None:
         """
         Run the given coroutine with error handling and optional callback actions when
         done.
 
+        If called from a thread other than the one running the clients event loop
+        (such as when the client runs on a dedicated IO thread), then the task is
+        created on the clients event loop in a thread-safe way.
+
         Parameters
         ----------
         coro : Coroutine
@@ -142,9 +148,23 @@ class LiveDataClient(DataClient):
 
         Returns
         -------
-        asyncio.Task
+        asyncio.Task or ``None``
+            ``None`` if the task was scheduled from another thread.
 
         """
+        if self._loop.is_running() and _get_running_loop() is not self._loop:
+            self._loop.call_soon_threadsafe(
+                functools.partial(
+                    self.create_task,
+                    coro,
+                    log_msg,
+                    actions,
+                    success_msg,
+                    success_color,
+                ),
+            )
+            return None
+
         log_msg = log_msg or coro.__name__
         self._log.debug(f"Creating task '{log_msg}'")
         task = self._loop.create_task(
@@ -161,6 +181,42 @@ class LiveDataClient(DataClient):
         )
         return task
 
+    def set_cache_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Set the event loop which owns the cache (when the client runs on another loop).
+
+        Cache updates made through `update_cache` are then scheduled on this loop in a
+        thread-safe way, as the cache is not thread-safe.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop
+            The event loop which owns the cache (the kernel event loop).
+
+        """
+        self._cache_loop = loop
+
+    def update_cache(self, func: Callable[..., Any], *args: Any) -> None:
+        """
+        Call the given cache update function with the given arguments.
+
+        The call is scheduled on the cache event loop if the client runs on another
+        thread (such as a dedicated IO thread), otherwise it is made immediately.
+
+        Parameters
+        ----------
+        func : Callable[..., Any]
+            The cache update function, such as `self._cache.add_currency`.
+        *args : Any
+            The arguments for the function.
+
+        """
+        cache_loop = self._cache_loop
+        if cache_loop is None or cache_loop is _get_running_loop():
+            func(*args)
+        else:
+            cache_loop.call_soon_threadsafe(func, *args)
+
     def _on_task_completed(
         self,
         actions: Callable | None,
@@ -321,6 +377,7 @@ class LiveMarketDataClient(MarketDataClient):
         )
 
         self._loop = loop
+        self._cache_loop: asyncio.AbstractEventLoop | None = None
         self._instrument_provider = instrument_provider
 
     async def run_after_delay(
@@ -349,11 +406,15 @@ class LiveMarketDataClient(MarketDataClient):
         actions: Callable | None = None,
         success_msg: str | None = None,
         success_color: LogColor = LogColor.NORMAL,
-    ) -> asyncio.Task:
+    ) -> asyncio.Task | None:
         """
         Run the given coroutine with error handling and optional callback actions when
         done.
 
+        If called from a thread other than the one running the clients event loop
+        (such as when the client runs on a dedicated IO thread), then the task is
+        created on the clients event loop in a thread-safe way.
+
         Parameters
         ----------
         coro : Coroutine
@@ -369,9 +430,23 @@ class LiveMarketDataClient(MarketDataClient):
 
         Returns
         -------
-        asyncio.Task
+        asyncio.Task or ``None``
+            ``None`` if the task was scheduled from another thread.
 
         """
+        if self._loop.is_running() and _get_running_loop() is not self._loop:
+            self._loop.call_soon_threadsafe(
+                functools.partial(
+                    self.create_task,
+                    coro,
+                    log_msg,
+                    actions,
+                    success_msg,
+                    success_color,
+                ),
+            )
+            return None
+
         log_msg = log_msg or coro.__name__
         self._log.debug(f"Creating task '{log_msg}'")
         task = self._loop.create_task(
@@ -388,6 +463,42 @@ class LiveMarketDataClient(MarketDataClient):
         )
         return task
 
+    def set_cache_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Set the event loop which owns the cache (when the client runs on another loop).
+
+        Cache updates made through `update_cache` are then scheduled on this loop in a
+        thread-safe way, as the cache is not thread-safe.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop
+            The event loop which owns the cache (the kernel event loop).
+
+        """
+        self._cache_loop = loop
+
+    def update_cache(self, func: Callable[..., Any], *args: Any) -> None:
+        """
+        Call the given cache update function with the given arguments.
+
+        The call is scheduled on the cache event loop if the client runs on another
+        thread (such as a dedicated IO thread), otherwise it is made immediately.
+
+        Parameters
+        ----------
+        func : Callable[..., Any]
+            The cache update function, such as `self._cache.add_currency`.
+        *args : Any
+            The arguments for the function.
+
+        """
+        cache_loop = self._cache_loop
+        if cache_loop is None or cache_loop is _get_running_loop():
+            func(*args)
+        else:
+            cache_loop.call_soon_threadsafe(func, *args)
+
     def _on_task_completed(
         self,
         actions: Callable | None,
@@ -27,6 +27,8 @@ from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.data.messages import DataCommand
 from nautilus_trader.data.messages import DataRequest
 from nautilus_trader.data.messages import DataResponse
+from nautilus_trader.live.batch_queue import BatchQueue
+from nautilus_trader.live.batch_queue import LatencyHistogram
 
 
 class LiveDataEngine(DataEngine):
@@ -74,10 +76,32 @@ class LiveDataEngine(DataEngine):
         )
 
         self._loop: asyncio.AbstractEventLoop = loop
-        self._cmd_queue: asyncio.Queue = Queue(maxsize=config.qsize)
-        self._req_queue: asyncio.Queue = Queue(maxsize=config.qsize)
-        self._res_queue: asyncio.Queue = Queue(maxsize=config.qsize)
-        self._data_queue: asyncio.Queue = Queue(maxsize=config.qsize)
+        if config.batch_queues:
+            self._cmd_queue: asyncio.Queue | BatchQueue = BatchQueue(
+                loop,
+                maxsize=config.qsize,
+                track_latency=config.track_latency,
+            )
+            self._req_queue: asyncio.Queue | BatchQueue = BatchQueue(
+                loop,
+                maxsize=config.qsize,
+                track_latency=config.track_latency,
+            )
+            self._res_queue: asyncio.Queue | BatchQueue = BatchQueue(
+                loop,
+                maxsize=config.qsize,
+                track_latency=config.track_latency,
+            )
+            self._data_queue: asyncio.Queue | BatchQueue = BatchQueue(
+                loop,
+                maxsize=config.qsize,
+                track_latency=config.track_latency,
+            )
+        else:
+            self._cmd_queue = Queue(maxsize=config.qsize)
+            self._req_queue = Queue(maxsize=config.qsize)
+            self._res_queue = Queue(maxsize=config.qsize)
+            self._data_queue = Queue(maxsize=config.qsize)
 
         # Async tasks
         self._cmd_queue_task: asyncio.Task | None = None
@@ -200,6 +224,30 @@ class LiveDataEngine(DataEngine):
         """
         return self._data_queue.qsize()
 
+    def get_queue_latencies(self) -> dict[str, LatencyHistogram]:
+        """
+        Return the latency histograms for the internal queues (if tracked).
+
+        Latency is measured from a message being put on a queue (potentially
+        from another thread) until it is drained for processing.
+
+        Returns
+        -------
+        dict[str, LatencyHistogram]
+            Keyed by queue name ('cmd', 'req', 'res', 'data').
+
+        """
+        latencies: dict[str, LatencyHistogram] = {}
+        for name, queue in (
+            ("cmd", self._cmd_queue),
+            ("req", self._req_queue),
+            ("res", self._res_queue),
+            ("data", self._data_queue),
+        ):
+            if isinstance(queue, BatchQueue) and queue.latency is not None:
+                latencies[name] = queue.latency
+        return latencies
+
     def kill(self) -> None:
         """
         Kill the engine by abruptly canceling the queue tasks and calling stop.
@@ -245,6 +293,14 @@ class LiveDataEngine(DataEngine):
         PyCondition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
+        if isinstance(self._cmd_queue, BatchQueue):
+            if not self._cmd_queue.put_threadsafe(command):
+                self._log.warning(
+                    f"`_cmd_queue` exceeded capacity at "
+                    f"{self._cmd_queue.qsize():_} items",
+                )
+            return
+
         try:
             self._loop.call_soon_threadsafe(self._cmd_queue.put_nowait, command)
         except asyncio.QueueFull:
@@ -276,6 +332,14 @@ class LiveDataEngine(DataEngine):
         PyCondition.not_none(request, "request")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
+        if isinstance(self._req_queue, BatchQueue):
+            if not self._req_queue.put_threadsafe(request):
+                self._log.warning(
+                    f"`_req_queue` exceeded capacity at "
+                    f"{self._req_queue.qsize():_} items",
+                )
+            return
+
         try:
             self._loop.call_soon_threadsafe(self._req_queue.put_nowait, request)
         except asyncio.QueueFull:
@@ -307,6 +371,14 @@ class LiveDataEngine(DataEngine):
         PyCondition.not_none(response, "response")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
+        if isinstance(self._res_queue, BatchQueue):
+            if not self._res_queue.put_threadsafe(response):
+                self._log.warning(
+                    f"`_res_queue` exceeded capacity at "
+                    f"{self._res_queue.qsize():_} items",
+                )
+            return
+
         try:
             self._loop.call_soon_threadsafe(self._res_queue.put_nowait, response)
         except asyncio.QueueFull:
@@ -338,6 +410,14 @@ class LiveDataEngine(DataEngine):
         PyCondition.not_none(data, "data")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
+        if isinstance(self._data_queue, BatchQueue):
+            if not self._data_queue.put_threadsafe(data):
+                self._log.warning(
+                    f"`_data_queue` exceeded capacity at "
+                    f"{self._data_queue.qsize():_} items",
+                )
+            return
+
         try:
             self._loop.call_soon_threadsafe(self._data_queue.put_nowait, data)
         except asyncio.QueueFull:
@@ -383,6 +463,13 @@ class LiveDataEngine(DataEngine):
             f"DataCommand message queue processing starting (qsize={self.cmd_qsize()})",
         )
         try:
+            if isinstance(self._cmd_queue, BatchQueue):
+                # Drain all available items per wakeup
+                while True:
+                    for item in await self._cmd_queue.get_batch():
+                        if item is self._sentinel:
+                            return
+                        self._execute_command(item)
             while True:
                 command: DataCommand | None = await self._cmd_queue.get()
                 if command is self._sentinel:
@@ -404,6 +491,13 @@ class LiveDataEngine(DataEngine):
             f"DataRequest message queue processing starting (qsize={self.req_qsize()})",
         )
         try:
+            if isinstance(self._req_queue, BatchQueue):
+                # Drain all available items per wakeup
+                while True:
+                    for item in await self._req_queue.get_batch():
+                        if item is self._sentinel:
+                            return
+                        self._handle_request(item)
             while True:
                 request: DataRequest | None = await self._req_queue.get()
                 if request is self._sentinel:
@@ -425,6 +519,13 @@ class LiveDataEngine(DataEngine):
             f"DataResponse message queue processing starting (qsize={self.res_qsize()})",
         )
         try:
+            if isinstance(self._res_queue, BatchQueue):
+                # Drain all available items per wakeup
+                while True:
+                    for item in await self._res_queue.get_batch():
+                        if item is self._sentinel:
+                            return
+                        self._handle_response(item)
             while True:
                 response: DataResponse | None = await self._res_queue.get()
                 if response is self._sentinel:
@@ -444,6 +545,13 @@ class LiveDataEngine(DataEngine):
     async def _run_data_queue(self) -> None:
         self._log.debug(f"Data queue processing starting (qsize={self.data_qsize()})")
         try:
+            if isinstance(self._data_queue, BatchQueue):
+                # Drain all available items per wakeup
+                while True:
+                    for item in await self._data_queue.get_batch():
+                        if item is self._sentinel:
+                            return
+                        self._handle_data(item)
             while True:
                 data: Data | None = await self._data_queue.get()
                 if data is self._sentinel:
@@ -38,6 +38,7 @@ from nautilus_trader.execution.reports import ExecutionReport
 from nautilus_trader.execution.reports import FillReport
 from nautilus_trader.execution.reports import OrderStatusReport
 from nautilus_trader.execution.reports import PositionStatusReport
+from nautilus_trader.live.batch_queue import BatchQueue
 from nautilus_trader.model.enums import LiquiditySide
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import OrderStatus
@@ -116,8 +117,12 @@ class LiveExecutionEngine(ExecutionEngine):
         )
 
         self._loop: asyncio.AbstractEventLoop = loop
-        self._cmd_queue: asyncio.Queue = Queue(maxsize=config.qsize)
-        self._evt_queue: asyncio.Queue = Queue(maxsize=config.qsize)
+        if config.batch_queues:
+            self._cmd_queue: asyncio.Queue | BatchQueue = BatchQueue(loop, maxsize=config.qsize)
+            self._evt_queue: asyncio.Queue | BatchQueue = BatchQueue(loop, maxsize=config.qsize)
+        else:
+            self._cmd_queue = Queue(maxsize=config.qsize)
+            self._evt_queue = Queue(maxsize=config.qsize)
 
         # Async tasks
         self._cmd_queue_task: asyncio.Task | None = None
@@ -281,6 +286,14 @@ class LiveExecutionEngine(ExecutionEngine):
         PyCondition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
+        if isinstance(self._cmd_queue, BatchQueue):
+            if not self._cmd_queue.put_threadsafe(command):
+                self._log.warning(
+                    f"`_cmd_queue` exceeded capacity at "
+                    f"{self._cmd_queue.qsize():_} items",
+                )
+            return
+
         try:
             self._loop.call_soon_threadsafe(self._cmd_queue.put_nowait, command)
         except asyncio.QueueFull:
@@ -311,6 +324,14 @@ class LiveExecutionEngine(ExecutionEngine):
         """
         PyCondition.not_none(event, "event")
 
+        if isinstance(self._evt_queue, BatchQueue):
+            if not self._evt_queue.put_threadsafe(event):
+                self._log.warning(
+                    f"`_evt_queue` exceeded capacity at "
+                    f"{self._evt_queue.qsize():_} items",
+                )
+            return
+
         try:
             self._loop.call_soon_threadsafe(self._evt_queue.put_nowait, event)
         except asyncio.QueueFull:
@@ -367,6 +388,13 @@ class LiveExecutionEngine(ExecutionEngine):
             f"Command message queue processing starting (qsize={self.cmd_qsize()})",
         )
         try:
+            if isinstance(self._cmd_queue, BatchQueue):
+                # Drain all available items per wakeup
+                while True:
+                    for item in await self._cmd_queue.get_batch():
+                        if item is self._sentinel:
+                            return
+                        self._execute_command(item)
             while True:
                 command: TradingCommand | None = await self._cmd_queue.get()
                 if command is self._sentinel:
@@ -388,6 +416,13 @@ class LiveExecutionEngine(ExecutionEngine):
             f"Event message queue processing starting (qsize={self.evt_qsize()})",
         )
         try:
+            if isinstance(self._evt_queue, BatchQueue):
+                # Drain all available items per wakeup
+                while True:
+                    for item in await self._evt_queue.get_batch():
+                        if item is self._sentinel:
+                            return
+                        self._handle_event(item)
             while True:
                 event: OrderEvent | None = await self._evt_queue.get()
                 if event is self._sentinel:
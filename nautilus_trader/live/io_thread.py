@@ -0,0 +1,100 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import threading
+
+
+class IOThread:
+    """
+    Provides a dedicated thread running its own event loop for client IO.
+
+    Clients given the loop of this thread receive and decode messages off the
+    engines event loop, handing off to the engines through their thread-safe
+    queues.
+
+    Parameters
+    ----------
+    name : str, default "nautilus-io"
+        The name of the thread.
+
+    """
+
+    def __init__(self, name: str = "nautilus-io") -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._started = threading.Event()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Return the event loop of the thread.
+
+        Returns
+        -------
+        asyncio.AbstractEventLoop
+
+        """
+        return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Return whether the thread event loop is running.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._thread.is_alive() and self._loop.is_running()
+
+    def start(self) -> None:
+        """
+        Start the thread and run the event loop until stopped.
+
+        Returns once the event loop is running, so that tasks can be scheduled on
+        it thread-safely.
+
+        """
+        self._thread.start()
+        self._started.wait()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the event loop, cancel all remaining tasks and join the thread.
+
+        Parameters
+        ----------
+        timeout : float, default 5.0
+            The timeout (seconds) to wait for the thread to finish.
+
+        """
+        if self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(self._started.set)
+        try:
+            self._loop.run_forever()
+        finally:
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._loop.close()
@@ -27,6 +27,7 @@ from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.live.factories import LiveDataClientFactory
 from nautilus_trader.live.factories import LiveExecClientFactory
+from nautilus_trader.live.io_thread import IOThread
 from nautilus_trader.live.node_builder import TradingNodeBuilder
 from nautilus_trader.model.identifiers import TraderId
 from nautilus_trader.portfolio.base import PortfolioFacade
@@ -62,6 +63,12 @@ class TradingNode:
 
         loop = loop or asyncio.get_event_loop()
 
+        # Dedicated IO thread for data clients (if configured)
+        self._io_thread: IOThread | None = None
+        if config.data_clients_io_thread:
+            self._io_thread = IOThread()
+            self._io_thread.start()
+
         self.kernel = NautilusKernel(
             name=type(self).__name__,
             config=config,
@@ -78,6 +85,7 @@ class TradingNode:
             cache=self.kernel.cache,
             clock=self.kernel.clock,
             logger=self.kernel.logger,
+            data_client_loop=self._io_thread.loop if self._io_thread else None,
         )
 
         # Operation flags
@@ -448,6 +456,10 @@ class TradingNode:
                 self.kernel.logger.info("Shutting down executor")
                 self.kernel.executor.shutdown(wait=True, cancel_futures=True)
 
+            if self._io_thread:
+                self.kernel.logger.info("Stopping IO thread")
+                self._io_thread.stop()
+
             self.kernel.logger.info("Stopping event loop")
             self.kernel.cancel_all_tasks()
             self.kernel.loop.stop()
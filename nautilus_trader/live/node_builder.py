@@ -55,6 +55,9 @@ class TradingNodeBuilder:
         The logger for building clients.
     log : Logger
         The trading nodes logger.
+    data_client_loop : asyncio.AbstractEventLoop, optional
+        The event loop for the data clients (such as the loop of a dedicated IO thread).
+        If ``None`` then data clients use `loop`.
 
     """
 
@@ -68,6 +71,7 @@ class TradingNodeBuilder:
         cache: Cache,
         clock: LiveClock,
         logger: Logger,
+        data_client_loop: asyncio.AbstractEventLoop | None = None,
     ) -> None:
         self._msgbus = msgbus
         self._cache = cache
@@ -75,6 +79,7 @@ class TradingNodeBuilder:
         self._log = logger
 
         self._loop = loop
+        self._data_client_loop = data_client_loop or loop
         self._data_engine = data_engine
         self._exec_engine = exec_engine
         self._portfolio = portfolio
@@ -176,7 +181,7 @@ class TradingNodeBuilder:
             factory = self._data_factories[name]
 
             client = factory.create(
-                loop=self._loop,
+                loop=self._data_client_loop,
                 name=name,
                 config=client_config,
                 msgbus=self._msgbus,
@@ -184,6 +189,10 @@ class TradingNodeBuilder:
                 clock=self._clock,
             )
 
+            if self._data_client_loop is not self._loop:
+                # Cache updates from the client are made on the kernel loop
+                client.set_cache_loop(self._loop)
+
             self._data_engine.register_client(client)
 
             # Default client config
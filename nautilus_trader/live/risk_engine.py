@@ -24,6 +24,7 @@ from nautilus_trader.config import LiveRiskEngineConfig
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.message import Command
 from nautilus_trader.core.message import Event
+from nautilus_trader.live.batch_queue import BatchQueue
 from nautilus_trader.portfolio.base import PortfolioFacade
 from nautilus_trader.risk.engine import RiskEngine
 
@@ -77,8 +78,12 @@ class LiveRiskEngine(RiskEngine):
         )
 
         self._loop: asyncio.AbstractEventLoop = loop
-        self._cmd_queue: asyncio.Queue = Queue(maxsize=config.qsize)
-        self._evt_queue: asyncio.Queue = Queue(maxsize=config.qsize)
+        if config.batch_queues:
+            self._cmd_queue: asyncio.Queue | BatchQueue = BatchQueue(loop, maxsize=config.qsize)
+            self._evt_queue: asyncio.Queue | BatchQueue = BatchQueue(loop, maxsize=config.qsize)
+        else:
+            self._cmd_queue = Queue(maxsize=config.qsize)
+            self._evt_queue = Queue(maxsize=config.qsize)
 
         # Async tasks
         self._cmd_queue_task: asyncio.Task | None = None
@@ -168,6 +173,14 @@ class LiveRiskEngine(RiskEngine):
         PyCondition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
+        if isinstance(self._cmd_queue, BatchQueue):
+            if not self._cmd_queue.put_threadsafe(command):
+                self._log.warning(
+                    f"`_cmd_queue` exceeded capacity at "
+                    f"{self._cmd_queue.qsize():_} items",
+                )
+            return
+
         try:
             self._loop.call_soon_threadsafe(self._cmd_queue.put_nowait, command)
         except asyncio.QueueFull:
@@ -199,6 +212,14 @@ class LiveRiskEngine(RiskEngine):
         PyCondition.not_none(event, "event")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
+        if isinstance(self._evt_queue, BatchQueue):
+            if not self._evt_queue.put_threadsafe(event):
+                self._log.warning(
+                    f"`_evt_queue` exceeded capacity at "
+                    f"{self._evt_queue.qsize():_} items",
+                )
+            return
+
         try:
             self._loop.call_soon_threadsafe(self._evt_queue.put_nowait, event)
         except asyncio.QueueFull:
@@ -237,6 +258,13 @@ class LiveRiskEngine(RiskEngine):
             f"Command message queue processing (qsize={self.cmd_qsize()})",
         )
         try:
+            if isinstance(self._cmd_queue, BatchQueue):
+                # Drain all available items per wakeup
+                while True:
+                    for item in await self._cmd_queue.get_batch():
+                        if item is self._sentinel:
+                            return
+                        self._execute_command(item)
             while True:
                 command: Command | None = await self._cmd_queue.get()
                 if command is self._sentinel:
@@ -258,6 +286,13 @@ class LiveRiskEngine(RiskEngine):
             f"Event message queue processing starting (qsize={self.evt_qsize()})",
         )
         try:
+            if isinstance(self._evt_queue, BatchQueue):
+                # Drain all available items per wakeup
+                while True:
+                    for item in await self._evt_queue.get_batch():
+                        if item is self._sentinel:
+                            return
+                        self._handle_event(item)
             while True:
                 event: Event | None = await self._evt_queue.get()
                 if event is self._sentinel:
@@ -19,6 +19,7 @@ import itertools
 import os
 import pathlib
 import platform
+import re
 from collections import defaultdict
 from collections.abc import Callable
 from collections.abc import Generator
@@ -28,8 +29,11 @@ from pathlib import Path
 from typing import Any, NamedTuple
 
 import fsspec
+import msgspec
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.dataset as pds
 import pyarrow.parquet as pq
 from fsspec.implementations.local import make_path_posix
@@ -67,12 +71,48 @@ from nautilus_trader.serialization.arrow.serializer import list_schemas
 TimestampLike = int | str | float
 
 
+def _ts_init_mask(batch: pa.RecordBatch, start_ns: int | None, end_ns: int | None) -> pa.Array:
+    ts_init = batch.column("ts_init")
+    if start_ns is not None and end_ns is not None:
+        return pc.and_(pc.greater_equal(ts_init, start_ns), pc.less_equal(ts_init, end_ns))
+    elif start_ns is not None:
+        return pc.greater_equal(ts_init, start_ns)
+    else:
+        return pc.less_equal(ts_init, end_ns)
+
+
+def _batch_to_structured_array(batch: pa.RecordBatch) -> np.ndarray:
+    names = batch.schema.names
+    columns = [column.to_numpy(zero_copy_only=False) for column in batch.columns]
+    dtype = [(name, column.dtype) for name, column in zip(names, columns, strict=True)]
+    array = np.empty(batch.num_rows, dtype=dtype)
+    for name, column in zip(names, columns, strict=True):
+        array[name] = column
+    return array
+
+
 class FeatherFile(NamedTuple):
     path: str
     class_name: str
 
 
+class CatalogFileInfo(NamedTuple):
+    path: str  # Relative to the data type directory
+    instrument_id: str | None
+    bar_type: str | None
+    num_rows: int
+    ts_init_min: int
+    ts_init_max: int
+
+
+def _file_info_order(info: CatalogFileInfo) -> tuple[str, int, str]:
+    # Order files by directory, then by time
+    return info.path.rpartition("/")[0], info.ts_init_min, info.path
+
+
 _NAUTILUS_PATH = "NAUTILUS_PATH"
+_MANIFEST_FILENAME = "_manifest.json"
+_TIME_RANGE_FILENAME_PATTERN = re.compile(r"^(\d+)-(\d+)(?:-\d+)?\.parquet$")
 _DEFAULT_FS_PROTOCOL = "file"
 
 
@@ -139,6 +179,9 @@ class ParquetDataCatalog(BaseDataCatalog):
         self.max_rows_per_group = max_rows_per_group
         self.show_query_paths = show_query_paths
 
+        # Decoded manifests per data type directory (updated on write)
+        self._manifests: dict[str, dict[str, CatalogFileInfo]] = {}
+
         if self.fs_protocol == "file":
             final_path = str(make_path_posix(str(path)))
         else:
@@ -236,6 +279,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         data_cls: type[Data],
         instrument_id: str | None = None,
         basename_template: str = "part-{i}",
+        append: bool = False,
         **kwargs: Any,
     ) -> None:
         if isinstance(data[0], CustomData):
@@ -244,7 +288,13 @@ class ParquetDataCatalog(BaseDataCatalog):
         path = self._make_path(data_cls=data_cls, instrument_id=instrument_id)
         kw = dict(**self.dataset_kwargs, **kwargs)
 
-        if "partitioning" not in kw:
+        if append:
+            PyCondition.true(
+                "partitioning" not in kw,
+                "`partitioning` not supported when appending",
+            )
+            self._append_write(table=table, path=path)
+        elif "partitioning" not in kw:
             self._fast_write(
                 table=table,
                 path=path,
@@ -265,6 +315,8 @@ class ParquetDataCatalog(BaseDataCatalog):
                 **kwargs,
             )
 
+        self._update_manifest(class_to_filename(data_cls), path)
+
     def _fast_write(
         self,
         table: pa.Table,
@@ -281,10 +333,346 @@ class ParquetDataCatalog(BaseDataCatalog):
             row_group_size=self.max_rows_per_group,
         )
 
+    def _append_write(self, table: pa.Table, path: str) -> None:
+        start, end = self._table_ts_range(table)
+
+        self.fs.mkdirs(path, exist_ok=True)
+        existing_files = self._list_parquet_files(path)
+        if existing_files:
+            last_end = max(self._file_ts_range(file)[1] for file in existing_files)
+            if start < last_end:
+                raise ValueError(
+                    f"Cannot append data starting at {start} to {path}, "
+                    f"which already contains data up to {last_end} (files must not overlap)",
+                )
+
+        self._write_time_range_file(table, path, start, end, existing_names=set())
+
+    def _write_time_range_file(
+        self,
+        table: pa.Table,
+        path: str,
+        start: int,
+        end: int,
+        existing_names: set[str],
+    ) -> str:
+        # Files are named by their `ts_init` range, so that names order by time
+        name = f"{start}-{end}"
+        count = 0
+        while name in existing_names or self.fs.exists(f"{path}/{name}.parquet"):
+            count += 1
+            name = f"{start}-{end}-{count}"
+
+        file = f"{path}/{name}.parquet"
+        pq.write_table(
+            table,
+            where=file,
+            filesystem=self.fs,
+            row_group_size=self.max_rows_per_group,
+        )
+        existing_names.add(name)
+        return file
+
+    def _list_parquet_files(self, path: str) -> list[str]:
+        if not self.fs.exists(path):
+            return []
+        return [file for file in self.fs.glob(f"{path}/*.parquet") if self.fs.isfile(file)]
+
+    @staticmethod
+    def _table_ts_range(table: pa.Table) -> tuple[int, int]:
+        ts_range = pc.min_max(table.column("ts_init")).as_py()
+        return ts_range["min"], ts_range["max"]
+
+    def _file_ts_range(self, file: str) -> tuple[int, int]:
+        match = _TIME_RANGE_FILENAME_PATTERN.match(file.rsplit("/", 1)[-1])
+        if match:
+            return int(match.group(1)), int(match.group(2))
+
+        # Read the `ts_init` range from the file metadata statistics
+        metadata = pq.read_metadata(file, filesystem=self.fs)
+        index = metadata.schema.to_arrow_schema().get_field_index("ts_init")
+        starts: list[int] = []
+        ends: list[int] = []
+        for i in range(metadata.num_row_groups):
+            stats = metadata.row_group(i).column(index).statistics
+            if stats is None or not stats.has_min_max:
+                # No statistics, fall back to reading the column
+                table = pq.read_table(file, columns=["ts_init"], filesystem=self.fs)
+                return self._table_ts_range(table)
+            starts.append(stats.min)
+            ends.append(stats.max)
+
+        if not starts:
+            return 0, 0  # Empty file
+        return min(starts), max(ends)
+
+    def compact(
+        self,
+        data_cls: type,
+        instrument_id: str | None = None,
+        max_rows_per_file: int | None = None,
+    ) -> None:
+        """
+        Compact the files for the given data type (and instrument ID) into fewer files.
+
+        All files in a data directory are merged into files of `max_rows_per_file`
+        rows (a single file if ``None``), written with row groups of the catalogs
+        `max_rows_per_group`. Data remains sorted by `ts_init` across the new files,
+        which are named by their time range (as for appended files).
+
+        Parameters
+        ----------
+        data_cls : type
+            The data type to compact.
+        instrument_id : str, optional
+            The instrument ID (or bar type) directory to compact.
+            If ``None`` then all directories for `data_cls` are compacted.
+        max_rows_per_file : int, optional
+            The maximum number of rows per compacted file.
+
+        Warnings
+        --------
+        Each directory is loaded into memory while it is compacted.
+
+        """
+        if max_rows_per_file is not None:
+            PyCondition.positive_int(max_rows_per_file, "max_rows_per_file")
+
+        path = self._make_path(data_cls=data_cls, instrument_id=instrument_id)
+        if instrument_id is not None:
+            dirs = [path]
+        else:
+            dirs = sorted({file.rsplit("/", 1)[0] for file in self._find_parquet_files(path)})
+
+        for directory in dirs:
+            self._compact_dir(directory, max_rows_per_file)
+            self._update_manifest(class_to_filename(data_cls), directory, reuse=False)
+
+    def _compact_dir(self, path: str, max_rows_per_file: int | None) -> None:
+        files = sorted(self._list_parquet_files(path), key=self._file_ts_range)
+        if not files:
+            return
+
+        tables = [pq.read_table(file, filesystem=self.fs) for file in files]
+        table = pa.concat_tables(tables).sort_by("ts_init")  # Stable sort
+        if not table.num_rows:
+            return
+
+        rows_per_file = max_rows_per_file or table.num_rows
+        if len(files) == 1 and rows_per_file >= table.num_rows:
+            return  # Already compact
+
+        # Write new files first, then remove the old files
+        new_names: set[str] = set()
+        new_files: set[str] = set()
+        for offset in range(0, table.num_rows, rows_per_file):
+            chunk = table.slice(offset, rows_per_file)
+            start, end = self._table_ts_range(chunk)
+            file = self._write_time_range_file(chunk, path, start, end, existing_names=new_names)
+            new_files.add(self.fs._strip_protocol(file))
+
+        for file in files:
+            if self.fs._strip_protocol(file) not in new_files:
+                self.fs.rm(file)
+
+        # Drop any suffixes which were only needed to avoid overwriting the old files
+        for file in sorted(new_files):
+            name = file.rsplit("/", 1)[-1]
+            match = _TIME_RANGE_FILENAME_PATTERN.match(name)
+            target = f"{file.rsplit('/', 1)[0]}/{match.group(1)}-{match.group(2)}.parquet"
+            if target != file and target not in new_files and not self.fs.exists(target):
+                self.fs.mv(file, target)
+
+    # -- MANIFEST ---------------------------------------------------------------------------------
+
+    def _find_parquet_files(self, path: str) -> list[str]:
+        if not self.fs.exists(path):
+            return []
+        return [file for file in self.fs.find(path) if file.endswith(".parquet")]
+
+    def _manifest_path(self, type_name: str) -> str:
+        return f"{self.path}/data/{type_name}/{_MANIFEST_FILENAME}"
+
+    def _read_manifest(self, type_name: str) -> dict[str, CatalogFileInfo] | None:
+        files = self._manifests.get(type_name)
+        if files is not None:
+            return dict(files)
+
+        manifest_path = self._manifest_path(type_name)
+        if not self.fs.exists(manifest_path):
+            return None
+
+        with self.fs.open(manifest_path, "rb") as f:
+            decoded = msgspec.json.decode(f.read(), type=list[CatalogFileInfo])
+
+        files = {info.path: info for info in decoded}
+        self._manifests[type_name] = files
+        return dict(files)
+
+    def _write_manifest(self, type_name: str, files: dict[str, CatalogFileInfo]) -> None:
+        with self.fs.open(self._manifest_path(type_name), "wb") as f:
+            f.write(msgspec.json.encode(sorted(files.values())))
+        self._manifests[type_name] = dict(files)
+
+    def _sync_manifest(
+        self,
+        type_name: str,
+        files: dict[str, CatalogFileInfo],
+    ) -> dict[str, CatalogFileInfo]:
+        # Check the manifest against the files listed on disk, so that files added or
+        # removed outside the catalog writes are not ignored by queries
+        type_path = f"{self.path}/data/{type_name}"
+        stripped_type_path = self.fs._strip_protocol(type_path).rstrip("/")
+        listed = {
+            self.fs._strip_protocol(file)[len(stripped_type_path) + 1 :]: file
+            for file in self._find_parquet_files(type_path)
+        }
+        if listed.keys() == files.keys():
+            return files
+
+        synced = {path: info for path, info in files.items() if path in listed}
+        for relative_path, file in listed.items():
+            if relative_path not in synced:
+                synced[relative_path] = self._scan_file(type_name, relative_path, file)
+
+        self._write_manifest(type_name, synced)
+        return synced
+
+    def _scan_files(
+        self,
+        type_name: str,
+        path: str,
+        known: dict[str, CatalogFileInfo] | None = None,
+    ) -> dict[str, CatalogFileInfo]:
+        type_path = self.fs._strip_protocol(f"{self.path}/data/{type_name}").rstrip("/")
+        files: dict[str, CatalogFileInfo] = {}
+        for file in self._find_parquet_files(path):
+            relative_path = self.fs._strip_protocol(file)[len(type_path) + 1 :]
+
+            # Appended files are never rewritten under the same name, so can be reused
+            info = known.get(relative_path) if known else None
+            if info is not None and _TIME_RANGE_FILENAME_PATTERN.match(file.rsplit("/", 1)[-1]):
+                files[relative_path] = info
+                continue
+
+            files[relative_path] = self._scan_file(type_name, relative_path, file)
+
+        return files
+
+    def _scan_file(self, type_name: str, relative_path: str, file: str) -> CatalogFileInfo:
+        # Files are stored under a directory named by the instrument ID (or bar type)
+        parts = relative_path.split("/")
+        key = parts[0] if len(parts) > 1 else None
+        if key is not None and type_name == class_to_filename(Bar):
+            instrument_id = key.rsplit("-", 4)[0]
+            bar_type = key
+        else:
+            instrument_id = key
+            bar_type = None
+
+        ts_init_min, ts_init_max = self._file_ts_range(file)
+        return CatalogFileInfo(
+            path=relative_path,
+            instrument_id=instrument_id,
+            bar_type=bar_type,
+            num_rows=pq.read_metadata(file, filesystem=self.fs).num_rows,
+            ts_init_min=ts_init_min,
+            ts_init_max=ts_init_max,
+        )
+
+    def _update_manifest(self, type_name: str, path: str, reuse: bool = True) -> None:
+        files = self._read_manifest(type_name)
+        if files is None:
+            # No manifest yet, so scan all files for the data type
+            self.rebuild_manifest(type_name)
+            return
+
+        # Rescan only the files under the written path
+        type_path = self.fs._strip_protocol(f"{self.path}/data/{type_name}").rstrip("/")
+        prefix = self.fs._strip_protocol(path).rstrip("/")[len(type_path) + 1 :]
+        rescanned = {
+            relative_path: info
+            for relative_path, info in files.items()
+            if not prefix or relative_path.startswith(prefix + "/")
+        }
+        for relative_path in rescanned:
+            del files[relative_path]
+        files.update(self._scan_files(type_name, path, known=rescanned if reuse else None))
+        self._write_manifest(type_name, files)
+
+    def rebuild_manifest(self, data_cls: type | str | None = None) -> None:
+        """
+        Rebuild the catalog manifest by scanning the files for the given data type.
+
+        The manifest records the instrument ID (or bar type), row count and
+        `ts_init` range of every parquet file, and is kept up to date by the
+        catalogs own writes. Files added or removed outside of the catalog are
+        picked up when querying, so it only needs to be rebuilt if files were
+        rewritten in place outside of the catalog.
+
+        Parameters
+        ----------
+        data_cls : type or str, optional
+            The data type (or data type directory name) to rebuild the manifest for.
+            If ``None`` then the manifests for all data types are rebuilt.
+
+        """
+        if data_cls is None:
+            type_names = self.list_data_types()
+        elif isinstance(data_cls, str):
+            type_names = [data_cls]
+        else:
+            type_names = [class_to_filename(data_cls)]
+
+        for type_name in type_names:
+            type_path = f"{self.path}/data/{type_name}"
+            self._write_manifest(type_name, self._scan_files(type_name, type_path))
+
+    def _query_files(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | None = None,
+        bar_types: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+    ) -> list[str] | None:
+        # Returns ``None`` when the data type has no manifest (caller falls back to listing files)
+        type_name = class_to_filename(data_cls)
+        files = self._read_manifest(type_name)
+        if files is None:
+            return None
+
+        files = self._sync_manifest(type_name, files)
+
+        if instrument_ids is not None and not isinstance(instrument_ids, list):
+            instrument_ids = [instrument_ids]
+        if bar_types is not None and not isinstance(bar_types, list):
+            bar_types = [bar_types]
+
+        instrument_keys = {urisafe_instrument_id(x) for x in instrument_ids or []}
+        bar_type_keys = {urisafe_instrument_id(x) for x in bar_types or []}
+        start_ns = dt_to_unix_nanos(start) if start is not None else None
+        end_ns = dt_to_unix_nanos(end) if end is not None else None
+
+        paths: list[str] = []
+        for info in sorted(files.values(), key=_file_info_order):
+            if start_ns is not None and info.ts_init_max < start_ns:
+                continue
+            if end_ns is not None and info.ts_init_min > end_ns:
+                continue
+            if instrument_keys and info.instrument_id not in instrument_keys:
+                continue
+            if bar_type_keys and info.bar_type not in bar_type_keys:
+                continue
+            paths.append(f"{self.path}/data/{type_name}/{info.path}")
+
+        return paths
+
     def write_data(
         self,
         data: list[Data | Event] | list[NautilusRustDataType],
         basename_template: str = "part-{i}",
+        append: bool = False,
         **kwargs: Any,
     ) -> None:
         """
@@ -303,6 +691,10 @@ class ParquetDataCatalog(BaseDataCatalog):
             The token '{i}' will be replaced with an automatically incremented
             integer as files are partitioned.
             If not specified, it defaults to 'part-{i}' + the default extension '.parquet'.
+        append : bool, default False
+            If the data should be appended as a new file named by its `ts_init` range
+            (`basename_template` is then ignored). The data must not overlap with
+            existing data for the data type and instrument ID.
         kwargs : Any
             Additional keyword arguments to be passed to the `write_chunk` method.
 
@@ -325,6 +717,8 @@ class ParquetDataCatalog(BaseDataCatalog):
         ------
         ValueError
             If data of the same type is not monotonically increasing (or non-decreasing) based on `ts_init`.
+        ValueError
+            If `append` and the data overlaps existing data in the catalog.
 
         """
 
@@ -352,6 +746,7 @@ class ParquetDataCatalog(BaseDataCatalog):
                 data_cls=name_to_cls[cls_name],
                 instrument_id=instrument_id,
                 basename_template=basename_template,
+                append=append,
                 **kwargs,
             )
 
@@ -367,13 +762,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         where: str | None = None,
         **kwargs: Any,
     ) -> list[Data | CustomData]:
-        if self.fs_protocol == "file" and data_cls in (
-            OrderBookDelta,
-            OrderBookDepth10,
-            QuoteTick,
-            TradeTick,
-            Bar,
-        ):
+        if self.uses_rust_backend(data_cls):
             data = self.query_rust(
                 data_cls=data_cls,
                 instrument_ids=instrument_ids,
@@ -402,6 +791,30 @@ class ParquetDataCatalog(BaseDataCatalog):
             ]
         return data
 
+    def uses_rust_backend(self, data_cls: type) -> bool:
+        """
+        Return whether queries for the given data type are served by the Rust backend.
+
+        Rust backed queries filter by file and time range only (`filter_expr` is not applied).
+
+        Parameters
+        ----------
+        data_cls : type
+            The data type to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.fs_protocol == "file" and data_cls in (
+            OrderBookDelta,
+            OrderBookDepth10,
+            QuoteTick,
+            TradeTick,
+            Bar,
+        )
+
     def backend_session(
         self,
         data_cls: type,
@@ -422,13 +835,49 @@ class ParquetDataCatalog(BaseDataCatalog):
             raise ValueError("`session` was `None` when a value was expected")
 
         file_prefix = class_to_filename(data_cls)
-        glob_path = f"{self.path}/data/{file_prefix}/**/*"
-        dirs: list[str] = self.fs.glob(glob_path)
+
+        # Prune files outside the query using the manifest (when available)
+        files = self._query_files(
+            data_cls=data_cls,
+            instrument_ids=instrument_ids,
+            bar_types=bar_types,
+            start=start,
+            end=end,
+        )
+        if files is None:
+            files = self._list_query_files(
+                data_cls=data_cls,
+                instrument_ids=instrument_ids,
+                bar_types=bar_types,
+            )
         if self.show_query_paths:
-            print(dirs)
+            print(files)
+
+        for idx, path in enumerate(files):
+            table = f"{file_prefix}_{idx}"
+            query = self._build_query(
+                table,
+                # instrument_ids=None, # Filtering by filename for now
+                start=start,
+                end=end,
+                where=where,
+            )
 
-        for idx, path in enumerate(dirs):
-            assert self.fs.exists(path)
+            session.add_file(data_type, table, str(path), query)
+
+        return session
+
+    def _list_query_files(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | None = None,
+        bar_types: list[str] | None = None,
+    ) -> list[str]:
+        file_prefix = class_to_filename(data_cls)
+        paths = self._find_parquet_files(f"{self.path}/data/{file_prefix}")
+
+        files: list[str] = []
+        for path in sorted(paths):
             # Parse the parent directory which *should* be the instrument ID,
             # this prevents us matching all instrument ID substrings.
             dir = path.split("/")[-2]
@@ -448,18 +897,9 @@ class ParquetDataCatalog(BaseDataCatalog):
             if bar_types and not any(dir == urisafe_instrument_id(x) for x in bar_types):
                 continue
 
-            table = f"{file_prefix}_{idx}"
-            query = self._build_query(
-                table,
-                # instrument_ids=None, # Filtering by filename for now
-                start=start,
-                end=end,
-                where=where,
-            )
-
-            session.add_file(data_type, table, str(path), query)
+            files.append(path)
 
-        return session
+        return files
 
     def query_rust(
         self,
@@ -500,12 +940,62 @@ class ParquetDataCatalog(BaseDataCatalog):
         filter_expr: str | None = None,
         **kwargs: Any,
     ) -> list[Data]:
+        table = self.query_table(
+            data_cls=data_cls,
+            instrument_ids=instrument_ids,
+            bar_types=bar_types,
+            start=start,
+            end=end,
+            filter_expr=filter_expr,
+        )
+        if table is None:
+            return []
+
+        assert (
+            table.num_rows
+        ), f"No rows found for {data_cls=} {instrument_ids=} {filter_expr=} {start=} {end=}"
+
+        return self._handle_table_nautilus(table, data_cls=data_cls)
+
+    def query_table(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | None = None,
+        bar_types: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+        filter_expr: str | None = None,
+        **kwargs: Any,
+    ) -> pa.Table | None:
+        """
+        Query the catalog for the raw Arrow table of the given data type.
+
+        No Nautilus objects are materialized, the table can be converted later
+        using `table_to_data(...)`.
+
+        Returns
+        -------
+        pa.Table or ``None``
+            ``None`` if no data exists for `data_cls`.
+
+        """
         file_prefix = class_to_filename(data_cls)
         dataset_path = f"{self.path}/data/{file_prefix}"
         if not self.fs.exists(dataset_path):
-            return []
-        table = self._load_pyarrow_table(
+            return None
+
+        # Prune files outside the query using the manifest (when available)
+        files = self._query_files(
+            data_cls=data_cls,
+            instrument_ids=instrument_ids,
+            bar_types=bar_types,
+            start=start,
+            end=end,
+        )
+
+        return self._load_pyarrow_table(
             path=dataset_path,
+            files=files,
             filter_expr=filter_expr,
             instrument_ids=instrument_ids,
             bar_types=bar_types,
@@ -513,18 +1003,206 @@ class ParquetDataCatalog(BaseDataCatalog):
             end=end,
         )
 
-        assert (
-            table is not None
-        ), f"No table found for {data_cls=} {instrument_ids=} {filter_expr=} {start=} {end=}"
-        assert (
-            table.num_rows
-        ), f"No rows found for {data_cls=} {instrument_ids=} {filter_expr=} {start=} {end=}"
+    @staticmethod
+    def table_to_data(
+        table: pa.Table | pa.RecordBatch,
+        data_cls: type,
+        metadata: dict | None = None,
+    ) -> list[Data | CustomData]:
+        """
+        Convert the given Arrow table (from `query_table(...)` or `query_batches(...)`)
+        to Nautilus objects.
 
-        return self._handle_table_nautilus(table, data_cls=data_cls)
+        Parameters
+        ----------
+        table : pa.Table or pa.RecordBatch
+            The table to convert.
+        data_cls : type
+            The data type of the table.
+        metadata : dict, optional
+            The data type metadata for generic (custom) data.
+
+        Returns
+        -------
+        list[Data | CustomData]
+
+        """
+        if not table.num_rows:
+            return []
+
+        data = ParquetDataCatalog._handle_table_nautilus(table, data_cls=data_cls)
+        if not is_nautilus_class(data_cls):
+            # Special handling for generic data
+            data = [
+                CustomData(data_type=DataType(data_cls, metadata=metadata), data=d) for d in data
+            ]
+        return data
+
+    def query_batches(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | None = None,
+        bar_types: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+        batch_size: int = 65_536,
+    ) -> Generator[pa.RecordBatch, None, None]:
+        """
+        Lazily query the catalog for Arrow record batches of the given data type.
+
+        Files and row groups outside the `start` and `end` window are skipped
+        without being read. Columns are returned as stored, so prices and sizes
+        of Nautilus data types are raw fixed-point integers, and each batch
+        carries the instrument metadata of its file as schema metadata.
+
+        Parameters
+        ----------
+        data_cls : type
+            The data type to query.
+        instrument_ids : list[str], optional
+            The instrument IDs to filter by.
+        bar_types : list[str], optional
+            The bar types to filter by.
+        start : TimestampLike, optional
+            The start (inclusive) `ts_init` of the query.
+        end : TimestampLike, optional
+            The end (inclusive) `ts_init` of the query.
+        batch_size : int, default 65_536
+            The maximum number of rows per batch.
+
+        Yields
+        ------
+        pa.RecordBatch
+
+        Notes
+        -----
+        Batches are ordered by `ts_init` per instrument ID (or bar type), and
+        are not merged across instruments. Each instruments batches can be passed
+        to `BacktestEngine.add_data_iterator(...)` via `table_to_data(...)`.
+
+        """
+        PyCondition.positive_int(batch_size, "batch_size")
+
+        files = self._query_files(
+            data_cls=data_cls,
+            instrument_ids=instrument_ids,
+            bar_types=bar_types,
+            start=start,
+            end=end,
+        )
+        if files is None:
+            files = self._list_query_files(
+                data_cls=data_cls,
+                instrument_ids=instrument_ids,
+                bar_types=bar_types,
+            )
+
+        start_ns = dt_to_unix_nanos(start) if start is not None else None
+        end_ns = dt_to_unix_nanos(end) if end is not None else None
+        for file in files:
+            with self.fs.open(file, "rb") as f:
+                parquet_file = pq.ParquetFile(f)
+                row_groups = self._query_row_groups(parquet_file.metadata, start_ns, end_ns)
+                if not row_groups:
+                    continue
+
+                batches = parquet_file.iter_batches(batch_size=batch_size, row_groups=row_groups)
+                for batch in batches:
+                    if start_ns is not None or end_ns is not None:
+                        batch = batch.filter(_ts_init_mask(batch, start_ns, end_ns))
+                    if batch.num_rows:
+                        yield batch
+
+    def query_numpy(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | None = None,
+        bar_types: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+    ) -> np.ndarray:
+        """
+        Query the catalog for a NumPy structured array of the given data type.
+
+        The fields are the stored columns, so prices and sizes of Nautilus data
+        types are raw fixed-point integers (see `query_batches(...)`).
+
+        Parameters
+        ----------
+        data_cls : type
+            The data type to query.
+        instrument_ids : list[str], optional
+            The instrument IDs to filter by.
+        bar_types : list[str], optional
+            The bar types to filter by.
+        start : TimestampLike, optional
+            The start (inclusive) `ts_init` of the query.
+        end : TimestampLike, optional
+            The end (inclusive) `ts_init` of the query.
+
+        Returns
+        -------
+        np.ndarray
+
+        Warnings
+        --------
+        The rows of multiple instruments are concatenated without an instrument
+        field, query by a single instrument ID (or bar type) to keep them apart.
+
+        """
+        arrays = [
+            _batch_to_structured_array(batch)
+            for batch in self.query_batches(
+                data_cls=data_cls,
+                instrument_ids=instrument_ids,
+                bar_types=bar_types,
+                start=start,
+                end=end,
+            )
+        ]
+        if not arrays:
+            return self._empty_structured_array(data_cls)
+        return np.concatenate(arrays)
+
+    def _empty_structured_array(self, data_cls: type) -> np.ndarray:
+        # Use the schema of the stored files (or the registered schema) for the dtype
+        files = self._find_parquet_files(f"{self.path}/data/{class_to_filename(data_cls)}")
+        if files:
+            schema = pq.read_schema(files[0], filesystem=self.fs)
+        else:
+            schema = list_schemas().get(data_cls)
+            if schema is None:
+                return np.empty(0)
+
+        return _batch_to_structured_array(pa.RecordBatch.from_pylist([], schema=schema))
+
+    @staticmethod
+    def _query_row_groups(
+        metadata: pq.FileMetaData,
+        start_ns: int | None,
+        end_ns: int | None,
+    ) -> list[int]:
+        row_groups = list(range(metadata.num_row_groups))
+        if start_ns is None and end_ns is None:
+            return row_groups
+
+        index = metadata.schema.to_arrow_schema().get_field_index("ts_init")
+        selected: list[int] = []
+        for i in row_groups:
+            stats = metadata.row_group(i).column(index).statistics
+            if stats is not None and stats.has_min_max:
+                if start_ns is not None and stats.max < start_ns:
+                    continue
+                if end_ns is not None and stats.min > end_ns:
+                    continue
+            selected.append(i)
+
+        return selected
 
     def _load_pyarrow_table(
         self,
         path: str,
+        files: list[str] | None = None,
         filter_expr: str | None = None,
         instrument_ids: list[str] | None = None,
         bar_types: list[str] | None = None,
@@ -532,8 +1210,17 @@ class ParquetDataCatalog(BaseDataCatalog):
         end: TimestampLike | None = None,
         ts_column: str = "ts_init",
     ) -> pds.Dataset | None:
-        # Original dataset
-        dataset = pds.dataset(path, filesystem=self.fs)
+        if files is not None and not files:
+            # All files pruned, return an empty table with the schema of the dataset
+            return pds.dataset(path, filesystem=self.fs).schema.empty_table()
+        elif files is not None:
+            # Files already filtered by instrument ID and bar type
+            dataset = pds.dataset(files, filesystem=self.fs)
+            instrument_ids = None
+            bar_types = None
+        else:
+            # Original dataset
+            dataset = pds.dataset(path, filesystem=self.fs)
 
         # Instrument id filters (not stored in table, need to filter based on files)
         if instrument_ids is not None:
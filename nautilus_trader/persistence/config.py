@@ -18,6 +18,7 @@ from __future__ import annotations
 import fsspec
 
 from nautilus_trader.common.config import NautilusConfig
+from nautilus_trader.common.config import PositiveInt
 
 
 class StreamingConfig(NautilusConfig, frozen=True):
@@ -39,6 +40,8 @@ class StreamingConfig(NautilusConfig, frozen=True):
     include_types : list[type], optional
         A list of Arrow serializable types to write.
         If this is specified then **only** the included types will be written.
+    batch_size : PositiveInt, default 1000
+        The number of objects to buffer per table (and instrument) before writing a batch.
 
     """
 
@@ -48,6 +51,7 @@ class StreamingConfig(NautilusConfig, frozen=True):
     flush_interval_ms: int | None = None
     replace_existing: bool = False
     include_types: list[type] | None = None
+    batch_size: PositiveInt = 1000
 
     @property
     def fs(self):
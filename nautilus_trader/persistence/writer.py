@@ -14,6 +14,8 @@
 # -------------------------------------------------------------------------------------------------
 
 import datetime
+import queue
+import threading
 from io import TextIOWrapper
 from typing import Any, BinaryIO
 
@@ -40,6 +42,9 @@ from nautilus_trader.serialization.arrow.serializer import list_schemas
 from nautilus_trader.serialization.arrow.serializer import register_arrow
 
 
+_FLUSH_FILES = object()  # Sentinel for the writer thread to flush all file streams
+
+
 class StreamingFeatherWriter:
     """
     Provides a stream writer of Nautilus objects into feather files.
@@ -57,6 +62,22 @@ class StreamingFeatherWriter:
     include_types : list[type], optional
         A list of Arrow serializable types to write.
         If this is specified then **only** the included types will be written.
+    batch_size : int, default 1000
+        The number of objects to buffer per table (and instrument) before writing
+        them as a single Arrow batch. Partial batches are written on each flush interval,
+        by the writer thread when no further objects are written (if `use_thread`).
+    max_pending_batches : int, default 100
+        The maximum number of batches pending serialization by the writer thread,
+        after which `write` blocks until a batch is written (bounding memory).
+    use_thread : bool, default True
+        If batches should be serialized and written on a background thread.
+
+    Raises
+    ------
+    ValueError
+        If `batch_size` is not positive (> 0).
+    ValueError
+        If `max_pending_batches` is not positive (> 0).
 
     """
 
@@ -67,7 +88,13 @@ class StreamingFeatherWriter:
         flush_interval_ms: int | None = None,
         replace: bool = False,
         include_types: list[type] | None = None,
+        batch_size: int = 1000,
+        max_pending_batches: int = 100,
+        use_thread: bool = True,
     ) -> None:
+        PyCondition.positive_int(batch_size, "batch_size")
+        PyCondition.positive_int(max_pending_batches, "max_pending_batches")
+
         self.path = path
         self.fs: fsspec.AbstractFileSystem = fsspec.filesystem(fs_protocol)
         self.fs.makedirs(self.fs._parent(self.path), exist_ok=True)
@@ -100,6 +127,21 @@ class StreamingFeatherWriter:
         self._last_flush = datetime.datetime(1970, 1, 1)  # Default value to begin
         self.missing_writers: set[type] = set()
 
+        # Objects are buffered per writer key and written in batches
+        self.batch_size = batch_size
+        self._buffers: dict[object, tuple[type, list[object]]] = {}
+        self._lock = threading.Lock()  # Guards buffers shared with the writer thread
+        self._queue: queue.Queue | None = None
+        self._thread: threading.Thread | None = None
+        if use_thread:
+            self._queue = queue.Queue(maxsize=max_pending_batches)
+            self._thread = threading.Thread(
+                target=self._run_writer_thread,
+                name=type(self).__name__,
+                daemon=True,
+            )
+            self._thread.start()
+
     @property
     def is_closed(self) -> bool:
         """
@@ -242,45 +284,143 @@ class StreamingFeatherWriter:
             else:
                 return
 
+        key: object
         if table in self._per_instrument_writers:
-            writer: RecordBatchStreamWriter = self._instrument_writers[(table, obj.instrument_id.value)]  # type: ignore
+            key = (table, obj.instrument_id.value)  # type: ignore
+        else:
+            key = table
+
+        batch: tuple[type, list[object]] | None = None
+        with self._lock:
+            buffer = self._buffers.get(key)
+            if buffer is None:
+                buffer = (cls, [])
+                self._buffers[key] = buffer
+            buffer[1].append(obj)
+            if len(buffer[1]) >= self.batch_size:
+                batch = self._buffers.pop(key)
+
+        if batch is not None:
+            self._submit_batch(key, *batch)
+
+        self.check_flush()
+
+    def _get_writer(self, key: object) -> RecordBatchStreamWriter:
+        if key in self._instrument_writers:
+            return self._instrument_writers[key]  # type: ignore [index]
+        return self._writers[key]  # type: ignore [index]
+
+    def _submit_batch(self, key: object, cls: type, objs: list[object]) -> None:
+        writer = self._get_writer(key)
+        if self._queue is None:
+            self._write_batch(writer, cls, objs)
         else:
-            writer: RecordBatchStreamWriter = self._writers[table]  # type: ignore
+            self._queue.put((writer, cls, objs))  # Blocks while the queue is full
 
-        serialized = ArrowSerializer.serialize_batch([obj], data_cls=cls)
-        if not serialized:
-            return
+    def _submit_all_batches(self) -> None:
+        with self._lock:
+            buffers = self._buffers
+            self._buffers = {}
+        for key, (cls, objs) in buffers.items():
+            self._submit_batch(key, cls, objs)
 
+    def _write_batch(
+        self,
+        writer: RecordBatchStreamWriter,
+        cls: type,
+        objs: list[object],
+    ) -> None:
         try:
+            serialized = ArrowSerializer.serialize_batch(objs, data_cls=cls)
+            if not serialized:
+                return
             writer.write_table(serialized)
-            self.check_flush()
         except Exception as e:
             self.logger.error(f"Failed to serialize {cls=}")
             self.logger.error(f"ERROR = `{e}`")
-            self.logger.debug(f"data = {obj}")
+            self.logger.debug(f"data = {objs}")
+
+    def _run_writer_thread(self) -> None:
+        assert self._queue is not None  # Type checking
+        timeout = self.flush_interval_ms.total_seconds()
+        while True:
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._flush_idle()
+                continue
+            try:
+                if item is None:
+                    return  # Writer closing
+                elif item is _FLUSH_FILES:
+                    self._flush_files()
+                else:
+                    self._write_batch(*item)
+            finally:
+                self._queue.task_done()
+
+    def _flush_idle(self) -> None:
+        # Called on the writer thread when no batches arrived within the flush
+        # interval, so buffered objects of a quiet stream still reach the files
+        now = datetime.datetime.now()
+        if now - self._last_flush <= self.flush_interval_ms:
+            return
+
+        assert self._queue is not None  # Type checking
+        with self._lock:
+            if not self._queue.empty():
+                return  # Earlier batches are pending, write buffers after them
+            buffers = self._buffers
+            self._buffers = {}
+
+        for key, (cls, objs) in buffers.items():
+            self._write_batch(self._get_writer(key), cls, objs)
+        self._flush_files()
+        self._last_flush = now
+
+    def _flush_files(self) -> None:
+        for stream in tuple(self._files.values()):
+            if not stream.closed:
+                stream.flush()
 
     def check_flush(self) -> None:
         """
         Flush all stream writers if current time greater than the next flush interval.
+
+        Any buffered objects are submitted for writing without waiting for them
+        to be written. When not using a writer thread this should be called
+        periodically so that quiet streams are still flushed.
+
         """
         now = datetime.datetime.now()
         if now - self._last_flush > self.flush_interval_ms:
-            self.flush()
+            self._submit_all_batches()
+            if self._queue is None:
+                self._flush_files()
+            else:
+                self._queue.put(_FLUSH_FILES)
             self._last_flush = now
 
     def flush(self) -> None:
         """
         Flush all stream writers.
+
+        Any buffered objects are written before this method returns.
+
         """
-        for stream in self._files.values():
-            if not stream.closed:
-                stream.flush()
+        self._submit_all_batches()
+        if self._queue is not None:
+            self._queue.join()  # Wait for pending batches to be written
+        self._flush_files()
 
     def close(self) -> None:
         """
         Flush and close all stream writers.
         """
         self.flush()
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)  # type: ignore [union-attr]
+            self._thread.join()
         for wcls in tuple(self._writers):
             self._writers[wcls].close()
             del self._writers[wcls]
@@ -48,6 +48,7 @@ from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.events.order cimport OrderAccepted
 from nautilus_trader.model.events.order cimport OrderCanceled
 from nautilus_trader.model.events.order cimport OrderEvent
+from nautilus_trader.model.events.order cimport OrderExpired
 from nautilus_trader.model.events.order cimport OrderFilled
 from nautilus_trader.model.events.order cimport OrderRejected
 from nautilus_trader.model.events.order cimport OrderUpdated
@@ -425,6 +426,11 @@ cdef class Portfolio(PortfolioFacade):
         if not account.calculate_account_state:
             return  # Nothing to calculate
 
+        if isinstance(event, OrderExpired):
+            # Order no longer contributes to the account state
+            self._accounts.discard_order(event.instrument_id, event.client_order_id)
+            return
+
         if not isinstance(event, _UPDATE_ORDER_EVENTS):
             return  # No change to account state
 
@@ -461,17 +467,10 @@ cdef class Portfolio(PortfolioFacade):
                 instrument_id=event.instrument_id,
             )
 
-        cdef list orders_open = self._cache.orders_open(
-            venue=None,  # Faster query filtering
-            instrument_id=event.instrument_id,
-        )
-
-        cdef:
-            Order o
-        account_state = self._accounts.update_orders(
+        account_state = self._accounts.update_order(
             account=account,
             instrument=instrument,
-            orders_open=[o for o in orders_open if o.is_passive_c()],
+            order=order,
             ts_event=event.ts_event,
         )
 
@@ -541,6 +540,7 @@ cdef class Portfolio(PortfolioFacade):
         self._net_positions.clear()
         self._unrealized_pnls.clear()
         self._pending_calcs.clear()
+        self._accounts.reset()
         self.analyzer.reset()
 
         self.initialized = False
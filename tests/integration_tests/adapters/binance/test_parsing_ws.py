@@ -17,7 +17,11 @@ import pkgutil
 
 import msgspec
 
+from nautilus_trader.adapters.binance.common.data import _parse_stream_name
+from nautilus_trader.adapters.binance.common.schemas.market import BinanceOrderBookData
 from nautilus_trader.adapters.binance.common.schemas.market import BinanceTickerData
+from nautilus_trader.model.enums import BookAction
+from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 
 
@@ -42,3 +46,69 @@ class TestBinanceWebSocketParsing:
 
         # Assert
         assert result.instrument_id == ETHUSDT.id
+
+    def test_parse_order_book_deltas(self):
+        # Arrange
+        raw = pkgutil.get_data(
+            package="tests.integration_tests.adapters.binance.resources.ws_messages",
+            resource="ws_futures_depth_diff_update.json",
+        )
+
+        # Act
+        decoder = msgspec.json.Decoder(BinanceOrderBookData)
+        data = decoder.decode(raw)
+        result = data.parse_to_order_book_deltas(
+            instrument_id=ETHUSDT.id,
+            ts_init=9999999999999991,
+        )
+
+        # Assert
+        assert len(result.deltas) == 2
+        assert result.deltas[0].action == BookAction.UPDATE
+        assert result.deltas[0].order.side == OrderSide.BUY
+        assert str(result.deltas[0].order.price) == "0.0024"
+        assert str(result.deltas[0].order.size) == "10"
+        assert result.deltas[0].sequence == 160
+        assert result.deltas[1].order.side == OrderSide.SELL
+        assert str(result.deltas[1].order.price) == "0.0026"
+
+    def test_parse_order_book_snapshot(self):
+        # Arrange
+        raw = pkgutil.get_data(
+            package="tests.integration_tests.adapters.binance.resources.ws_messages",
+            resource="ws_futures_depth_diff_update.json",
+        )
+
+        # Act
+        decoder = msgspec.json.Decoder(BinanceOrderBookData)
+        data = decoder.decode(raw)
+        result = data.parse_to_order_book_snapshot(
+            instrument_id=ETHUSDT.id,
+            ts_init=9999999999999991,
+        )
+
+        # Assert
+        assert len(result.deltas) == 3
+        assert result.deltas[0].action == BookAction.CLEAR
+        assert result.deltas[1].action == BookAction.ADD
+        assert result.deltas[1].ts_init == 9999999999999991
+
+    def test_parse_stream_name(self):
+        # Arrange
+        raw = b'{"stream":"ethusdt@kline_1m","data":{"e":"kline"}}'
+
+        # Act
+        result = _parse_stream_name(raw)
+
+        # Assert
+        assert result == "ethusdt@kline_1m"
+
+    def test_parse_stream_name_when_not_combined_stream_frame_returns_none(self):
+        # Arrange
+        raw = b'{"result":null,"id":1}'
+
+        # Act
+        result = _parse_stream_name(raw)
+
+        # Assert
+        assert result is None
@@ -947,6 +947,39 @@ class TestCacheDatabaseAdapter:
         # Assert
         assert result == {order.client_order_id: order}
 
+    @pytest.mark.asyncio
+    async def test_load_orders_cache_when_many_orders_in_database(self):
+        # Arrange
+        orders = [
+            self.strategy.order_factory.market(
+                _AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100_000),
+            )
+            for _ in range(25)
+        ]
+
+        for order in orders:
+            self.database.add_order(order)
+
+        order = orders[0]
+        order.apply(TestEventStubs.order_submitted(order))
+        self.database.update_order(order)
+
+        # Allow MPSC thread to insert
+        await eventually(lambda: len(self.database.load_orders()) == len(orders))
+        await eventually(
+            lambda: self.database.load_order(order.client_order_id).last_event
+            == order.last_event,
+        )
+
+        # Act
+        result = self.database.load_orders()
+
+        # Assert
+        assert result == {o.client_order_id: o for o in orders}
+        assert result[order.client_order_id].last_event == order.last_event
+
     @pytest.mark.asyncio
     async def test_load_positions_cache_when_no_positions(self):
         # Arrange, Act
@@ -0,0 +1,121 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from nautilus_trader.backtest.checkpoint import BacktestCheckpoint
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
+from nautilus_trader.test_kit.providers import TestDataProvider
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+
+
+def setup_engine() -> BacktestEngine:
+    engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
+    engine.add_venue(
+        venue=Venue("SIM"),
+        oms_type=OmsType.HEDGING,
+        account_type=AccountType.MARGIN,
+        base_currency=USD,
+        starting_balances=[Money(1_000_000, USD)],
+    )
+    wrangler = QuoteTickDataWrangler(USDJPY_SIM)
+    provider = TestDataProvider()
+    ticks = wrangler.process_bar_data(
+        bid_data=provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")[:2000],
+        ask_data=provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv")[:2000],
+    )
+    engine.add_instrument(USDJPY_SIM)
+    engine.add_data(ticks)
+    return engine
+
+
+def ts_inits() -> list[int]:
+    engine = setup_engine()
+    result = [tick.ts_init for tick in engine.data]
+    engine.dispose()
+    return result
+
+
+def iteration(engine: BacktestEngine) -> int:
+    return engine.iteration
+
+
+def resume(engine: BacktestEngine, start: int) -> int:
+    engine.run(start=start)
+    return engine.iteration
+
+
+def fail(engine: BacktestEngine) -> None:
+    raise ValueError("boom")
+
+
+class TestBacktestCheckpoint:
+    def setup(self) -> None:
+        # Fixture Setup
+        self.ts_inits = ts_inits()
+        self.checkpoint = BacktestCheckpoint(setup=setup_engine, ts_checkpoint=self.ts_inits[3999])
+
+    def test_restore_runs_engine_to_checkpoint(self) -> None:
+        # Arrange, Act
+        engine = self.checkpoint.restore()
+
+        # Assert
+        assert engine.iteration == sum(ts <= self.ts_inits[3999] for ts in self.ts_inits)
+        engine.dispose()
+
+    def test_save_and_load_checkpoint(self, tmp_path: Path) -> None:
+        # Arrange
+        path = str(tmp_path / "checkpoint.pkl")
+
+        # Act
+        self.checkpoint.save(path)
+        result = BacktestCheckpoint.load(path)
+
+        # Assert
+        assert result.setup is setup_engine
+        assert result.ts_checkpoint == self.checkpoint.ts_checkpoint
+
+    def test_run_resumes_each_function_from_checkpoint(self) -> None:
+        # Arrange
+        checkpoint_iteration = sum(ts <= self.ts_inits[3999] for ts in self.ts_inits)
+        resume_after_checkpoint = partial(resume, start=self.checkpoint.ts_checkpoint + 1)
+
+        # Act
+        result = self.checkpoint.run(
+            [iteration, resume_after_checkpoint, resume_after_checkpoint],
+            max_workers=2,
+        )
+
+        # Assert
+        assert result == [checkpoint_iteration, len(self.ts_inits), len(self.ts_inits)]
+
+    def test_run_reraises_exception(self) -> None:
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError, match="boom"):
+            self.checkpoint.run([fail])
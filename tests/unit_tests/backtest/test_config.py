@@ -168,6 +168,28 @@ class TestBacktestConfig:
         )
         assert config.data_type == QuoteTick
 
+    @pytest.mark.parametrize(
+        ("bar_spec", "expected"),
+        [
+            [None, None],
+            ["1-MINUTE-BID", "AUD/USD.SIM-1-MINUTE-BID-EXTERNAL"],
+            ["1-MINUTE-BID-EXTERNAL", "AUD/USD.SIM-1-MINUTE-BID-EXTERNAL"],
+            ["5-MINUTE-LAST-INTERNAL", "AUD/USD.SIM-5-MINUTE-LAST-INTERNAL"],
+        ],
+    )
+    def test_backtest_data_config_bar_type(self, bar_spec: str | None, expected: str | None):
+        # Arrange
+        config = BacktestDataConfig(
+            catalog_path="/",
+            data_cls="nautilus_trader.model.data:Bar",
+            catalog_fs_protocol="memory",
+            instrument_id=InstrumentId.from_str("AUD/USD.SIM"),
+            bar_spec=bar_spec,
+        )
+
+        # Act, Assert
+        assert config.bar_type == expected
+
     @pytest.mark.parametrize(
         "model",
         [
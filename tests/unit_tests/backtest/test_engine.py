@@ -17,9 +17,11 @@ import sys
 from decimal import Decimal
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from nautilus_trader.backtest.engine import BacktestDataStream
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.backtest.models import FillModel
@@ -44,6 +46,7 @@ from nautilus_trader.model.data import DataType
 from nautilus_trader.model.data import InstrumentStatus
 from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import AggregationSource
 from nautilus_trader.model.enums import BarAggregation
@@ -78,6 +81,35 @@ GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
 USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
 
+
+class PassiveOrdersStrategy(Strategy):
+    """
+    Submits limit orders away from the market on the first quote, leaving them open.
+    """
+
+    def __init__(self, order_count: int) -> None:
+        super().__init__()
+        self.order_count = order_count
+        self._submitted = False
+
+    def on_start(self) -> None:
+        self._submitted = False
+        self.subscribe_quote_ticks(USDJPY_SIM.id)
+
+    def on_quote_tick(self, tick: QuoteTick) -> None:
+        if self._submitted:
+            return
+        self._submitted = True
+        price = USDJPY_SIM.make_price(tick.bid_price.as_double() * 0.5)
+        for _ in range(self.order_count):
+            order = self.order_factory.limit(
+                USDJPY_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100_000),
+                price,
+            )
+            self.submit_order(order)
+
 class TestBacktestEngine:
     def setup(self):
         # Fixture Setup
@@ -187,6 +219,47 @@ class TestBacktestEngine:
         # Assert
         assert self.engine.iteration == 8000
 
+    def test_run_with_data_iterator(self):
+        # Arrange
+        engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
+        engine.add_venue(
+            venue=Venue("SIM"),
+            oms_type=OmsType.HEDGING,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            starting_balances=[Money(1_000_000, USD)],
+        )
+        engine.add_instrument(USDJPY_SIM)
+
+        ticks = self.engine.data
+        chunks = (ticks[i : i + 1000] for i in range(0, len(ticks), 1000))
+
+        # Act
+        engine.add_data_iterator(chunks)
+        engine.run()
+
+        # Assert
+        assert engine.data == []  # Iterator streams are not resident
+        assert engine.iteration == 8000
+        engine.dispose()
+
+    def test_run_multiple_time_windows(self):
+        # Arrange
+        ts_inits = [tick.ts_init for tick in self.engine.data]
+        windows = [
+            (ts_inits[0], ts_inits[1999]),
+            (ts_inits[4000], ts_inits[5999]),
+        ]
+
+        # Act
+        for start, end in windows:
+            self.engine.run(start=start, end=end, streaming=True)
+        self.engine.end()
+
+        # Assert
+        expected = sum(start <= ts <= end for start, end in windows for ts in ts_inits)
+        assert self.engine.iteration == expected
+
     def test_run(self):
         # Arrange, Act
         self.engine.add_strategy(Strategy())
@@ -249,6 +322,31 @@ class TestBacktestEngine:
             engine.run()
             engine.dispose()
 
+    def test_run_after_reset_does_not_retain_order_margins(self):
+        # Arrange
+        strategy = PassiveOrdersStrategy(order_count=2)
+        self.engine.add_strategy(strategy)
+        self.engine.run()
+        margin_two_orders = self.engine.portfolio.margins_init(Venue("SIM"))[USDJPY_SIM.id]
+
+        expected_engine = self.create_engine(
+            BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)),
+        )
+        expected_engine.add_strategy(PassiveOrdersStrategy(order_count=1))
+        expected_engine.run()
+        expected = expected_engine.portfolio.margins_init(Venue("SIM"))[USDJPY_SIM.id]
+        expected_engine.dispose()
+
+        # Act
+        self.engine.reset()
+        strategy.order_count = 1
+        self.engine.run()
+
+        # Assert
+        result = self.engine.portfolio.margins_init(Venue("SIM"))[USDJPY_SIM.id]
+        assert margin_two_orders > expected
+        assert result == expected
+
     def test_backtest_engine_strategy_timestamps(self):
         # Arrange
         config = SignalStrategyConfig(instrument_id=USDJPY_SIM.id)
@@ -410,6 +508,51 @@ class TestBacktestEngineData:
         # Assert
         assert len(self.engine.data) == 5
 
+    def test_add_data_merges_streams_on_ts_init(self):
+        # Arrange
+        data_type = DataType(MyData, metadata={"news_wire": "hacks"})
+        custom_data1 = [
+            CustomData(data_type, MyData("AAPL hacked", 1000, 1000)),
+            CustomData(data_type, MyData("AMZN hacked", 2000, 2000)),
+            CustomData(data_type, MyData("NFLX hacked", 3000, 3000)),
+        ]
+        custom_data2 = [
+            CustomData(data_type, MyData("FB hacked", 500, 500)),
+            CustomData(data_type, MyData("MSFT hacked", 2000, 2000)),
+        ]
+
+        # Act
+        self.engine.add_data(custom_data1, ClientId("NEWS_CLIENT"))
+        self.engine.add_data(custom_data2, ClientId("NEWS_CLIENT"))
+
+        # Assert
+        assert [d.data.value for d in self.engine.data] == [
+            "FB hacked",
+            "AAPL hacked",
+            "AMZN hacked",
+            "MSFT hacked",  # <-- equal `ts_init` ordered by stream
+            "NFLX hacked",
+        ]
+
+    def test_data_stream_ts_inits_index(self):
+        # Arrange
+        data_type = DataType(MyData)
+        data = [
+            CustomData(data_type, MyData("AAPL hacked", 1000, 1000)),
+            CustomData(data_type, MyData("AMZN hacked", 2000, 2000)),
+        ]
+
+        # Act
+        stream = BacktestDataStream(data)
+        lazy_stream = BacktestDataStream(iter(data))
+
+        # Assert
+        assert stream.is_resident
+        assert stream.ts_inits.dtype == np.uint64
+        assert stream.ts_inits.tolist() == [1000, 2000]
+        assert not lazy_stream.is_resident
+        assert lazy_stream.ts_inits is None
+
     def test_add_instrument_when_no_venue_raises_exception(self):
         # Arrange
         engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
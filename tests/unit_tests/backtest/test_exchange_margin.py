@@ -2903,6 +2903,29 @@ class TestSimulatedExchangeMarginAccount:
         # Assert
         assert entry.status == OrderStatus.ACCEPTED
 
+    def test_next_pending_ns_with_inflight_command_notifies_pending_handler(self) -> None:
+        # Arrange
+        self.exchange.set_latency_model(LatencyModel(secs_to_nanos(1)))
+        pending: list[int] = []
+        self.exchange.register_pending_handler(lambda e: pending.append(e.next_pending_ns()))
+        entry = self.strategy.order_factory.limit(
+            instrument_id=_USDJPY_SIM.id,
+            order_side=OrderSide.BUY,
+            price=Price.from_str("100.000"),
+            quantity=Quantity.from_int(200_000),
+        )
+        idle_ns = self.exchange.next_pending_ns()
+
+        # Act
+        self.strategy.submit_order(entry)
+        self.exchange.process(secs_to_nanos(1))
+
+        # Assert
+        assert idle_ns == 2**64 - 1
+        assert pending == [secs_to_nanos(1)]
+        assert self.exchange.next_pending_ns() == 2**64 - 1
+        assert entry.status == OrderStatus.ACCEPTED
+
     def test_latency_model_cancel_order(self) -> None:
         # Arrange
         self.exchange.set_latency_model(LatencyModel(secs_to_nanos(1)))
@@ -22,6 +22,8 @@ from nautilus_trader.backtest.models import FillModel
 from nautilus_trader.backtest.models import MakerTakerFeeModel
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.component import TestClock
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarType
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import BookType
@@ -32,6 +34,7 @@ from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import TimeInForce
 from nautilus_trader.model.events import OrderFilled
 from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.orders import MarketOrder
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.component import TestComponentStubs
@@ -128,6 +131,69 @@ class TestOrderMatchingEngine:
         # Assert
         assert exec_messages
 
+    def test_process_bar_with_no_orders_moves_market_to_close(self) -> None:
+        # Arrange
+        bar = Bar(
+            bar_type=BarType.from_str("ETHUSDT-PERP.BINANCE-1-MINUTE-LAST-EXTERNAL"),
+            open=Price.from_str("100.00"),
+            high=Price.from_str("102.00"),
+            low=Price.from_str("99.00"),
+            close=Price.from_str("101.00"),
+            volume=Quantity.from_str("4.000"),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        # Act
+        self.matching_engine.process_bar(bar)
+
+        # Assert
+        assert self.matching_engine.best_bid_price() == Price.from_str("101.00")
+        assert self.matching_engine.best_ask_price() == Price.from_str("101.00")
+
+    def test_process_bar_fills_resting_limit_order_within_bar_range(self) -> None:
+        # Arrange
+        exec_messages = []
+        self.msgbus.register("ExecEngine.process", lambda x: exec_messages.append(x))
+        bar_type = BarType.from_str("ETHUSDT-PERP.BINANCE-1-MINUTE-LAST-EXTERNAL")
+        bar1 = Bar(
+            bar_type=bar_type,
+            open=Price.from_str("100.00"),
+            high=Price.from_str("100.00"),
+            low=Price.from_str("100.00"),
+            close=Price.from_str("100.00"),
+            volume=Quantity.from_str("4.000"),
+            ts_event=0,
+            ts_init=0,
+        )
+        bar2 = Bar(
+            bar_type=bar_type,
+            open=Price.from_str("100.00"),
+            high=Price.from_str("101.00"),
+            low=Price.from_str("99.00"),
+            close=Price.from_str("100.50"),
+            volume=Quantity.from_str("4.000"),
+            ts_event=60_000_000_000,
+            ts_init=60_000_000_000,
+        )
+        self.matching_engine.process_bar(bar1)
+
+        order = TestExecStubs.limit_order(
+            instrument=self.instrument,
+            order_side=OrderSide.BUY,
+            price=Price.from_str("99.50"),
+            quantity=self.instrument.make_qty(1),
+        )
+        self.matching_engine.process_order(order, self.account_id)
+
+        # Act
+        self.matching_engine.process_bar(bar2)
+
+        # Assert
+        fills = [m for m in exec_messages if isinstance(m, OrderFilled)]
+        assert len(fills) == 1
+        assert fills[0].last_px == Price.from_str("99.50")
+
     @pytest.mark.skip(reason="WIP to introduce flags")
     def test_process_auction_book(self) -> None:
         # Arrange
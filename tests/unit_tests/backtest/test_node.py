@@ -24,11 +24,13 @@ from nautilus_trader.config import BacktestRunConfig
 from nautilus_trader.config import BacktestVenueConfig
 from nautilus_trader.config import ImportableStrategyConfig
 from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.persistence.funcs import parse_bytes
 from nautilus_trader.test_kit.mocks.data import load_catalog_with_stub_quote_ticks_audusd
 from nautilus_trader.test_kit.mocks.data import setup_catalog
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 
 
 class TestBacktestNode:
@@ -128,6 +130,96 @@ class TestBacktestNode:
         # Assert
         assert len(results) == 1
 
+    def test_init_with_invalid_max_workers_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            BacktestNode(configs=self.backtest_configs, max_workers=0)
+
+    def test_run_with_multiple_workers(self):
+        # Arrange
+        configs = self.backtest_configs * 3
+        sequential_results = BacktestNode(configs=configs).run()
+        node = BacktestNode(configs=configs, max_workers=2)
+
+        # Act
+        results = node.run()
+
+        # Assert
+        assert len(results) == 3
+        assert node.get_engines() == []  # Engines live in the worker processes
+        assert [r.iterations for r in results] == [r.iterations for r in sequential_results]
+        assert [r.total_orders for r in results] == [r.total_orders for r in sequential_results]
+
+    def test_run_with_multiple_workers_writes_worker_logs(self, capsys):
+        # Arrange
+        config = BacktestRunConfig(
+            engine=BacktestEngineConfig(
+                strategies=self.strategies,
+                logging=LoggingConfig(log_level="INFO"),
+            ),
+            venues=[self.venue_config],
+            data=[self.data_config],
+        )
+        configs = [config] * 2
+        node = BacktestNode(configs=configs, max_workers=2)
+
+        # Act
+        results = node.run()
+
+        # Assert
+        assert len(results) == 2
+        assert [r.run_config_id for r in results] == [c.id for c in configs]
+        assert capsys.readouterr().out.count("BACKTEST POST-RUN") == 2
+
+    def test_load_data_config_with_bar_spec_loads_bar_type(self):
+        # Arrange
+        bars = [TestDataStubs.bar_5decimal(), TestDataStubs.bar_5decimal_5min_bid()]
+        self.catalog.write_data(bars)
+        bar_data_config = BacktestDataConfig(
+            catalog_path=self.catalog.path,
+            catalog_fs_protocol=self.catalog.fs_protocol,
+            data_cls=Bar,
+            instrument_id=InstrumentId.from_str("AUD/USD.SIM"),
+            bar_spec="1-MINUTE-BID",
+        )
+
+        # Act
+        result = BacktestNode.load_data_config(bar_data_config)
+
+        # Assert
+        assert result.data == [TestDataStubs.bar_5decimal()]
+
+    def test_run_with_multiple_workers_and_shared_bar_data(self):
+        # Arrange
+        bars = [TestDataStubs.bar_5decimal(), TestDataStubs.bar_5decimal_5min_bid()]
+        self.catalog.write_data(bars)
+        bar_data_config = BacktestDataConfig(
+            catalog_path=self.catalog.path,
+            catalog_fs_protocol=self.catalog.fs_protocol,
+            data_cls=Bar,
+            instrument_id=InstrumentId.from_str("AUD/USD.SIM"),
+            bar_spec="1-MINUTE-BID",
+        )
+        config = BacktestRunConfig(
+            engine=BacktestEngineConfig(
+                strategies=self.strategies,
+                logging=LoggingConfig(bypass_logging=True),
+            ),
+            venues=[self.venue_config],
+            data=[self.data_config, bar_data_config],
+        )
+        configs = [config] * 2  # Bar data config shared by both runs
+        sequential_results = BacktestNode(configs=configs).run()
+        node = BacktestNode(configs=configs, max_workers=2)
+
+        # Act
+        results = node.run()
+
+        # Assert
+        assert len(results) == 2
+        assert [r.iterations for r in results] == [r.iterations for r in sequential_results]
+        assert [r.total_orders for r in results] == [r.total_orders for r in sequential_results]
+
     def test_backtest_run_batch_sync(self):
         # Arrange
         config = BacktestRunConfig(
@@ -606,6 +606,118 @@ class TestCache:
         # Assert
         assert result == 0.80005
 
+    def test_get_xrate_after_quote_update_returns_updated_rate(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+
+        tick1 = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.80000"),
+            ask_price=Price.from_str("0.80010"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+        tick2 = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.90000"),
+            ask_price=Price.from_str("0.90010"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=1,
+            ts_init=1,
+        )
+
+        self.cache.add_quote_tick(tick1)
+        result1 = self.cache.get_xrate(SIM, AUD, USD)
+        result2 = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Act
+        self.cache.add_quote_tick(tick2)
+        result3 = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Assert
+        assert result1 == 0.80005
+        assert result2 == 0.80005
+        assert result3 == 0.90005
+
+    def test_get_xrate_with_cross_rate_updates_only_on_path_quote_change(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_instrument(USDJPY_SIM)
+
+        audusd = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.80000"),
+            ask_price=Price.from_str("0.80010"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+        usdjpy1 = QuoteTick(
+            instrument_id=USDJPY_SIM.id,
+            bid_price=Price.from_str("110.800"),
+            ask_price=Price.from_str("110.810"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+        usdjpy2 = QuoteTick(
+            instrument_id=USDJPY_SIM.id,
+            bid_price=Price.from_str("120.800"),
+            ask_price=Price.from_str("120.810"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=1,
+            ts_init=1,
+        )
+
+        self.cache.add_quote_tick(audusd)
+        self.cache.add_quote_tick(usdjpy1)
+        result1 = self.cache.get_xrate(SIM, AUD, JPY)
+        result2 = self.cache.get_xrate(SIM, JPY, AUD, PriceType.BID)
+        result3 = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Act
+        self.cache.add_quote_tick(usdjpy2)
+        result4 = self.cache.get_xrate(SIM, AUD, JPY)
+        result5 = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Assert
+        assert result1 == 1.0 * 0.80005 * 110.805
+        assert result2 == 1.0 / 110.8 / 0.8
+        assert result3 == 0.80005
+        assert result4 == 1.0 * 0.80005 * 120.805
+        assert result5 == 0.80005
+
+    def test_get_xrate_when_instrument_added_after_quotes_returns_correct_rate(self):
+        # Arrange
+        self.cache.reset()
+
+        tick = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.80000"),
+            ask_price=Price.from_str("0.80010"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_quote_tick(tick)
+        result1 = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Act
+        self.cache.add_instrument(AUDUSD_SIM)
+        result2 = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Assert
+        assert result1 == 0.0
+        assert result2 == 0.80005
+
     def test_get_xrate_fallbacks_to_bars_if_no_quotes_returns_correct_rate(self):
         # Arrange
         self.cache.reset()
@@ -819,6 +819,49 @@ class TestCache:
         assert self.cache.orders_total_count(side=OrderSide.BUY) == 1
         assert self.cache.orders_total_count(side=OrderSide.SELL) == 0
 
+    def test_orders_open_queries_return_orders_in_insertion_order(self):
+        # Arrange
+        orders = []
+        for i in range(12):
+            order = self.strategy.order_factory.limit(
+                AUDUSD_SIM.id if i % 2 == 0 else GBPUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100_000),
+                Price.from_str("1.00000"),
+            )
+            self.cache.add_order(order, None)
+            order.apply(TestEventStubs.order_submitted(order))
+            self.cache.update_order(order)
+            order.apply(TestEventStubs.order_accepted(order))
+            self.cache.update_order(order)
+            orders.append(order)
+
+        # Act
+        order = orders[4]
+        order.apply(TestEventStubs.order_canceled(order))
+        self.cache.update_order(order)
+
+        # Assert
+        audusd_orders = [o for o in orders[::2] if o is not order]
+        assert self.cache.orders() == orders
+        assert self.cache.orders_open() == [o for o in orders if o is not order]
+        assert self.cache.orders_open(instrument_id=AUDUSD_SIM.id) == audusd_orders
+        assert self.cache.orders_open(venue=AUDUSD_SIM.venue, strategy_id=self.strategy.id) == [
+            o for o in orders if o is not order
+        ]
+        assert (
+            self.cache.orders_open(instrument_id=AUDUSD_SIM.id, strategy_id=self.strategy.id)
+            == audusd_orders
+        )
+        assert self.cache.orders_open(venue=Venue("OTHER"), instrument_id=AUDUSD_SIM.id) == []
+        assert self.cache.orders_closed(instrument_id=AUDUSD_SIM.id) == [order]
+        assert self.cache.client_order_ids_open(instrument_id=GBPUSD_SIM.id) == {
+            o.client_order_id for o in orders[1::2]
+        }
+        assert self.cache.orders_open_count(instrument_id=AUDUSD_SIM.id) == 5
+        assert self.cache.orders_open_count(strategy_id=self.strategy.id) == 11
+        assert self.cache.orders_closed_count(strategy_id=self.strategy.id) == 1
+
     def test_update_position_for_open_position(self):
         # Arrange
         order1 = self.strategy.order_factory.market(
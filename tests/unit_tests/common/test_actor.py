@@ -30,6 +30,7 @@ from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.data.messages import DataResponse
 from nautilus_trader.execution.engine import ExecutionEngine
+from nautilus_trader.indicators.base.indicator import Indicator
 from nautilus_trader.model.currencies import EUR
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.data import Bar
@@ -65,6 +66,45 @@ GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
 USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
 
+class RecordingIndicator(Indicator):
+    def __init__(self) -> None:
+        super().__init__(params=[])
+        self.calls: list[tuple[str, int]] = []
+
+    def handle_quote_tick(self, tick: QuoteTick) -> None:
+        self.calls.append(("handle_quote_tick", 1))
+
+    def handle_quote_ticks(self, ticks: list) -> None:
+        self.calls.append(("handle_quote_ticks", len(ticks)))
+
+    def handle_trade_tick(self, tick: TradeTick) -> None:
+        self.calls.append(("handle_trade_tick", 1))
+
+    def handle_trade_ticks(self, ticks: list) -> None:
+        self.calls.append(("handle_trade_ticks", len(ticks)))
+
+    def handle_bar(self, bar: Bar) -> None:
+        self.calls.append(("handle_bar", 1))
+
+    def handle_bars(self, bars: list) -> None:
+        self.calls.append(("handle_bars", len(bars)))
+
+
+class PerItemHistoricalActor(Actor):
+    def __init__(self, indicator: Indicator) -> None:
+        super().__init__()
+        self.indicator = indicator
+        self.calls_seen: list[int] = []
+
+    def on_historical_data(self, data) -> None:
+        self.calls_seen.append(len(self.indicator.calls))
+
+
+class BatchHistoricalActor(PerItemHistoricalActor):
+    def on_historical_data_batch(self, data: list) -> None:
+        self.calls_seen.append(len(self.indicator.calls))
+
+
 class TestActor:
     def setup(self) -> None:
         # Fixture Setup
@@ -1222,6 +1262,207 @@ class TestActor:
         # Assert
         assert result == bars
 
+    def test_handle_bars_when_batch_handler_overridden_receives_whole_batch(self) -> None:
+        # Arrange
+        class BatchActor(Actor):
+            def __init__(self) -> None:
+                super().__init__()
+                self.batches: list[list[Bar]] = []
+                self.items: list[Bar] = []
+
+            def on_historical_data(self, data) -> None:
+                self.items.append(data)
+
+            def on_historical_data_batch(self, data: list) -> None:
+                self.batches.append(data)
+
+        actor = BatchActor()
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        actor.start()
+
+        bars = [TestDataStubs.bar_5decimal(), TestDataStubs.bar_5decimal()]
+
+        # Act
+        actor.handle_bars(bars)
+
+        # Assert
+        assert actor.batches == [bars]
+        assert actor.items == []
+
+    def test_handle_bars_with_default_handlers_updates_indicators_with_whole_batch(self) -> None:
+        # Arrange
+        actor = MockActor()
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        indicator = RecordingIndicator()
+        actor.register_indicator_for_bars(TestDataStubs.bartype_audusd_1min_bid(), indicator)
+
+        actor.start()
+
+        bars = [TestDataStubs.bar_5decimal(), TestDataStubs.bar_5decimal()]
+
+        # Act
+        actor.handle_bars(bars)
+
+        # Assert
+        assert indicator.calls == [("handle_bars", 2)]
+
+    def test_handle_bars_when_per_item_handler_overridden_updates_indicators_per_bar(
+        self,
+    ) -> None:
+        # Arrange
+        indicator = RecordingIndicator()
+        actor = PerItemHistoricalActor(indicator)
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        actor.register_indicator_for_bars(TestDataStubs.bartype_audusd_1min_bid(), indicator)
+
+        actor.start()
+
+        bars = [TestDataStubs.bar_5decimal(), TestDataStubs.bar_5decimal()]
+
+        # Act
+        actor.handle_bars(bars)
+
+        # Assert
+        assert indicator.calls == [("handle_bar", 1), ("handle_bar", 1)]
+        assert actor.calls_seen == [1, 2]  # Indicator updated before each bar is handled
+
+    def test_handle_bars_when_batch_handler_overridden_updates_indicators_with_whole_batch(
+        self,
+    ) -> None:
+        # Arrange
+        indicator = RecordingIndicator()
+        actor = BatchHistoricalActor(indicator)
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        actor.register_indicator_for_bars(TestDataStubs.bartype_audusd_1min_bid(), indicator)
+
+        actor.start()
+
+        bars = [TestDataStubs.bar_5decimal(), TestDataStubs.bar_5decimal()]
+
+        # Act
+        actor.handle_bars(bars)
+
+        # Assert
+        assert indicator.calls == [("handle_bars", 2)]
+        assert actor.calls_seen == [1]
+
+    def test_handle_quote_ticks_when_per_item_handler_overridden_updates_indicators_per_tick(
+        self,
+    ) -> None:
+        # Arrange
+        indicator = RecordingIndicator()
+        actor = PerItemHistoricalActor(indicator)
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        actor.register_indicator_for_quote_ticks(AUDUSD_SIM.id, indicator)
+
+        actor.start()
+
+        ticks = [TestDataStubs.quote_tick(), TestDataStubs.quote_tick()]
+
+        # Act
+        actor.handle_quote_ticks(ticks)
+
+        # Assert
+        assert indicator.calls == [("handle_quote_tick", 1), ("handle_quote_tick", 1)]
+        assert actor.calls_seen == [1, 2]
+
+    @pytest.mark.parametrize("actor_cls", [MockActor, BatchHistoricalActor])
+    def test_handle_quote_ticks_updates_indicators_with_whole_batch(self, actor_cls) -> None:
+        # Arrange
+        indicator = RecordingIndicator()
+        actor = MockActor() if actor_cls is MockActor else actor_cls(indicator)
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        actor.register_indicator_for_quote_ticks(AUDUSD_SIM.id, indicator)
+
+        actor.start()
+
+        ticks = [TestDataStubs.quote_tick(), TestDataStubs.quote_tick()]
+
+        # Act
+        actor.handle_quote_ticks(ticks)
+
+        # Assert
+        assert indicator.calls == [("handle_quote_ticks", 2)]
+
+    def test_handle_trade_ticks_when_per_item_handler_overridden_updates_indicators_per_tick(
+        self,
+    ) -> None:
+        # Arrange
+        indicator = RecordingIndicator()
+        actor = PerItemHistoricalActor(indicator)
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        actor.register_indicator_for_trade_ticks(AUDUSD_SIM.id, indicator)
+
+        actor.start()
+
+        ticks = [TestDataStubs.trade_tick(), TestDataStubs.trade_tick()]
+
+        # Act
+        actor.handle_trade_ticks(ticks)
+
+        # Assert
+        assert indicator.calls == [("handle_trade_tick", 1), ("handle_trade_tick", 1)]
+        assert actor.calls_seen == [1, 2]
+
+    @pytest.mark.parametrize("actor_cls", [MockActor, BatchHistoricalActor])
+    def test_handle_trade_ticks_updates_indicators_with_whole_batch(self, actor_cls) -> None:
+        # Arrange
+        indicator = RecordingIndicator()
+        actor = MockActor() if actor_cls is MockActor else actor_cls(indicator)
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        actor.register_indicator_for_trade_ticks(AUDUSD_SIM.id, indicator)
+
+        actor.start()
+
+        ticks = [TestDataStubs.trade_tick(), TestDataStubs.trade_tick()]
+
+        # Act
+        actor.handle_trade_ticks(ticks)
+
+        # Assert
+        assert indicator.calls == [("handle_trade_ticks", 2)]
+
     def test_handle_data_when_not_running_does_not_send_to_on_data(self) -> None:
         # Arrange
         actor = MockActor()
@@ -23,6 +23,7 @@ import pytz
 
 from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.component import TestClockGroup
 from nautilus_trader.common.component import TimeEvent
 from nautilus_trader.common.component import TimeEventHandler
 from nautilus_trader.core.datetime import millis_to_nanos
@@ -554,6 +555,56 @@ class TestTestClock:
         assert clock.timer_count == 2
 
 
+class TestTestClockGroup:
+    def test_set_time_sets_time_of_all_linked_clocks(self):
+        # Arrange
+        group = TestClockGroup()
+        clock1 = TestClock()
+        clock2 = TestClock()
+        group.add(clock1)
+        group.add(clock2)
+
+        # Act
+        group.set_time(1_000_000_000)
+
+        # Assert
+        assert group.time_ns == 1_000_000_000
+        assert clock1.timestamp_ns() == 1_000_000_000
+        assert clock2.timestamp_ns() == 1_000_000_000
+        assert clock2.timestamp_ms() == 1_000
+        assert clock2.timestamp() == 1.0
+
+    def test_set_timer_on_linked_clock_starts_from_group_time(self):
+        # Arrange
+        group = TestClockGroup()
+        clock = TestClock()
+        group.add(clock)
+        group.set_time(1_000_000_000)
+
+        # Act
+        clock.set_timer("TIMER", timedelta(seconds=1), callback=lambda e: None)
+        events = clock.advance_time(2_000_000_000)
+
+        # Assert
+        assert clock.next_time_ns("TIMER") == 3_000_000_000
+        assert [e.event.ts_event for e in events] == [2_000_000_000]
+        assert group.time_ns == 2_000_000_000
+
+    def test_remove_clock_retains_group_time(self):
+        # Arrange
+        group = TestClockGroup()
+        clock = TestClock()
+        group.add(clock)
+        group.set_time(5_000_000_000)
+
+        # Act
+        group.remove(clock)
+        group.set_time(6_000_000_000)
+
+        # Assert
+        assert clock.timestamp_ns() == 5_000_000_000
+
+
 class TestLiveClock:
     def setup(self):
         # Fixture Setup
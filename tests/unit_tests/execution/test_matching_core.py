@@ -0,0 +1,301 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from decimal import Decimal
+
+import pandas as pd
+
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.execution.matching_core import MatchingCore
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import TimeInForce
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestMatchingCore:
+    def setup(self) -> None:
+        # Fixture Setup
+        self.order_factory = OrderFactory(
+            trader_id=TestIdStubs.trader_id(),
+            strategy_id=TestIdStubs.strategy_id(),
+            clock=TestClock(),
+        )
+
+        self.triggered = []
+        self.filled_market = []
+        self.filled_limit = []
+
+        self.core = MatchingCore(
+            instrument_id=AUDUSD_SIM.id,
+            price_increment=AUDUSD_SIM.price_increment,
+            trigger_stop_order=self.triggered.append,
+            fill_market_order=self.filled_market.append,
+            fill_limit_order=self.filled_limit.append,
+        )
+
+    def test_get_orders_bid_returns_orders_in_price_time_priority(self) -> None:
+        # Arrange
+        order1 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        order2 = self.order_factory.stop_market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00010"),
+        )
+        order3 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        order4 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("0.99990"),
+        )
+
+        # Act
+        self.core.add_order(order1)
+        self.core.add_order(order2)
+        self.core.add_order(order3)
+        self.core.add_order(order4)
+
+        # Assert
+        assert self.core.get_orders_bid() == [order2, order1, order3, order4]
+        assert self.core.get_orders_ask() == []
+
+    def test_get_orders_ask_returns_orders_in_price_time_priority(self) -> None:
+        # Arrange
+        order1 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00010"),
+        )
+        order2 = self.order_factory.stop_market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+            Price.from_str("0.99990"),
+        )
+        order3 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+
+        # Act
+        self.core.add_order(order1)
+        self.core.add_order(order2)
+        self.core.add_order(order3)
+
+        # Assert
+        assert self.core.get_orders_ask() == [order2, order3, order1]
+        assert self.core.get_orders() == [order2, order3, order1]
+
+    def test_delete_order_removes_order(self) -> None:
+        # Arrange
+        order1 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        order2 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        self.core.add_order(order1)
+        self.core.add_order(order2)
+
+        # Act
+        self.core.delete_order(order1)
+
+        # Assert
+        assert not self.core.order_exists(order1.client_order_id)
+        assert self.core.order_exists(order2.client_order_id)
+        assert self.core.get_orders_bid() == [order2]
+
+    def test_add_order_when_already_added_does_not_duplicate(self) -> None:
+        # Arrange
+        order = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        self.core.add_order(order)
+
+        # Act
+        self.core.add_order(order)
+
+        # Assert
+        assert self.core.get_orders_ask() == [order]
+
+    def test_reindex_order_after_price_update_keeps_time_priority(self) -> None:
+        # Arrange
+        order1 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("0.99990"),
+        )
+        order2 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        self.core.add_order(order1)
+        self.core.add_order(order2)
+
+        order1.apply(TestEventStubs.order_submitted(order1))
+        order1.apply(TestEventStubs.order_accepted(order1))
+        order1.apply(TestEventStubs.order_updated(order1, price=Price.from_str("1.00000")))
+
+        # Act
+        self.core.reindex_order(order1)
+
+        # Assert
+        assert self.core.get_orders_bid() == [order1, order2]
+
+    def test_reset_clears_orders(self) -> None:
+        # Arrange
+        order = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        self.core.add_order(order)
+
+        # Act
+        self.core.reset()
+
+        # Assert
+        assert self.core.get_orders() == []
+        assert not self.core.order_exists(order.client_order_id)
+
+    def test_get_orders_bid_when_unchanged_returns_same_list(self) -> None:
+        # Arrange
+        order1 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        order2 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00010"),
+        )
+        self.core.add_order(order1)
+        orders = self.core.get_orders_bid()
+
+        # Act
+        self.core.add_order(order2)
+
+        # Assert
+        assert self.core.get_orders_bid() is self.core.get_orders_bid()
+        assert orders == [order1]  # Previously returned list is not mutated
+        assert self.core.get_orders_bid() == [order2, order1]
+
+    def test_get_orders_expired_returns_orders_expiring_at_or_before_timestamp(self) -> None:
+        # Arrange
+        expire1 = pd.Timestamp("2024-01-01 00:01", tz="UTC")
+        expire2 = pd.Timestamp("2024-01-01 00:02", tz="UTC")
+        order1 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+            time_in_force=TimeInForce.GTD,
+            expire_time=expire2,
+        )
+        order2 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00010"),
+            time_in_force=TimeInForce.GTD,
+            expire_time=expire1,
+        )
+        order3 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("0.99990"),
+        )
+        self.core.add_order(order1)
+        self.core.add_order(order2)
+        self.core.add_order(order3)
+
+        # Act
+        result1 = self.core.get_orders_expired(expire1.value - 1)
+        result2 = self.core.get_orders_expired(expire1.value)
+        result3 = self.core.get_orders_expired(expire2.value)
+        self.core.delete_order(order2)
+        result4 = self.core.get_orders_expired(expire2.value)
+
+        # Assert
+        assert result1 == []
+        assert result2 == [order2]
+        assert result3 == [order2, order1]
+        assert result4 == [order1]
+
+    def test_get_orders_trailing_returns_only_trailing_stop_orders(self) -> None:
+        # Arrange
+        order1 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        order2 = self.order_factory.trailing_stop_market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+            trailing_offset=Decimal("0.00010"),
+            trigger_price=Price.from_str("0.99990"),
+        )
+        self.core.add_order(order1)
+        self.core.add_order(order2)
+
+        # Act
+        result1 = self.core.get_orders_trailing()
+        self.core.delete_order(order2)
+        result2 = self.core.get_orders_trailing()
+
+        # Assert
+        assert result1 == [order2]
+        assert result2 == []
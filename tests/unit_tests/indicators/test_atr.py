@@ -15,6 +15,7 @@
 
 import sys
 
+import numpy as np
 import pytest
 
 from nautilus_trader.indicators.atr import AverageTrueRange
@@ -171,3 +172,27 @@ class TestAverageTrueRange:
         # Assert
         assert not self.atr.initialized
         assert self.atr.value == 0
+
+    def test_handle_bars_matches_sequential_handle_bar(self):
+        # Arrange
+        bars = [TestDataStubs.bar_5decimal(), TestDataStubs.bar_5decimal_5min_bid()] * 6
+        sequential = AverageTrueRange(10)
+        for bar in bars:
+            sequential.handle_bar(bar)
+
+        # Act
+        self.atr.handle_bars(bars)
+
+        # Assert
+        assert self.atr.initialized
+        assert self.atr.value == sequential.value
+
+    def test_update_many_with_mismatched_lengths_raises_value_error(self):
+        # Arrange
+        highs = np.array([1.00020, 1.00030])
+        lows = np.array([1.00000])
+        closes = np.array([1.00010, 1.00020])
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.atr.update_many(highs, lows, closes)
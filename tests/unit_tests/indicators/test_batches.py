@@ -0,0 +1,247 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import math
+
+import pytest
+
+from nautilus_trader.indicators.amat import ArcherMovingAveragesTrends
+from nautilus_trader.indicators.aroon import AroonOscillator
+from nautilus_trader.indicators.atr import AverageTrueRange
+from nautilus_trader.indicators.average.ama import AdaptiveMovingAverage
+from nautilus_trader.indicators.average.dema import DoubleExponentialMovingAverage
+from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
+from nautilus_trader.indicators.average.hma import HullMovingAverage
+from nautilus_trader.indicators.average.rma import WilderMovingAverage
+from nautilus_trader.indicators.average.sma import SimpleMovingAverage
+from nautilus_trader.indicators.average.vidya import VariableIndexDynamicAverage
+from nautilus_trader.indicators.average.wma import WeightedMovingAverage
+from nautilus_trader.indicators.bias import Bias
+from nautilus_trader.indicators.bollinger_bands import BollingerBands
+from nautilus_trader.indicators.cci import CommodityChannelIndex
+from nautilus_trader.indicators.cmo import ChandeMomentumOscillator
+from nautilus_trader.indicators.dm import DirectionalMovement
+from nautilus_trader.indicators.donchian_channel import DonchianChannel
+from nautilus_trader.indicators.efficiency_ratio import EfficiencyRatio
+from nautilus_trader.indicators.keltner_channel import KeltnerChannel
+from nautilus_trader.indicators.keltner_position import KeltnerPosition
+from nautilus_trader.indicators.kvo import KlingerVolumeOscillator
+from nautilus_trader.indicators.linear_regression import LinearRegression
+from nautilus_trader.indicators.macd import MovingAverageConvergenceDivergence
+from nautilus_trader.indicators.obv import OnBalanceVolume
+from nautilus_trader.indicators.pressure import Pressure
+from nautilus_trader.indicators.psl import PsychologicalLine
+from nautilus_trader.indicators.roc import RateOfChange
+from nautilus_trader.indicators.rsi import RelativeStrengthIndex
+from nautilus_trader.indicators.rvi import RelativeVolatilityIndex
+from nautilus_trader.indicators.stochastics import Stochastics
+from nautilus_trader.indicators.vhf import VerticalHorizontalFilter
+from nautilus_trader.indicators.volatility_ratio import VolatilityRatio
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+# Every indicator which overrides `handle_bars` (directly or via `MovingAverage`)
+INDICATOR_FACTORIES = [
+    lambda: ArcherMovingAveragesTrends(5, 10, 3),
+    lambda: AroonOscillator(10),
+    lambda: AverageTrueRange(10),
+    lambda: AdaptiveMovingAverage(10, 2, 30),
+    lambda: DoubleExponentialMovingAverage(10),
+    lambda: ExponentialMovingAverage(10),
+    lambda: HullMovingAverage(10),
+    lambda: WilderMovingAverage(10),
+    lambda: SimpleMovingAverage(10),
+    lambda: VariableIndexDynamicAverage(10),
+    lambda: WeightedMovingAverage(10),
+    lambda: Bias(10),
+    lambda: BollingerBands(10, 2.0),
+    lambda: CommodityChannelIndex(10),
+    lambda: ChandeMomentumOscillator(10),
+    lambda: DirectionalMovement(10),
+    lambda: DonchianChannel(10),
+    lambda: EfficiencyRatio(10),
+    lambda: KeltnerChannel(10, 2.5),
+    lambda: KeltnerPosition(10, 2.5),
+    lambda: KlingerVolumeOscillator(5, 10, 3),
+    lambda: LinearRegression(10),
+    lambda: MovingAverageConvergenceDivergence(5, 10),
+    lambda: OnBalanceVolume(10),
+    lambda: Pressure(10),
+    lambda: PsychologicalLine(10),
+    lambda: RateOfChange(10),
+    lambda: RelativeStrengthIndex(10),
+    lambda: RelativeVolatilityIndex(10),
+    lambda: Stochastics(10, 3),
+    lambda: VerticalHorizontalFilter(10),
+    lambda: VolatilityRatio(5, 10),
+]
+
+# Every moving average, which all override `handle_quote_ticks` and `handle_trade_ticks`
+MOVING_AVERAGE_FACTORIES = [
+    lambda: AdaptiveMovingAverage(10, 2, 30, price_type=PriceType.MID),
+    lambda: DoubleExponentialMovingAverage(10, price_type=PriceType.MID),
+    lambda: ExponentialMovingAverage(10, price_type=PriceType.MID),
+    lambda: HullMovingAverage(10, price_type=PriceType.MID),
+    lambda: WilderMovingAverage(10, price_type=PriceType.MID),
+    lambda: SimpleMovingAverage(10, price_type=PriceType.MID),
+    lambda: VariableIndexDynamicAverage(10, price_type=PriceType.MID),
+    lambda: WeightedMovingAverage(10, price_type=PriceType.MID),
+]
+
+
+def _prices(count: int) -> list[float]:
+    return [round(1.00000 + 0.00050 * math.sin(i / 3) + 0.00001 * i, 5) for i in range(count)]
+
+
+def _bars(count: int) -> list[Bar]:
+    bar_type = TestDataStubs.bartype_audusd_1min_bid()
+    bars = []
+    prices = _prices(count)
+    for i in range(count):
+        mid = prices[i]
+        open_ = round(mid - 0.00002 * math.cos(i), 5)
+        close = round(mid + 0.00002 * math.cos(i), 5)
+        bars.append(
+            Bar(
+                bar_type=bar_type,
+                open=Price(open_, 5),
+                high=Price(max(open_, close) + 0.00003 * (1 + i % 4), 5),
+                low=Price(min(open_, close) - 0.00003 * (1 + i % 3), 5),
+                close=Price(close, 5),
+                volume=Quantity.from_int(100_000 * (1 + i % 7)),
+                ts_event=i,
+                ts_init=i,
+            ),
+        )
+    return bars
+
+
+def _public_state(indicator) -> dict:
+    return {
+        name: getattr(indicator, name)
+        for name in dir(indicator)
+        if not name.startswith("_") and not callable(getattr(indicator, name))
+    }
+
+
+@pytest.mark.parametrize(
+    "factory",
+    INDICATOR_FACTORIES,
+    ids=lambda factory: type(factory()).__name__,
+)
+def test_handle_bars_matches_sequential_handle_bar(factory):
+    # Arrange
+    bars = _bars(50)
+    sequential = factory()
+    for bar in bars:
+        sequential.handle_bar(bar)
+
+    batched = factory()
+
+    # Act
+    batched.handle_bars(bars)
+
+    # Assert
+    expected = _public_state(sequential)
+    assert batched.initialized
+    assert _public_state(batched).keys() == expected.keys()
+    for name, value in _public_state(batched).items():
+        if isinstance(value, float):
+            assert value == pytest.approx(expected[name]), name
+        else:
+            assert value == expected[name], name
+
+
+@pytest.mark.parametrize(
+    "factory",
+    INDICATOR_FACTORIES,
+    ids=lambda factory: type(factory()).__name__,
+)
+def test_handle_bars_in_chunks_matches_single_batch(factory):
+    # Arrange
+    bars = _bars(50)
+    single = factory()
+    single.handle_bars(bars)
+
+    chunked = factory()
+
+    # Act
+    chunked.handle_bars(bars[:7])
+    chunked.handle_bars([])
+    chunked.handle_bars(bars[7:])
+
+    # Assert
+    expected = _public_state(single)
+    for name, value in _public_state(chunked).items():
+        if isinstance(value, float):
+            assert value == pytest.approx(expected[name]), name
+        else:
+            assert value == expected[name], name
+
+
+@pytest.mark.parametrize(
+    "factory",
+    MOVING_AVERAGE_FACTORIES,
+    ids=lambda factory: type(factory()).__name__,
+)
+def test_handle_quote_ticks_matches_sequential_handle_quote_tick(factory):
+    # Arrange
+    ticks = [
+        TestDataStubs.quote_tick(bid_price=price, ask_price=price + 0.00002, ts_event=i, ts_init=i)
+        for i, price in enumerate(_prices(50))
+    ]
+    sequential = factory()
+    for tick in ticks:
+        sequential.handle_quote_tick(tick)
+
+    batched = factory()
+
+    # Act
+    batched.handle_quote_ticks(ticks)
+
+    # Assert
+    assert batched.initialized
+    assert batched.count == sequential.count
+    assert batched.value == pytest.approx(sequential.value)
+
+
+@pytest.mark.parametrize(
+    "factory",
+    MOVING_AVERAGE_FACTORIES,
+    ids=lambda factory: type(factory()).__name__,
+)
+def test_handle_trade_ticks_matches_sequential_handle_trade_tick(factory):
+    # Arrange
+    ticks = [
+        TestDataStubs.trade_tick(price=price, ts_event=i, ts_init=i)
+        for i, price in enumerate(_prices(50))
+    ]
+    sequential = factory()
+    for tick in ticks:
+        sequential.handle_trade_tick(tick)
+
+    batched = factory()
+
+    # Act
+    batched.handle_trade_ticks(ticks)
+
+    # Assert
+    assert batched.initialized
+    assert batched.count == sequential.count
+    assert batched.value == pytest.approx(sequential.value)
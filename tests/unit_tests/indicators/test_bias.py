@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pytest
+
 from nautilus_trader.indicators.bias import Bias
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
@@ -100,7 +102,7 @@ class TestBias:
         self.bias.update_raw(109.9)
         self.bias.update_raw(110.04)
         # Act, Assert
-        assert self.bias.value == 0.0006547359231776628
+        assert self.bias.value == pytest.approx(0.0006547359231776628, rel=1e-9)
 
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
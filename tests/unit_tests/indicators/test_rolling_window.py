@@ -0,0 +1,141 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from collections import deque
+
+import numpy as np
+import pytest
+
+from nautilus_trader.indicators.base.rolling_window import RollingWindow
+
+
+class TestRollingWindow:
+    def test_instantiate_returns_empty_window(self):
+        # Arrange, Act
+        window = RollingWindow(5)
+
+        # Assert
+        assert window.capacity == 5
+        assert window.count == 0
+        assert len(window) == 0
+        assert not window.is_full()
+        assert window.sum() == 0.0
+        assert window.mean() == 0.0
+        assert window.variance() == 0.0
+        assert repr(window) == "RollingWindow(capacity=5, count=0)"
+
+    def test_instantiate_with_invalid_capacity_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            RollingWindow(0)
+
+    def test_append_when_not_full_returns_expected_statistics(self):
+        # Arrange
+        window = RollingWindow(5)
+
+        # Act
+        window.append(1.0)
+        window.append(2.0)
+        window.append(3.0)
+
+        # Assert
+        assert window.count == 3
+        assert window.first() == 1.0
+        assert window.last() == 3.0
+        assert window.sum() == 6.0
+        assert window.weighted_sum() == 14.0  # 1 * 1 + 2 * 2 + 3 * 3
+        assert window.mean() == 2.0
+        assert window.variance() == pytest.approx(2.0 / 3.0)
+
+    def test_append_when_full_evicts_oldest_value(self):
+        # Arrange
+        window = RollingWindow(3)
+
+        # Act
+        for value in (1.0, 2.0, 3.0, 4.0, 5.0):
+            window.append(value)
+
+        # Assert
+        assert window.is_full()
+        assert window.count == 3
+        assert window.first() == 3.0
+        assert window.last() == 5.0
+        assert window.sum() == 12.0
+        assert window.weighted_sum() == 26.0  # 1 * 3 + 2 * 4 + 3 * 5
+        assert window.mean() == 4.0
+        assert window.std() == pytest.approx(np.std([3.0, 4.0, 5.0]))
+
+    def test_std_with_mean_returns_deviation_about_given_mean(self):
+        # Arrange
+        window = RollingWindow(4)
+        for value in (1.0, 2.0, 4.0, 8.0):
+            window.append(value)
+
+        # Act
+        result = window.std_with_mean(4.0)
+
+        # Assert
+        assert result == pytest.approx(np.sqrt(np.mean((np.array([1.0, 2.0, 4.0, 8.0]) - 4.0) ** 2)))
+
+    def test_statistics_match_fresh_calculation_over_many_updates(self):
+        # Arrange
+        rng = np.random.default_rng(42)
+        window = RollingWindow(7, track_extremes=True)
+        values = deque(maxlen=7)
+
+        # Act, Assert
+        for value in rng.normal(100.0, 5.0, size=100):
+            window.append(value)
+            values.append(value)
+            expected = np.array(values)
+            assert window.mean() == pytest.approx(expected.mean(), rel=1e-12)
+            assert window.std() == pytest.approx(expected.std(), rel=1e-9)
+            assert window.max() == expected.max()
+            assert window.min() == expected.min()
+
+    def test_max_min_when_not_tracking_extremes_raises_value_error(self):
+        # Arrange
+        window = RollingWindow(3)
+        window.append(1.0)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            window.max()
+        with pytest.raises(ValueError):
+            window.min()
+
+    def test_first_when_empty_raises_value_error(self):
+        # Arrange
+        window = RollingWindow(3)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            window.first()
+
+    def test_clear_resets_window(self):
+        # Arrange
+        window = RollingWindow(3, track_extremes=True)
+        for value in (1.0, 2.0, 3.0, 4.0):
+            window.append(value)
+
+        # Act
+        window.clear()
+        window.append(10.0)
+
+        # Assert
+        assert window.count == 1
+        assert window.sum() == 10.0
+        assert window.max() == 10.0
+        assert window.min() == 10.0
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pytest
+
 from nautilus_trader.indicators.rvi import RelativeVolatilityIndex
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
@@ -95,7 +97,7 @@ class TestRelativeVolatilityIndex:
         self.rvi.update_raw(110.04)
 
         # Assert
-        assert self.rvi.value == 67.2446018137445
+        assert self.rvi.value == pytest.approx(67.2446018137445, rel=1e-9)
 
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.indicators.average.sma import SimpleMovingAverage
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
@@ -174,3 +176,50 @@ class TestSimpleMovingAverage:
         # Assert
         assert not self.sma.initialized
         assert self.sma.value == 0
+
+    def test_update_many_matches_sequential_updates(self):
+        # Arrange
+        values = np.linspace(1.0, 2.0, num=25)
+        sequential = SimpleMovingAverage(10)
+        for value in values:
+            sequential.update_raw(value)
+
+        # Act
+        self.sma.update_many(values)
+
+        # Assert
+        assert self.sma.initialized
+        assert self.sma.count == sequential.count
+        assert self.sma.value == sequential.value
+
+    def test_handle_bars_matches_sequential_handle_bar(self):
+        # Arrange
+        bars = [TestDataStubs.bar_5decimal(), TestDataStubs.bar_5decimal_5min_bid()] * 6
+        sequential = SimpleMovingAverage(10)
+        for bar in bars:
+            sequential.handle_bar(bar)
+
+        # Act
+        self.sma.handle_bars(bars)
+
+        # Assert
+        assert self.sma.count == 12
+        assert self.sma.value == sequential.value
+
+    def test_handle_quote_ticks_matches_sequential_handle_quote_tick(self):
+        # Arrange
+        indicator = SimpleMovingAverage(10, PriceType.MID)
+        sequential = SimpleMovingAverage(10, PriceType.MID)
+        ticks = [
+            TestDataStubs.quote_tick(AUDUSD_SIM, bid_price=1.00001 + i * 0.00001, ask_price=1.00010)
+            for i in range(5)
+        ]
+        for tick in ticks:
+            sequential.handle_quote_tick(tick)
+
+        # Act
+        indicator.handle_quote_ticks(ticks)
+
+        # Assert
+        assert indicator.count == 5
+        assert indicator.value == sequential.value
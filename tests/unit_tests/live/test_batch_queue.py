@@ -0,0 +1,168 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import threading
+
+import pytest
+
+from nautilus_trader.live.batch_queue import BatchQueue
+from nautilus_trader.live.batch_queue import LatencyHistogram
+from nautilus_trader.live.io_thread import IOThread
+
+
+class TestLatencyHistogram:
+    def test_empty_histogram(self):
+        # Arrange, Act
+        histogram = LatencyHistogram()
+
+        # Assert
+        assert histogram.count == 0
+        assert histogram.mean_ns == 0.0
+        assert histogram.percentile_ns(0.99) == 0
+
+    def test_record_latencies(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        for latency_ns in [100, 200, 300, 1_000_000]:
+            histogram.record(latency_ns)
+
+        # Assert
+        assert histogram.count == 4
+        assert histogram.min_ns == 100
+        assert histogram.max_ns == 1_000_000
+        assert histogram.mean_ns == 250_150.0
+        assert histogram.percentile_ns(0.5) == 255  # Upper bound of bucket [128, 255]
+        assert histogram.percentile_ns(1.0) == 1_000_000
+
+    def test_percentile_with_invalid_quantile_raises_value_error(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            histogram.percentile_ns(1.5)
+
+
+class TestBatchQueue:
+    def test_instantiate_with_invalid_maxsize_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            BatchQueue(asyncio.new_event_loop(), maxsize=0)
+
+    @pytest.mark.asyncio
+    async def test_get_batch_drains_all_available_items(self):
+        # Arrange
+        queue = BatchQueue(asyncio.get_running_loop(), maxsize=10)
+        for i in range(5):
+            queue.put_threadsafe(i)
+
+        # Act
+        batch = await queue.get_batch()
+
+        # Assert
+        assert batch == [0, 1, 2, 3, 4]
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_get_batch_respects_max_batch(self):
+        # Arrange
+        queue = BatchQueue(asyncio.get_running_loop(), maxsize=10, max_batch=2)
+        for i in range(5):
+            queue.put_threadsafe(i)
+
+        # Act
+        batch1 = await queue.get_batch()
+        batch2 = await queue.get_batch()
+
+        # Assert
+        assert batch1 == [0, 1]
+        assert batch2 == [2, 3]
+        assert queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_put_threadsafe_when_over_capacity_reports_overflow_once(self):
+        # Arrange
+        queue = BatchQueue(asyncio.get_running_loop(), maxsize=2)
+
+        # Act
+        results = [queue.put_threadsafe(i) for i in range(5)]
+
+        # Assert
+        assert results == [True, True, False, True, True]
+        assert queue.qsize() == 5  # Producers are never blocked
+
+    @pytest.mark.asyncio
+    async def test_get_batch_wakes_for_items_put_from_other_thread(self):
+        # Arrange
+        queue = BatchQueue(asyncio.get_running_loop(), maxsize=1_000)
+
+        def produce():
+            for i in range(100):
+                queue.put_threadsafe(i)
+
+        # Act
+        consumer = asyncio.create_task(queue.get_batch())
+        await asyncio.sleep(0)  # Consumer now waiting
+        thread = threading.Thread(target=produce)
+        thread.start()
+        thread.join()
+
+        received = await asyncio.wait_for(consumer, timeout=1.0)
+        while len(received) < 100:
+            received += await asyncio.wait_for(queue.get_batch(), timeout=1.0)
+
+        # Assert
+        assert received == list(range(100))
+
+    @pytest.mark.asyncio
+    async def test_get_batch_with_track_latency_records_latencies(self):
+        # Arrange
+        queue = BatchQueue(asyncio.get_running_loop(), maxsize=10, track_latency=True)
+        queue.put_threadsafe("a")
+        queue.put_threadsafe("b")
+
+        # Act
+        batch = await queue.get_batch()
+
+        # Assert
+        assert batch == ["a", "b"]
+        assert queue.latency is not None
+        assert queue.latency.count == 2
+
+    @pytest.mark.asyncio
+    async def test_handoff_from_io_thread(self):
+        # Arrange
+        queue = BatchQueue(asyncio.get_running_loop(), maxsize=1_000, track_latency=True)
+        io_thread = IOThread()
+        io_thread.start()
+
+        async def produce():
+            for i in range(100):
+                queue.put_threadsafe(i)
+
+        # Act
+        asyncio.run_coroutine_threadsafe(produce(), io_thread.loop).result(timeout=1.0)
+        received: list[int] = []
+        while len(received) < 100:
+            received += await asyncio.wait_for(queue.get_batch(), timeout=1.0)
+        io_thread.stop()
+
+        # Assert
+        assert received == list(range(100))
+        assert queue.latency.count == 100
+        assert not io_thread.is_running
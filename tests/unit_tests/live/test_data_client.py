@@ -14,6 +14,9 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import threading
+
+import pytest
 
 from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import MessageBus
@@ -21,6 +24,7 @@ from nautilus_trader.common.providers import InstrumentProvider
 from nautilus_trader.live.data_client import LiveDataClient
 from nautilus_trader.live.data_client import LiveMarketDataClient
 from nautilus_trader.live.data_engine import LiveDataEngine
+from nautilus_trader.live.io_thread import IOThread
 from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.portfolio.portfolio import Portfolio
@@ -75,6 +79,75 @@ class TestLiveDataClientTests:
         # Arrange, Act, Assert
         assert True  # No exception raised
 
+    def test_create_task_from_other_thread_schedules_on_client_loop(self):
+        # Arrange
+        io_thread = IOThread()
+        io_thread.start()
+        client = LiveDataClient(
+            loop=io_thread.loop,
+            client_id=ClientId("BLOOMBERG"),
+            venue=None,  # Multi-venue
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        ran_on: list[threading.Thread] = []
+        done = threading.Event()
+
+        async def run():
+            ran_on.append(threading.current_thread())
+            done.set()
+
+        # Act
+        result = client.create_task(run())
+        done.wait(timeout=1.0)
+        io_thread.stop()
+
+        # Assert
+        assert result is None  # Scheduled thread-safely
+        assert len(ran_on) == 1
+        assert ran_on[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_update_cache_from_other_thread_is_made_on_cache_loop(self):
+        # Arrange
+        io_thread = IOThread()
+        io_thread.start()
+        client = LiveDataClient(
+            loop=io_thread.loop,
+            client_id=ClientId("BLOOMBERG"),
+            venue=None,  # Multi-venue
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        client.set_cache_loop(asyncio.get_running_loop())
+
+        updated_on: list[threading.Thread] = []
+
+        def update(value: str) -> None:
+            updated_on.append(threading.current_thread())
+
+        # Act
+        io_thread.loop.call_soon_threadsafe(client.update_cache, update, "USD")
+        while not updated_on:
+            await asyncio.sleep(0.01)
+        io_thread.stop()
+
+        # Assert
+        assert updated_on == [threading.current_thread()]
+
+    def test_update_cache_without_cache_loop_updates_immediately(self):
+        # Arrange
+        updated: list[str] = []
+
+        # Act
+        self.client.update_cache(updated.append, "USD")
+
+        # Assert
+        assert updated == ["USD"]
+
 
 class TestLiveMarketDataClientTests:
     def setup(self):
@@ -119,3 +192,34 @@ class TestLiveMarketDataClientTests:
     def test_dummy_test(self):
         # Arrange, Act, Assert
         assert True  # No exception raised
+
+    def test_create_task_from_other_thread_schedules_on_client_loop(self):
+        # Arrange
+        io_thread = IOThread()
+        io_thread.start()
+        client = LiveMarketDataClient(
+            loop=io_thread.loop,
+            client_id=ClientId(BINANCE.value),
+            venue=BINANCE,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            instrument_provider=InstrumentProvider(),
+        )
+
+        ran_on: list[threading.Thread] = []
+        done = threading.Event()
+
+        async def run():
+            ran_on.append(threading.current_thread())
+            done.set()
+
+        # Act
+        result = client.create_task(run())
+        done.wait(timeout=1.0)
+        io_thread.stop()
+
+        # Assert
+        assert result is None  # Scheduled thread-safely
+        assert len(ran_on) == 1
+        assert ran_on[0] is not threading.current_thread()
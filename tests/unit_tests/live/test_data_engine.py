@@ -353,3 +353,31 @@ class TestLiveDataEngine:
 
         # Tear Down
         self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_data_with_batch_queues_processes_all_data(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=LiveDataEngineConfig(qsize=10, batch_queues=True),
+        )
+        self.engine.start()
+
+        # Act
+        for _ in range(20):  # Exceeds soft capacity without blocking
+            self.engine.process(TestDataStubs.trade_tick())
+
+        # Assert
+        await eventually(lambda: self.engine.data_qsize() == 0)
+        await eventually(lambda: self.engine.data_count == 20)
+
+        # Tear Down
+        self.engine.stop()
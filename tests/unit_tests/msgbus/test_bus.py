@@ -17,10 +17,14 @@ import pytest
 
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.component import TopicCache
 from nautilus_trader.common.component import is_matching_py
 from nautilus_trader.core.message import Request
 from nautilus_trader.core.message import Response
 from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 
 
@@ -440,6 +444,103 @@ class TestMessageBus:
         assert handler1 == ["message1"]
         assert handler2 == ["message1", "message2", "message3"]
 
+    def test_subscribe_pattern_after_topic_resolved_then_receives_message_on_topic(self):
+        # Arrange
+        handler1 = []
+        handler2 = []
+
+        self.msgbus.subscribe(topic="data.quotes.SIM.AUDUSD", handler=handler1.append)
+        self.msgbus.publish("data.quotes.SIM.AUDUSD", "message1")
+
+        # Act
+        self.msgbus.subscribe(topic="data.quotes.*", handler=handler2.append)
+        self.msgbus.publish("data.quotes.SIM.AUDUSD", "message2")
+
+        # Assert
+        assert handler1 == ["message1", "message2"]
+        assert handler2 == ["message2"]
+
+    def test_publish_sends_to_handlers_in_priority_then_subscription_order(self):
+        # Arrange
+        received = []
+
+        self.msgbus.subscribe(topic="data.*", handler=lambda m: received.append(1))
+        self.msgbus.subscribe(topic="data.quotes", handler=lambda m: received.append(2))
+        self.msgbus.subscribe(topic="*", handler=lambda m: received.append(3), priority=10)
+        self.msgbus.subscribe(topic="data.quote?", handler=lambda m: received.append(4))
+
+        # Act
+        self.msgbus.publish("data.quotes", "message")
+
+        # Assert
+        assert received == [3, 1, 2, 4]
+
+    def test_publish_batch_with_batch_handler_sends_whole_batch(self):
+        # Arrange
+        batches = []
+        subscriber = []
+
+        self.msgbus.subscribe(topic="data.*", handler=subscriber.append, batch_handler=batches.append)
+
+        # Act
+        self.msgbus.publish_batch("data.bars", ["bar1", "bar2", "bar3"])
+
+        # Assert
+        assert batches == [["bar1", "bar2", "bar3"]]
+        assert subscriber == []
+        assert self.msgbus.pub_count == 3
+
+    def test_publish_batch_without_batch_handler_sends_each_message(self):
+        # Arrange
+        subscriber1 = []
+        subscriber2 = []
+
+        self.msgbus.subscribe(topic="data.bars", handler=subscriber1.append)
+        self.msgbus.subscribe(topic="data.bars", handler=subscriber2.append)
+
+        # Act
+        self.msgbus.publish_batch("data.bars", ["bar1", "bar2"])
+
+        # Assert
+        assert subscriber1 == ["bar1", "bar2"]
+        assert subscriber2 == ["bar1", "bar2"]
+        assert self.msgbus.pub_count == 2
+
+    def test_publish_batch_with_mixed_subscriptions_sends_batch_or_each_message(self):
+        # Arrange
+        batches = []
+        subscriber = []
+
+        self.msgbus.subscribe(
+            topic="data.bars",
+            handler=lambda m: None,
+            batch_handler=batches.append,
+        )
+        self.msgbus.subscribe(topic="data.*", handler=subscriber.append)
+
+        # Act
+        self.msgbus.publish_batch("data.bars", ["bar1", "bar2"])
+        self.msgbus.publish_batch("data.bars", [])
+
+        # Assert
+        assert batches == [["bar1", "bar2"]]  # One call per (non-empty) batch
+        assert subscriber == ["bar1", "bar2"]
+        assert self.msgbus.pub_count == 2
+
+    def test_unsubscribe_pattern_after_topic_resolved_then_stops_receiving(self):
+        # Arrange
+        handler = []
+        self.msgbus.subscribe(topic="data.*", handler=handler.append)
+        self.msgbus.publish("data.quotes", "message1")
+
+        # Act
+        self.msgbus.unsubscribe(topic="data.*", handler=handler.append)
+        self.msgbus.publish("data.quotes", "message2")
+
+        # Assert
+        assert handler == ["message1"]
+        assert self.msgbus.subscriptions() == []
+
     def test_msgbus_for_system_events_using_component_id(self):
         # Arrange
         subscriber = []
@@ -457,6 +558,64 @@ class TestMessageBus:
         assert subscriber == ["DUMMY EVENT", "TRADER EVENT"]
 
 
+class TestTopicCache:
+    def test_get_quotes_topic_returns_cached_topic(self):
+        # Arrange
+        topic_cache = TopicCache()
+        instrument_id = TestIdStubs.audusd_id()
+
+        # Act
+        topic1 = topic_cache.get_quotes_topic(instrument_id)
+        topic2 = topic_cache.get_quotes_topic(InstrumentId.from_str("AUD/USD.SIM"))
+
+        # Assert
+        assert topic1 == "data.quotes.SIM.AUD/USD"
+        assert topic2 is topic1
+
+    def test_get_bars_topic_returns_cached_topic_per_bar_type(self):
+        # Arrange
+        topic_cache = TopicCache()
+        bar_type_1min = TestDataStubs.bartype_audusd_1min_bid()
+        bar_type_5min = TestDataStubs.bartype_audusd_5min_bid()
+
+        # Act
+        topic1 = topic_cache.get_bars_topic(bar_type_1min)
+        topic2 = topic_cache.get_bars_topic(BarType.from_str(str(bar_type_1min)))
+        topic3 = topic_cache.get_bars_topic(bar_type_5min)
+
+        # Assert
+        assert topic2 is topic1
+        assert topic3 == f"data.bars.{bar_type_5min}"
+
+    def test_topics_match_formats(self):
+        # Arrange
+        topic_cache = TopicCache()
+        instrument_id = TestIdStubs.audusd_id()
+        bar_type = TestDataStubs.bartype_audusd_1min_bid()
+        strategy_id = TestIdStubs.strategy_id()
+
+        # Act, Assert
+        assert topic_cache.get_instrument_topic(instrument_id) == "data.instrument.SIM.AUD/USD"
+        assert topic_cache.get_deltas_topic(instrument_id) == "data.book.deltas.SIM.AUD/USD"
+        assert topic_cache.get_depth_topic(instrument_id) == "data.book.depth.SIM.AUD/USD"
+        assert (
+            topic_cache.get_snapshots_topic(instrument_id, 1000)
+            == "data.book.snapshots.SIM.AUD/USD.1000"
+        )
+        assert topic_cache.get_trades_topic(instrument_id) == "data.trades.SIM.AUD/USD"
+        assert topic_cache.get_status_topic(instrument_id) == "data.status.SIM.AUD/USD"
+        assert (
+            topic_cache.get_close_prices_topic(instrument_id)
+            == "data.venue.close_price.AUD/USD.SIM"
+        )
+        assert topic_cache.get_bars_topic(bar_type) == f"data.bars.{bar_type}"
+        assert topic_cache.get_order_events_topic(strategy_id) == f"events.order.{strategy_id}"
+        assert (
+            topic_cache.get_position_events_topic(strategy_id)
+            == f"events.position.{strategy_id}"
+        )
+
+
 @pytest.mark.parametrize(
     ("topic", "pattern", "expected"),
     [
@@ -469,6 +628,12 @@ class TestMessageBus:
         ["data.quotes.BINANCE", "data.*.BINANCE", True],
         ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.*", True],
         ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.ETH*", True],
+        ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.BTC*", False],
+        ["data.quotes.BINANCE", "data.quotes.BINANC?", True],
+        ["data.quotes.BINANCE", "data.quotes.BINAN?", False],
+        ["data.quotes", "data.quotes.*", False],
+        ["", "*", True],
+        ["", "?", False],
     ],
 )
 def test_is_matching_given_various_topic_pattern_combos(topic, pattern, expected):
@@ -17,6 +17,7 @@ import datetime
 import sys
 from decimal import Decimal
 
+import numpy as np
 import pandas as pd
 import pyarrow.dataset as ds
 import pytest
@@ -37,6 +38,7 @@ from nautilus_trader.model.instruments import BettingInstrument
 from nautilus_trader.model.instruments import Equity
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
+from nautilus_trader.persistence.catalog.parquet import CatalogFileInfo
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
 from nautilus_trader.persistence.wranglers_v2 import QuoteTickDataWranglerV2
 from nautilus_trader.persistence.wranglers_v2 import TradeTickDataWranglerV2
@@ -241,6 +243,196 @@ def test_catalog_custom_data(catalog: ParquetDataCatalog) -> None:
     assert isinstance(data[0], CustomData)
 
 
+def test_catalog_query_table_to_data(catalog_betfair: ParquetDataCatalog) -> None:
+    # Arrange
+    expected = catalog_betfair.trade_ticks()
+
+    # Act
+    table = catalog_betfair.query_table(TradeTick)
+    data = catalog_betfair.table_to_data(table, TradeTick)
+
+    # Assert
+    assert table.num_rows == len(expected)
+    assert data == expected
+
+
+def test_catalog_query_table_when_no_data(catalog: ParquetDataCatalog) -> None:
+    # Arrange, Act
+    table = catalog.query_table(TradeTick)
+
+    # Assert
+    assert table is None
+
+
+def test_catalog_write_data_append(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    first = [TestDataStubs.trade_tick(ts_init=i) for i in range(0, 5)]
+    second = [TestDataStubs.trade_tick(ts_init=i) for i in range(5, 10)]
+
+    # Act
+    catalog.write_data(first, append=True)
+    catalog.write_data(second, append=True)
+
+    # Assert
+    files = catalog.fs.glob(f"{catalog.path}/data/trade_tick/**/*.parquet")
+    assert sorted(f.rsplit("/", 1)[-1] for f in files) == ["0-4.parquet", "5-9.parquet"]
+    assert [t.ts_init for t in catalog.trade_ticks()] == list(range(10))
+
+
+def test_catalog_write_data_append_when_overlapping_raises_value_error(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    catalog.write_data([TestDataStubs.trade_tick(ts_init=i) for i in range(0, 5)], append=True)
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        catalog.write_data([TestDataStubs.trade_tick(ts_init=3)], append=True)
+
+
+def test_catalog_compact(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    for start in range(0, 10, 2):
+        data = [TestDataStubs.trade_tick(ts_init=i) for i in range(start, start + 2)]
+        catalog.write_data(data, append=True)
+
+    # Act
+    catalog.compact(TradeTick, max_rows_per_file=4)
+
+    # Assert
+    files = catalog.fs.glob(f"{catalog.path}/data/trade_tick/**/*.parquet")
+    assert sorted(f.rsplit("/", 1)[-1] for f in files) == [
+        "0-3.parquet",
+        "4-7.parquet",
+        "8-9.parquet",
+    ]
+    assert [t.ts_init for t in catalog.trade_ticks()] == list(range(10))
+
+
+def test_catalog_manifest_prunes_files_outside_query(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    for start in range(0, 10, 2):
+        data = [TestDataStubs.trade_tick(ts_init=i) for i in range(start, start + 2)]
+        catalog.write_data(data, append=True)
+
+    # Act
+    files = catalog._query_files(TradeTick, start=3, end=4)
+    ticks = catalog.trade_ticks(start=3, end=4)
+
+    # Assert
+    assert [f.rsplit("/", 1)[-1] for f in files] == ["2-3.parquet", "4-5.parquet"]
+    assert [t.ts_init for t in ticks] == [3, 4]
+
+
+def test_catalog_query_table_when_manifest_prunes_all_files_returns_empty_table(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    catalog.write_data([TestDataStubs.trade_tick(ts_init=i) for i in range(5)], append=True)
+
+    # Act
+    table = catalog.query_table(TradeTick, start=100, end=200)
+
+    # Assert
+    assert catalog._query_files(TradeTick, start=100, end=200) == []
+    assert table is not None
+    assert table.num_rows == 0
+    assert "ts_init" in table.schema.names
+
+
+def test_catalog_manifest_includes_files_written_outside_catalog(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    catalog.write_data([TestDataStubs.trade_tick(ts_init=i) for i in range(5)], append=True)
+    file = catalog.fs.glob(f"{catalog.path}/data/trade_tick/**/*.parquet")[0]
+    catalog.fs.copy(file, file.rsplit("/", 1)[0] + "/external.parquet")
+
+    # Act
+    files = catalog._query_files(TradeTick)
+
+    # Assert
+    assert sorted(f.rsplit("/", 1)[-1] for f in files) == ["0-4.parquet", "external.parquet"]
+    assert "external.parquet" in str(catalog._read_manifest("trade_tick"))
+
+
+def test_catalog_manifest_is_cached_and_updated_on_write(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    catalog.write_data([TestDataStubs.trade_tick(ts_init=i) for i in range(5)], append=True)
+    cached = catalog._manifests["trade_tick"]
+
+    # Act
+    catalog.write_data([TestDataStubs.trade_tick(ts_init=i) for i in range(5, 10)], append=True)
+
+    # Assert
+    assert len(cached) == 1
+    assert len(catalog._manifests["trade_tick"]) == 2
+    assert len(catalog._query_files(TradeTick, start=6)) == 1
+
+
+def test_catalog_rebuild_manifest(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    catalog.write_data([TestDataStubs.trade_tick(ts_init=i) for i in range(5)])
+    manifest_path = catalog._manifest_path("trade_tick")
+    catalog.fs.rm(manifest_path)
+
+    # Act
+    catalog.rebuild_manifest(TradeTick)
+
+    # Assert
+    manifest = catalog._read_manifest("trade_tick")
+    assert list(manifest.values()) == [
+        CatalogFileInfo(
+            path="AUDUSD.SIM/part-0.parquet",
+            instrument_id="AUDUSD.SIM",
+            bar_type=None,
+            num_rows=5,
+            ts_init_min=0,
+            ts_init_max=4,
+        ),
+    ]
+
+
+def test_catalog_query_batches(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    catalog.write_data([TestDataStubs.trade_tick(ts_init=i) for i in range(10)])
+
+    # Act
+    batches = list(catalog.query_batches(TradeTick, start=2, end=7, batch_size=4))
+
+    # Assert
+    assert [batch.column("ts_init").to_pylist() for batch in batches] == [[2, 3], [4, 5, 6, 7]]
+    assert [t.ts_init for t in catalog.table_to_data(batches[0], TradeTick)] == [2, 3]
+
+
+def test_catalog_query_numpy(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    catalog.write_data([TestDataStubs.trade_tick(ts_init=i) for i in range(10)])
+
+    # Act
+    array = catalog.query_numpy(TradeTick, start=2, end=4)
+
+    # Assert
+    assert array["ts_init"].tolist() == [2, 3, 4]
+    assert array["price"].dtype == np.int64  # Raw fixed-point
+    assert len(set(array["price"].tolist())) == 1
+
+
+def test_catalog_query_numpy_when_no_rows_returns_empty_structured_array(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    catalog.write_data([TestDataStubs.trade_tick(ts_init=i) for i in range(10)])
+    expected = catalog.query_numpy(TradeTick, start=2, end=4)
+
+    # Act
+    array = catalog.query_numpy(TradeTick, start=100, end=200)
+
+    # Assert
+    assert len(array) == 0
+    assert array.dtype == expected.dtype
+
+
 def test_catalog_bars_querying_by_bar_type(catalog: ParquetDataCatalog) -> None:
     # Arrange
     bar_type = TestDataStubs.bartype_adabtc_binance_1min_last()
@@ -14,8 +14,11 @@
 # -------------------------------------------------------------------------------------------------
 
 import copy
+import time
 from collections import Counter
 
+import pyarrow as pa
+
 from nautilus_trader.backtest.node import BacktestNode
 from nautilus_trader.backtest.results import BacktestResult
 from nautilus_trader.config import BacktestDataConfig
@@ -31,8 +34,11 @@ from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.writer import StreamingFeatherWriter
 from nautilus_trader.persistence.writer import generate_signal_class
 from nautilus_trader.test_kit.mocks.data import NewsEventData
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 from nautilus_trader.test_kit.stubs.persistence import TestPersistenceStubs
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 
@@ -292,6 +298,61 @@ class TestPersistenceStreaming:
         result = Counter([r.__class__.__name__ for r in result])  # type: ignore
         assert result["SignalCounter"] == 179  # type: ignore
 
+    def test_feather_writer_writes_batches(self, catalog: ParquetDataCatalog) -> None:
+        # Arrange
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        writer = StreamingFeatherWriter(
+            path=f"{catalog.path}/live/test",
+            fs_protocol=catalog.fs_protocol,
+            flush_interval_ms=60_000,
+            batch_size=10,
+        )
+        writer.write(instrument)
+
+        # Act
+        for i in range(25):
+            writer.write(TestDataStubs.trade_tick(instrument, ts_init=i))
+        writer.close()
+
+        # Assert
+        path = f"{catalog.path}/live/test/trade_tick/AUDUSD.SIM.feather"
+        with catalog.fs.open(path, "rb") as f:
+            batches = list(pa.ipc.open_stream(f))
+        assert [batch.num_rows for batch in batches] == [10, 10, 5]
+        ticks = catalog.read_live_run("test")
+        assert [t.ts_init for t in ticks if isinstance(t, TradeTick)] == list(range(25))
+
+    def test_feather_writer_flushes_quiet_stream_on_interval(
+        self,
+        catalog: ParquetDataCatalog,
+    ) -> None:
+        # Arrange
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        writer = StreamingFeatherWriter(
+            path=f"{catalog.path}/live/test",
+            fs_protocol=catalog.fs_protocol,
+            flush_interval_ms=50,
+            batch_size=10,
+        )
+        writer.write(instrument)
+        path = f"{catalog.path}/live/test/trade_tick/AUDUSD.SIM.feather"
+
+        def read_rows() -> int:
+            with catalog.fs.open(path, "rb") as f:
+                return sum(batch.num_rows for batch in pa.ipc.open_stream(f))
+
+        # Act
+        for i in range(5):
+            writer.write(TestDataStubs.trade_tick(instrument, ts_init=i))
+
+        deadline = time.monotonic() + 5.0
+        while read_rows() < 5 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # Assert
+        assert read_rows() == 5
+        writer.close()
+
     def test_generate_signal_class(self) -> None:
         # Arrange
         cls = generate_signal_class(name="test", value_type=float)
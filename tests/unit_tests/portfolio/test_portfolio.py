@@ -491,6 +491,161 @@ class TestPortfolio:
         # Assert
         assert self.portfolio.margins_init(BINANCE)[BTCUSDT_BINANCE.id] == Money(0.1, USDT)
 
+    def test_order_events_update_margin_init_incrementally(self):
+        # Arrange
+        AccountFactory.register_calculated_account("BINANCE")
+
+        account_id = AccountId("BINANCE-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=None,  # Multi-currency account
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(100000.00000000, USDT),
+                    Money(0.00000000, USDT),
+                    Money(100000.00000000, USDT),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        order1 = self.order_factory.limit(
+            BTCUSDT_BINANCE.id,
+            OrderSide.BUY,
+            Quantity.from_str("100"),
+            Price.from_str("0.5"),
+        )
+        order2 = self.order_factory.limit(
+            BTCUSDT_BINANCE.id,
+            OrderSide.SELL,
+            Quantity.from_str("100"),
+            Price.from_str("1.5"),
+        )
+        order3 = self.order_factory.limit(
+            BTCUSDT_BINANCE.id,
+            OrderSide.SELL,
+            Quantity.from_str("100"),
+            Price.from_str("2.0"),
+        )
+
+        for order in [order1, order2, order3]:
+            self.cache.add_order(order, position_id=None)
+            order.apply(TestEventStubs.order_submitted(order))
+            self.cache.update_order(order)
+
+        # Act
+        for i, order in enumerate([order1, order2, order3]):
+            accepted = TestEventStubs.order_accepted(order, venue_order_id=VenueOrderId(str(i)))
+            order.apply(accepted)
+            self.cache.update_order(order)
+            self.portfolio.update_order(accepted)
+
+        margin_all_accepted = self.portfolio.margins_init(BINANCE)[BTCUSDT_BINANCE.id]
+
+        canceled = TestEventStubs.order_canceled(order2)
+        order2.apply(canceled)
+        self.cache.update_order(order2)
+        self.portfolio.update_order(canceled)
+
+        margin_one_canceled = self.portfolio.margins_init(BINANCE)[BTCUSDT_BINANCE.id]
+
+        expired = TestEventStubs.order_expired(order1)
+        order1.apply(expired)
+        self.cache.update_order(order1)
+        self.portfolio.update_order(expired)
+
+        canceled = TestEventStubs.order_canceled(order3)
+        order3.apply(canceled)
+        self.cache.update_order(order3)
+        self.portfolio.update_order(canceled)
+
+        # Assert
+        assert margin_all_accepted == Money(0.8, USDT)
+        assert margin_one_canceled == Money(0.5, USDT)
+        assert self.portfolio.margins_init(BINANCE).get(BTCUSDT_BINANCE.id) is None
+
+    def test_reset_rebuilds_order_margin_from_cache(self):
+        # Arrange
+        AccountFactory.register_calculated_account("BINANCE")
+
+        account_id = AccountId("BINANCE-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=None,  # Multi-currency account
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(100000.00000000, USDT),
+                    Money(0.00000000, USDT),
+                    Money(100000.00000000, USDT),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        order1 = self.order_factory.limit(
+            BTCUSDT_BINANCE.id,
+            OrderSide.BUY,
+            Quantity.from_str("100"),
+            Price.from_str("0.5"),
+        )
+        order2 = self.order_factory.limit(
+            BTCUSDT_BINANCE.id,
+            OrderSide.SELL,
+            Quantity.from_str("100"),
+            Price.from_str("1.5"),
+        )
+        order3 = self.order_factory.limit(
+            BTCUSDT_BINANCE.id,
+            OrderSide.SELL,
+            Quantity.from_str("100"),
+            Price.from_str("2.0"),
+        )
+
+        for order in [order1, order2, order3]:
+            self.cache.add_order(order, position_id=None)
+            order.apply(TestEventStubs.order_submitted(order))
+            self.cache.update_order(order)
+
+        for i, order in enumerate([order1, order2]):
+            accepted = TestEventStubs.order_accepted(order, venue_order_id=VenueOrderId(str(i)))
+            order.apply(accepted)
+            self.cache.update_order(order)
+            self.portfolio.update_order(accepted)
+
+        margin_before_reset = self.portfolio.margins_init(BINANCE)[BTCUSDT_BINANCE.id]
+
+        # Act
+        self.portfolio.reset()
+
+        # Order canceled while the portfolio is not tracking order events
+        order2.apply(TestEventStubs.order_canceled(order2))
+        self.cache.update_order(order2)
+
+        accepted = TestEventStubs.order_accepted(order3, venue_order_id=VenueOrderId("2"))
+        order3.apply(accepted)
+        self.cache.update_order(order3)
+        self.portfolio.update_order(accepted)
+
+        # Assert
+        assert margin_before_reset == Money(0.4, USDT)
+        assert self.portfolio.margins_init(BINANCE)[BTCUSDT_BINANCE.id] == Money(0.5, USDT)
+
     def test_update_positions(self):
         # Arrange
         AccountFactory.register_calculated_account("BINANCE")